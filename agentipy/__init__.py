@@ -1,10 +1,30 @@
+import importlib
 import logging
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.langchain import create_solana_tools
-from agentipy.mcp.all_actions import ALL_ACTIONS
-from agentipy.mcp.mcp_server import start_mcp_server
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
-__all__ = ["SolanaAgentKit", "create_solana_tools","start_mcp_server", "ALL_ACTIONS"]
+# LangChain and MCP integrations are resolved on first attribute access so
+# that `import agentipy` does not pull in their dependencies.
+_LAZY_EXPORTS = {
+    "create_solana_tools": "agentipy.langchain",
+    "start_mcp_server": "agentipy.mcp.mcp_server",
+    "run_multi_agent_server": "agentipy.mcp.mcp_server",
+    "ALL_ACTIONS": "agentipy.mcp.all_actions",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
+
+__all__ = ["SolanaAgentKit", "create_solana_tools","start_mcp_server", "run_multi_agent_server", "ALL_ACTIONS"]
@@ -1,24 +1,43 @@
+from __future__ import annotations
+
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import base58
-from allora_sdk.v2.api_client import (PriceInferenceTimeframe,
-                                      PriceInferenceToken, SignatureFormat)
-from solana.rpc.api import Client
-from solana.rpc.async_api import AsyncClient
 from solders.keypair import Keypair  # type: ignore
 from solders.pubkey import Pubkey  # type: ignore
-from typing_extensions import Union
 
 from agentipy.constants import API_VERSION, BASE_PROXY_URL, DEFAULT_OPTIONS
-from agentipy.types import BondingCurveState, PumpfunTokenOptions
-from agentipy.utils.meteora_dlmm.types import ActivationType
-from agentipy.wallet.solana_wallet_client import SolanaWalletClient
+from agentipy.utils.instrumentation import instrument_methods
+
+# Only solders/base58 are loaded eagerly; RPC clients, SDKs and type modules
+# are imported on first use to keep `import agentipy` cheap on cold start.
+if TYPE_CHECKING:
+    from allora_sdk.v2.api_client import (PriceInferenceTimeframe,
+                                          PriceInferenceToken, SignatureFormat)
+    from solana.rpc.api import Client
+    from solana.rpc.async_api import AsyncClient
+
+    from agentipy.types import (BondingCurveState, PumpfunTokenOptions,
+                                TokenScreeningCriteria)
+    from agentipy.utils.backpack.stream import BackpackMarketStream
+    from agentipy.utils.helius.indexer import HeliusHistoryIndexer
+    from agentipy.utils.meteora_dlmm.types import ActivationType
+    from agentipy.utils.rpc_accounting import RpcAccountant
+    from agentipy.wallet.solana_wallet_client import SolanaWalletClient
 
 logger = logging.getLogger(__name__)
 
 
+async def _to_thread(func, *args):
+    """Run a blocking manager call in a worker thread so it does not stall the event loop."""
+    # Imported here: asyncio is only needed once a coroutine runs, not to import SolanaAgentKit
+    import asyncio
+
+    return await asyncio.to_thread(func, *args)
+
+
 class SolanaAgentKitError(Exception):
     """Custom exception for errors in SolanaAgentKit"""
     pass
@@ -46,6 +65,7 @@ class SolanaAgentKit:
         quicknode_rpc_url: Optional[str] = None,
         jito_block_engine_url: Optional[str] = None,
         jito_uuid: Optional[str] = None,
+        jito_regions: Optional[List[str]] = None,
         stork_api_key: Optional[str] = None,
         coingecko_api_key: Optional[str] = None,
         coingecko_demo_api_key: Optional[str] = None,
@@ -54,7 +74,9 @@ class SolanaAgentKit:
         allora_api_key: Optional[str] = None,
         solutiofi_api_key: Optional[str] = None,
         generate_wallet: bool = False,
-   
+        rpc_accountant: Optional[RpcAccountant] = None,
+        helius_indexer: Optional[HeliusHistoryIndexer] = None,
+        backpack_stream: Optional[BackpackMarketStream] = None,
     ):
         """
         Initialize the SolanaAgentKit.
@@ -68,8 +90,16 @@ class SolanaAgentKit:
             quicknode_rpc_url (str, optional): QuickNode RPC URL.
             jito_block_engine_url (str, optional): Jito block engine URL for Solana.
             jito_uuid (str, optional): Jito UUID for authentication.
+            jito_regions (List[str], optional): Block-engine regions (names such as "ny" or "frankfurt", or URLs)
+                that bundles and transactions are fanned out to. Defaults to the comma-separated JITO_REGIONS
+                variable; without regions everything goes to `jito_block_engine_url`.
             generate_wallet (bool): If True, generates a new wallet and returns the details.
-         
+            rpc_accountant (RpcAccountant, optional): Counts, rate-limits and budgets RPC calls made through
+                `connection` and `connection_client`. Defaults to the shared `rpc_accountant`.
+            helius_indexer (HeliusHistoryIndexer, optional): Local index serving `get_parsed_transaction_history`
+                as a read-through cache.
+            backpack_stream (BackpackMarketStream, optional): Started market stream serving Backpack depth,
+                ticker and recent-trade lookups of its symbols from memory.
         """
         self.rpc_url = rpc_url or os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY", "")
@@ -80,6 +110,9 @@ class SolanaAgentKit:
         self.quicknode_rpc_url = quicknode_rpc_url or os.getenv("QUICKNODE_RPC_URL", "")
         self.jito_block_engine_url = jito_block_engine_url or os.getenv("JITO_BLOCK_ENGINE_URL", "")
         self.jito_uuid = jito_uuid or os.getenv("JITO_UUID", None)
+        self.jito_regions = jito_regions or [
+            region.strip() for region in os.getenv("JITO_REGIONS", "").split(",") if region.strip()
+        ]
         self.stork_api_key = stork_api_key or os.getenv("STORK_API_KEY", "")
         self.coingecko_api_key = coingecko_api_key or os.getenv("COINGECKO_PRO_API_KEY", "")
         self.coingecko_demo_api_key = coingecko_demo_api_key or os.getenv("COINGECKO_DEMO_API_KEY", "")
@@ -103,16 +136,56 @@ class SolanaAgentKit:
         if not self.wallet or not self.wallet_address:
             raise ValueError("A valid private key must be provided or a wallet must be generated.")
 
-        self.connection = AsyncClient(self.rpc_url)
-        self.connection_client = Client(self.rpc_url)
-
-        self.wallet_client = SolanaWalletClient(self.connection_client, self.wallet)
+        self.rpc_accountant = rpc_accountant
+        self.helius_indexer = helius_indexer
+        self.backpack_stream = backpack_stream
+        self._connection = None
+        self._connection_client = None
+        self._wallet_client = None
 
         if generate_wallet:
             logger.info("New Wallet Generated:")
             logger.info(f"Public Key: {self.wallet_address}")
             logger.info(f"Private Key: {self.private_key}")
 
+    @property
+    def connection(self) -> AsyncClient:
+        """Async Solana RPC client, created on first access."""
+        if self._connection is None:
+            from solana.rpc.async_api import AsyncClient
+            self.connection = AsyncClient(self.rpc_url)
+        return self._connection
+
+    @connection.setter
+    def connection(self, value: AsyncClient):
+        from agentipy.utils.rpc_accounting import instrument_client
+        self._connection = instrument_client(value, self.rpc_accountant)
+
+    @property
+    def connection_client(self) -> Client:
+        """Synchronous Solana RPC client, created on first access."""
+        if self._connection_client is None:
+            from solana.rpc.api import Client
+            self.connection_client = Client(self.rpc_url)
+        return self._connection_client
+
+    @connection_client.setter
+    def connection_client(self, value: Client):
+        from agentipy.utils.rpc_accounting import instrument_client
+        self._connection_client = instrument_client(value, self.rpc_accountant)
+
+    @property
+    def wallet_client(self) -> SolanaWalletClient:
+        """Wallet client bound to the synchronous RPC client, created on first access."""
+        if self._wallet_client is None:
+            from agentipy.wallet.solana_wallet_client import SolanaWalletClient
+            self._wallet_client = SolanaWalletClient(self.connection_client, self.wallet)
+        return self._wallet_client
+
+    @wallet_client.setter
+    def wallet_client(self, value: SolanaWalletClient):
+        self._wallet_client = value
+
     async def request_faucet_funds(self):
         from agentipy.tools.request_faucet_funds import FaucetManager
         try:
@@ -208,14 +281,14 @@ class SolanaAgentKit:
     async def get_token_data_by_ticker(self, ticker: str):
         from agentipy.tools.get_token_data import TokenDataManager
         try:
-            return TokenDataManager.get_token_data_by_ticker(ticker)
+            return await _to_thread(TokenDataManager.get_token_data_by_ticker, ticker)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to get token data: {e}")
     
     async def get_token_data_by_address(self, mint: str):
         from agentipy.tools.get_token_data import TokenDataManager
         try: 
-            return TokenDataManager.get_token_data_by_address(Pubkey.from_string(mint))
+            return await _to_thread(TokenDataManager.get_token_data_by_address, Pubkey.from_string(mint))
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to get token data: {e}")
 
@@ -243,28 +316,28 @@ class SolanaAgentKit:
     async def buy_with_raydium(self, pair_address: str, sol_in: float = 0.01, slippage: int = 5):
         from agentipy.tools.use_raydium import RaydiumManager
         try:
-            return await RaydiumManager.buy_with_raydium(self, pair_address, sol_in, slippage)
+            return await _to_thread(RaydiumManager.buy_with_raydium, self, pair_address, sol_in, slippage)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to buy using raydium: {e}")
     
     async def sell_with_raydium(self, pair_address: str, percentage: int = 100, slippage: int = 5):
         from agentipy.tools.use_raydium import RaydiumManager
         try:
-            return await RaydiumManager.sell_with_raydium(self, pair_address, percentage, slippage)
+            return await _to_thread(RaydiumManager.sell_with_raydium, self, pair_address, percentage, slippage)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to sell using raydium: {e}")
     
     async def burn_and_close_accounts(self, token_account: str):
         from agentipy.tools.burn_and_close_account import BurnManager
         try:
-            return await BurnManager.burn_and_close_account(self, token_account)
+            return await _to_thread(BurnManager.burn_and_close_account, self, token_account)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to close account: {e}")
     
     async def multiple_burn_and_close_accounts(self, token_accounts: list[str]):
         from agentipy.tools.burn_and_close_account import BurnManager
         try:
-            return await BurnManager.process_multiple_accounts(self, token_accounts)
+            return await BurnManager.burn_and_close_accounts_bulk(self, token_accounts)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to close accounts: {e}")
     
@@ -278,14 +351,14 @@ class SolanaAgentKit:
     async def buy_using_moonshot(self, mint_str: str, collateral_amount: float = 0.01, slippage_bps: int = 500):
         from agentipy.tools.use_moonshot import MoonshotManager
         try:
-            return await MoonshotManager.buy(self, mint_str, collateral_amount, slippage_bps)
+            return await _to_thread(MoonshotManager.buy, self, mint_str, collateral_amount, slippage_bps)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to buy using moonshot: {e}")
     
     async def sell_using_moonshot(self, mint_str: str, token_balance: float = 0.01, slippage_bps: int = 500):
         from agentipy.tools.use_moonshot import MoonshotManager
         try:
-            return await MoonshotManager.sell(self, mint_str, token_balance, slippage_bps)
+            return await _to_thread(MoonshotManager.sell, self, mint_str, token_balance, slippage_bps)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to sell using moonshot: {e}")
     
@@ -306,14 +379,14 @@ class SolanaAgentKit:
     async def get_balances(self, address: str):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_balances(self, address)
+            return await _to_thread(HeliusManager.get_balances, self, address)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
 
     async def get_address_name(self, address: str):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_address_name(self, address)
+            return await _to_thread(HeliusManager.get_address_name, self, address)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -331,7 +404,7 @@ class SolanaAgentKit:
             pagination_token: str = None):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_nft_events(self, accounts,types,sources,start_slot,end_slot,start_time,end_time,first_verified_creator,verified_collection_address,limit,sort_order,pagination_token)
+            return await _to_thread(HeliusManager.get_nft_events, self, accounts,types,sources,start_slot,end_slot,start_time,end_time,first_verified_creator,verified_collection_address,limit,sort_order,pagination_token)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -341,14 +414,14 @@ class SolanaAgentKit:
         pagination_token: str=None):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_mintlists(self,first_verified_creators,verified_collection_addresses,limit,pagination_token)
+            return await _to_thread(HeliusManager.get_mintlists, self,first_verified_creators,verified_collection_addresses,limit,pagination_token)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def get_nft_fingerprint(self, mints: List[str]):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_nft_fingerprint(self,mints)
+            return await _to_thread(HeliusManager.get_nft_fingerprint, self,mints)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -359,14 +432,14 @@ class SolanaAgentKit:
         pagination_token: str=None):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_active_listings(self,first_verified_creators,verified_collection_addresses,marketplaces,limit,pagination_token)
+            return await _to_thread(HeliusManager.get_active_listings, self,first_verified_creators,verified_collection_addresses,marketplaces,limit,pagination_token)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def get_nft_metadata(self, mint_accounts: List[str]):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_nft_metadata(self,mint_accounts)
+            return await HeliusManager.get_nft_metadata_batched(self, mint_accounts)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -381,14 +454,14 @@ class SolanaAgentKit:
         pagination_token: str=None):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_raw_transactions(self,accounts,start_slot,end_slot,start_time,end_time,limit,sort_order,pagination_token)
+            return await _to_thread(HeliusManager.get_raw_transactions, self,accounts,start_slot,end_slot,start_time,end_time,limit,sort_order,pagination_token)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def get_parsed_transactions(self, transactions: List[str], commitment: str=None):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_parsed_transactions(self,transactions,commitment)
+            return await HeliusManager.get_parsed_transactions_batched(self, transactions, commitment)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
     
@@ -401,10 +474,42 @@ class SolanaAgentKit:
         type: str=''):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_parsed_transaction_history(self,address,before,until,commitment,source,type)
+            # The index holds finalized history only; other commitments go to the API
+            if self.helius_indexer is not None and commitment in ("", "finalized"):
+                return await self.helius_indexer.get_history(self, address, before, until, source, type)
+            return await _to_thread(HeliusManager.get_parsed_transaction_history, self,address,before,until,commitment,source,type)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
-        
+
+    def iter_transaction_history(self, address: str, **kwargs):
+        """
+        Streams the parsed transaction history of an address across all pages.
+
+        Keyword arguments are those of `HeliusManager.iter_transaction_history`
+        (`before`, `until`, slot/time bounds, `max_items`, ...).
+
+        Returns:
+            AsyncIterator[dict]: Parsed transactions, newest first.
+        """
+        from agentipy.tools.use_helius import HeliusManager
+        return HeliusManager.iter_transaction_history(self, address, **kwargs)
+
+    def iter_raw_transactions(self, accounts: List[str], **kwargs):
+        from agentipy.tools.use_helius import HeliusManager
+        return HeliusManager.iter_raw_transactions(self, accounts, **kwargs)
+
+    def iter_nft_events(self, accounts: List[str], **kwargs):
+        from agentipy.tools.use_helius import HeliusManager
+        return HeliusManager.iter_nft_events(self, accounts, **kwargs)
+
+    def iter_mintlists(self, first_verified_creators: List[str], **kwargs):
+        from agentipy.tools.use_helius import HeliusManager
+        return HeliusManager.iter_mintlists(self, first_verified_creators, **kwargs)
+
+    def iter_active_listings(self, first_verified_creators: List[str], **kwargs):
+        from agentipy.tools.use_helius import HeliusManager
+        return HeliusManager.iter_active_listings(self, first_verified_creators, **kwargs)
+
     async def create_webhook(self, 
         webhook_url: str, 
         transaction_types: list, 
@@ -414,21 +519,21 @@ class SolanaAgentKit:
         auth_header: str=None):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.create_webhook(self,webhook_url,transaction_types,account_addresses,webhook_type,txn_status,auth_header)
+            return await _to_thread(HeliusManager.create_webhook, self,webhook_url,transaction_types,account_addresses,webhook_type,txn_status,auth_header)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def get_all_webhooks(self):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_all_webhooks(self)
+            return await _to_thread(HeliusManager.get_all_webhooks, self)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def get_webhook(self, webhook_id: str):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.get_webhook(self,webhook_id)
+            return await _to_thread(HeliusManager.get_webhook, self,webhook_id)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -442,32 +547,69 @@ class SolanaAgentKit:
         auth_header: str=None):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.edit_webhook(self,webhook_id,webhook_url,transaction_types,account_addresses,webhook_type,txn_status,auth_header)
+            return await _to_thread(HeliusManager.edit_webhook, self,webhook_id,webhook_url,transaction_types,account_addresses,webhook_type,txn_status,auth_header)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
 
     async def delete_webhook(self, webhook_id: str):
         from agentipy.tools.use_helius import HeliusManager
         try:
-            return HeliusManager.delete_webhook(self,webhook_id)
+            return await _to_thread(HeliusManager.delete_webhook, self,webhook_id)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
-    async def fetch_token_report_summary(mint:str):
+    async def fetch_token_report_summary(self, mint:str):
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_token_report_summary(mint)
+            return await RugCheckManager.shared().fetch_token_report_summary(mint)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
-    async def fetch_token_detailed_report(mint:str):
+    async def fetch_token_detailed_report(self, mint:str):
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_token_detailed_report(mint)
+            return await RugCheckManager.shared().fetch_token_detailed_report(mint)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
+
+    async def fetch_token_reports_bulk(self, mints: List[str], detailed: bool = False, max_concurrency: int = 16):
+        """
+        Fetches RugCheck reports for many mints concurrently.
+
+        Args:
+            mints (List[str]): Mint addresses of the tokens.
+            detailed (bool): Fetch detailed reports instead of summaries.
+            max_concurrency (int): Maximum number of requests in flight.
+
+        Returns:
+            dict: Reports keyed by mint; None for mints whose report could not be fetched.
+        """
+        from agentipy.tools.rugcheck import RugCheckManager
+        try:
+            return await RugCheckManager.shared().fetch_reports_bulk(mints, detailed, max_concurrency)
+        except Exception as e:
+            raise SolanaAgentKitError(f"Failed to fetch token reports: {e}")
+
+    async def screen_tokens(self, mints, criteria: Optional[TokenScreeningCriteria] = None, max_concurrency: int = 16):
+        """
+        Screens a stream of mints, combining on-chain mint checks, RugCheck reports and prices.
+
+        Args:
+            mints (Iterable[str] | AsyncIterable[str]): Mint addresses to screen.
+            criteria (TokenScreeningCriteria, optional): Rejection rules.
+            max_concurrency (int): Maximum number of mints being enriched at once.
+
+        Yields:
+            TokenScreeningResult: Scored results, as soon as each one is ready.
+        """
+        from agentipy.tools.screen_tokens import TokenScreener
+        try:
+            async for result in TokenScreener(self, criteria, max_concurrency).screen(mints):
+                yield result
+        except Exception as e:
+            raise SolanaAgentKitError(f"Failed to screen tokens: {e}")
     
-    async def fetch_all_domains(page: int = 1, limit: int = 50, verified: bool = False):
+    async def fetch_all_domains(self, page: int = 1, limit: int = 50, verified: bool = False):
         """
         Fetches all registered domains with optional pagination and filtering.
 
@@ -484,11 +626,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_all_domains(page, limit, verified)
+            return await RugCheckManager.shared().fetch_all_domains(page, limit, verified)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch all domains: {e}")
     
-    async def fetch_domains_csv(verified: bool = False):
+    async def fetch_domains_csv(self, verified: bool = False):
         """
         Fetches all registered domains in CSV format.
 
@@ -503,11 +645,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_domains_csv(verified)
+            return await RugCheckManager.shared().fetch_domains_csv(verified)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch domains CSV: {e}")
         
-    async def lookup_domain(domain: str):
+    async def lookup_domain(self, domain: str):
         """
         Looks up a domain by name.
 
@@ -522,11 +664,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.lookup_domain(domain)
+            return await RugCheckManager.shared().lookup_domain(domain)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to lookup domain: {e}")
         
-    async def fetch_domain_records(domain: str) :
+    async def fetch_domain_records(self, domain: str) :
         """
         Fetches all records for a domain.
 
@@ -541,11 +683,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_domain_records(domain)
+            return await RugCheckManager.shared().fetch_domain_records(domain)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch domain records: {e}")
         
-    async def fetch_leaderboard():
+    async def fetch_leaderboard(self):
         """
         Fetches the leaderboard with optional pagination.
 
@@ -561,11 +703,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_leaderboard()
+            return await RugCheckManager.shared().fetch_leaderboard()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch leaderboard: {e}")
         
-    async def fetch_new_tokens():
+    async def fetch_new_tokens(self):
         """
         Fetches new tokens with optional pagination.
 
@@ -581,11 +723,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_new_tokens()
+            return await RugCheckManager.shared().fetch_new_tokens()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch new tokens: {e}")
         
-    async def fetch_most_viewed_tokens():
+    async def fetch_most_viewed_tokens(self):
         """
         Fetches the most viewed tokens with optional pagination.
 
@@ -601,11 +743,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_most_viewed_tokens()
+            return await RugCheckManager.shared().fetch_most_viewed_tokens()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch most viewed tokens: {e}")
         
-    async def fetch_trending_tokens():
+    async def fetch_trending_tokens(self):
         """
         Fetches trending tokens with optional pagination.
 
@@ -621,11 +763,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_trending_tokens()
+            return await RugCheckManager.shared().fetch_trending_tokens()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch trending tokens: {e}")
 
-    async def fetch_recently_verified_tokens():
+    async def fetch_recently_verified_tokens(self):
         """
         Fetches recently verified tokens with optional pagination.
 
@@ -641,11 +783,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_recently_verified_tokens()
+            return await RugCheckManager.shared().fetch_recently_verified_tokens()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch recently verified tokens: {e}")
 
-    async def fetch_token_lp_lockers(token_id: str):
+    async def fetch_token_lp_lockers(self, token_id: str):
         """
         Fetches token LP lockers with optional pagination.
 
@@ -661,11 +803,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_token_lp_lockers(token_id)
+            return await RugCheckManager.shared().fetch_token_lp_lockers(token_id)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch token LP lockers: {e}")
 
-    async def fetch_token_flux_lp_lockers(token_id: str):
+    async def fetch_token_flux_lp_lockers(self, token_id: str):
         """
         Fetches token flux LP lockers with optional pagination.
 
@@ -681,11 +823,11 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_token_flux_lp_lockers(token_id)
+            return await RugCheckManager.shared().fetch_token_flux_lp_lockers(token_id)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch token flux LP lockers: {e}")
         
-    async def fetch_token_votes(mint: str):
+    async def fetch_token_votes(self, mint: str):
         """
         Fetches token votes with optional pagination.
 
@@ -701,7 +843,7 @@ class SolanaAgentKit:
         """
         from agentipy.tools.rugcheck import RugCheckManager
         try:
-            return await RugCheckManager.fetch_token_votes(mint)
+            return await RugCheckManager.shared().fetch_token_votes(mint)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch token votes: {e}")
     
@@ -736,21 +878,21 @@ class SolanaAgentKit:
     async def resolve_name_to_address(self, domain: str):
         from agentipy.tools.use_sns import NameServiceManager
         try:
-            return NameServiceManager.resolve_name_to_address(self, domain)
+            return await _to_thread(NameServiceManager.resolve_name_to_address, self, domain)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def get_favourite_domain(self, owner: str):
         from agentipy.tools.use_sns import NameServiceManager
         try:
-            return NameServiceManager.get_favourite_domain(self, owner)
+            return await _to_thread(NameServiceManager.get_favourite_domain, self, owner)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def get_all_domains_for_owner(self, owner: str):
         from agentipy.tools.use_sns import NameServiceManager
         try:
-            return NameServiceManager.get_all_domains_for_owner(self, owner)
+            return await _to_thread(NameServiceManager.get_all_domains_for_owner, self, owner)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -758,21 +900,21 @@ class SolanaAgentKit:
                                      mint: Optional[str] = None, referrer_key: Optional[str] = None):
         from agentipy.tools.use_sns import NameServiceManager
         try:
-            return NameServiceManager.get_registration_transaction(self, domain, buyer, buyer_token_account, space, mint, referrer_key)
+            return await _to_thread(NameServiceManager.get_registration_transaction, self, domain, buyer, buyer_token_account, space, mint, referrer_key)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
 
     async def deploy_collection(self, name: str, uri: str, royalty_basis_points: int, creator_address: str):
         from agentipy.tools.use_metaplex import DeployCollectionManager
         try:
-            return DeployCollectionManager.deploy_collection(self, name, uri, royalty_basis_points, creator_address)
+            return await _to_thread(DeployCollectionManager.deploy_collection, self, name, uri, royalty_basis_points, creator_address)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def get_metaplex_asset(self, assetId:str):
         from agentipy.tools.use_metaplex import DeployCollectionManager
         try:
-            return DeployCollectionManager.get_metaplex_asset(self, assetId)
+            return await _to_thread(DeployCollectionManager.get_metaplex_asset, self, assetId)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -784,7 +926,7 @@ class SolanaAgentKit:
     after: Union[str, None] = None):
         from agentipy.tools.use_metaplex import DeployCollectionManager
         try:
-            return DeployCollectionManager.get_metaplex_assets_by_creator(self, creator, onlyVerified, sortBy, sortDirection, limit, page, before, after)
+            return await _to_thread(DeployCollectionManager.get_metaplex_assets_by_creator, self, creator, onlyVerified, sortBy, sortDirection, limit, page, before, after)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -796,7 +938,7 @@ class SolanaAgentKit:
     after: Union[str, None] = None):
         from agentipy.tools.use_metaplex import DeployCollectionManager
         try:
-            return DeployCollectionManager.get_metaplex_assets_by_authority(self, authority, sortBy, sortDirection, limit, page, before, after)
+            return await _to_thread(DeployCollectionManager.get_metaplex_assets_by_authority, self, authority, sortBy, sortDirection, limit, page, before, after)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -804,7 +946,7 @@ class SolanaAgentKit:
     share: Union[str, None] = None, recipient: Union[str, None] = None):
         from agentipy.tools.use_metaplex import DeployCollectionManager
         try:
-            return DeployCollectionManager.mint_metaplex_core_nft(self, collectionMint, name, uri, sellerFeeBasisPoints, address, share, recipient)
+            return await _to_thread(DeployCollectionManager.mint_metaplex_core_nft, self, collectionMint, name, uri, sellerFeeBasisPoints, address, share, recipient)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -824,7 +966,7 @@ class SolanaAgentKit:
     dst_chain_token_out_amount: str = "auto"):
         from agentipy.tools.use_debridge import DeBridgeManager   
         try:
-            return DeBridgeManager.create_debridge_transaction(self, src_chain_id, src_chain_token_in, src_chain_token_in_amount, dst_chain_id, dst_chain_token_out, dst_chain_token_out_recipient, src_chain_order_authority_address, dst_chain_order_authority_address, affiliate_fee_percent, affiliate_fee_recipient, prepend_operating_expenses, dst_chain_token_out_amount)
+            return await _to_thread(DeBridgeManager.create_debridge_transaction, self, src_chain_id, src_chain_token_in, src_chain_token_in_amount, dst_chain_id, dst_chain_token_out, dst_chain_token_out_recipient, src_chain_order_authority_address, dst_chain_order_authority_address, affiliate_fee_percent, affiliate_fee_recipient, prepend_operating_expenses, dst_chain_token_out_amount)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
@@ -851,264 +993,371 @@ class SolanaAgentKit:
         tweet_author_username: str):
         from agentipy.tools.use_cybers import CybersManager   
         try:
-            return CybersManager.create_coin(self, name, symbol, image_path, tweet_author_id, tweet_author_username)
+            return await _to_thread(CybersManager.create_coin, self, name, symbol, image_path, tweet_author_id, tweet_author_username)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
 
     async def get_tip_accounts(self):
         from agentipy.tools.use_jito import JitoManager
         try:
-            return JitoManager.get_tip_accounts(self)
+            return await JitoManager.get_tip_accounts(self)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
 
-    async def get_random_tip_account():
+    async def get_random_tip_account(self):
         from agentipy.tools.use_jito import JitoManager
         try:
-            return JitoManager.get_random_tip_account()
+            return await JitoManager.get_random_tip_account(self)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def get_bundle_statuses(self, bundle_uuids):
         from agentipy.tools.use_jito import JitoManager
         try:
-            return JitoManager.get_bundle_statuses(self, bundle_uuids)
+            return await JitoManager.get_bundle_statuses(self, bundle_uuids)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
 
     async def send_bundle(self, params=None):
         from agentipy.tools.use_jito import JitoManager
         try:
-            return JitoManager.send_bundle(self, params)
+            return await JitoManager.send_bundle(self, params)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def get_inflight_bundle_statuses(self, bundle_uuids):
         from agentipy.tools.use_jito import JitoManager
         try:
-            return JitoManager.get_inflight_bundle_statuses(self, bundle_uuids)
+            return await JitoManager.get_inflight_bundle_statuses(self, bundle_uuids)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
         
     async def send_txn(self, params=None, bundleOnly=False):
         from agentipy.tools.use_jito import JitoManager
         try:
-            return JitoManager.send_txn(self, params, bundleOnly)
+            return await JitoManager.send_txn(self, params, bundleOnly)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to {e}")
-    
+
+    async def send_bundle_with_tip(self, transactions: List[Any], tip_lamports: int, wait: bool = False, timeout: float = 30.0):
+        """
+        Sends signed transactions as a Jito bundle, adding a tip paid by the agent's wallet.
+
+        Args:
+            transactions (List): Signed solders Transaction/VersionedTransaction objects (at most 4 when a tip is added).
+            tip_lamports (int): Tip amount; no tip is added if a transaction already pays a tip account.
+            wait (bool): Wait until the bundle lands or fails.
+            timeout (float): Seconds to wait when `wait` is set.
+
+        Returns:
+            dict: The bundle id, and its final in-flight status when waiting.
+        """
+        from agentipy.tools.use_jito import JitoManager
+        try:
+            return await JitoManager.send_bundle_with_tip(self, transactions, tip_lamports, wait, timeout)
+        except Exception as e:
+            raise SolanaAgentKitError(f"Failed to send bundle: {e}")
+
+    async def wait_for_bundles(self, bundle_ids: List[str], timeout: float = 30.0):
+        """
+        Polls Jito in-flight bundle statuses until every bundle has landed or failed.
+
+        Args:
+            bundle_ids (List[str]): Bundle ids returned by `send_bundle`.
+            timeout (float): Seconds to poll before returning the last known statuses.
+
+        Returns:
+            Dict[str, Optional[dict]]: Last in-flight status per bundle id.
+        """
+        from agentipy.tools.use_jito import JitoManager
+        try:
+            return await JitoManager.wait_for_bundles(self, bundle_ids, timeout)
+        except Exception as e:
+            raise SolanaAgentKitError(f"Failed to poll bundle statuses: {e}")
+
+    def get_jito_region_stats(self):
+        """
+        Returns acceptance, landing and latency statistics of the configured Jito regions.
+
+        Returns:
+            Dict[str, dict]: Statistics per region, best-scoring first; empty without `jito_regions`.
+        """
+        from agentipy.tools.use_jito import JitoManager
+        return JitoManager.get_region_stats(self)
+
     async def get_account_balances(self):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_account_balances(self)
+            return await AsyncBackpackManager.for_agent(self).get_account_balances()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch account balances: {e}")
 
 
     async def request_withdrawal(self, address: str, blockchain: str, quantity: str, symbol: str, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.request_withdrawal(self, address, blockchain, quantity, symbol, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).request_withdrawal(address, blockchain, quantity, symbol, **kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to request withdrawal: {e}")
 
 
     async def get_account_settings(self):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_account_settings(self)
+            return await AsyncBackpackManager.for_agent(self).get_account_settings()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch account settings: {e}")
 
 
     async def update_account_settings(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.update_account_settings(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).update_account_settings(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to update account settings: {e}")
 
 
     async def get_borrow_lend_positions(self):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_borrow_lend_positions(self)
+            return await AsyncBackpackManager.for_agent(self).get_borrow_lend_positions()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch borrow/lend positions: {e}")
 
 
     async def execute_borrow_lend(self, quantity: str, side: str, symbol: str):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.execute_borrow_lend(self, quantity, side, symbol)
+            return await AsyncBackpackManager.for_agent(self).execute_borrow_lend(quantity, side, symbol)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to execute borrow/lend operation: {e}")
 
 
     async def get_collateral_info(self, sub_account_id: int = None):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_collateral_info(self, sub_account_id)
+            return await AsyncBackpackManager.for_agent(self).get_collateral_info(sub_account_id)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch collateral information: {e}")
 
 
     async def get_account_deposits(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_account_deposits(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_account_deposits(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch account deposits: {e}")
 
 
     async def get_open_positions(self):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_open_positions(self)
+            return await AsyncBackpackManager.for_agent(self).get_open_positions()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch open positions: {e}")
 
 
     async def get_borrow_history(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_borrow_history(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_borrow_history(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch borrow history: {e}")
 
 
     async def get_interest_history(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_interest_history(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_interest_history(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch interest history: {e}")
 
 
     async def get_fill_history(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_fill_history(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_fill_history(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch fill history: {e}")
 
 
     async def get_borrow_position_history(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_borrow_position_history(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_borrow_position_history(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch borrow position history: {e}")
 
 
     async def get_funding_payments(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_funding_payments(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_funding_payments(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch funding payments: {e}")
 
 
     async def get_order_history(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_order_history(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_order_history(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch order history: {e}")
 
 
     async def get_pnl_history(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_pnl_history(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_pnl_history(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch PNL history: {e}")
 
 
     async def get_settlement_history(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_settlement_history(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_settlement_history(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch settlement history: {e}")
 
+    async def export_backpack_history(self, kind: str, path: Optional[str] = None, **filters):
+        """
+        Exports a complete Backpack account history, walking all pages concurrently.
+
+        Args:
+            kind (str): One of "fills", "orders", "pnl", "funding", "borrows", "interest".
+            path (str, optional): Output file; ".parquet" writes Parquet, anything else CSV.
+                Without a path the history is returned as NumPy arrays.
+            **filters: Filters of the matching BackpackManager history method.
+
+        Returns:
+            Dict[str, np.ndarray] | int: Column arrays, or the number of rows written to `path`.
+        """
+        from agentipy.tools.use_backpack import AsyncBackpackManager
+        from agentipy.utils.backpack.export import BackpackHistoryExporter
+        try:
+            exporter = BackpackHistoryExporter(AsyncBackpackManager.for_agent(self))
+            if path is None:
+                return await exporter.export_arrays(kind, **filters)
+            if path.endswith(".parquet"):
+                return await exporter.export_parquet(kind, path, **filters)
+            return await exporter.export_csv(kind, path, **filters)
+        except Exception as e:
+            raise SolanaAgentKitError(f"Failed to export {kind} history: {e}")
+
 
     async def get_users_open_orders(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_users_open_orders(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_users_open_orders(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch user's open orders: {e}")
 
 
     async def execute_order(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.execute_order(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).execute_order(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to execute order: {e}")
 
 
     async def cancel_open_order(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.cancel_open_order(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).cancel_open_order(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to cancel open order: {e}")
 
+    async def execute_orders(self, orders: List[Dict[str, Any]]):
+        """
+        Places many Backpack orders at once, through the batch order endpoint where available.
+
+        Args:
+            orders (List[dict]): Orders with the keyword arguments of `execute_order`.
+
+        Returns:
+            Dict[int, dict]: Result per client id; failed orders map to `{"error": ...}`.
+        """
+        from agentipy.tools.use_backpack import AsyncBackpackManager
+        try:
+            return await AsyncBackpackManager.for_agent(self).execute_orders(orders)
+        except Exception as e:
+            raise SolanaAgentKitError(f"Failed to execute orders: {e}")
+
+    async def cancel_orders(self, cancels: List[Dict[str, Any]]):
+        """
+        Cancels many Backpack orders concurrently.
+
+        Args:
+            cancels (List[dict]): Each with `symbol` and `client_id` or `order_id`.
+
+        Returns:
+            Dict[int | str, dict]: Result per client id (or order id); failures map to `{"error": ...}`.
+        """
+        from agentipy.tools.use_backpack import AsyncBackpackManager
+        try:
+            return await AsyncBackpackManager.for_agent(self).cancel_orders(cancels)
+        except Exception as e:
+            raise SolanaAgentKitError(f"Failed to cancel orders: {e}")
+
 
     async def get_open_orders(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_open_orders(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_open_orders(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch open orders: {e}")
 
 
     async def cancel_open_orders(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.cancel_open_orders(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).cancel_open_orders(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to cancel open orders: {e}")
 
 
     async def get_supported_assets(self):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_supported_assets(self)
+            return await AsyncBackpackManager.for_agent(self).get_supported_assets()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch supported assets: {e}")
 
 
     async def get_ticker_information(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_ticker_information(self, **kwargs)
+            if self.backpack_stream is not None:
+                ticker = self.backpack_stream.get_ticker(kwargs.get("symbol"))
+                if ticker is not None:
+                    return ticker
+            return await AsyncBackpackManager.for_agent(self).get_ticker_information(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch ticker information: {e}")
 
 
     async def get_markets(self):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_markets(self)
+            return await AsyncBackpackManager.for_agent(self).get_markets()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch markets: {e}")
 
 
     async def get_market(self, **kwargs):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_market(self, **kwargs)
+            return await AsyncBackpackManager.for_agent(self).get_market(**kwargs)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch market: {e}")
 
 
     async def get_tickers(self):
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_tickers(self)
+            return await AsyncBackpackManager.for_agent(self).get_tickers()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch tickers: {e}")
     
@@ -1122,9 +1371,11 @@ class SolanaAgentKit:
         Returns:
             dict: Order book depth.
         """
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_depth(self, symbol)
+            if self.backpack_stream is not None and self.backpack_stream.is_synced(symbol):
+                return self.backpack_stream.get_depth(symbol)
+            return await AsyncBackpackManager.for_agent(self).get_depth(symbol)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch order book depth: {e}")
 
@@ -1142,9 +1393,9 @@ class SolanaAgentKit:
         Returns:
             dict: K-Lines data.
         """
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_klines(self, symbol, interval, start_time, end_time)
+            return await AsyncBackpackManager.for_agent(self).get_klines(symbol, interval, start_time, end_time)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch K-Lines: {e}")
 
@@ -1159,9 +1410,9 @@ class SolanaAgentKit:
         Returns:
             dict: Mark price data.
         """
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_mark_price(self, symbol)
+            return await AsyncBackpackManager.for_agent(self).get_mark_price(symbol)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch mark price: {e}")
 
@@ -1176,9 +1427,9 @@ class SolanaAgentKit:
         Returns:
             dict: Open interest data.
         """
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_open_interest(self, symbol)
+            return await AsyncBackpackManager.for_agent(self).get_open_interest(symbol)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch open interest: {e}")
 
@@ -1195,9 +1446,9 @@ class SolanaAgentKit:
         Returns:
             dict: Funding interval rate data.
         """
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_funding_interval_rates(self, symbol, limit, offset)
+            return await AsyncBackpackManager.for_agent(self).get_funding_interval_rates(symbol, limit, offset)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch funding interval rates: {e}")
 
@@ -1209,9 +1460,9 @@ class SolanaAgentKit:
         Returns:
             dict: System status.
         """
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_status(self)
+            return await AsyncBackpackManager.for_agent(self).get_status()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch system status: {e}")
 
@@ -1223,9 +1474,9 @@ class SolanaAgentKit:
         Returns:
             str: "pong"
         """
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.send_ping(self)
+            return await AsyncBackpackManager.for_agent(self).send_ping()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to send ping: {e}")
 
@@ -1237,9 +1488,9 @@ class SolanaAgentKit:
         Returns:
             str: Current system time.
         """
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_system_time(self)
+            return await AsyncBackpackManager.for_agent(self).get_system_time()
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch system time: {e}")
 
@@ -1255,9 +1506,14 @@ class SolanaAgentKit:
         Returns:
             dict: Recent trade data.
         """
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_recent_trades(self, symbol, limit)
+            if self.backpack_stream is not None:
+                trades = self.backpack_stream.get_recent_trades(symbol, limit)
+                # The stream only knows trades since it started
+                if len(trades) >= limit:
+                    return trades
+            return await AsyncBackpackManager.for_agent(self).get_recent_trades(symbol, limit)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch recent trades: {e}")
 
@@ -1274,9 +1530,9 @@ class SolanaAgentKit:
         Returns:
             dict: Historical trade data.
         """
-        from agentipy.tools.use_backpack import BackpackManager
+        from agentipy.tools.use_backpack import AsyncBackpackManager
         try:
-            return await BackpackManager.get_historical_trades(self, symbol, limit, offset)
+            return await AsyncBackpackManager.for_agent(self).get_historical_trades(symbol, limit, offset)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch historical trades: {e}")
     
@@ -1293,7 +1549,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_adrena import AdrenaTradeManager
-            return await AdrenaTradeManager.close_perp_trade_short(self, price, trade_mint)
+            return await _to_thread(AdrenaTradeManager.close_perp_trade_short, self, price, trade_mint)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to close perp short trade: {e}")
 
@@ -1310,7 +1566,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_adrena import AdrenaTradeManager
-            return await AdrenaTradeManager.close_perp_trade_long(self, price, trade_mint)
+            return await _to_thread(AdrenaTradeManager.close_perp_trade_long, self, price, trade_mint)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to close perp long trade: {e}")
 
@@ -1339,7 +1595,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_adrena import AdrenaTradeManager
-            return await AdrenaTradeManager.open_perp_trade_long(
+            return await _to_thread(AdrenaTradeManager.open_perp_trade_long, 
                 self, price, collateral_amount, collateral_mint, leverage, trade_mint, slippage
             )
         except Exception as e:
@@ -1370,7 +1626,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_adrena import AdrenaTradeManager
-            return await AdrenaTradeManager.open_perp_trade_short(
+            return await _to_thread(AdrenaTradeManager.open_perp_trade_short, 
                 self, price, collateral_amount, collateral_mint, leverage, trade_mint, slippage
             )
         except Exception as e:
@@ -1401,7 +1657,7 @@ class SolanaAgentKit:
         """
         from agentipy.tools.use_3land import ThreeLandManager
         try:
-            return await ThreeLandManager.create_3land_collection(
+            return await _to_thread(ThreeLandManager.create_3land_collection, 
                 self, collection_symbol, collection_name, collection_description, main_image_url, cover_image_url, is_devnet
             )
         except Exception as e:
@@ -1446,7 +1702,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_3land import ThreeLandManager
-            return await ThreeLandManager.create_3land_nft(
+            return await _to_thread(ThreeLandManager.create_3land_nft, 
                 self,
                 item_name,
                 seller_fee,
@@ -1478,7 +1734,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.create_drift_user_account(self, deposit_amount, deposit_symbol)
+            return await _to_thread(DriftManager.create_drift_user_account, self, deposit_amount, deposit_symbol)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to create Drift user account: {e}")
 
@@ -1498,7 +1754,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.deposit_to_drift_user_account(self, amount, symbol, is_repayment)
+            return await _to_thread(DriftManager.deposit_to_drift_user_account, self, amount, symbol, is_repayment)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to deposit to Drift user account: {e}")
 
@@ -1518,7 +1774,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.withdraw_from_drift_user_account(self, amount, symbol, is_borrow)
+            return await _to_thread(DriftManager.withdraw_from_drift_user_account, self, amount, symbol, is_borrow)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to withdraw from Drift user account: {e}")
 
@@ -1540,7 +1796,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.trade_using_drift_perp_account(self, amount, symbol, action, trade_type, price)
+            return await _to_thread(DriftManager.trade_using_drift_perp_account, self, amount, symbol, action, trade_type, price)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to trade using Drift perp account: {e}")
 
@@ -1553,7 +1809,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.check_if_drift_account_exists(self)
+            return await _to_thread(DriftManager.check_if_drift_account_exists, self)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to check Drift account existence: {e}")
 
@@ -1566,7 +1822,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.drift_user_account_info(self)
+            return await _to_thread(DriftManager.drift_user_account_info, self)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch Drift user account info: {e}")
         
@@ -1579,7 +1835,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.get_available_drift_markets(self)
+            return await _to_thread(DriftManager.get_available_drift_markets, self)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch available Drift markets: {e}")
 
@@ -1596,7 +1852,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.stake_to_drift_insurance_fund(self, amount, symbol)
+            return await _to_thread(DriftManager.stake_to_drift_insurance_fund, self, amount, symbol)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to stake to Drift insurance fund: {e}")
 
@@ -1613,7 +1869,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.request_unstake_from_drift_insurance_fund(self, amount, symbol)
+            return await _to_thread(DriftManager.request_unstake_from_drift_insurance_fund, self, amount, symbol)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to request unstake from Drift insurance fund: {e}")
 
@@ -1629,7 +1885,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.unstake_from_drift_insurance_fund(self, symbol)
+            return await _to_thread(DriftManager.unstake_from_drift_insurance_fund, self, symbol)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to unstake from Drift insurance fund: {e}")
 
@@ -1656,7 +1912,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.drift_swap_spot_token(self, from_symbol, to_symbol, slippage, to_amount, from_amount)
+            return await _to_thread(DriftManager.drift_swap_spot_token, self, from_symbol, to_symbol, slippage, to_amount, from_amount)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to swap spot token on Drift: {e}")
 
@@ -1673,7 +1929,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.get_drift_perp_market_funding_rate(self, symbol, period)
+            return await _to_thread(DriftManager.get_drift_perp_market_funding_rate, self, symbol, period)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to get Drift perp market funding rate: {e}")
         
@@ -1691,7 +1947,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.get_drift_entry_quote_of_perp_trade(self, amount, symbol, action)
+            return await _to_thread(DriftManager.get_drift_entry_quote_of_perp_trade, self, amount, symbol, action)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to get Drift entry quote of perp trade: {e}")
 
@@ -1707,7 +1963,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.get_drift_lend_borrow_apy(self, symbol)
+            return await _to_thread(DriftManager.get_drift_lend_borrow_apy, self, symbol)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to get Drift lend/borrow APY: {e}")
 
@@ -1742,7 +1998,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.create_drift_vault(
+            return await _to_thread(DriftManager.create_drift_vault, 
                 self, name, market_name, redeem_period, max_tokens, min_deposit_amount, management_fee, profit_share, hurdle_rate, permissioned
             )
         except Exception as e:
@@ -1761,7 +2017,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.update_drift_vault_delegate(self, vault, delegate_address)
+            return await _to_thread(DriftManager.update_drift_vault_delegate, self, vault, delegate_address)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to update Drift vault delegate: {e}")
 
@@ -1798,7 +2054,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.update_drift_vault(
+            return await _to_thread(DriftManager.update_drift_vault, 
                 self, vault_address, name, market_name, redeem_period, max_tokens, min_deposit_amount, management_fee, profit_share, hurdle_rate, permissioned
             )
         except Exception as e:
@@ -1816,7 +2072,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.get_drift_vault_info(self, vault_name)
+            return await _to_thread(DriftManager.get_drift_vault_info, self, vault_name)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to get Drift vault info: {e}")
         
@@ -1833,7 +2089,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.deposit_into_drift_vault(self, amount, vault)
+            return await _to_thread(DriftManager.deposit_into_drift_vault, self, amount, vault)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to deposit into Drift vault: {e}")
 
@@ -1850,7 +2106,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.request_withdrawal_from_drift_vault(self, amount, vault)
+            return await _to_thread(DriftManager.request_withdrawal_from_drift_vault, self, amount, vault)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to request withdrawal from Drift vault: {e}")
 
@@ -1866,7 +2122,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.withdraw_from_drift_vault(self, vault)
+            return await _to_thread(DriftManager.withdraw_from_drift_vault, self, vault)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to withdraw from Drift vault: {e}")
 
@@ -1882,7 +2138,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.derive_drift_vault_address(self, name)
+            return await _to_thread(DriftManager.derive_drift_vault_address, self, name)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to derive Drift vault address: {e}")
 
@@ -1911,7 +2167,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_drift import DriftManager
-            return await DriftManager.trade_using_delegated_drift_vault(self, vault, amount, symbol, action, trade_type, price)
+            return await _to_thread(DriftManager.trade_using_delegated_drift_vault, self, vault, amount, symbol, action, trade_type, price)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to trade using delegated Drift vault: {e}")
 
@@ -1932,7 +2188,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_flash import FlashTradeManager
-            return await FlashTradeManager.flash_open_trade(self, token, side, collateral_usd, leverage)
+            return await _to_thread(FlashTradeManager.flash_open_trade, self, token, side, collateral_usd, leverage)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to open flash trade: {e}")
 
@@ -1949,7 +2205,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_flash import FlashTradeManager
-            return await FlashTradeManager.flash_close_trade(self, token, side)
+            return await _to_thread(FlashTradeManager.flash_close_trade, self, token, side)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to close flash trade: {e}")
         
@@ -1965,7 +2221,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_alldomains import AllDomainsManager
-            return await AllDomainsManager.resolve_all_domains(self, domain)
+            return await _to_thread(AllDomainsManager.resolve_all_domains, self, domain)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to resolve all domains: {e}")
 
@@ -1981,7 +2237,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_alldomains import AllDomainsManager
-            return await AllDomainsManager.get_owned_domains_for_tld(self, tld)
+            return await _to_thread(AllDomainsManager.get_owned_domains_for_tld, self, tld)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch owned domains: {e}")
 
@@ -1994,7 +2250,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_alldomains import AllDomainsManager
-            return await AllDomainsManager.get_all_domains_tlds(self)
+            return await _to_thread(AllDomainsManager.get_all_domains_tlds, self)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch all domains TLDs: {e}")
 
@@ -2010,7 +2266,7 @@ class SolanaAgentKit:
         """
         try:
             from agentipy.tools.use_alldomains import AllDomainsManager
-            return await AllDomainsManager.get_owned_all_domains(self, owner)
+            return await _to_thread(AllDomainsManager.get_owned_all_domains, self, owner)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch owned all domains: {e}")
         
@@ -2024,7 +2280,7 @@ class SolanaAgentKit:
         should_log: Optional[bool] = False,) -> Optional[List[str]]:
         try:
             from agentipy.tools.use_lightprotocol import LightProtocolManager
-            return await LightProtocolManager.send_compressed_airdrop(self, mint_address, amount, decimals, recipients, priority_fee_in_lamports, should_log)
+            return await _to_thread(LightProtocolManager.send_compressed_airdrop, self, mint_address, amount, decimals, recipients, priority_fee_in_lamports, should_log)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to fetch owned all domains: {e}")
         
@@ -2035,7 +2291,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_manifest import ManifestManager
-            return await ManifestManager.create_market(self, base_mint, quote_mint)
+            return await _to_thread(ManifestManager.create_market, self, base_mint, quote_mint)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to create manifest market: {e}")
         
@@ -2048,7 +2304,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_manifest import ManifestManager
-            return await ManifestManager.place_batch_orders(self, market_id, quantity, side, price)
+            return await _to_thread(ManifestManager.place_batch_orders, self, market_id, quantity, side, price)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to place limit order: {e}")
         
@@ -2059,7 +2315,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_manifest import ManifestManager
-            return await ManifestManager.place_batch_orders(self, market_id, orders)
+            return await _to_thread(ManifestManager.place_batch_orders, self, market_id, orders)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to place batch orders: {e}")
         
@@ -2069,7 +2325,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_manifest import ManifestManager
-            return await ManifestManager.cancel_all_orders(self, market_id)
+            return await _to_thread(ManifestManager.cancel_all_orders, self, market_id)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to cancel all orders: {e}")
         
@@ -2079,7 +2335,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_manifest import ManifestManager
-            return await ManifestManager.withdraw_all(self, market_id)
+            return await _to_thread(ManifestManager.withdraw_all, self, market_id)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to withdraw all: {e}")
             
@@ -2092,7 +2348,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_openpook import OpenBookManager
-            return await OpenBookManager.create_market(self, base_mint, quote_mint, lot_size, tick_size)
+            return await _to_thread(OpenBookManager.create_market, self, base_mint, quote_mint, lot_size, tick_size)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to create openbook market: {e}")
         
@@ -2102,7 +2358,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_orca import OrcaManager
-            return await OrcaManager.close_position(self, position_mint_address)
+            return await _to_thread(OrcaManager.close_position, self, position_mint_address)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to close position: {e}")
         
@@ -2116,7 +2372,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_orca import OrcaManager
-            return await OrcaManager.close_position(self, mint_deploy, mint_pair, initial_price, fee_tier)
+            return await _to_thread(OrcaManager.close_position, self, mint_deploy, mint_pair, initial_price, fee_tier)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to create clmm: {e}")
     
@@ -2131,7 +2387,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_orca import OrcaManager
-            return await OrcaManager.create_liquidity_pool(self, deposit_token_amount, deposit_token_mint, other_token_mint, initial_price, max_price, fee_tier)
+            return await _to_thread(OrcaManager.create_liquidity_pool, self, deposit_token_amount, deposit_token_mint, other_token_mint, initial_price, max_price, fee_tier)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to create liquidity pool: {e}")
     
@@ -2140,7 +2396,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_orca import OrcaManager
-            return await OrcaManager.fetch_positions(self)
+            return await _to_thread(OrcaManager.fetch_positions, self)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to close position: {e}")
     
@@ -2153,7 +2409,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_orca import OrcaManager
-            return await OrcaManager.open_centered_position(self, whirlpool_address, price_offset_bps, input_token_mint, input_amount)
+            return await _to_thread(OrcaManager.open_centered_position, self, whirlpool_address, price_offset_bps, input_token_mint, input_amount)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to open centered position: {e}")
         
@@ -2167,7 +2423,7 @@ class SolanaAgentKit:
         ) -> Optional[Dict[str, Any]]:
         try:
             from agentipy.tools.use_orca import OrcaManager
-            return await OrcaManager.open_single_sided_position(self, whirlpool_address, distance_from_current_price_bps, width_bps, input_token_mint, input_amount)
+            return await _to_thread(OrcaManager.open_single_sided_position, self, whirlpool_address, distance_from_current_price_bps, width_bps, input_token_mint, input_amount)
         except Exception as e:
             raise SolanaAgentKitError(f"Failed to open single sided position: {e}")
 
@@ -2433,7 +2689,7 @@ class SolanaAgentKit:
     
     async def get_price_prediction(self, asset: PriceInferenceToken,
     timeframe: PriceInferenceTimeframe,
-    signature_format: SignatureFormat = SignatureFormat.ETHEREUM_SEPOLIA):
+    signature_format: Optional[SignatureFormat] = None):
         """
         Fetch a future price prediction for BTC or ETH for a given timeframe (5m or 8h) from the Allora Network.
 
@@ -2442,6 +2698,9 @@ class SolanaAgentKit:
         :return: A dictionary containing the predicted price and confidence interval.
         """
         from agentipy.tools.use_allora import AlloraManager
+        if signature_format is None:
+            from allora_sdk.v2.api_client import SignatureFormat
+            signature_format = SignatureFormat.ETHEREUM_SEPOLIA
         try:
             return await AlloraManager.get_price_prediction(self, asset, timeframe, signature_format)
         except Exception as e:
@@ -2882,4 +3141,9 @@ class SolanaAgentKit:
             from agentipy.tools.use_voltr import VoltrManager
             return VoltrManager.withdraw_strategy(self, withdraw_amount, vault, strategy)
         except Exception as e:
-            raise SolanaAgentKitError(f"Failed to withdraw from strategy: {e}")
\ No newline at end of file
+            raise SolanaAgentKitError(f"Failed to withdraw from strategy: {e}")
+
+
+# Record latency, errors, RPC calls and bytes of every facade method
+# (see agentipy.utils.instrumentation.metrics)
+instrument_methods(SolanaAgentKit, "agent")
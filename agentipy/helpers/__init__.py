@@ -1,5 +1,6 @@
 import asyncio
 import platform
+from typing import Any, Dict
 
 
 def fix_asyncio_for_windows():
@@ -52,4 +53,84 @@ def validate_input (data:dict,schema:dict) -> None:
             # Choices validation
             if rules.get("choices") and value not in rules["choices"]:
                 raise ValueError(f"{field} must be one of {rules['choices']}")
-    
+
+
+class InputValidator:
+    """
+    A `validate_input` schema compiled once into a reusable validator.
+
+    The rules of every field are resolved up front, so calling the validator
+    only performs the checks themselves. Error messages match `validate_input`.
+
+    Example:
+        input_validator = compile_schema({"address": {"type": str, "required": True}})
+        input_validator(data)  # raises ValueError when data is invalid
+    """
+
+    __slots__ = ("schema", "_checks")
+
+    def __init__(self, schema: Dict[str, Dict[str, Any]]):
+        self.schema = schema
+        checks = []
+        for field, rules in schema.items():
+            expected = rules["type"]
+            if isinstance(expected, tuple):
+                type_name = " or ".join(t.__name__ for t in expected)
+            else:
+                type_name = expected.__name__
+            choices = rules.get("choices")
+            if choices:
+                try:
+                    choices = frozenset(choices)
+                except TypeError:
+                    # Unhashable choices (e.g. lists or dicts) fall back to equality checks
+                    choices = tuple(choices)
+            checks.append((
+                field,
+                rules.get("required", True),
+                expected,
+                type_name,
+                rules.get("min_length"),
+                rules.get("min"),
+                rules.get("max"),
+                choices or None,
+                rules.get("choices"),
+            ))
+        self._checks = tuple(checks)
+
+    def __call__(self, data: dict) -> None:
+        for field, required, expected, type_name, min_length, minimum, maximum, choices, choices_repr in self._checks:
+            if field not in data:
+                if required:
+                    raise ValueError(f"Missing required field: {field}")
+                continue
+
+            value = data[field]
+            if not isinstance(value, expected):
+                raise ValueError(f"{field} must be of type {type_name}")
+            if min_length is not None and len(value) < min_length:
+                raise ValueError(f"{field} must have minimum length of {min_length}")
+            if isinstance(value, (int, float)):
+                if minimum is not None and value < minimum:
+                    raise ValueError(f"{field} must be greater than {minimum}")
+                if maximum is not None and value > maximum:
+                    raise ValueError(f"{field} must be less than {maximum}")
+            if choices is not None:
+                try:
+                    allowed = value in choices
+                except TypeError:
+                    # An unhashable value cannot be in a frozenset of hashable choices
+                    allowed = False
+                if not allowed:
+                    raise ValueError(f"{field} must be one of {choices_repr}")
+
+
+def compile_schema(schema: Dict[str, Dict[str, Any]]) -> InputValidator:
+    """
+    Compiles a `validate_input` schema into an InputValidator.
+
+    Compile schemas once (at module or class level) for code paths that
+    validate on every call, instead of calling `validate_input` with a
+    schema literal each time.
+    """
+    return InputValidator(schema)
@@ -1,86 +1,156 @@
+import importlib
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional
+
 from agentipy.agent import SolanaAgentKit
-from agentipy.langchain.allora import get_allora_tools
-from agentipy.langchain.backpack import get_backpack_tools
-from agentipy.langchain.coingecko import get_coingecko_tools
-from agentipy.langchain.core import get_all_core_tools
-from agentipy.langchain.curve import get_curve_tools
-from agentipy.langchain.cybersmanager import get_cyber_tools
-from agentipy.langchain.debridge import get_debridge_tools
-from agentipy.langchain.domain import get_domain_tools
-from agentipy.langchain.drift import get_drift_tools
-from agentipy.langchain.elfaai import get_elfaai_tools
-from agentipy.langchain.faucet import get_faucet_tools
-from agentipy.langchain.flash import get_flash_tools
-from agentipy.langchain.fluxbeam import get_fluxbeam_tools
-from agentipy.langchain.gibwork import get_gibwork_tools
-from agentipy.langchain.helius import get_helius_tools
-from agentipy.langchain.jito import get_jito_tools
-from agentipy.langchain.land3 import get_land_tools
-from agentipy.langchain.lightprotocolmanager import get_light_protocol_tools
-from agentipy.langchain.lulo import get_lulo_tools
-from agentipy.langchain.manifest import get_manifest_tools
-from agentipy.langchain.metaplex import get_metaplex_tools
-from agentipy.langchain.meteora import get_meteora_tools
-from agentipy.langchain.moonshot import get_moonshot_tools
-from agentipy.langchain.orca import get_orca_tools
-from agentipy.langchain.perpetual import get_perp_tools
-from agentipy.langchain.pumpfun import get_pumpfun_tools
-from agentipy.langchain.raydium import get_raydium_tools
-from agentipy.langchain.rugcheck import get_rugcheck_tools
-from agentipy.langchain.sendarcade import get_rock_paper_scissors_tools
-from agentipy.langchain.sns import get_sns_tools
-from agentipy.langchain.solayermanager import get_solayer_tools
-from agentipy.langchain.solutiofi import get_solutiofi_tools
-from agentipy.langchain.squads import get_squads_tools
-from agentipy.langchain.stork import get_stork_tools
-from agentipy.langchain.switchboard import get_switchboard_tools
-from agentipy.langchain.tensor import get_tensor_tools
-from agentipy.langchain.tiplink import get_tiplink_tools
-from agentipy.langchain.voltr import get_voltr_tools
+from agentipy.utils.instrumentation import instrument
+
+# Tool providers declared by name with the import path of their factory.
+# Provider modules (and their third-party dependencies) are only imported
+# when the provider is first requested.
+TOOL_PROVIDERS: Dict[str, str] = {
+    "helius": "agentipy.langchain.helius:get_helius_tools",
+    "core": "agentipy.langchain.core:get_all_core_tools",
+    "lulo": "agentipy.langchain.lulo:get_lulo_tools",
+    "flash": "agentipy.langchain.flash:get_flash_tools",
+    "land3": "agentipy.langchain.land3:get_land_tools",
+    "metaplex": "agentipy.langchain.metaplex:get_metaplex_tools",
+    "raydium": "agentipy.langchain.raydium:get_raydium_tools",
+    "pumpfun": "agentipy.langchain.pumpfun:get_pumpfun_tools",
+    "meteora": "agentipy.langchain.meteora:get_meteora_tools",
+    "moonshot": "agentipy.langchain.moonshot:get_moonshot_tools",
+    "fluxbeam": "agentipy.langchain.fluxbeam:get_fluxbeam_tools",
+    "gibwork": "agentipy.langchain.gibwork:get_gibwork_tools",
+    "perpetual": "agentipy.langchain.perpetual:get_perp_tools",
+    "domain": "agentipy.langchain.domain:get_domain_tools",
+    "sns": "agentipy.langchain.sns:get_sns_tools",
+    "coingecko": "agentipy.langchain.coingecko:get_coingecko_tools",
+    "debridge": "agentipy.langchain.debridge:get_debridge_tools",
+    "cybers": "agentipy.langchain.cybersmanager:get_cyber_tools",
+    "faucet": "agentipy.langchain.faucet:get_faucet_tools",
+    "curve": "agentipy.langchain.curve:get_curve_tools",
+    "lightprotocol": "agentipy.langchain.lightprotocolmanager:get_light_protocol_tools",
+    "stork": "agentipy.langchain.stork:get_stork_tools",
+    "backpack": "agentipy.langchain.backpack:get_backpack_tools",
+    "jito": "agentipy.langchain.jito:get_jito_tools",
+    "elfaai": "agentipy.langchain.elfaai:get_elfaai_tools",
+    "drift": "agentipy.langchain.drift:get_drift_tools",
+    "manifest": "agentipy.langchain.manifest:get_manifest_tools",
+    "orca": "agentipy.langchain.orca:get_orca_tools",
+    "rugcheck": "agentipy.langchain.rugcheck:get_rugcheck_tools",
+    "solayer": "agentipy.langchain.solayermanager:get_solayer_tools",
+    "sendarcade": "agentipy.langchain.sendarcade:get_rock_paper_scissors_tools",
+    "allora": "agentipy.langchain.allora:get_allora_tools",
+    "solutiofi": "agentipy.langchain.solutiofi:get_solutiofi_tools",
+    "squads": "agentipy.langchain.squads:get_squads_tools",
+    "switchboard": "agentipy.langchain.switchboard:get_switchboard_tools",
+    "tensor": "agentipy.langchain.tensor:get_tensor_tools",
+    "tiplink": "agentipy.langchain.tiplink:get_tiplink_tools",
+    "voltr": "agentipy.langchain.voltr:get_voltr_tools",
+}
+
+# Tools that only read state (no transactions, orders, or other side effects).
+# MCP BATCH runs consecutive read-only tools concurrently.
+READ_ONLY_TOOLS: FrozenSet[str] = frozenset({
+    # allora
+    "allora_get_all_topics", "allora_get_inference_by_topic_id", "allora_get_price_prediction",
+    # backpack
+    "backpack_get_account_balances", "backpack_get_account_deposits", "backpack_get_account_settings",
+    "backpack_get_borrow_history", "backpack_get_borrow_lend_positions", "backpack_get_borrow_position_history",
+    "backpack_get_collateral_info", "backpack_get_depth", "backpack_get_fill_history",
+    "backpack_get_funding_interval_rates", "backpack_get_funding_payments", "backpack_get_interest_history",
+    "backpack_get_klines", "backpack_get_mark_price", "backpack_get_market", "backpack_get_markets",
+    "backpack_get_open_interest", "backpack_get_open_orders", "backpack_get_open_positions",
+    "backpack_get_order_history", "backpack_get_pnl_history", "backpack_get_settlement_history",
+    "backpack_get_status", "backpack_get_supported_assets", "backpack_get_system_time",
+    "backpack_get_ticker_information", "backpack_get_tickers", "backpack_get_users_open_orders", "backpack_send_ping",
+    # coingecko
+    "coingecko_get_latest_pools", "coingecko_get_token_info", "coingecko_get_token_price_data",
+    "coingecko_get_top_gainers", "coingecko_get_trending_pools", "coingecko_get_trending_tokens",
+    # core
+    "solana_balance", "solana_fetch_price", "solana_fetch_token_detailed_report", "solana_fetch_token_report_summary",
+    "solana_get_tps", "solana_get_wallet_address", "solana_token_data", "solana_token_data_by_ticker",
+    # curve
+    "solana_calculate_pump_curve_price", "solana_get_pump_curve_state",
+    # debridge
+    "debridge_check_transaction_status",
+    # domain / sns
+    "get_all_domains_tlds", "get_owned_all_domains", "get_owned_domains_for_tld", "resolve_all_domains",
+    "solana_sns_get_all_domains", "solana_sns_get_favourite_domain", "solana_sns_resolve",
+    # drift
+    "check_if_drift_account_exists", "derive_drift_vault_address", "drift_user_account_info",
+    "get_available_drift_markets", "get_drift_entry_quote_of_perp_trade", "get_drift_lend_borrow_apy",
+    "get_drift_perp_market_funding_rate", "get_drift_vault_info",
+    # elfaai
+    "elfa_ai_get_api_key_status", "elfa_ai_get_smart_mentions", "elfa_ai_get_smart_twitter_account_stats",
+    "elfa_ai_get_top_mentions_by_ticker", "elfa_ai_get_trending_tokens", "elfa_ai_ping_api",
+    "elfa_ai_search_mentions_by_keywords",
+    # helius
+    "solana_helius_get_active_listings", "solana_helius_get_address_name", "solana_helius_get_all_webhooks",
+    "solana_helius_get_balances", "solana_helius_get_mintlists", "solana_helius_get_nft_events",
+    "solana_helius_get_nft_fingerprint", "solana_helius_get_nft_metadata",
+    "solana_helius_get_parsed_transaction_history", "solana_helius_get_parsed_transactions",
+    "solana_helius_get_raw_transactions", "solana_helius_get_webhook",
+    # jito
+    "get_bundle_statuses", "get_inflight_bundle_statuses", "get_random_tip_account", "get_tip_accounts",
+    # metaplex
+    "solana_get_metaplex_asset", "solana_get_metaplex_assets_by_authority", "solana_get_metaplex_assets_by_creator",
+    # orca
+    "orca_fetch_positions",
+    # rugcheck
+    "rugcheck_fetch_all_domains", "rugcheck_fetch_domain_records", "rugcheck_fetch_domains_csv",
+    "rugcheck_fetch_leaderboard", "rugcheck_fetch_most_viewed_tokens", "rugcheck_fetch_new_tokens",
+    "rugcheck_fetch_recently_verified_tokens", "rugcheck_fetch_token_flux_lp_lockers",
+    "rugcheck_fetch_token_lp_lockers", "rugcheck_fetch_token_votes", "rugcheck_fetch_trending_tokens",
+    "rugcheck_lookup_domain",
+    # stork / switchboard
+    "stork_get_price", "switchboard_simulate_feed",
+    # voltr
+    "voltr_get_position_values",
+})
+
+_loaded_factories: Dict[str, Callable[..., list]] = {}
+
+
+def get_tool_provider(name: str) -> Callable[..., list]:
+    """Resolve the tool factory registered under `name`, importing its module on first use.
+
+    Args:
+        name (str): Provider name as listed in TOOL_PROVIDERS
+
+    Returns:
+        Callable: Factory taking `solana_kit` and returning a list of tools
+
+    Raises:
+        ValueError: If no provider is registered under `name`
+    """
+    factory = _loaded_factories.get(name)
+    if factory is None:
+        if name not in TOOL_PROVIDERS:
+            raise ValueError(f"Unknown tool provider: {name}. Available providers: {', '.join(TOOL_PROVIDERS)}")
+        module_path, attr = TOOL_PROVIDERS[name].split(":")
+        factory = getattr(importlib.import_module(module_path), attr)
+        _loaded_factories[name] = factory
+    return factory
+
+
+def create_solana_tools(solana_kit: SolanaAgentKit, providers: Optional[Iterable[str]] = None) -> List:
+    """Create LangChain tools for the given SolanaAgentKit.
 
+    Args:
+        solana_kit (SolanaAgentKit): The Solana agent kit to initialize tools with
+        providers (Iterable[str], optional): Provider names to include. Defaults to all registered providers.
 
-def create_solana_tools(solana_kit: SolanaAgentKit):
-    return [
-        *get_helius_tools(solana_kit=solana_kit),
-        *get_all_core_tools(solana_kit=solana_kit),
-        *get_lulo_tools(solana_kit=solana_kit),
-        *get_flash_tools(solana_kit=solana_kit),
-        *get_land_tools(solana_kit=solana_kit),
-        *get_metaplex_tools(solana_kit=solana_kit),
-        *get_raydium_tools(solana_kit=solana_kit),
-        *get_pumpfun_tools(solana_kit=solana_kit),
-        *get_meteora_tools(solana_kit=solana_kit),
-        *get_moonshot_tools(solana_kit=solana_kit),
-        *get_fluxbeam_tools(solana_kit=solana_kit),
-        *get_gibwork_tools(solana_kit=solana_kit),
-        *get_perp_tools(solana_kit=solana_kit),
-        *get_domain_tools(solana_kit=solana_kit),
-        *get_sns_tools(solana_kit=solana_kit),
-        *get_coingecko_tools(solana_kit=solana_kit),
-        *get_debridge_tools(solana_kit=solana_kit),
-      
-        *get_cyber_tools(solana_kit=solana_kit),
-        *get_faucet_tools(solana_kit=solana_kit),
-        *get_curve_tools(solana_kit=solana_kit),
-       
-        *get_light_protocol_tools(solana_kit=solana_kit),
-        *get_stork_tools(solana_kit=solana_kit),
-        *get_backpack_tools(solana_kit=solana_kit),
-        *get_jito_tools(solana_kit=solana_kit) ,
-        *get_elfaai_tools(solana_kit=solana_kit),
-        *get_metaplex_tools(solana_kit=solana_kit),
-        *get_debridge_tools(solana_kit=solana_kit),
-        *get_drift_tools(solana_kit=solana_kit),
-        *get_manifest_tools(solana_kit=solana_kit),
-        *get_orca_tools(solana_kit=solana_kit),
-        *get_rugcheck_tools(solana_kit=solana_kit),
-        *get_solayer_tools(solana_kit=solana_kit),
-        *get_rock_paper_scissors_tools(solana_kit=solana_kit),
-        *get_allora_tools(solana_kit=solana_kit),
-        *get_solutiofi_tools(solana_kit=solana_kit),
-        *get_squads_tools(solana_kit=solana_kit),
-        *get_switchboard_tools(solana_kit=solana_kit),
-        *get_tensor_tools(solana_kit=solana_kit),
-        *get_tiplink_tools(solana_kit=solana_kit),
-        *get_voltr_tools(solana_kit=solana_kit),
-    ]   
+    Returns:
+        list: List of initialized Solana tools, without duplicates
+    """
+    tools = []
+    seen = set()
+    for name in dict.fromkeys(providers if providers is not None else TOOL_PROVIDERS):
+        for tool in get_tool_provider(name)(solana_kit=solana_kit):
+            if tool.name in seen:
+                continue
+            seen.add(tool.name)
+            # Wrap the bound method on this instance only; tools are pydantic models, so bypass their __setattr__
+            object.__setattr__(tool, "_arun", instrument(f"langchain.{tool.name}")(tool._arun))
+            tools.append(tool)
+    return tools
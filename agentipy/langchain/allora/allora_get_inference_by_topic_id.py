@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class AlloraGetInferenceByTopicIdTool(BaseTool):
@@ -20,14 +21,14 @@ class AlloraGetInferenceByTopicIdTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "topic_id": {"type": int, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "topic_id": {"type": int, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             inference_data = await self.agent_kit.get_inference_by_topic_id(
                 topic_id=data["topic_id"]
             )
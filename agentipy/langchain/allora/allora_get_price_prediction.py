@@ -1,11 +1,12 @@
 import json
+from typing import ClassVar
 
 from allora_sdk.v2.api_client import (PriceInferenceTimeframe,
                                       PriceInferenceToken, SignatureFormat)
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class AlloraGetPricePredictionTool(BaseTool):
@@ -26,16 +27,16 @@ class AlloraGetPricePredictionTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "asset": {"type": str, "required": True},
+        "timeframe": {"type": str, "required": True},
+        "signature_format": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "asset": {"type": str, "required": True},
-                "timeframe": {"type": str, "required": True},
-                "signature_format": {"type": str, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             price_prediction = await self.agent_kit.get_price_prediction(
                 asset=PriceInferenceToken[data["asset"]],
                 timeframe=PriceInferenceTimeframe[data["timeframe"]],
@@ -23,7 +23,9 @@ from .orders import (
     BackpackExecuteOrderTool,
     BackpackCancelOpenOrderTool,
     BackpackCancelOpenOrdersTool,
-    BackpackGetUsersOpenOrdersTool
+    BackpackGetUsersOpenOrdersTool,
+    BackpackExecuteBatchOrdersTool,
+    BackpackCancelBatchOrdersTool
 )
 from .positions import (
     BackpackGetOpenPositionsTool,
@@ -84,6 +86,8 @@ def get_backpack_tools(solana_kit: SolanaAgentKit):
         BackpackCancelOpenOrderTool(solana_kit=solana_kit),
         BackpackCancelOpenOrdersTool(solana_kit=solana_kit),
         BackpackGetUsersOpenOrdersTool(solana_kit=solana_kit),
+        BackpackExecuteBatchOrdersTool(solana_kit=solana_kit),
+        BackpackCancelBatchOrdersTool(solana_kit=solana_kit),
         
         # Position tools
         BackpackGetOpenPositionsTool(solana_kit=solana_kit),
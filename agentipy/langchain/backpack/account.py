@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class BackpackGetAccountBalancesTool(BaseTool):
     name: str = "backpack_get_account_balances"
@@ -107,14 +108,14 @@ class BackpackGetAccountDepositsTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "sub_account_id": {"type": int, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "sub_account_id": {"type": int, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
 
             sub_account_id = data.get("sub_account_id")
             deposits = await self.solana_kit.get_account_deposits(
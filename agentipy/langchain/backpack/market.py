@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class BackpackGetMarketsTool(BaseTool):
     name: str = "backpack_get_markets"
@@ -110,14 +111,14 @@ class BackpackGetDepthTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "symbol": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "symbol": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             symbol = data["symbol"]
             depth = await self.solana_kit.get_depth(symbol)
@@ -153,16 +154,16 @@ class BackpackGetKlinesTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "symbol": {"type": str, "required": True},
+        "interval": {"type": str, "required": True},
+        "start_time": {"type": int, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "symbol": {"type": str, "required": True},
-                "interval": {"type": str, "required": True},
-                "start_time": {"type": int, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
 
             klines = await self.solana_kit.get_klines(
                 symbol=data["symbol"],
@@ -199,14 +200,14 @@ class BackpackGetMarkPriceTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "symbol": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "symbol": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
 
             symbol = data["symbol"]
             mark_price_data = await self.solana_kit.get_mark_price(symbol)
@@ -239,14 +240,14 @@ class BackpackGetOpenInterestTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "symbol": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "symbol": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
 
             symbol = data["symbol"]
             open_interest = await self.solana_kit.get_open_interest(symbol)
@@ -281,16 +282,16 @@ class BackpackGetFundingIntervalRatesTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "symbol": {"type": str, "required": True},
+        "limit": {"type": int, "required": False},
+        "offset": {"type": int, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "symbol": {"type": str, "required": True},
-                "limit": {"type": int, "required": False},
-                "offset": {"type": int, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
 
             symbol = data["symbol"]
             limit = data.get("limit", 100)
@@ -157,3 +157,67 @@ class BackpackGetUsersOpenOrdersTool(BaseTool):
 
     def _run(self, input: str):
         raise NotImplementedError("This tool only supports async execution via _arun. Please use the async interface.")
+
+class BackpackExecuteBatchOrdersTool(BaseTool):
+    name: str = "backpack_execute_batch_orders"
+    description: str = """
+    Executes several orders at once using the BackpackManager batch order endpoint.
+
+    Input: A JSON string with an "orders" list; each order takes the parameters of
+    backpack_execute_order (order_type, side, symbol, price, quantity, client_id, ...).
+    Output:
+    {
+        "results": "dict, the execution result per client_id",
+        "message": "string, if an error occurs"
+    }
+    """
+    solana_kit: SolanaAgentKit
+
+    async def _arun(self, input: str):
+        try:
+            data = json.loads(input)
+            results = await self.solana_kit.execute_orders(data["orders"])
+            return {
+                "results": results,
+                "message": "Success"
+            }
+        except Exception as e:
+            return {
+                "results": None,
+                "message": f"Error executing batch orders: {str(e)}"
+            }
+
+    def _run(self, input: str):
+        raise NotImplementedError("This tool only supports async execution via _arun. Please use the async interface.")
+
+class BackpackCancelBatchOrdersTool(BaseTool):
+    name: str = "backpack_cancel_batch_orders"
+    description: str = """
+    Cancels several specific orders at once using the BackpackManager.
+
+    Input: A JSON string with a "cancels" list; each entry has "symbol" and
+    "client_id" or "order_id".
+    Output:
+    {
+        "results": "dict, the cancellation result per client_id or order_id",
+        "message": "string, if an error occurs"
+    }
+    """
+    solana_kit: SolanaAgentKit
+
+    async def _arun(self, input: str):
+        try:
+            data = json.loads(input)
+            results = await self.solana_kit.cancel_orders(data["cancels"])
+            return {
+                "results": results,
+                "message": "Success"
+            }
+        except Exception as e:
+            return {
+                "results": None,
+                "message": f"Error canceling batch orders: {str(e)}"
+            }
+
+    def _run(self, input: str):
+        raise NotImplementedError("This tool only supports async execution via _arun. Please use the async interface.")
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class BackpackGetOpenPositionsTool(BaseTool):
     name: str = "backpack_get_open_positions"
@@ -81,16 +82,16 @@ class BackpackExecuteBorrowLendTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "quantity": {"type": str, "required": True},
+        "side": {"type": str, "required": True},
+        "symbol": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "quantity": {"type": str, "required": True},
-                "side": {"type": str, "required": True},
-                "symbol": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             result = await self.solana_kit.execute_borrow_lend(
                 quantity=data["quantity"],
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class BackpackGetStatusTool(BaseTool):
     name: str = "backpack_get_status"
@@ -170,14 +171,14 @@ class BackpackGetCollateralInfoTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "sub_account_id": {"type": int, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "sub_account_id": {"type": int, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
 
             collateral_info = await self.solana_kit.get_collateral_info(
                 sub_account_id=data.get("sub_account_id")
@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
 
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class CoingeckoGetTopGainersTool(BaseTool):
@@ -23,15 +24,15 @@ class CoingeckoGetTopGainersTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "duration": {"type": str, "required": False},
+        "top_coins": {"type": (int, str), "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "duration": {"type": str, "required": False},
-                "top_coins": {"type": (int, str), "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             top_gainers = await self.agent_kit.get_top_gainers(
                 duration=data.get("duration", "24h"),
                 top_coins=data.get("top_coins", "all")
@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class CoingeckoGetLatestPoolsTool(BaseTool):
@@ -52,14 +53,14 @@ class CoingeckoGetTrendingPoolsTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "duration": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "duration": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             trending_pools = await self.agent_kit.get_trending_pools(
                 duration=data.get("duration", "24h")
             )
@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class CoingeckoGetTokenPriceDataTool(BaseTool):
@@ -22,14 +23,14 @@ class CoingeckoGetTokenPriceDataTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "token_addresses": {"type": list, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "token_addresses": {"type": list, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             price_data = await self.agent_kit.get_token_price_data(
                 token_addresses=data["token_addresses"]
             )
@@ -62,14 +63,14 @@ class CoingeckoGetTokenInfoTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "token_address": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "token_address": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             token_info = await self.agent_kit.get_token_info(
                 token_address=data["token_address"]
             )
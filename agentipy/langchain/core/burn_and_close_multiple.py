@@ -1,8 +1,9 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
 
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class SolanaBurnAndCloseMultipleTool(BaseTool):
     name: str = "solana_burn_and_close_multiple_accounts"
@@ -15,14 +16,14 @@ class SolanaBurnAndCloseMultipleTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "token_accounts": {"type": list, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "token_accounts": {"type": list, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             token_accounts = data.get("token_accounts", [])
 
@@ -31,7 +32,7 @@ class SolanaBurnAndCloseMultipleTool(BaseTool):
             return {
                 "status": "success",
                 "message": "Token accounts burned and closed successfully.",
-                "result": result,
+                "result": [entry.model_dump() for entry in result],
             }
         except Exception as e:
             return {
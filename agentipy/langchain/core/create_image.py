@@ -1,7 +1,8 @@
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 import json
+from typing import ClassVar
 
 from agentipy.tools import create_image
 
@@ -18,16 +19,16 @@ class SolanaCreateImageTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "prompt": {"type": str, "required": True},
+        "size": {"type": str, "required": False},
+        "n": {"type": int, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "prompt": {"type": str, "required": True},
-                "size": {"type": str, "required": False},
-                "n": {"type": int, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
            
             prompt = data["prompt"]
             size = data.get("size", "1024x1024")
@@ -1,8 +1,9 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
 
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class SolanaTokenDataTool(BaseTool):
     """
@@ -15,14 +16,14 @@ class SolanaTokenDataTool(BaseTool):
     - mintAddress: string, e.g., "So11111111111111111111111111111111111111112" (required)
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mint_address": {"type": str, "required": True}
+    })
 
     async def call(self, input: str) -> str:
         try:
             data = json.loads(input)
-            schema = {
-                "mint_address": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             mint_address = data["mint_address"]
             token_data = await self.solana_kit.get_token_data_by_address(mint_address)
             return json.dumps({
@@ -53,14 +54,14 @@ class SolanaTokenDataByTickerTool(BaseTool):
     - ticker: string, e.g., "USDC" (required)
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "ticker": {"type": str, "required": True}
+    })
 
     async def call(self, input: str) -> str:
         try:
             data = json.loads(input)
-            schema = {
-                "ticker": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             ticker = data["ticker"]
             token_data = await self.solana_kit.get_token_data_by_ticker(ticker)
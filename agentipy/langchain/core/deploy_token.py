@@ -1,7 +1,8 @@
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
 import json
-from agentipy.helpers import validate_input
+from typing import ClassVar
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaDeployTokenTool(BaseTool):
@@ -14,15 +15,15 @@ class SolanaDeployTokenTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "decimals": {"type": int, "required": True, "min": 0, "max": 9},
+        "initialSupply": {"type": int, "required": True, "min": 1}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "decimals": {"type": int, "required": True, "min": 0, "max": 9},
-                "initialSupply": {"type": int, "required": True, "min": 1}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             decimals = data.get("decimals", 9)
             token_details = await self.solana_kit.deploy_token(decimals)
             return {
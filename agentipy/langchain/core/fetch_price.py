@@ -1,7 +1,8 @@
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 import json
+from typing import ClassVar
 
 class SolanaFetchPriceTool(BaseTool):
     """
@@ -14,14 +15,14 @@ class SolanaFetchPriceTool(BaseTool):
     - tokenId: string, the mint address of the token, e.g., "JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN"
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "token_id": {"type": str, "required": True}
+    })
 
     async def call(self, input: str) -> str:
         try:
             data = json.loads(input)
-            schema = {
-                "token_id": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             token_id = data["token_id"]
             price = await self.solana_kit.fetch_price(token_id)
             return json.dumps({
@@ -1,8 +1,9 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
 
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 
@@ -23,6 +24,9 @@ class SolanaFetchTokenReportSummaryTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mint": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         """
@@ -30,10 +34,7 @@ class SolanaFetchTokenReportSummaryTool(BaseTool):
         """
         try:
             data = json.loads(input)
-            schema = {
-                "mint": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             mint = data["mint"]
             
@@ -73,6 +74,9 @@ class SolanaFetchTokenDetailedReportTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mint": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         """
@@ -80,10 +84,7 @@ class SolanaFetchTokenDetailedReportTool(BaseTool):
         """
         try:
             data = json.loads(input)
-            schema = {
-                "mint": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             mint = data["mint"]
             
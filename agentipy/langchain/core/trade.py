@@ -1,10 +1,11 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 from solders.pubkey import Pubkey  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaTradeTool(BaseTool):
@@ -21,17 +22,17 @@ class SolanaTradeTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "output_mint": {"type": str, "required": True},
+        "input_amount": {"type": int, "required": True, "min": 1},
+        "input_mint": {"type": str, "required": False},
+        "slippage_bps": {"type": int, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "output_mint": {"type": str, "required": True},
-                "input_amount": {"type": int, "required": True, "min": 1},
-                "input_mint": {"type": str, "required": False},
-                "slippage_bps": {"type": int, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             output_mint = Pubkey.from_string(data["output_mint"])
             input_mint = Pubkey.from_string(data["input_mint"]) if "input_mint" in data else None
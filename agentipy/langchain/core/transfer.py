@@ -1,10 +1,11 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 from solders.pubkey import Pubkey  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaTransferTool(BaseTool):
@@ -20,16 +21,16 @@ class SolanaTransferTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({  
+        "to": {"type": str, "required": True},
+        "amount": {"type": int, "required": True, "min": 1},
+        "mint": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {  
-                "to": {"type": str, "required": True},
-                "amount": {"type": int, "required": True, "min": 1},
-                "mint": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             recipient = Pubkey.from_string(data["to"])
             mint_address = data.get("mint") and Pubkey.from_string(data["mint"])
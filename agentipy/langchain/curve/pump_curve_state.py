@@ -1,10 +1,11 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 from solders.pubkey import Pubkey  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaGetPumpCurveStateTool(BaseTool):
@@ -25,15 +26,15 @@ class SolanaGetPumpCurveStateTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "conn": {"type": str, "required": True},
+        "curve_address": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:    
             data = json.loads(input)
-            schema = {
-                "conn": {"type": str, "required": True},
-                "curve_address": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             conn = data["conn"]
             curve_address = data["curve_address"]
@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaCybersCreateCoinTool(BaseTool):
@@ -27,18 +28,18 @@ class SolanaCybersCreateCoinTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "name": {"type": str, "required": True},
+        "symbol": {"type": str, "required": True},
+        "image_path": {"type": str, "required": True},
+        "tweet_author_id": {"type": str, "required": True},
+        "tweet_author_username": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "name": {"type": str, "required": True},
-                "symbol": {"type": str, "required": True},
-                "image_path": {"type": str, "required": True},
-                "tweet_author_id": {"type": str, "required": True},
-                "tweet_author_username": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             name = data["name"]
             symbol = data["symbol"]
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaDeBridgeCheckTransactionStatusTool(BaseTool):
@@ -21,14 +22,14 @@ class SolanaDeBridgeCheckTransactionStatusTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "tx_hash": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "tx_hash": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             tx_hash = data["tx_hash"]
 
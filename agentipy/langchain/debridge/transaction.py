@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaDeBridgeCreateTransactionTool(BaseTool):
@@ -32,25 +33,25 @@ class SolanaDeBridgeCreateTransactionTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "src_chain_id": {"type": str, "required": True},
+        "src_chain_token_in": {"type": str, "required": True},
+        "src_chain_token_in_amount": {"type": str, "required": True},
+        "dst_chain_id": {"type": str, "required": True},
+        "dst_chain_token_out": {"type": str, "required": True},
+        "dst_chain_token_out_recipient": {"type": str, "required": True},
+        "src_chain_order_authority_address": {"type": str, "required": True},
+        "dst_chain_order_authority_address": {"type": str, "required": True},
+        "affiliate_fee_percent": {"type": str, "required": False},
+        "affiliate_fee_recipient": {"type": str, "required": False},
+        "prepend_operating_expenses": {"type": bool, "required": False},
+        "dst_chain_token_out_amount": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "src_chain_id": {"type": str, "required": True},
-                "src_chain_token_in": {"type": str, "required": True},
-                "src_chain_token_in_amount": {"type": str, "required": True},
-                "dst_chain_id": {"type": str, "required": True},
-                "dst_chain_token_out": {"type": str, "required": True},
-                "dst_chain_token_out_recipient": {"type": str, "required": True},
-                "src_chain_order_authority_address": {"type": str, "required": True},
-                "dst_chain_order_authority_address": {"type": str, "required": True},
-                "affiliate_fee_percent": {"type": str, "required": False},
-                "affiliate_fee_recipient": {"type": str, "required": False},
-                "prepend_operating_expenses": {"type": bool, "required": False},
-                "dst_chain_token_out_amount": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             transaction_data = await self.solana_kit.create_debridge_transaction(
                 src_chain_id=data["src_chain_id"],
@@ -98,14 +99,14 @@ class SolanaDeBridgeExecuteTransactionTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "transaction_data": {"type": dict, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "transaction_data": {"type": dict, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             transaction_data = data["transaction_data"]
 
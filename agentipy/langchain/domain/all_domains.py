@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class ResolveAllDomainsTool(BaseTool):
@@ -20,14 +21,14 @@ class ResolveAllDomainsTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "domain": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "domain": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             domain_tld = await self.solana_kit.resolve_all_domains(data["domain"])
             return {"tld": domain_tld, "message": "Success"} if domain_tld else {"message": "Domain resolution failed"}
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class GetOwnedAllDomainsTool(BaseTool):
@@ -20,14 +21,14 @@ class GetOwnedAllDomainsTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "owner": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "owner": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             owned_domains = await self.solana_kit.get_owned_all_domains(data["owner"])
             return {"domains": owned_domains, "message": "Success"} if owned_domains else {"message": "No owned domains found"}
         except Exception as e:
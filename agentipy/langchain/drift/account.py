@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class CreateDriftUserAccountTool(BaseTool):
     name: str = "create_drift_user_account"
@@ -20,15 +21,15 @@ class CreateDriftUserAccountTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "deposit_amount": {"type": float, "required": True},
+        "deposit_symbol": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "deposit_amount": {"type": float, "required": True},
-                "deposit_symbol": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             transaction = await self.solana_kit.create_drift_user_account(
                 deposit_amount=data["deposit_amount"],
                 deposit_symbol=data["deposit_symbol"],
@@ -64,16 +65,16 @@ class DepositToDriftUserAccountTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True},
+        "symbol": {"type": str, "required": True},
+        "is_repayment": {"type": bool, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "amount": {"type": float, "required": True},
-                "symbol": {"type": str, "required": True},
-                "is_repayment": {"type": bool, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             transaction = await self.solana_kit.deposit_to_drift_user_account(
                 amount=data["amount"],
@@ -111,16 +112,16 @@ class WithdrawFromDriftUserAccountTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True},
+        "symbol": {"type": str, "required": True},
+        "is_borrow": {"type": bool, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "amount": {"type": float, "required": True},
-                "symbol": {"type": str, "required": True},
-                "is_borrow": {"type": bool, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
           
             transaction = await self.solana_kit.withdraw_from_drift_user_account(
                 amount=data["amount"],
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class StakeToDriftInsuranceFundTool(BaseTool):
     name: str = "stake_to_drift_insurance_fund"
@@ -20,15 +21,15 @@ class StakeToDriftInsuranceFundTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True},
+        "symbol": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "amount": {"type": float, "required": True},
-                "symbol": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             transaction = await self.solana_kit.stake_to_drift_insurance_fund(
                 amount=data["amount"],
@@ -64,15 +65,15 @@ class RequestUnstakeFromDriftInsuranceFundTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True},
+        "symbol": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "amount": {"type": float, "required": True},
-                "symbol": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
          
             transaction = await self.solana_kit.request_unstake_from_drift_insurance_fund(
                 amount=data["amount"],
@@ -107,14 +108,14 @@ class UnstakeFromDriftInsuranceFundTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "symbol": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "symbol": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
            
             transaction = await self.solana_kit.unstake_from_drift_insurance_fund(
                 symbol=data["symbol"]
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class GetAvailableDriftMarketsTool(BaseTool):
     name: str = "get_available_drift_markets"
@@ -53,18 +54,18 @@ class TradeUsingDriftPerpAccountTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True},
+        "symbol": {"type": str, "required": True},
+        "action": {"type": str, "required": True},
+        "trade_type": {"type": str, "required": True},
+        "price": {"type": float, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "amount": {"type": float, "required": True},
-                "symbol": {"type": str, "required": True},
-                "action": {"type": str, "required": True},
-                "trade_type": {"type": str, "required": True},
-                "price": {"type": float, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             transaction = await self.solana_kit.trade_using_drift_perp_account(
                 amount=data["amount"],
                 symbol=data["symbol"],
@@ -102,15 +103,15 @@ class GetDriftPerpMarketFundingRateTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "symbol": {"type": str, "required": True},
+        "period": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "symbol": {"type": str, "required": True},
-                "period": {"type": str, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)            
+            self.input_validator(data)            
             funding_rate = await self.solana_kit.get_drift_perp_market_funding_rate(
                 symbol=data["symbol"],
                 period=data.get("period", "year"),
@@ -146,16 +147,16 @@ class GetDriftEntryQuoteOfPerpTradeTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True},
+        "symbol": {"type": str, "required": True},
+        "action": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "amount": {"type": float, "required": True},
-                "symbol": {"type": str, "required": True},
-                "action": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             entry_quote = await self.solana_kit.get_drift_entry_quote_of_perp_trade(
                 amount=data["amount"],
                 symbol=data["symbol"],
@@ -194,18 +195,18 @@ class DriftSwapSpotTokenTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "from_symbol": {"type": str, "required": True},
+        "to_symbol": {"type": str, "required": True},
+        "slippage": {"type": float, "required": False},
+        "to_amount": {"type": float, "required": False},
+        "from_amount": {"type": float, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "from_symbol": {"type": str, "required": True},
-                "to_symbol": {"type": str, "required": True},
-                "slippage": {"type": float, "required": False},
-                "to_amount": {"type": float, "required": False},
-                "from_amount": {"type": float, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)           
+            self.input_validator(data)           
             transaction = await self.solana_kit.drift_swap_spot_token(
                 from_symbol=data["from_symbol"],
                 to_symbol=data["to_symbol"],
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class GetDriftLendBorrowApyTool(BaseTool):
     name: str = "get_drift_lend_borrow_apy"
@@ -19,14 +20,14 @@ class GetDriftLendBorrowApyTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "symbol": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "symbol": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
                
             apy_data = await self.solana_kit.get_drift_lend_borrow_apy(
                 symbol=data["symbol"]
@@ -68,22 +69,22 @@ class CreateDriftVaultTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "name": {"type": str, "required": True},
+        "market_name": {"type": str, "required": True},
+        "redeem_period": {"type": int, "required": True},
+        "max_tokens": {"type": int, "required": True},
+        "min_deposit_amount": {"type": float, "required": True},
+        "management_fee": {"type": float, "required": True},
+        "profit_share": {"type": float, "required": True},
+        "hurdle_rate": {"type": float, "required": False},
+        "permissioned": {"type": bool, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "name": {"type": str, "required": True},
-                "market_name": {"type": str, "required": True},
-                "redeem_period": {"type": int, "required": True},
-                "max_tokens": {"type": int, "required": True},
-                "min_deposit_amount": {"type": float, "required": True},
-                "management_fee": {"type": float, "required": True},
-                "profit_share": {"type": float, "required": True},
-                "hurdle_rate": {"type": float, "required": False},
-                "permissioned": {"type": bool, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             vault_details = await self.solana_kit.create_drift_vault(
                 name=data["name"],
@@ -126,15 +127,15 @@ class UpdateDriftVaultDelegateTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "vault": {"type": str, "required": True},
+        "delegate_address": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "vault": {"type": str, "required": True},
-                "delegate_address": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             transaction = await self.solana_kit.update_drift_vault_delegate(
                 vault=data["vault"],
@@ -178,23 +179,23 @@ class UpdateDriftVaultTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "vault_address": {"type": str, "required": True},
+        "name": {"type": str, "required": True},
+        "market_name": {"type": str, "required": True},
+        "redeem_period": {"type": int, "required": True},
+        "max_tokens": {"type": int, "required": True},
+        "min_deposit_amount": {"type": float, "required": True},
+        "management_fee": {"type": float, "required": True},
+        "profit_share": {"type": float, "required": True},
+        "hurdle_rate": {"type": float, "required": False},
+        "permissioned": {"type": bool, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "vault_address": {"type": str, "required": True},
-                "name": {"type": str, "required": True},
-                "market_name": {"type": str, "required": True},
-                "redeem_period": {"type": int, "required": True},
-                "max_tokens": {"type": int, "required": True},
-                "min_deposit_amount": {"type": float, "required": True},
-                "management_fee": {"type": float, "required": True},
-                "profit_share": {"type": float, "required": True},
-                "hurdle_rate": {"type": float, "required": False},
-                "permissioned": {"type": bool, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             vault_update = await self.solana_kit.update_drift_vault(
                 vault_address=data["vault_address"],
@@ -237,14 +238,14 @@ class GetDriftVaultInfoTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "vault_name": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "vault_name": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             vault_info = await self.solana_kit.get_drift_vault_info(
                 vault_name=data["vault_name"]
@@ -279,15 +280,15 @@ class DepositIntoDriftVaultTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True},
+        "vault": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "amount": {"type": float, "required": True},
-                "vault": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             transaction = await self.solana_kit.deposit_into_drift_vault(
                 amount=data["amount"],
@@ -323,15 +324,15 @@ class RequestWithdrawalFromDriftVaultTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True},
+        "vault": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:    
-            schema = {
-                "amount": {"type": float, "required": True},
-                "vault": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             transaction = await self.solana_kit.request_withdrawal_from_drift_vault(
                 amount=data["amount"],
@@ -366,14 +367,14 @@ class WithdrawFromDriftVaultTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "vault": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "vault": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             transaction = await self.solana_kit.withdraw_from_drift_vault(
                 vault=data["vault"]
@@ -407,14 +408,14 @@ class DeriveDriftVaultAddressTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "name": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "name": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             vault_address = await self.solana_kit.derive_drift_vault_address(
                 name=data["name"]
@@ -453,19 +454,19 @@ class TradeUsingDelegatedDriftVaultTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "vault": {"type": str, "required": True},
+        "amount": {"type": float, "required": True},
+        "symbol": {"type": str, "required": True},
+        "action": {"type": str, "required": True},
+        "trade_type": {"type": str, "required": True},
+        "price": {"type": float, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "vault": {"type": str, "required": True},
-                "amount": {"type": float, "required": True},
-                "symbol": {"type": str, "required": True},
-                "action": {"type": str, "required": True},
-                "trade_type": {"type": str, "required": True},
-                "price": {"type": float, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             
             transaction = await self.solana_kit.trade_using_delegated_drift_vault(
                 vault=data["vault"],
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class ElfaAiGetSmartMentionsTool(BaseTool):
@@ -21,15 +22,15 @@ class ElfaAiGetSmartMentionsTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "limit": {"type": int, "required": False},
+        "offset": {"type": int, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "limit": {"type": int, "required": False},
-                "offset": {"type": int, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             mentions_data = await self.agent_kit.get_smart_mentions(
                 limit=data.get("limit", 100),
                 offset=data.get("offset", 0)
@@ -68,18 +69,18 @@ class ElfaAiGetTopMentionsByTickerTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "ticker": {"type": str, "required": True},
+        "time_window": {"type": str, "required": False},
+        "page": {"type": int, "required": False},
+        "page_size": {"type": int, "required": False},
+        "include_account_details": {"type": bool, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "ticker": {"type": str, "required": True},
-                "time_window": {"type": str, "required": False},
-                "page": {"type": int, "required": False},
-                "page_size": {"type": int, "required": False},
-                "include_account_details": {"type": bool, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             mentions_data = await self.agent_kit.get_top_mentions_by_ticker(
                 ticker=data["ticker"],
                 time_window=data.get("time_window", "1h"),
@@ -121,18 +122,18 @@ class ElfaAiSearchMentionsByKeywordsTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "keywords": {"type": str, "required": True},
+        "from_timestamp": {"type": int, "required": True},
+        "to_timestamp": {"type": int, "required": True},
+        "limit": {"type": int, "required": False},
+        "cursor": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "keywords": {"type": str, "required": True},
-                "from_timestamp": {"type": int, "required": True},
-                "to_timestamp": {"type": int, "required": True},
-                "limit": {"type": int, "required": False},
-                "cursor": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             search_results = await self.agent_kit.search_mentions_by_keywords(
                 keywords=data["keywords"],
                 from_timestamp=data["from_timestamp"],
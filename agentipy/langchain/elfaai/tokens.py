@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class ElfaAiGetTrendingTokensTool(BaseTool):
@@ -23,17 +24,17 @@ class ElfaAiGetTrendingTokensTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "time_window": {"type": str, "required": False},
+        "page": {"type": int, "required": False},
+        "page_size": {"type": int, "required": False},
+        "min_mentions": {"type": int, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "time_window": {"type": str, "required": False},
-                "page": {"type": int, "required": False},
-                "page_size": {"type": int, "required": False},
-                "min_mentions": {"type": int, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             trending_tokens = await self.agent_kit.get_trending_tokens_using_elfa_ai(
                 time_window=data.get("time_window", "24h"),
                 page=data.get("page", 1),
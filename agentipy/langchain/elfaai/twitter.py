@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class ElfaAiGetSmartTwitterAccountStatsTool(BaseTool):
@@ -20,14 +21,14 @@ class ElfaAiGetSmartTwitterAccountStatsTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "username": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "username": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             account_stats = await self.agent_kit.get_smart_twitter_account_stats(
                 username=data["username"]
             )
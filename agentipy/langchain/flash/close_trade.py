@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class FlashCloseTradeTool(BaseTool):
@@ -21,15 +22,15 @@ class FlashCloseTradeTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "token": {"type": str, "required": True},
+        "side": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "token": {"type": str, "required": True},
-                "side": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)         
+            self.input_validator(data)         
             transaction = await self.solana_kit.flash_close_trade(
                 token=data["token"],
                 side=data["side"]
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 from solders.pubkey import Pubkey # type: ignore
 
 
@@ -24,17 +25,17 @@ class FluxBeamCreatePoolTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "token_a": {"type": str, "required": True},
+        "token_a_amount": {"type": float, "required": True},
+        "token_b": {"type": str, "required": True},
+        "token_b_amount": {"type": float, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "token_a": {"type": str, "required": True},
-                "token_a_amount": {"type": float, "required": True},
-                "token_b": {"type": str, "required": True},
-                "token_b_amount": {"type": float, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             transaction_signature = await self.agent_kit.fluxbeam_create_pool(
                 token_a=Pubkey.from_string(data["token_a"]),
                 token_a_amount=data["token_a_amount"],
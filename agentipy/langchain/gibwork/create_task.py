@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 from solders.pubkey import Pubkey # type: ignore
 
 
@@ -21,19 +22,19 @@ class SolanaCreateGibworkTaskTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "title": {"type": str, "required": True},
+        "content": {"type": str, "required": True},
+        "requirements": {"type": str, "required": True},
+        "tags": {"type": list, "required": True},
+        "token_mint_address": {"type": str, "required": True},
+        "token_amount": {"type": int, "required": True, "min": 1}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "title": {"type": str, "required": True},
-                "content": {"type": str, "required": True},
-                "requirements": {"type": str, "required": True},
-                "tags": {"type": list, "required": True},
-                "token_mint_address": {"type": str, "required": True},
-                "token_amount": {"type": int, "required": True, "min": 1}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             title = data["title"]
             content = data["content"]
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class SolanaHeliusGetActiveListingsTool(BaseTool):
     name: str = "solana_helius_get_active_listings"
@@ -23,18 +24,18 @@ class SolanaHeliusGetActiveListingsTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "first_verified_creators": {"type": list, "required": True},
+        "verified_collection_addresses": {"type": list, "required": False},
+        "marketplaces": {"type": list, "required": False},
+        "limit": {"type": int, "required": False},
+        "pagination_token": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "first_verified_creators": {"type": list, "required": True},
-                "verified_collection_addresses": {"type": list, "required": False},
-                "marketplaces": {"type": list, "required": False},
-                "limit": {"type": int, "required": False},
-                "pagination_token": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             result = await self.solana_kit.get_active_listings(
                 first_verified_creators=data["first_verified_creators"],
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class SolanaHeliusGetMintlistsTool(BaseTool):
     name: str = "solana_helius_get_mintlists"
@@ -23,17 +24,17 @@ class SolanaHeliusGetMintlistsTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "first_verified_creators": {"type": list, "required": True},
+        "verified_collection_addresses": {"type": list, "required": False},
+        "limit": {"type": int, "required": False},
+        "pagination_token": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "first_verified_creators": {"type": list, "required": True},
-                "verified_collection_addresses": {"type": list, "required": False},
-                "limit": {"type": int, "required": False},
-                "pagination_token": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             result = await self.solana_kit.get_mintlists(
                 first_verified_creators=data["first_verified_creators"],
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaHeliusGetNftEventsTool(BaseTool):
@@ -32,25 +33,25 @@ class SolanaHeliusGetNftEventsTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "accounts": {"type": list, "required": True},
+        "types": {"type": list, "required": False},
+        "sources": {"type": list, "required": False},
+        "start_slot": {"type": int, "required": False},
+        "end_slot": {"type": int, "required": False},
+        "start_time": {"type": int, "required": False},
+        "end_time": {"type": int, "required": False},
+        "first_verified_creator": {"type": list, "required": False},
+        "verified_collection_address": {"type": list, "required": False},
+        "limit": {"type": int, "required": False},
+        "sort_order": {"type": str, "required": False},
+        "pagination_token": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "accounts": {"type": list, "required": True},
-                "types": {"type": list, "required": False},
-                "sources": {"type": list, "required": False},
-                "start_slot": {"type": int, "required": False},
-                "end_slot": {"type": int, "required": False},
-                "start_time": {"type": int, "required": False},
-                "end_time": {"type": int, "required": False},
-                "first_verified_creator": {"type": list, "required": False},
-                "verified_collection_address": {"type": list, "required": False},
-                "limit": {"type": int, "required": False},
-                "sort_order": {"type": str, "required": False},
-                "pagination_token": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             accounts = data["accounts"]
             types = data.get("types")
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaHeliusGetNFTFingerprintTool(BaseTool):
@@ -20,14 +21,14 @@ class SolanaHeliusGetNFTFingerprintTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mints": {"type": list, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:    
             data = json.loads(input)
-            schema = {
-                "mints": {"type": list, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             mints = data["mints"]
 
             result = await self.solana_kit.get_nft_fingerprint(mints)
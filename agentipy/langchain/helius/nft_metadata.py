@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaHeliusGetNFTMetadataTool(BaseTool):
@@ -20,14 +21,14 @@ class SolanaHeliusGetNFTMetadataTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mint_addresses": {"type": list, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "mint_addresses": {"type": list, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             mint_addresses = data["mint_addresses"]
 
             result = await self.solana_kit.get_nft_metadata(mint_addresses)
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class SolanaHeliusGetParsedTransactionHistoryTool(BaseTool):
     name: str = "solana_helius_get_parsed_transaction_history"
@@ -24,19 +25,19 @@ class SolanaHeliusGetParsedTransactionHistoryTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "address": {"type": str, "required": True},
+        "before": {"type": str, "required": False},
+        "until": {"type": str, "required": False},
+        "commitment": {"type": str, "required": False},
+        "source": {"type": str, "required": False},
+        "type": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "address": {"type": str, "required": True},
-                "before": {"type": str, "required": False},
-                "until": {"type": str, "required": False},
-                "commitment": {"type": str, "required": False},
-                "source": {"type": str, "required": False},
-                "type": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             address = data["address"]
             before = data.get("before", "")
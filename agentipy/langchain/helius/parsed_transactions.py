@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class SolanaHeliusGetParsedTransactionsTool(BaseTool):
     name: str = "solana_helius_get_parsed_transactions"
@@ -20,15 +21,15 @@ class SolanaHeliusGetParsedTransactionsTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "signatures": {"type": list, "required": True},
+        "commitment": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "signatures": {"type": list, "required": True},
-                "commitment": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             signatures = data["signatures"]
             commitment = data.get("commitment")
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class SolanaHeliusGetRawTransactionsTool(BaseTool):
     name: str = "solana_helius_get_raw_transactions"
@@ -26,21 +27,21 @@ class SolanaHeliusGetRawTransactionsTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "signatures": {"type": list, "required": True},
+        "start_slot": {"type": int, "required": False},
+        "end_slot": {"type": int, "required": False},
+        "start_time": {"type": int, "required": False},
+        "end_time": {"type": int, "required": False},
+        "limit": {"type": int, "required": False},
+        "sort_order": {"type": str, "required": False},
+        "pagination_token": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "signatures": {"type": list, "required": True},
-                "start_slot": {"type": int, "required": False},
-                "end_slot": {"type": int, "required": False},
-                "start_time": {"type": int, "required": False},
-                "end_time": {"type": int, "required": False},
-                "limit": {"type": int, "required": False},
-                "sort_order": {"type": str, "required": False},
-                "pagination_token": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             signatures = data["signatures"]
             start_slot = data.get("start_slot")
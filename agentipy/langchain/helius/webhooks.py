@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaHeliusCreateWebhookTool(BaseTool):
@@ -26,18 +27,18 @@ class SolanaHeliusCreateWebhookTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "webhook_url": {"type": str, "required": True},
+        "transaction_types": {"type": list, "required": True},
+        "account_addresses": {"type": list, "required": True},
+        "webhook_type": {"type": str, "required": True},
+        "auth_header": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "webhook_url": {"type": str, "required": True},
-                "transaction_types": {"type": list, "required": True},
-                "account_addresses": {"type": list, "required": True},
-                "webhook_type": {"type": str, "required": True},
-                "auth_header": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             webhook_url = data["webhook_url"]
             transaction_types = data["transaction_types"]
@@ -116,14 +117,14 @@ class SolanaHeliusGetWebhookTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "webhook_id": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "webhook_id": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             webhook_id = data["webhook_id"]
             result = await self.solana_kit.get_webhook(webhook_id)
             return {
@@ -164,18 +165,18 @@ class SolanaHeliusEditWebhookTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "webhook_id": {"type": str, "required": True},
+        "webhook_url": {"type": str, "required": True},
+        "transaction_types": {"type": list, "required": True},
+        "account_addresses": {"type": list, "required": True},
+        "webhook_type": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "webhook_id": {"type": str, "required": True},
-                "webhook_url": {"type": str, "required": True},
-                "transaction_types": {"type": list, "required": True},
-                "account_addresses": {"type": list, "required": True},
-                "webhook_type": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
          
             webhook_id = data["webhook_id"]
             webhook_url = data["webhook_url"]
@@ -221,14 +222,14 @@ class SolanaHeliusDeleteWebhookTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "webhook_id": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "webhook_id": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             webhook_id = data["webhook_id"] 
             result = await self.solana_kit.delete_webhook(webhook_id)
             return {
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class SolanaGetBundleStatuses(BaseTool):
     name: str = "get_bundle_statuses"
@@ -19,14 +20,14 @@ class SolanaGetBundleStatuses(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "bundle_uuids": {"type": list, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "bundle_uuids": {"type": list, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             bundle_uuids = data["bundle_uuids"]
             result = await self.solana_kit.get_bundle_statuses(bundle_uuids)
@@ -59,14 +60,14 @@ class SolanaSendBundle(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "txn_signatures": {"type": list, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "txn_signatures": {"type": list, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             txn_signatures = data["txn_signatures"]
             result = await self.solana_kit.send_bundle(txn_signatures)
@@ -99,14 +100,14 @@ class SolanaGetInflightBundleStatuses(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "bundle_uuids": {"type": list, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "bundle_uuids": {"type": list, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             bundle_uuids = data["bundle_uuids"]
             result = await self.solana_kit.get_inflight_bundle_statuses(bundle_uuids)
@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaSendTxn(BaseTool):
@@ -23,15 +24,15 @@ class SolanaSendTxn(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "txn_signature": {"type": str, "required": True},
+        "bundleOnly": {"type": bool, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "txn_signature": {"type": str, "required": True},
-                "bundleOnly": {"type": bool, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             txn_signature = data["txn_signature"]
             bundleOnly = data["bundleOnly"]
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class Create3LandCollectionTool(BaseTool):
@@ -25,19 +26,19 @@ class Create3LandCollectionTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "collection_symbol": {"type": str, "required": True},
+        "collection_name": {"type": str, "required": True},
+        "collection_description": {"type": str, "required": True},
+        "main_image_url": {"type": str, "required": False},
+        "cover_image_url": {"type": str, "required": False},
+        "is_devnet": {"type": bool, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "collection_symbol": {"type": str, "required": True},
-                "collection_name": {"type": str, "required": True},
-                "collection_description": {"type": str, "required": True},
-                "main_image_url": {"type": str, "required": False},
-                "cover_image_url": {"type": str, "required": False},
-                "is_devnet": {"type": bool, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
 
             
             
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class Create3LandNFTTool(BaseTool):
@@ -32,26 +33,26 @@ class Create3LandNFTTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "item_name": {"type": str, "required": True},
+        "seller_fee": {"type": float, "required": True},
+        "item_amount": {"type": int, "required": True},
+        "item_symbol": {"type": str, "required": True},
+        "item_description": {"type": str, "required": True},
+        "traits": {"type": str, "required": True},
+        "price": {"type": float, "required": False},
+        "main_image_url": {"type": str, "required": False},
+        "cover_image_url": {"type": str, "required": False},
+        "spl_hash": {"type": str, "required": False},
+        "pool_name": {"type": str, "required": False},
+        "is_devnet": {"type": bool, "required": False},
+        "with_pool": {"type": bool, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "item_name": {"type": str, "required": True},
-                "seller_fee": {"type": float, "required": True},
-                "item_amount": {"type": int, "required": True},
-                "item_symbol": {"type": str, "required": True},
-                "item_description": {"type": str, "required": True},
-                "traits": {"type": str, "required": True},
-                "price": {"type": float, "required": False},
-                "main_image_url": {"type": str, "required": False},
-                "cover_image_url": {"type": str, "required": False},
-                "spl_hash": {"type": str, "required": False},
-                "pool_name": {"type": str, "required": False},
-                "is_devnet": {"type": bool, "required": False},
-                "with_pool": {"type": bool, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
 
            
             
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class LightProtocolSendCompressedAirdropTool(BaseTool):
@@ -25,19 +26,19 @@ class LightProtocolSendCompressedAirdropTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mint_address": {"type": str, "required": True},
+        "amount": {"type": float, "required": True},
+        "decimals": {"type": int, "required": True},
+        "recipients": {"type": list, "required": True},
+        "priority_fee_in_lamports": {"type": int, "required": True},
+        "should_log": {"type": bool, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "mint_address": {"type": str, "required": True},
-                "amount": {"type": float, "required": True},
-                "decimals": {"type": int, "required": True},
-                "recipients": {"type": list, "required": True},
-                "priority_fee_in_lamports": {"type": int, "required": True},
-                "should_log": {"type": bool, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             
             transaction_ids = await self.solana_kit.send_compressed_airdrop(
                 mint_address=data["mint_address"],
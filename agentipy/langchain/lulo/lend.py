@@ -1,10 +1,11 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 from solders.pubkey import Pubkey  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class LuloLendTool(BaseTool):
@@ -24,15 +25,15 @@ class LuloLendTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mint_address": {"type": str, "required": True},
+        "amount": {"type": float, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "mint_address": {"type": str, "required": True},
-                "amount": {"type": float, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             transaction_signature = await self.agent_kit.lulo_lend(
                 mint_address=Pubkey.from_string(data["mint_address"]),
                 amount=data["amount"]
@@ -66,14 +67,14 @@ class LuloLendAssetsTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "amount": {"type": float, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             transaction_signature = await self.agent_kit.lend_assets(
                 amount=data["amount"]
             )
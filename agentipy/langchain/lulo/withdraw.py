@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 from solders.pubkey import Pubkey # type: ignore
 
 
@@ -22,15 +23,15 @@ class LuloWithdrawTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mint_address": {"type": str, "required": True},
+        "amount": {"type": float, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "mint_address": {"type": str, "required": True},
-                "amount": {"type": float, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             transaction_signature = await self.agent_kit.lulo_withdraw(
                 mint_address=Pubkey.from_string(data["mint_address"]),
                 amount=data["amount"]
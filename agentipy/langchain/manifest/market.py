@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class ManifestWithdrawAllTool(BaseTool):
@@ -22,14 +23,14 @@ class ManifestWithdrawAllTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "market_id": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "market_id": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             withdrawal_result = await self.solana_kit.withdraw_all(
                 market_id=data["market_id"]
             )
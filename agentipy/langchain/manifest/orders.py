@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class ManifestCreateMarketTool(BaseTool):
@@ -23,15 +24,15 @@ class ManifestCreateMarketTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "base_mint": {"type": str, "required": True},
+        "quote_mint": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "base_mint": {"type": str, "required": True},
-                "quote_mint": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             market_data = await self.solana_kit.create_manifest_market(
                 base_mint=data["base_mint"],
                 quote_mint=data["quote_mint"]
@@ -68,17 +69,17 @@ class ManifestPlaceLimitOrderTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "market_id": {"type": str, "required": True},
+        "quantity": {"type": float, "required": True},
+        "side": {"type": str, "required": True},
+        "price": {"type": float, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "market_id": {"type": str, "required": True},
-                "quantity": {"type": float, "required": True},
-                "side": {"type": str, "required": True},
-                "price": {"type": float, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             order_details = await self.solana_kit.place_limit_order(
                 market_id=data["market_id"],
                 quantity=data["quantity"],
@@ -115,15 +116,15 @@ class ManifestPlaceBatchOrdersTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "market_id": {"type": str, "required": True},
+        "orders": {"type": list, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "market_id": {"type": str, "required": True},
-                "orders": {"type": list, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             batch_order_details = await self.solana_kit.place_batch_orders(
                 market_id=data["market_id"],
                 orders=data["orders"]
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 
@@ -28,19 +29,19 @@ class SolanaGetMetaplexAssetsByCreatorTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "creator": {"type": str, "required": True},
+        "only_verified": {"type": bool, "required": False},
+        "sort_by": {"type": str, "required": False},
+        "sort_direction": {"type": str, "required": False},
+        "limit": {"type": int, "required": False, "min": 1},
+        "page": {"type": int, "required": False, "min": 1}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "creator": {"type": str, "required": True},
-                "only_verified": {"type": bool, "required": False},
-                "sort_by": {"type": str, "required": False},
-                "sort_direction": {"type": str, "required": False},
-                "limit": {"type": int, "required": False, "min": 1},
-                "page": {"type": int, "required": False, "min": 1}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             creator = data["creator"]
             only_verified = data.get("only_verified", False)
@@ -86,18 +87,18 @@ class SolanaGetMetaplexAssetsByAuthorityTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "authority": {"type": str, "required": True},
+        "sort_by": {"type": str, "required": False},
+        "sort_direction": {"type": str, "required": False},
+        "limit": {"type": int, "required": False, "min": 1},
+        "page": {"type": int, "required": False, "min": 1}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "authority": {"type": str, "required": True},
-                "sort_by": {"type": str, "required": False},
-                "sort_direction": {"type": str, "required": False},
-                "limit": {"type": int, "required": False, "min": 1},
-                "page": {"type": int, "required": False, "min": 1}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             authority = data["authority"]
             sort_by = data.get("sort_by")
@@ -140,17 +141,17 @@ class SolanaDeployCollectionTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "name": {"type": str, "required": True},
+        "uri": {"type": str, "required": True},
+        "royalty_basis_points": {"type": int, "required": True, "min": 0, "max": 10000},
+        "creator_address": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "name": {"type": str, "required": True},
-                "uri": {"type": str, "required": True},
-                "royalty_basis_points": {"type": int, "required": True, "min": 0, "max": 10000},
-                "creator_address": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             name = data["name"]
             uri = data["uri"]
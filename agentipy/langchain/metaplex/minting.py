@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class SolanaMintMetaplexCoreNFTTool(BaseTool):
     name: str = "solana_mint_metaplex_core_nft"
@@ -27,20 +28,20 @@ class SolanaMintMetaplexCoreNFTTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "collection_mint": {"type": str, "required": True},
+        "name": {"type": str, "required": True},
+        "uri": {"type": str, "required": True},
+        "seller_fee_basis_points": {"type": int, "required": True, "min": 0, "max": 10000},
+        "address": {"type": str, "required": True},
+        "share": {"type": str, "required": True},
+        "recipient": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "collection_mint": {"type": str, "required": True},
-                "name": {"type": str, "required": True},
-                "uri": {"type": str, "required": True},
-                "seller_fee_basis_points": {"type": int, "required": True, "min": 0, "max": 10000},
-                "address": {"type": str, "required": True},
-                "share": {"type": str, "required": True},
-                "recipient": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             collection_mint = data["collection_mint"]
             name = data["name"]
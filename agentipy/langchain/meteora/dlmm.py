@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 from agentipy.utils.meteora_dlmm.types import ActivationType
 
 
@@ -29,22 +30,22 @@ class SolanaMeteoraDLMMTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "bin_step": {"type": int, "required": True},
+        "token_a_mint": {"type": str, "required": True},
+        "token_b_mint": {"type": str, "required": True},
+        "initial_price": {"type": float, "required": True},
+        "price_rounding_up": {"type": bool, "required": True},
+        "fee_bps": {"type": int, "required": True},
+        "activation_type": {"type": str, "required": True},
+        "has_alpha_vault": {"type": bool, "required": True},
+        "activation_point": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str) -> dict:
         try:
             data = json.loads(input)
-            schema = {
-                "bin_step": {"type": int, "required": True},
-                "token_a_mint": {"type": str, "required": True},
-                "token_b_mint": {"type": str, "required": True},
-                "initial_price": {"type": float, "required": True},
-                "price_rounding_up": {"type": bool, "required": True},
-                "fee_bps": {"type": int, "required": True},
-                "activation_type": {"type": str, "required": True},
-                "has_alpha_vault": {"type": bool, "required": True},
-                "activation_point": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
            
             
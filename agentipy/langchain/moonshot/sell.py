@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaSellUsingMoonshotTool(BaseTool):
@@ -17,16 +18,16 @@ class SolanaSellUsingMoonshotTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mint_str": {"type": str, "required": True},
+        "token_balance": {"type": float, "required": False, "min": 0},
+        "slippage_bps": {"type": int, "required": False, "min": 0, "max": 10000}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "mint_str": {"type": str, "required": True},
-                "token_balance": {"type": float, "required": False, "min": 0},
-                "slippage_bps": {"type": int, "required": False, "min": 0, "max": 10000}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             mint_str = data["mint_str"]
             token_balance = data.get("token_balance", 0.01)
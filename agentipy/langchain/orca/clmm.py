@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
 
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class OrcaCreateClmmTool(BaseTool):
     name: str = "orca_create_clmm"
@@ -24,17 +25,17 @@ class OrcaCreateClmmTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mint_deploy": {"type": str, "required": True},
+        "mint_pair": {"type": str, "required": True},
+        "initial_price": {"type": float, "required": True},
+        "fee_tier": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "mint_deploy": {"type": str, "required": True},
-                "mint_pair": {"type": str, "required": True},
-                "initial_price": {"type": float, "required": True},
-                "fee_tier": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             clmm_data = await self.solana_kit.create_clmm(
                 mint_deploy=data["mint_deploy"],
                 mint_pair=data["mint_pair"],
@@ -1,10 +1,11 @@
 
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class OrcaCreateLiquidityPoolTool(BaseTool):
@@ -28,19 +29,19 @@ class OrcaCreateLiquidityPoolTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "deposit_token_amount": {"type": float, "required": True},
+        "deposit_token_mint": {"type": str, "required": True},
+        "other_token_mint": {"type": str, "required": True},
+        "initial_price": {"type": float, "required": True},
+        "max_price": {"type": float, "required": True},
+        "fee_tier": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "deposit_token_amount": {"type": float, "required": True},
-                "deposit_token_mint": {"type": str, "required": True},
-                "other_token_mint": {"type": str, "required": True},
-                "initial_price": {"type": float, "required": True},
-                "max_price": {"type": float, "required": True},
-                "fee_tier": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             pool_data = await self.solana_kit.create_liquidity_pool(
                 deposit_token_amount=data["deposit_token_amount"],
                 deposit_token_mint=data["deposit_token_mint"],
@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class OrcaFetchPositionsTool(BaseTool):
@@ -55,17 +56,17 @@ class OrcaOpenCenteredPositionTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "whirlpool_address": {"type": str, "required": True},
+        "price_offset_bps": {"type": int, "required": True},
+        "input_token_mint": {"type": str, "required": True},
+        "input_amount": {"type": float, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "whirlpool_address": {"type": str, "required": True},
-                "price_offset_bps": {"type": int, "required": True},
-                "input_token_mint": {"type": str, "required": True},
-                "input_amount": {"type": float, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             position_data = await self.solana_kit.open_centered_position(
                 whirlpool_address=data["whirlpool_address"],
                 price_offset_bps=data["price_offset_bps"],
@@ -105,18 +106,18 @@ class OrcaOpenSingleSidedPositionTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "whirlpool_address": {"type": str, "required": True},
+        "distance_from_current_price_bps": {"type": int, "required": True},
+        "width_bps": {"type": int, "required": True},
+        "input_token_mint": {"type": str, "required": True},
+        "input_amount": {"type": float, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "whirlpool_address": {"type": str, "required": True},
-                "distance_from_current_price_bps": {"type": int, "required": True},
-                "width_bps": {"type": int, "required": True},
-                "input_token_mint": {"type": str, "required": True},
-                "input_amount": {"type": float, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             position_data = await self.solana_kit.open_single_sided_position(
                 whirlpool_address=data["whirlpool_address"],
                 distance_from_current_price_bps=data["distance_from_current_price_bps"],
@@ -154,14 +155,14 @@ class OrcaClosePositionTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "position_mint_address": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "position_mint_address": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             closure_result = await self.solana_kit.close_position(
                 position_mint_address=data["position_mint_address"]
             )
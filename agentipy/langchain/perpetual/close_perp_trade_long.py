@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class ClosePerpTradeLongTool(BaseTool):
@@ -21,15 +22,15 @@ class ClosePerpTradeLongTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "price": {"type": float, "required": True},
+        "trade_mint": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "price": {"type": float, "required": True},
-                "trade_mint": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
 
             price = data["price"]
             trade_mint = data["trade_mint"]
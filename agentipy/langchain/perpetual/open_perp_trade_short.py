@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class OpenPerpTradeShortTool(BaseTool):
@@ -25,19 +26,19 @@ class OpenPerpTradeShortTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "price": {"type": float, "required": True},
+        "collateral_amount": {"type": float, "required": True},
+        "collateral_mint": {"type": str, "required": False},
+        "leverage": {"type": float, "required": False},
+        "trade_mint": {"type": str, "required": False},
+        "slippage": {"type": float, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "price": {"type": float, "required": True},
-                "collateral_amount": {"type": float, "required": True},
-                "collateral_mint": {"type": str, "required": False},
-                "leverage": {"type": float, "required": False},
-                "trade_mint": {"type": str, "required": False},
-                "slippage": {"type": float, "required": False}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
 
             transaction = await self.solana_kit.open_perp_trade_short(  
                 price=data["price"],
@@ -1,10 +1,11 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 from solders.pubkey import Pubkey  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaBuyPumpfunTokenTool(BaseTool):
@@ -29,19 +30,19 @@ class SolanaBuyPumpfunTokenTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mint": {"type": str, "required": True},
+        "bonding_curve": {"type": str, "required": True},
+        "associated_bonding_curve": {"type": str, "required": True},
+        "amount": {"type": int, "required": True, "min": 1},
+        "slippage": {"type": float, "required": False, "min": 0, "max": 100},
+        "max_retries": {"type": int, "required": False, "min": 1}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "mint": {"type": str, "required": True},
-                "bonding_curve": {"type": str, "required": True},
-                "associated_bonding_curve": {"type": str, "required": True},
-                "amount": {"type": int, "required": True, "min": 1},
-                "slippage": {"type": float, "required": False, "min": 0, "max": 100},
-                "max_retries": {"type": int, "required": False, "min": 1}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             mint = Pubkey(data["mint"])
             bonding_curve = Pubkey(data["bonding_curve"])
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaPumpFunTokenTool(BaseTool):
@@ -18,17 +19,17 @@ class SolanaPumpFunTokenTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "token_name": {"type": str, "required": True},
+        "token_ticker": {"type": str, "required": True},
+        "description": {"type": str, "required": True},
+        "image_url": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "token_name": {"type": str, "required": True},
-                "token_ticker": {"type": str, "required": True},
-                "description": {"type": str, "required": True},
-                "image_url": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
     
             result = await self.solana_kit.launch_pump_fun_token(
                 data["token_name"],
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaRaydiumBuyTool(BaseTool):
@@ -17,19 +18,19 @@ class SolanaRaydiumBuyTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "pair_address": { "type": str, "required": True },
+        "sol_in": { "type": float, "required": False,  },
+        "slippage": { "type": int, "required": False,  }
+    })
 
     async def _arun(self, input: str):
         try:
          
             data = json.loads(input)
-            schema = {
-                "pair_address": { "type": str, "required": True },
-                "sol_in": { "type": float, "required": False,  },
-                "slippage": { "type": int, "required": False,  }
-            }
 
             
-            validate_input(data, schema)
+            self.input_validator(data)
     
            
             pair_address = data["pair_address"]
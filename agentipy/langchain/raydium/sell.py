@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaRaydiumSellTool(BaseTool):
@@ -17,17 +18,17 @@ class SolanaRaydiumSellTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "pair_address": { "type": str, "required": True },
+        "percentage": { "type": int, "required": False, "default": 100 },
+        "slippage": { "type": int, "required": False, "default": 5 }
+    })
 
     async def _arun(self, input: str):
         try:
           
             data = json.loads(input)
-            schema = {
-                "pair_address": { "type": str, "required": True },
-                "percentage": { "type": int, "required": False, "default": 100 },
-                "slippage": { "type": int, "required": False, "default": 5 }
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             
             pair_address = data["pair_address"]
             percentage = data.get("percentage", 100)  # Default to 100% if not provided
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class RugCheckFetchAllDomainsTool(BaseTool):
     name: str = "rugcheck_fetch_all_domains"
@@ -21,16 +22,16 @@ class RugCheckFetchAllDomainsTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "page": {"type": int, "required": False},
+        "limit": {"type": int, "required": False},
+        "verified": {"type": bool, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "page": {"type": int, "required": False},
-                "limit": {"type": int, "required": False},
-                "verified": {"type": bool, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             domains = await self.agent_kit.fetch_all_domains(
                 page=data.get("page", 1),
                 limit=data.get("limit", 50),
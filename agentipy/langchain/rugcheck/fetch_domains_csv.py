@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class RugCheckFetchDomainsCSVTool(BaseTool):
     name: str = "rugcheck_fetch_domains_csv"
@@ -19,14 +20,14 @@ class RugCheckFetchDomainsCSVTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "verified": {"type": bool, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "verified": {"type": bool, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             csv_data = await self.agent_kit.fetch_domains_csv(
                 verified=data.get("verified", False)
             )
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class RugCheckFetchTokenFluxLPLockersTool(BaseTool):
     name: str = "rugcheck_fetch_token_flux_lp_lockers"
@@ -19,14 +20,14 @@ class RugCheckFetchTokenFluxLPLockersTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "token_id": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "token_id": {"type": str, "required": True}
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             flux_lp_lockers = await self.agent_kit.fetch_token_flux_lp_lockers(
                 token_id=data["token_id"]
             )
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from agentipy.agent import SolanaAgentKit
 from langchain.tools import BaseTool
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 class RockPaperScissorsTool(BaseTool):
     name: str = "rock_paper_scissors"
@@ -20,15 +21,15 @@ class RockPaperScissorsTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True},
+        "choice": {"type": str, "required": True, }
+    })
 
     async def _arun(self, input: str):
         try:
-            schema = {
-                "amount": {"type": float, "required": True},
-                "choice": {"type": str, "required": True, }
-            }
             data = json.loads(input)
-            validate_input(data, schema)
+            self.input_validator(data)
             result = await self.agent_kit.rock_paper_scissors(
                 amount=data["amount"],
                 choice=data["choice"]
@@ -1,7 +1,8 @@
 import json
+from typing import ClassVar
 from langchain.tools import BaseTool
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolanaSNSRegisterDomainTool(BaseTool):
@@ -26,19 +27,19 @@ class SolanaSNSRegisterDomainTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "domain": {"type": str, "required": True},
+        "buyer": {"type": str, "required": True},
+        "buyer_token_account": {"type": str, "required": True},
+        "space": {"type": int, "required": True, "min": 1},
+        "mint": {"type": str, "required": False},
+        "referrer_key": {"type": str, "required": False}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "domain": {"type": str, "required": True},
-                "buyer": {"type": str, "required": True},
-                "buyer_token_account": {"type": str, "required": True},
-                "space": {"type": int, "required": True, "min": 1},
-                "mint": {"type": str, "required": False},
-                "referrer_key": {"type": str, "required": False}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             domain = data["domain"]
             buyer = data["buyer"]
@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolutiofiCloseAccountsTool(BaseTool):
@@ -22,14 +23,14 @@ class SolutiofiCloseAccountsTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "mints": {"type": list, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "mints": {"type": list, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             transaction_details = await self.agent_kit.close_accounts(
                 mints=data["mints"]
             )
@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolutiofiMergeTokensTool(BaseTool):
@@ -24,16 +25,16 @@ class SolutiofiMergeTokensTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "input_assets": {"type": list, "required": True},
+        "output_mint": {"type": str, "required": True},
+        "priority_fee": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "input_assets": {"type": list, "required": True},
-                "output_mint": {"type": str, "required": True},
-                "priority_fee": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             transaction_details = await self.agent_kit.merge_tokens(
                 input_assets=data["input_assets"],
                 output_mint=data["output_mint"],
@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SolutiofiSpreadTokenTool(BaseTool):
@@ -24,16 +25,16 @@ class SolutiofiSpreadTokenTool(BaseTool):
     }
     """
     agent_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "input_asset": {"type": dict, "required": True},
+        "target_tokens": {"type": list, "required": True},
+        "priority_fee": {"type": str, "required": True}
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "input_asset": {"type": dict, "required": True},
-                "target_tokens": {"type": list, "required": True},
-                "priority_fee": {"type": str, "required": True}
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
             transaction_details = await self.agent_kit.spread_token(
                 input_asset=data["input_asset"],
                 target_tokens=data["target_tokens"],
@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class SwitchboardSimulateFeedTool(BaseTool):
@@ -24,15 +25,15 @@ class SwitchboardSimulateFeedTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "feed": {"type": str, "required": True},
+        "crossbar_url": {"type": str, "required": False},
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "feed": {"type": str, "required": True},
-                "crossbar_url": {"type": str, "required": False},
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             feed = data["feed"]
             crossbar_url = data.get("crossbar_url")
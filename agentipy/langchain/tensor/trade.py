@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class TensorListNFTForSaleTool(BaseTool):
@@ -24,15 +25,15 @@ class TensorListNFTForSaleTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "price": {"type": float, "required": True},
+        "nft_mint": {"type": str, "required": True},
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "price": {"type": float, "required": True},
-                "nft_mint": {"type": str, "required": True},
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             price = data["price"]
             nft_mint = data["nft_mint"]
@@ -69,14 +70,14 @@ class TensorCancelListingTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "nft_mint": {"type": str, "required": True},
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "nft_mint": {"type": str, "required": True},
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             nft_mint = data["nft_mint"]
 
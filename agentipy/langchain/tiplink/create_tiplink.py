@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class TiplinkCreateTool(BaseTool):
@@ -24,15 +25,15 @@ class TiplinkCreateTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "amount": {"type": float, "required": True},
+        "spl_mint_address": {"type": str, "required": False},
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "amount": {"type": float, "required": True},
-                "spl_mint_address": {"type": str, "required": False},
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             amount = data["amount"]
             spl_mint_address = data.get("spl_mint_address")
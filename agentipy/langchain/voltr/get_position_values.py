@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class VoltrGetPositionValuesTool(BaseTool):
@@ -23,14 +24,14 @@ class VoltrGetPositionValuesTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "vault": {"type": str, "required": True},
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "vault": {"type": str, "required": True},
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             vault = data["vault"]
 
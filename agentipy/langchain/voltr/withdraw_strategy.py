@@ -1,9 +1,10 @@
 import json
+from typing import ClassVar
 
 from langchain.tools import BaseTool
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import InputValidator, compile_schema
 
 
 class VoltrWithdrawStrategyTool(BaseTool):
@@ -25,16 +26,16 @@ class VoltrWithdrawStrategyTool(BaseTool):
     }
     """
     solana_kit: SolanaAgentKit
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "withdraw_amount": {"type": str, "required": True},
+        "vault": {"type": str, "required": True},
+        "strategy": {"type": str, "required": True},
+    })
 
     async def _arun(self, input: str):
         try:
             data = json.loads(input)
-            schema = {
-                "withdraw_amount": {"type": str, "required": True},
-                "vault": {"type": str, "required": True},
-                "strategy": {"type": str, "required": True},
-            }
-            validate_input(data, schema)
+            self.input_validator(data)
 
             withdraw_amount = data["withdraw_amount"]
             vault = data["vault"]
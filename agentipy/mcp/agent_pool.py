@@ -0,0 +1,97 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from agentipy.agent import SolanaAgentKit
+
+logger = logging.getLogger("agentipy-mcp-server")
+
+DEFAULT_IDLE_TIMEOUT = 900.0
+DEFAULT_MAX_AGENTS = 1000
+
+
+class AgentPool:
+    """
+    Lazily creates and caches SolanaAgentKit instances keyed by a session or wallet identifier.
+
+    Agents are built on first use with `agent_factory(agent_id)` and evicted once
+    they have been idle for `idle_timeout` seconds, or in least-recently-used
+    order when more than `max_agents` are alive. Agents that point at the same
+    RPC URL share one async and one sync RPC client, so a single process keeps
+    one connection pool per endpoint rather than one per wallet.
+    """
+
+    def __init__(
+        self,
+        agent_factory: Callable[[str], SolanaAgentKit],
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_agents: int = DEFAULT_MAX_AGENTS,
+    ):
+        self.agent_factory = agent_factory
+        self.idle_timeout = idle_timeout
+        self.max_agents = max_agents
+        self._agents: "OrderedDict[str, Tuple[SolanaAgentKit, float]]" = OrderedDict()
+        self._connections: Dict[str, object] = {}
+        self._connection_clients: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _share_connections(self, agent: SolanaAgentKit):
+        from solana.rpc.api import Client
+        from solana.rpc.async_api import AsyncClient
+
+        if agent.rpc_url not in self._connections:
+            self._connections[agent.rpc_url] = AsyncClient(agent.rpc_url)
+            self._connection_clients[agent.rpc_url] = Client(agent.rpc_url)
+        agent.connection = self._connections[agent.rpc_url]
+        agent.connection_client = self._connection_clients[agent.rpc_url]
+
+    def _evict_idle(self, now: float):
+        while self._agents:
+            agent_id, (_, last_used) = next(iter(self._agents.items()))
+            if now - last_used < self.idle_timeout and len(self._agents) <= self.max_agents:
+                break
+            self._agents.popitem(last=False)
+            logger.info(f"Evicted idle agent '{agent_id}'")
+
+    def get(self, agent_id: str) -> SolanaAgentKit:
+        """
+        Return the agent for `agent_id`, creating it on first use.
+
+        Raises:
+            ValueError: If `agent_id` is empty.
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._agents.pop(agent_id, None)
+            if entry is None:
+                agent = self.agent_factory(agent_id)
+                self._share_connections(agent)
+                logger.info(f"Created agent '{agent_id}' ({agent.wallet_address})")
+            else:
+                agent = entry[0]
+            self._agents[agent_id] = (agent, now)
+            self._evict_idle(now)
+            return agent
+
+    def remove(self, agent_id: str) -> Optional[SolanaAgentKit]:
+        with self._lock:
+            entry = self._agents.pop(agent_id, None)
+            return entry[0] if entry else None
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    async def close(self):
+        """Drop all agents and close the shared async RPC clients."""
+        with self._lock:
+            self._agents.clear()
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._connection_clients.clear()
+        for connection in connections:
+            await connection.close()
@@ -2,6 +2,7 @@ from allora_sdk.v2.api_client import (PriceInferenceTimeframe,
                                       PriceInferenceToken, SignatureFormat)
 from mcp.types import Tool
 
+from agentipy.mcp.cache import CachePolicy
 from agentipy.tools.use_allora import AlloraManager
 
 ALLORA_ACTIONS = {
@@ -10,6 +11,7 @@ ALLORA_ACTIONS = {
         description="Get all topics from Allora's API",
         inputSchema={},
         handler=lambda agent, params: AlloraManager(agent).get_all_topics(),
+        cache=CachePolicy(ttl=300),
     ),
     "GET_PRICE_PREDICTION": Tool(
         name="GET_PRICE_PREDICTION",
@@ -19,11 +21,13 @@ ALLORA_ACTIONS = {
                 "type": "string",
                 "description": "Crypto asset symbol (BTC or ETH).",
                 "enum": ["BTC", "ETH"],
+                "required": True,
             },
             "timeframe": {
                 "type": "string",
                 "description": "Prediction timeframe (FIVE_MINUTES or EIGHT_HOURS).",
                 "enum": ["FIVE_MINUTES", "EIGHT_HOURS"],
+                "required": True,
             },
             "signature_format": {
                 "type": "string",
@@ -37,13 +41,15 @@ ALLORA_ACTIONS = {
             timeframe=PriceInferenceTimeframe[params["timeframe"]],
             signature_format=SignatureFormat[params.get("signature_format", "ETHEREUM_SEPOLIA")],
         ),
+        cache=CachePolicy(ttl=30, key_fields=("asset", "timeframe", "signature_format")),
     ),
     "GET_INFERENCE_BY_TOPIC_ID": Tool(
         name="GET_INFERENCE_BY_TOPIC_ID",
         description="Fetch inference data for a specific topic ID.",
         inputSchema={
-            "topic_id": {"type": "integer", "description": "Topic ID to fetch inference data for."},
+            "topic_id": {"type": "integer", "description": "Topic ID to fetch inference data for.", "required": True},
         },
         handler=lambda agent, params: AlloraManager(agent).get_inference_by_topic_id(params["topic_id"]),
+        cache=CachePolicy(ttl=30, key_fields=("topic_id",)),
     ),
 }
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Dict, List
+
+from mcp.types import Tool
+
+from agentipy.mcp.cache import ResultCache
+from agentipy.mcp.executor import ToolExecutor
+
+logger = logging.getLogger("agentipy-mcp-server")
+
+BATCH_ACTION_NAME = "BATCH"
+MAX_BATCH_SIZE = 50
+
+_JSON_TYPES = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+def _as_tuple(value) -> tuple:
+    if value is None:
+        return ()
+    return value if isinstance(value, tuple) else (value,)
+
+
+def is_read_only(tool_def: Any) -> bool:
+    """An action is read-only when it is flagged as such or carries a cache policy."""
+    return bool(getattr(tool_def, "read_only", False)) or ResultCache.policy_for(tool_def) is not None
+
+
+def compile_params_validator(schema: Dict[str, dict]) -> Callable[[dict], None]:
+    """
+    Compile an action's `inputSchema` (a mapping of parameter name to
+    `{"type": name or [names], "enum": [...], "required": bool}`) into a callable that raises
+    ValueError on invalid params. Parameters are optional unless marked `"required": True`.
+    """
+    checks = []
+    for field, rules in schema.items():
+        type_names = rules.get("type")
+        if isinstance(type_names, list):
+            expected = tuple(t for name in type_names for t in _as_tuple(_JSON_TYPES.get(name)))
+            type_name = " or ".join(type_names)
+        else:
+            expected = _JSON_TYPES.get(type_names)
+            type_name = type_names
+        choices = rules.get("enum")
+        checks.append((field, rules.get("required", False), type_name, expected or None, frozenset(choices) if choices else None))
+
+    def validate(params: dict):
+        if not isinstance(params, dict):
+            raise ValueError("params must be an object")
+        for field, required, type_name, expected, choices in checks:
+            if field not in params:
+                if required:
+                    raise ValueError(f"Missing required field: {field}")
+                continue
+            if params[field] is None and not required:
+                continue
+            value = params[field]
+            # bool is a subclass of int; reject it for numeric fields
+            if expected is not None and (
+                not isinstance(value, expected) or (isinstance(value, bool) and bool not in _as_tuple(expected))
+            ):
+                raise ValueError(f"{field} must be of type {type_name}")
+            if choices is not None and value not in choices:
+                raise ValueError(f"{field} must be one of {sorted(choices)}")
+
+    return validate
+
+
+def make_batch_action(
+    actions: Dict[str, Tool],
+    executor: ToolExecutor,
+    max_batch_size: int = MAX_BATCH_SIZE,
+    allow_writes: bool = False,
+) -> Tool:
+    """
+    Build the BATCH meta-action for the given actions.
+
+    BATCH takes `requests`, a list of `{"action": name, "params": {...}}`
+    entries, and returns one `{"action", "status", "result" | "error"}` entry
+    per request, in order. Consecutive read-only actions run concurrently.
+
+    Entries naming a state-changing action fail with an error unless
+    `allow_writes` is set. With it, such an action runs on its own, after
+    everything before it has completed, so the relative order of writes and
+    reads is preserved.
+    """
+    validators = {
+        name: compile_params_validator(tool_def.inputSchema or {})
+        for name, tool_def in actions.items()
+    }
+
+    async def run_entry(agent, entry: Any) -> dict:
+        name = entry.get("action") if isinstance(entry, dict) else None
+        try:
+            if name not in actions:
+                raise ValueError(f"Unknown action: {name}")
+            if not allow_writes and not is_read_only(actions[name]):
+                raise ValueError(f"{name} is not read-only; BATCH only runs read-only actions")
+            params = entry.get("params") or {}
+            validators[name](params)
+            result = await executor.run(name, actions[name], agent, params)
+            return {"action": name, "status": "success", "result": result}
+        except Exception as e:
+            logger.error(f"Error in batched action '{name}': {str(e)}")
+            return {"action": name, "status": "error", "error": str(e)}
+
+    async def handler(agent, params: dict) -> List[dict]:
+        requests = params.get("requests")
+        if isinstance(requests, str):
+            requests = json.loads(requests)
+        if not isinstance(requests, list):
+            raise ValueError("requests must be a list of {action, params} objects")
+        if len(requests) > max_batch_size:
+            raise ValueError(f"A batch may contain at most {max_batch_size} requests")
+
+        results: List[dict] = []
+        group: List[Any] = []
+        for entry in requests:
+            name = entry.get("action") if isinstance(entry, dict) else None
+            if name not in actions or not allow_writes or is_read_only(actions[name]):
+                group.append(entry)
+                continue
+            if group:
+                results.extend(await asyncio.gather(*(run_entry(agent, e) for e in group)))
+                group = []
+            results.append(await run_entry(agent, entry))
+        if group:
+            results.extend(await asyncio.gather(*(run_entry(agent, e) for e in group)))
+        return results
+
+    if allow_writes:
+        description = (
+            "Run several actions in one call. Read-only actions are executed concurrently and "
+            "state-changing actions one at a time, in order; results are returned in request "
+            "order with per-item errors."
+        )
+    else:
+        description = (
+            "Run several read-only actions in one call. They are executed concurrently; "
+            "results are returned in request order with per-item errors."
+        )
+    return Tool(
+        name=BATCH_ACTION_NAME,
+        description=description,
+        inputSchema={
+            "requests": {
+                "type": "array",
+                "description": f"Up to {max_batch_size} objects of the form {{\"action\": name, \"params\": {{...}}}}",
+            },
+        },
+        handler=handler,
+        meta=True,
+    )
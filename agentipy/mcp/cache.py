@@ -0,0 +1,103 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional, Tuple
+
+DEFAULT_CACHE_SIZE = 1024
+
+CACHE_MISS = object()
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Cache policy attached to a read-only MCP tool definition (`Tool(..., cache=CachePolicy(...))`).
+
+    Attributes:
+        ttl (float): Seconds a cached result stays valid.
+        key_fields (tuple, optional): Parameters that identify a result. Defaults to all parameters.
+        cacheable (bool): Set to False to explicitly opt a tool out of caching.
+    """
+    ttl: float
+    key_fields: Optional[Tuple[str, ...]] = None
+    cacheable: bool = True
+
+
+class ResultCache:
+    """
+    In-memory LRU cache with per-entry TTL for MCP tool results.
+
+    Results are scoped per agent (wallet) so that the same read issued on behalf
+    of different wallets never shares an entry.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def policy_for(tool_def: Any) -> Optional[CachePolicy]:
+        policy = getattr(tool_def, "cache", None)
+        if isinstance(policy, CachePolicy) and policy.cacheable and policy.ttl > 0:
+            return policy
+        return None
+
+    @staticmethod
+    def make_key(name: str, agent: Any, params: dict, policy: CachePolicy) -> Hashable:
+        fields = policy.key_fields if policy.key_fields is not None else sorted(params)
+        values = tuple(
+            (field, json.dumps(params.get(field), sort_keys=True, default=str))
+            for field in fields
+        )
+        agent_key = str(getattr(agent, "wallet_address", id(agent)))
+        return name, agent_key, values
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for `key`, or CACHE_MISS."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return CACHE_MISS
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return CACHE_MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
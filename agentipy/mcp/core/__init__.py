@@ -2,6 +2,7 @@
 
 from mcp.types import Tool
 
+from agentipy.mcp.cache import CachePolicy
 from agentipy.tools.deploy_token import TokenDeploymentManager
 from agentipy.tools.get_balance import BalanceFetcher
 from agentipy.tools.transfer import TokenTransferManager
@@ -12,14 +13,15 @@ SOLANA_ACTIONS = {
         description="Fetches wallet balance",
         inputSchema={"token_address": {"type": "string", "description": "Optional token address"}},
         handler=lambda agent, params: BalanceFetcher.get_balance(agent, params.get("token_address")),
+        cache=CachePolicy(ttl=5, key_fields=("token_address",)),
     ),
     "TRANSFER": Tool(
         name="TRANSFER",
         description="Transfers tokens",
         inputSchema={
-            "amount": {"type": "number", "description": "Amount to transfer"},
+            "amount": {"type": "number", "description": "Amount to transfer", "required": True},
             "mint": {"type": "string", "description": "Optional SPL token mint address"},
-            "to": {"type": "string", "description": "Recipient wallet address"},
+            "to": {"type": "string", "description": "Recipient wallet address", "required": True},
         },
         handler=lambda agent, params: TokenTransferManager.transfer(agent, params["to"], params["amount"], params.get("mint")),
     ),
@@ -0,0 +1,116 @@
+import asyncio
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from agentipy.mcp.cache import CACHE_MISS, ResultCache
+from agentipy.utils.instrumentation import track
+
+logger = logging.getLogger("agentipy-mcp-server")
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_TOOL_TIMEOUT = 60.0
+DEFAULT_MAX_WORKERS = 8
+
+
+class ToolTimeoutError(Exception):
+    """Raised when a tool handler exceeds its timeout."""
+    pass
+
+
+class ToolExecutor:
+    """
+    Runs MCP tool handlers with bounded concurrency and per-call timeouts.
+
+    Coroutine handlers run on the server loop. Any other handler is called in a
+    worker thread so that blocking code never stalls the loop; if it returns an
+    awaitable (e.g. a lambda wrapping an async manager method) that awaitable
+    is then awaited on the loop.
+
+    A tool can override the default timeout by setting a `timeout` attribute
+    (in seconds) on its definition. Tools carrying a `CachePolicy` in their
+    `cache` attribute are served from `cache` while their entry is fresh.
+
+    Meta tools (`meta=True`, e.g. BATCH) dispatch their sub-calls back through
+    the executor, so they run outside the semaphore and the default timeout to
+    avoid holding a slot while waiting on their own sub-calls.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        default_timeout: Optional[float] = DEFAULT_TOOL_TIMEOUT,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: Optional[ResultCache] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self.cache = cache
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._thread_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agentipy-mcp")
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so that it binds to the loop the server actually runs on
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def timeout_for(self, tool_def: Any) -> Optional[float]:
+        return getattr(tool_def, "timeout", None) or self.default_timeout
+
+    async def _invoke(self, tool_def: Any, agent: Any, params: dict) -> Any:
+        handler = tool_def.handler
+        if inspect.iscoroutinefunction(handler):
+            return await handler(agent, params)
+
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._thread_pool, handler, agent, params)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def run(self, name: str, tool_def: Any, agent: Any, params: dict) -> Any:
+        """
+        Execute a tool handler under the concurrency limit and its timeout.
+
+        Args:
+            name (str): Tool name, used for logging and error messages.
+            tool_def: Tool definition carrying a `handler(agent, params)` callable.
+            agent: SolanaAgentKit instance passed to the handler.
+            params (dict): Tool arguments.
+
+        Returns:
+            Any: The handler result.
+
+        Raises:
+            ToolTimeoutError: If the handler does not finish within its timeout.
+        """
+        if getattr(tool_def, "meta", False):
+            return await asyncio.wait_for(self._invoke(tool_def, agent, params), getattr(tool_def, "timeout", None))
+
+        policy = ResultCache.policy_for(tool_def) if self.cache is not None else None
+        if policy:
+            key = ResultCache.make_key(name, agent, params, policy)
+            cached = self.cache.get(key)
+            if cached is not CACHE_MISS:
+                return cached
+
+        timeout = self.timeout_for(tool_def)
+        async with self.semaphore:
+            try:
+                with track(f"mcp.{name}"):
+                    result = await asyncio.wait_for(self._invoke(tool_def, agent, params), timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Tool '{name}' timed out after {timeout}s")
+                raise ToolTimeoutError(f"Tool '{name}' timed out after {timeout}s")
+
+        if policy:
+            self.cache.set(key, result, policy.ttl)
+        return result
+
+    def shutdown(self):
+        self._thread_pool.shutdown(wait=False, cancel_futures=True)
@@ -7,7 +7,7 @@ JUPITER_ACTIONS = {
     "STAKE_WITH_JUP": Tool(
         name="STAKE_WITH_JUP",
         description="Stake SOL with Jupiter",
-        inputSchema={"amount": {"type": "number", "description": "Amount of SOL to stake"}},
+        inputSchema={"amount": {"type": "number", "description": "Amount of SOL to stake", "required": True}},
         handler=lambda agent, params: StakeManager.stake_with_jup(
             agent,
             amount=params["amount"],
@@ -17,10 +17,10 @@ JUPITER_ACTIONS = {
         name="TRADE_WITH_JUP",
         description="Trade a token with Jupiter",
         inputSchema={
-            "output_mint": {"type": "string", "description": "Token to trade"},
-            "input_amount": {"type": "number", "description": "Amount of token to trade"},
-            "input_mint": {"type": "string", "description": "Token to trade"},
-            "slippage_bps": {"type": "number", "description": "Slippage in basis points"},
+            "output_mint": {"type": "string", "description": "Token to trade", "required": True},
+            "input_amount": {"type": "number", "description": "Amount of token to trade", "required": True},
+            "input_mint": {"type": "string", "description": "Token to trade", "required": True},
+            "slippage_bps": {"type": "number", "description": "Slippage in basis points", "required": True},
         },
         handler=lambda agent, params: TradeManager.trade(
             agent,
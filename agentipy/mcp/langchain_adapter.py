@@ -0,0 +1,190 @@
+import inspect
+import json
+import logging
+import time
+import weakref
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+from mcp.types import Tool
+
+from agentipy.agent import SolanaAgentKit
+from agentipy.helpers import InputValidator
+from agentipy.langchain import READ_ONLY_TOOLS
+from agentipy.mcp.batch import compile_params_validator
+from agentipy.utils.instrumentation import track
+
+logger = logging.getLogger("agentipy-mcp-server")
+
+_PY_TO_JSON_TYPES = {
+    "str": "string",
+    "int": "integer",
+    "float": "number",
+    "bool": "boolean",
+    "list": "array",
+    "dict": "object",
+}
+
+GENERIC_INPUT_SCHEMA = {
+    "input": {
+        "type": "object",
+        "description": "Tool input as described in the tool description",
+    },
+}
+
+
+def _schema_from_rules(schema: Dict[str, dict]) -> Optional[Dict[str, dict]]:
+    """Convert a compiled `validate_input` schema (Python types) into JSON-typed schema entries."""
+    converted = {}
+    for field, rules in schema.items():
+        types = rules["type"] if isinstance(rules["type"], tuple) else (rules["type"],)
+        json_types = [_PY_TO_JSON_TYPES.get(t.__name__) for t in types]
+        if None in json_types:
+            return None
+        entry = {
+            "type": json_types[0] if len(json_types) == 1 else json_types,
+            "python_type": types[0].__name__,
+        }
+        if rules.get("choices"):
+            entry["enum"] = list(rules["choices"])
+        for key in ("required", "min", "max", "min_length"):
+            if key in rules:
+                entry[key] = rules[key]
+        converted[field] = entry
+    return converted
+
+
+@lru_cache(maxsize=None)
+def extract_input_schema(tool_cls: type) -> Optional[Dict[str, dict]]:
+    """
+    Derive an MCP input schema from a LangChain tool's compiled `input_validator`.
+
+    Returns None when the tool does not declare one.
+    """
+    input_validator = getattr(tool_cls, "input_validator", None)
+    if isinstance(input_validator, InputValidator):
+        return _schema_from_rules(input_validator.schema)
+    return None
+
+
+def _field_annotations(tool_cls: type) -> Dict[str, Any]:
+    fields = getattr(tool_cls, "model_fields", None)
+    if fields is not None:
+        return {name: field.annotation for name, field in fields.items()}
+    # pydantic v1 models
+    fields = getattr(tool_cls, "__fields__", None)
+    if fields is not None:
+        return {name: field.outer_type_ for name, field in fields.items()}
+    return {}
+
+
+@lru_cache(maxsize=None)
+def agent_field(tool_cls: type) -> str:
+    """
+    Name of the tool's SolanaAgentKit field (`solana_kit` for most tools, `agent_kit` for others).
+
+    Raises:
+        TypeError: If the tool class declares no SolanaAgentKit field.
+    """
+    for name, annotation in _field_annotations(tool_cls).items():
+        if isinstance(annotation, type) and issubclass(annotation, SolanaAgentKit):
+            return name
+    raise TypeError(f"{tool_cls.__name__} has no SolanaAgentKit field")
+
+
+def _public_schema(schema: Dict[str, dict]) -> Dict[str, dict]:
+    public = {}
+    for field, rules in schema.items():
+        entry = {"type": rules["type"]}
+        if rules.get("required", True):
+            entry["description"] = "Required"
+            entry["required"] = True
+        if "enum" in rules:
+            entry["enum"] = rules["enum"]
+        public[field] = entry
+    return public
+
+
+def _make_action(tool, read_only: bool) -> Tool:
+    tool_cls = type(tool)
+    kit_field = agent_field(tool_cls)
+    takes_input = len(inspect.signature(tool_cls._arun).parameters) > 1
+    schema = extract_input_schema(tool_cls) if takes_input else {}
+    validate = compile_params_validator(_public_schema(schema)) if schema is not None else None
+    float_fields = [field for field, rules in (schema or {}).items() if rules.get("python_type") == "float"]
+    # LangChain tools are bound to one agent; keep one instance per agent alive as long as the agent is
+    instances = weakref.WeakKeyDictionary()
+    instances[getattr(tool, kit_field)] = tool
+
+    async def handler(agent: SolanaAgentKit, params: dict):
+        if schema is None:
+            params = params.get("input", params)
+        else:
+            validate(params)
+            # JSON clients send whole numbers as integers; validate_input expects floats
+            for field in float_fields:
+                if isinstance(params.get(field), int) and not isinstance(params[field], bool):
+                    params = {**params, field: float(params[field])}
+        instance = instances.get(agent)
+        if instance is None:
+            instance = tool_cls(**{kit_field: agent})
+            instances[agent] = instance
+        if not takes_input:
+            return await instance._arun()
+        return await instance._arun(params if isinstance(params, str) else json.dumps(params))
+
+    return Tool(
+        name=tool.name.upper(),
+        description=tool.description.strip(),
+        inputSchema=_public_schema(schema) if schema is not None else GENERIC_INPUT_SCHEMA,
+        handler=handler,
+        read_only=read_only,
+    )
+
+
+def _is_read_only(tool, read_only_tools: FrozenSet[str]) -> bool:
+    """A tool is read-only when it is listed in `read_only_tools` or its LangChain metadata sets `read_only`."""
+    return tool.name in read_only_tools or bool((getattr(tool, "metadata", None) or {}).get("read_only"))
+
+
+def langchain_tools_to_actions(tools: List, read_only_tools: Optional[Iterable[str]] = None) -> Dict[str, Tool]:
+    """
+    Build MCP action definitions from LangChain tools.
+
+    Input schemas are derived once per tool class from its compiled
+    `input_validator`; tools without one take a generic `input` object. Validators are compiled once and reused for
+    every call. Action names are the upper-cased LangChain tool names.
+
+    The time taken is recorded under `mcp.langchain_actions` in the metrics
+    registry.
+
+    Args:
+        tools (list): LangChain `BaseTool` instances bound to a SolanaAgentKit.
+        read_only_tools (Iterable[str], optional): Tool names that are safe to run concurrently in BATCH.
+            Defaults to `agentipy.langchain.READ_ONLY_TOOLS`. Tools whose metadata sets `read_only` are
+            read-only as well.
+
+    Returns:
+        Dict[str, Tool]: Action definitions keyed by action name.
+    """
+    start = time.perf_counter()
+    read_only = READ_ONLY_TOOLS if read_only_tools is None else frozenset(read_only_tools)
+    actions = {}
+    with track("mcp.langchain_actions"):
+        for tool in tools:
+            action = _make_action(tool, _is_read_only(tool, read_only))
+            actions.setdefault(action.name, action)
+    derived = sum(1 for action in actions.values() if action.inputSchema != GENERIC_INPUT_SCHEMA)
+    concurrent = sum(1 for action in actions.values() if action.read_only)
+    logger.info(
+        f"Generated {len(actions)} MCP actions from LangChain tools "
+        f"({derived} with derived schemas, {concurrent} read-only) in {(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+    return actions
+
+
+def build_langchain_actions(agent: SolanaAgentKit, providers: Optional[Iterable[str]] = None, read_only_tools: Optional[Iterable[str]] = None) -> Dict[str, Tool]:
+    """Create the LangChain tools of the given providers and expose them as MCP actions."""
+    from agentipy.langchain import create_solana_tools
+
+    return langchain_tools_to_actions(create_solana_tools(agent, providers), read_only_tools)
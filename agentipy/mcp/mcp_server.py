@@ -1,16 +1,37 @@
 import json
 import logging
 import shlex
-from typing import Dict, List, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.fastmcp.tools import Tool as RegisteredTool
+from mcp.server.fastmcp.utilities.func_metadata import (ArgModelBase,
+                                                        FuncMetadata)
 from mcp.types import TextContent, Tool
+from pydantic import ConfigDict
 
 from agentipy.agent import SolanaAgentKit
+from agentipy.mcp.agent_pool import (DEFAULT_IDLE_TIMEOUT, DEFAULT_MAX_AGENTS,
+                                     AgentPool)
 from agentipy.mcp.all_actions import ALL_ACTIONS
+from agentipy.mcp.batch import BATCH_ACTION_NAME, make_batch_action
+from agentipy.mcp.cache import DEFAULT_CACHE_SIZE, ResultCache
+from agentipy.mcp.executor import (DEFAULT_MAX_CONCURRENCY,
+                                   DEFAULT_MAX_WORKERS, DEFAULT_TOOL_TIMEOUT,
+                                   ToolExecutor)
+from agentipy.mcp.serialization import (DEFAULT_MAX_PAGE_BYTES,
+                                        DEFAULT_PAGE_SIZE, ResultPager, dumps)
+from agentipy.utils.instrumentation import metrics
 
 logger = logging.getLogger("agentipy-mcp-server")
 
+# Server-level arguments accepted by every action in addition to its own
+CURSOR_PARAM = {
+    "type": "string",
+    "description": "next_cursor of a previous paged result; returns the next page without re-running the action",
+}
+AGENT_ID_PARAM = {"type": "string", "description": "Session or wallet identifier the action runs for", "required": True}
+
 mcp = FastMCP(
     "agentipy-mcp",
     instructions="Solana tools: Get balance, transfer SOL, price prediction, etc.",
@@ -33,14 +54,31 @@ async def list_tools(selected_actions: Dict[str, Tool]) -> List[Tool]:
         for action in selected_actions.values()
     ]
 
-async def call_tool(agent: SolanaAgentKit, selected_actions: Dict[str, Tool], name: str, arguments: dict):
+_default_executor: Optional[ToolExecutor] = None
+
+def _shared_executor() -> ToolExecutor:
+    """Executor of `call_tool` calls that do not pass one; created once and reused."""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ToolExecutor()
+    return _default_executor
+
+def _pager_owner(agent: SolanaAgentKit) -> str:
+    return str(agent.wallet_address)
+
+async def call_tool(agent: SolanaAgentKit, selected_actions: Dict[str, Tool], name: str, arguments: dict, executor: Optional[ToolExecutor] = None, pager: Optional[ResultPager] = None):
     if name not in selected_actions:
         return [TextContent(type="text", text=f"Unknown action: {name}")]
 
     action = selected_actions[name]
+    executor = executor or _shared_executor()
     try:
-        result = await action.handler(agent, arguments)
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        if pager is not None and arguments.get("cursor"):
+            return pager.next_page(arguments["cursor"], owner=_pager_owner(agent))
+        result = await executor.run(name, action, agent, arguments)
+        if pager is not None:
+            return pager.render(result, owner=_pager_owner(agent))
+        return [TextContent(type="text", text=dumps(result))]
     except Exception as e:
         logger.error(f"Error executing {name}: {str(e)}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -62,28 +100,178 @@ def normalize_kwargs(raw: Union[str, dict]) -> dict:
             return parse_key_value_string(raw)
     raise ValueError(f"Unsupported kwargs type: {type(raw)}")
 
-def run_server(agent: SolanaAgentKit, selected_actions: Dict[str, Tool], server_name="agentipy-mcp"):
-    logger.info(f'Starting MCP server with {list(selected_actions.keys())} actions')
+def _json_schema(input_schema: dict) -> dict:
+    """JSON Schema of an action's `inputSchema` (a mapping of parameter name to rules with a `required` flag)."""
+    properties = {name: {k: v for k, v in rules.items() if k != "required"} for name, rules in input_schema.items()}
+    required = [name for name, rules in input_schema.items() if rules.get("required")]
+    return {"type": "object", "properties": properties, **({"required": required} if required else {})}
+
+class _ActionArguments(ArgModelBase):
+    """Passes every argument through to the tool function; actions validate their own params."""
+    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+
+    def model_dump_one_level(self) -> dict:
+        return dict(self.model_extra or {})
 
-    for name, tool in selected_actions.items():
+def _advertised_actions(actions: Dict[str, Tool], multi_agent: bool) -> Dict[str, Tool]:
+    """Copies of the actions whose input schemas include the server-level `cursor` (and `agent_id`) arguments."""
+    extra = {"cursor": CURSOR_PARAM, **({"agent_id": AGENT_ID_PARAM} if multi_agent else {})}
+    return {
+        name: tool.model_copy(update={"inputSchema": {**(tool.inputSchema or {}), **extra}})
+        for name, tool in actions.items()
+    }
+
+async def _handle_tool_call(tool_name: str, tool_def: Tool, kwargs: dict, executor: ToolExecutor, pager: ResultPager, resolve_agent: Callable[[dict], SolanaAgentKit]):
+    if "kwargs" in kwargs:
+        kwargs = {**normalize_kwargs(kwargs["kwargs"]), **{k: v for k, v in kwargs.items() if k != "kwargs"}}
+
+    cursor = kwargs.pop("cursor", None)
+    agent = resolve_agent(kwargs)
+    # Follow-up pages of a large result are served without re-running the tool,
+    # and only to the agent the result was produced for
+    if cursor:
+        return pager.next_page(cursor, owner=_pager_owner(agent))
+
+    result = await executor.run(tool_name, tool_def, agent, kwargs)
+    contents = pager.render(result, owner=_pager_owner(agent))
+    metrics.record_bytes(sum(len(content.text) for content in contents), tool=f"mcp.{tool_name}")
+    return contents
+
+def _register_tools(selected_actions: Dict[str, Tool], executor: ToolExecutor, pager: ResultPager, resolve_agent: Callable[[dict], SolanaAgentKit], enable_batch: bool = True, multi_agent: bool = False, batch_allow_writes: bool = False, server: FastMCP = mcp) -> Dict[str, Tool]:
+    actions = dict(selected_actions)
+    if enable_batch and BATCH_ACTION_NAME not in actions:
+        actions[BATCH_ACTION_NAME] = make_batch_action(selected_actions, executor, allow_writes=batch_allow_writes)
+    actions = _advertised_actions(actions, multi_agent)
+
+    for name, tool in actions.items():
         def register_tool(tool_name, tool_def):
-            @mcp.tool(name=tool_name, description=tool_def.description)
             async def _tool(ctx: Context, **kwargs):
                 try:
-                    if "kwargs" in kwargs:
-                        kwargs = normalize_kwargs(kwargs["kwargs"])
-
-                    result = await tool_def.handler(agent, kwargs)
-                    return TextContent(type="text", text=json.dumps(result, indent=2))
+                    return await _handle_tool_call(tool_name, tool_def, kwargs, executor, pager, resolve_agent)
                 except Exception as e:
                     logger.error(f"Error in tool '{tool_name}': {str(e)}")
                     logger.error(f"Error in tool {tool_name} with kwargs {kwargs}")
                     await ctx.error(f"Error running tool: {str(e)}")
                     return TextContent(type="text", text=f"Error: {str(e)}")
+
+            # `server.tool()` would derive the schema from the `**kwargs` signature;
+            # advertise the action's own parameters and pass them through unchanged
+            server._tool_manager._tools[tool_name] = RegisteredTool(
+                fn=_tool,
+                name=tool_name,
+                description=tool_def.description,
+                parameters=_json_schema(tool_def.inputSchema or {}),
+                fn_metadata=FuncMetadata(arg_model=_ActionArguments),
+                is_async=True,
+                context_kwarg="ctx",
+            )
         register_tool(name, tool)
+    return actions
+
+def _make_executor(max_concurrency: int, default_timeout: Optional[float], max_workers: int, cache_size: int) -> ToolExecutor:
+    cache = ResultCache(max_size=cache_size) if cache_size > 0 else None
+    return ToolExecutor(max_concurrency=max_concurrency, default_timeout=default_timeout, max_workers=max_workers, cache=cache)
+
+def _serve(executor: ToolExecutor):
+    try:
+        mcp.run()
+    finally:
+        if executor.cache is not None:
+            logger.info(f"Result cache stats: {executor.cache.stats()}")
+        executor.shutdown()
 
-    mcp.run()
+def run_server(
+    agent: SolanaAgentKit,
+    selected_actions: Dict[str, Tool],
+    server_name="agentipy-mcp",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    default_timeout: Optional[float] = DEFAULT_TOOL_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_bytes: int = DEFAULT_MAX_PAGE_BYTES,
+    enable_batch: bool = True,
+    batch_allow_writes: bool = False,
+):
+    """
+    Register the selected actions on the MCP server and run it.
 
-def start_mcp_server(agent: SolanaAgentKit, selected_actions: Dict[str, Tool] = None):
+    Handlers run through a ToolExecutor: at most `max_concurrency` calls execute
+    at once, each call is cancelled after its timeout (the tool's `timeout`
+    attribute or `default_timeout`), and non-coroutine handlers are offloaded
+    to a pool of `max_workers` threads so they never block the server loop.
+    Read-only actions with a cache policy are served from an LRU of
+    `cache_size` entries (0 disables caching).
+
+    Results are serialized compactly. List results longer than `page_size`
+    items and any result larger than `max_page_bytes` are returned one page at
+    a time in several content chunks; the last chunk carries a `next_cursor`
+    that can be passed back as the `cursor` argument to fetch the next page.
+
+    With `enable_batch`, a BATCH meta-action is registered alongside the
+    selected actions so that clients can fan out several reads in one call.
+    BATCH rejects state-changing actions unless `batch_allow_writes` is set.
+    """
+    logger.info(f'Starting MCP server with {list(selected_actions.keys())} actions')
+    executor = _make_executor(max_concurrency, default_timeout, max_workers, cache_size)
+    _register_tools(selected_actions, executor, ResultPager(page_size=page_size, max_page_bytes=max_page_bytes), lambda kwargs: agent, enable_batch, batch_allow_writes=batch_allow_writes)
+    _serve(executor)
+
+def run_multi_agent_server(
+    agent_factory: Callable[[str], SolanaAgentKit],
+    selected_actions: Dict[str, Tool] = None,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    max_agents: int = DEFAULT_MAX_AGENTS,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    default_timeout: Optional[float] = DEFAULT_TOOL_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_bytes: int = DEFAULT_MAX_PAGE_BYTES,
+    enable_batch: bool = True,
+    batch_allow_writes: bool = False,
+):
+    """
+    Run one MCP server process on behalf of many wallets.
+
+    Every action takes an extra `agent_id` argument (a session or wallet
+    identifier), which is also required to fetch further pages with `cursor`. The matching SolanaAgentKit is created on first use with
+    `agent_factory(agent_id)`, shares RPC clients with the other agents of the
+    same endpoint and is evicted after `idle_timeout` seconds without calls.
+    The executor, its concurrency limit and the result cache are shared by
+    all agents. Execution, caching and paging options are the same as for
+    `run_server`.
+    """
     selected = selected_actions or ALL_ACTIONS
-    run_server(agent, selected)
+    logger.info(f'Starting multi-agent MCP server with {list(selected.keys())} actions')
+    pool = AgentPool(agent_factory, idle_timeout=idle_timeout, max_agents=max_agents)
+    executor = _make_executor(max_concurrency, default_timeout, max_workers, cache_size)
+
+    def resolve_agent(kwargs: dict) -> SolanaAgentKit:
+        agent_id = kwargs.pop("agent_id", None)
+        if not agent_id:
+            raise ValueError("Missing required argument: agent_id")
+        return pool.get(str(agent_id))
+
+    _register_tools(selected, executor, ResultPager(page_size=page_size, max_page_bytes=max_page_bytes), resolve_agent, enable_batch, multi_agent=True, batch_allow_writes=batch_allow_writes)
+    _serve(executor)
+
+def start_mcp_server(
+    agent: SolanaAgentKit,
+    selected_actions: Dict[str, Tool] = None,
+    include_langchain_tools: bool = False,
+    langchain_providers: Optional[List[str]] = None,
+    **server_options,
+):
+    """
+    Start the MCP server for one agent.
+
+    With `include_langchain_tools`, the LangChain tools of `langchain_providers`
+    (all providers by default) are exposed as additional actions through the
+    generated adapter; hand-written actions take precedence on name clashes.
+    """
+    selected = dict(selected_actions or ALL_ACTIONS)
+    if include_langchain_tools:
+        from agentipy.mcp.langchain_adapter import build_langchain_actions
+        selected = {**build_langchain_actions(agent, langchain_providers), **selected}
+    run_server(agent, selected, **server_options)
@@ -0,0 +1,159 @@
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+from mcp.types import TextContent
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_PAGE_BYTES = 256_000
+DEFAULT_CHUNK_BYTES = 32_000
+DEFAULT_MAX_STORED_RESULTS = 32
+DEFAULT_CURSOR_TTL = 300.0
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize a tool result compactly.
+
+    Uses orjson when it is installed and falls back to `json.dumps` without
+    indentation. Objects that are not natively serializable (Pubkey, pydantic
+    models, ...) are converted with `str`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+class ResultPager:
+    """
+    Splits large MCP tool results into bounded pages addressed by opaque cursors.
+
+    List results are paged by items (at most `page_size` items or roughly
+    `max_page_bytes` per page) and each page is streamed as several
+    `TextContent` chunks of at most `chunk_bytes`. Any other oversized result is
+    paged over its serialized text. The remainder of a paged result is kept for
+    `ttl` seconds in a bounded LRU so that follow-up calls passing `cursor`
+    are served without re-running the tool. A result rendered for an `owner`
+    is only served to follow-up calls of the same owner.
+    """
+
+    def __init__(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_page_bytes: int = DEFAULT_MAX_PAGE_BYTES,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        max_stored_results: int = DEFAULT_MAX_STORED_RESULTS,
+        ttl: float = DEFAULT_CURSOR_TTL,
+    ):
+        self.page_size = page_size
+        self.max_page_bytes = max_page_bytes
+        self.chunk_bytes = min(chunk_bytes, max_page_bytes)
+        self.max_stored_results = max_stored_results
+        self.ttl = ttl
+        self._results: "OrderedDict[str, Tuple[float, Optional[str], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _store(self, result: Any, owner: Optional[str]) -> str:
+        result_id = secrets.token_urlsafe(12)
+        with self._lock:
+            self._results[result_id] = (time.monotonic() + self.ttl, owner, result)
+            while len(self._results) > self.max_stored_results:
+                self._results.popitem(last=False)
+        return result_id
+
+    def _load(self, result_id: str, owner: Optional[str]) -> Any:
+        with self._lock:
+            entry = self._results.get(result_id)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._results.pop(result_id, None)
+                entry = None
+            # Other owners' cursors are reported like unknown ones
+            if entry is None or entry[1] != owner:
+                raise ValueError("Cursor expired or unknown; re-run the tool to get fresh results")
+            self._results.move_to_end(result_id)
+            return entry[2]
+
+    def _release(self, result_id: str):
+        with self._lock:
+            self._results.pop(result_id, None)
+
+    def _list_page(self, items: list, offset: int) -> Tuple[List[TextContent], int]:
+        contents, chunk, chunk_size, page_size = [], [], 2, 0
+        end = offset
+        while end < len(items) and end - offset < self.page_size:
+            encoded = dumps(items[end])
+            if page_size and page_size + len(encoded) > self.max_page_bytes:
+                break
+            if chunk and chunk_size + len(encoded) + 1 > self.chunk_bytes:
+                contents.append(TextContent(type="text", text="[" + ",".join(chunk) + "]"))
+                chunk, chunk_size = [], 2
+            chunk.append(encoded)
+            chunk_size += len(encoded) + 1
+            page_size += len(encoded)
+            end += 1
+        if chunk:
+            contents.append(TextContent(type="text", text="[" + ",".join(chunk) + "]"))
+        return contents, end
+
+    def _text_page(self, text: str, offset: int) -> Tuple[List[TextContent], int]:
+        end = min(offset + self.max_page_bytes, len(text))
+        contents = [
+            TextContent(type="text", text=text[start:min(start + self.chunk_bytes, end)])
+            for start in range(offset, end, self.chunk_bytes)
+        ]
+        return contents, end
+
+    def _page(self, result_id: Optional[str], payload: Any, offset: int, owner: Optional[str]) -> List[TextContent]:
+        if isinstance(payload, list):
+            contents, end = self._list_page(payload, offset)
+        else:
+            contents, end = self._text_page(payload, offset)
+
+        total = len(payload)
+        if end >= total:
+            if result_id:
+                self._release(result_id)
+            next_cursor = None
+        else:
+            result_id = result_id or self._store(payload, owner)
+            next_cursor = f"{result_id}:{end}"
+
+        page = {"offset": offset, "end": end, "total": total, "unit": "items" if isinstance(payload, list) else "chars"}
+        if next_cursor:
+            page["next_cursor"] = next_cursor
+        contents.append(TextContent(type="text", text=dumps({"page": page})))
+        return contents
+
+    def render(self, result: Any, owner: Optional[str] = None) -> List[TextContent]:
+        """Serialize a fresh tool result for `owner`, paging it when it is too large for one response."""
+        if isinstance(result, list):
+            if len(result) <= self.page_size:
+                text = dumps(result)
+                if len(text) <= self.chunk_bytes:
+                    return [TextContent(type="text", text=text)]
+            return self._page(None, result, 0, owner)
+
+        text = dumps(result)
+        if len(text) <= self.max_page_bytes:
+            return [TextContent(type="text", text=text)]
+        return self._page(None, text, 0, owner)
+
+    def next_page(self, cursor: str, owner: Optional[str] = None) -> List[TextContent]:
+        """Return the page of a result previously rendered for `owner` addressed by `cursor`."""
+        try:
+            result_id, offset = cursor.rsplit(":", 1)
+            offset = int(offset)
+        except (AttributeError, ValueError):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        return self._page(result_id, self._load(result_id, owner), offset, owner)
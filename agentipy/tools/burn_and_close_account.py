@@ -1,17 +1,21 @@
+import asyncio
 import logging
+from typing import List
 
-from solana.rpc.api import Client
+from solana.rpc.commitment import Confirmed
 from solana.rpc.types import TxOpts
 #from solana.transaction import Transaction
-from solders.transaction import Transaction
+from solders.transaction import Transaction, VersionedTransaction  # type: ignore
 from solders.compute_budget import set_compute_unit_limit  # type: ignore
 from solders.compute_budget import set_compute_unit_price  # type: ignore
+from solders.message import MessageV0  # type: ignore
 from solders.pubkey import Pubkey  # type: ignore
 from spl.token.constants import TOKEN_PROGRAM_ID
 from spl.token.instructions import (BurnParams, CloseAccountParams, burn,
                                     close_account)
 
 from agentipy.agent import SolanaAgentKit
+from agentipy.types import BurnAndCloseResult
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -19,6 +23,14 @@ logger = logging.getLogger(__name__)
 class BurnValues:
     DEFAULT_COMPUTE_UNIT_PRICE = 100_000
     DEFAULT_COMPUTE_UNIT_LIMIT = 100_000
+    # Compute units budgeted per burn + close instruction pair in bulk mode
+    COMPUTE_UNITS_PER_ACCOUNT = 12_000
+    # Burn + close pairs packed into one transaction; 8 pairs keep the
+    # serialized transaction comfortably below the 1232 byte packet limit
+    ACCOUNTS_PER_TRANSACTION = 8
+    # getMultipleAccounts accepts at most 100 keys per request
+    MAX_ACCOUNTS_PER_RPC = 100
+    MAX_CONCURRENT_SENDS = 16
 
 class BurnManager:
     @staticmethod
@@ -32,7 +44,7 @@ class BurnManager:
         """
         token_account_pubkey = Pubkey.from_string(token_account)
         try:
-            client = Client(agent.rpc_url)
+            client = agent.connection_client
             token_balance = int(client.get_token_account_balance(token_account_pubkey).value.amount)
             logger.info(f"Token balance for {token_account}: {token_balance}")
         except Exception as e:
@@ -99,3 +111,153 @@ class BurnManager:
                 BurnManager.burn_and_close_account(agent, token_account)
             except Exception as e:
                 logger.error(f"Error processing token account {token_account}: {e}", exc_info=True)
+
+    @staticmethod
+    async def _fetch_token_accounts(agent: SolanaAgentKit, pubkeys: List[Pubkey]) -> list:
+        """
+        Fetches the parsed state of token accounts with batched getMultipleAccounts calls.
+
+        Returns:
+            list: Parsed account infos in the same order as `pubkeys` (None for missing accounts).
+        """
+        chunks = [
+            pubkeys[i:i + BurnValues.MAX_ACCOUNTS_PER_RPC]
+            for i in range(0, len(pubkeys), BurnValues.MAX_ACCOUNTS_PER_RPC)
+        ]
+        responses = await asyncio.gather(*(
+            agent.connection.get_multiple_accounts_json_parsed(chunk, commitment=Confirmed)
+            for chunk in chunks
+        ))
+        return [account for response in responses for account in response.value]
+
+    @staticmethod
+    async def burn_and_close_accounts_bulk(
+        agent: SolanaAgentKit,
+        token_accounts: List[str],
+        accounts_per_transaction: int = BurnValues.ACCOUNTS_PER_TRANSACTION,
+        max_concurrency: int = BurnValues.MAX_CONCURRENT_SENDS,
+    ) -> List[BurnAndCloseResult]:
+        """
+        Burns the remaining balance of and closes many token accounts at once.
+
+        Account states are read with batched getMultipleAccounts calls, several
+        burn + close instruction pairs are packed into each transaction and the
+        transactions are submitted concurrently.
+
+        Args:
+            agent (SolanaAgentKit): The agent instance containing wallet and RPC configuration.
+            token_accounts (List[str]): Token account public keys as strings.
+            accounts_per_transaction (int): Number of accounts processed per transaction.
+            max_concurrency (int): Maximum number of transactions in flight at once.
+
+        Returns:
+            List[BurnAndCloseResult]: One result per requested token account, in input order.
+        """
+        if accounts_per_transaction < 1:
+            raise ValueError("accounts_per_transaction must be at least 1")
+
+        owner = agent.wallet.pubkey()
+        results = {}
+        pending = []
+
+        unique_accounts = list(dict.fromkeys(token_accounts))
+        pubkeys = []
+        for token_account in unique_accounts:
+            try:
+                pubkeys.append(Pubkey.from_string(token_account))
+            except Exception as e:
+                results[token_account] = BurnAndCloseResult(
+                    token_account=token_account, status="failed", error=f"Invalid public key: {e}"
+                )
+
+        valid_accounts = [account for account in unique_accounts if account not in results]
+        infos = await BurnManager._fetch_token_accounts(agent, pubkeys) if pubkeys else []
+
+        for token_account, pubkey, info in zip(valid_accounts, pubkeys, infos):
+            if info is None:
+                results[token_account] = BurnAndCloseResult(
+                    token_account=token_account, status="skipped", error="Account does not exist"
+                )
+                continue
+            try:
+                parsed = info.data.parsed["info"]
+                mint = Pubkey.from_string(parsed["mint"])
+                amount = int(parsed["tokenAmount"]["amount"])
+                if parsed["owner"] != str(owner):
+                    raise ValueError("Token account is not owned by the agent wallet")
+                if parsed.get("state") == "frozen":
+                    raise ValueError("Token account is frozen")
+            except Exception as e:
+                results[token_account] = BurnAndCloseResult(
+                    token_account=token_account, status="skipped", error=str(e)
+                )
+                continue
+
+            program_id = info.owner
+            instructions = []
+            # Wrapped SOL cannot be burned; closing returns the lamports instead
+            burn_amount = 0 if parsed.get("isNative") else amount
+            if burn_amount > 0:
+                instructions.append(burn(
+                    BurnParams(
+                        program_id=program_id,
+                        account=pubkey,
+                        mint=mint,
+                        owner=owner,
+                        amount=burn_amount
+                    )
+                ))
+            instructions.append(close_account(
+                CloseAccountParams(
+                    program_id=program_id,
+                    account=pubkey,
+                    dest=owner,
+                    owner=owner
+                )
+            ))
+            pending.append((token_account, str(mint), burn_amount, instructions))
+
+        if pending:
+            blockhash_response = await agent.connection.get_latest_blockhash(commitment=Confirmed)
+            recent_blockhash = blockhash_response.value.blockhash
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def send_batch(batch: list):
+                instructions = [
+                    set_compute_unit_price(BurnValues.DEFAULT_COMPUTE_UNIT_PRICE),
+                    set_compute_unit_limit(BurnValues.COMPUTE_UNITS_PER_ACCOUNT * len(batch)),
+                ]
+                for _, _, _, account_instructions in batch:
+                    instructions.extend(account_instructions)
+
+                signature, error = None, None
+                try:
+                    message = MessageV0.try_compile(owner, instructions, [], recent_blockhash)
+                    transaction = VersionedTransaction(message, [agent.wallet])
+                    async with semaphore:
+                        response = await agent.connection.send_raw_transaction(
+                            bytes(transaction), opts=TxOpts(skip_preflight=True)
+                        )
+                    signature = str(response.value)
+                    logger.info(f"Burned and closed {len(batch)} token accounts: {signature}")
+                except Exception as e:
+                    error = str(e)
+                    logger.error(f"Error sending burn and close transaction: {e}", exc_info=True)
+
+                for token_account, mint, burn_amount, _ in batch:
+                    results[token_account] = BurnAndCloseResult(
+                        token_account=token_account,
+                        status="failed" if error else "submitted",
+                        signature=signature,
+                        mint=mint,
+                        burned_amount=burn_amount,
+                        error=error,
+                    )
+
+            batches = [
+                pending[i:i + accounts_per_transaction]
+                for i in range(0, len(pending), accounts_per_transaction)
+            ]
+            await asyncio.gather(*(send_batch(batch) for batch in batches))
+
+        return [results[token_account] for token_account in token_accounts]
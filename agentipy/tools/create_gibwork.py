@@ -1,6 +1,6 @@
+import asyncio
 import base64
 
-import requests
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.types import TxOpts
 #from solana.transaction import Transaction
@@ -10,6 +10,7 @@ from solders.pubkey import Pubkey as PublicKey  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.types import GibworkCreateTaskResponse
+from agentipy.utils.http_policy import http_policy
 
 
 class GibworkManager:
@@ -36,7 +37,8 @@ class GibworkManager:
                 },
             }
 
-            response = requests.post(
+            response = await asyncio.to_thread(
+                http_policy.post,
                 "https://api2.gib.work/tasks/public/transaction",
                 headers={"Content-Type": "application/json"},
                 json=payload,
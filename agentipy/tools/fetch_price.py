@@ -1,9 +1,16 @@
+import asyncio
+from typing import Dict, Iterable, Optional
+
 import aiohttp
 
 from agentipy.helpers import fix_asyncio_for_windows
+from agentipy.utils.http_policy import http_policy
 
 fix_asyncio_for_windows()
 
+PRICE_API_URL = "https://lite-api.jup.ag/price/v3"
+MAX_IDS_PER_PRICE_REQUEST = 50
+
 class TokenPriceFetcher:
     @staticmethod
     async def fetch_price(token_id: str) -> str:
@@ -20,32 +27,65 @@ class TokenPriceFetcher:
             Exception: If the fetch request fails or price data is unavailable.
         """
         #v3
-        url = f"https://lite-api.jup.ag/price/v3?ids={token_id}"
+        url = f"{PRICE_API_URL}?ids={token_id}"
 
         try:
             async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        if response.status == 400:
-                            error_text = await response.text()
-                            raise Exception(f"Failed to fetch price (400 Bad Request): {error_text}")
-                        elif response.status == 404:
-                            error_text = await response.text()
-                            raise Exception(f"Failed to fetch price (404 Not Found): {error_text}")
-                        else:
-                            raise Exception(f"Failed to fetch price: {response.status}")
-
-                    data = await response.json()
-
-                    token_data = data.get(token_id) 
-                    if token_data:
-                        price = token_data.get("usdPrice") 
+                response = await http_policy.arequest(session, "GET", url)
+                if response.status != 200:
+                    if response.status == 400:
+                        error_text = await response.text()
+                        raise Exception(f"Failed to fetch price (400 Bad Request): {error_text}")
+                    elif response.status == 404:
+                        error_text = await response.text()
+                        raise Exception(f"Failed to fetch price (404 Not Found): {error_text}")
                     else:
-                        price = None 
+                        raise Exception(f"Failed to fetch price: {response.status}")
+
+                data = await response.json()
 
-                    if price is None: 
-                        raise Exception(f"Price data not available for token ID: {token_id}. Response: {data}")
+                token_data = data.get(token_id) 
+                if token_data:
+                    price = token_data.get("usdPrice") 
+                else:
+                    price = None 
 
-                    return str(price)
+                if price is None: 
+                    raise Exception(f"Price data not available for token ID: {token_id}. Response: {data}")
+
+                return str(price)
         except Exception as e:
-            raise Exception(f"Price fetch failed: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Price fetch failed: {str(e)}")
+
+    @staticmethod
+    async def fetch_prices(token_ids: Iterable[str]) -> Dict[str, Optional[float]]:
+        """
+        Fetch the USD prices of many tokens, requesting up to 50 ids per call.
+
+        Args:
+            token_ids (Iterable[str]): Token mint addresses.
+
+        Returns:
+            Dict[str, Optional[float]]: Prices keyed by mint; None where no price is available.
+
+        Raises:
+            Exception: If a price request fails.
+        """
+        ids = list(dict.fromkeys(token_ids))
+        chunks = [ids[i:i + MAX_IDS_PER_PRICE_REQUEST] for i in range(0, len(ids), MAX_IDS_PER_PRICE_REQUEST)]
+
+        async with aiohttp.ClientSession() as session:
+            async def fetch_chunk(chunk):
+                response = await http_policy.arequest(session, "GET", PRICE_API_URL, params={"ids": ",".join(chunk)})
+                if response.status != 200:
+                    raise Exception(f"Failed to fetch prices: {response.status}")
+                return await response.json()
+
+            responses = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+
+        prices: Dict[str, Optional[float]] = {}
+        for data in responses:
+            for token_id, token_data in (data or {}).items():
+                price = (token_data or {}).get("usdPrice")
+                prices[token_id] = float(price) if price is not None else None
+        return {token_id: prices.get(token_id) for token_id in ids}
@@ -1,39 +1,59 @@
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Dict, Optional
 
-import requests
 from solders.pubkey import Pubkey  # type: ignore
 
 from agentipy.types import JupiterTokenData
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
+VERIFIED_TOKENS_URL = "https://tokens.jup.ag/tokens?tags=verified"
+VERIFIED_TOKENS_TTL = 3600.0
+
 class TokenDataManager:
-    @staticmethod
-    def get_token_data_by_address(mint: Pubkey) -> Optional[JupiterTokenData]:
-        try:
-            if not mint:
-                raise ValueError("Mint address is required")
+    _verified_tokens: Optional[Dict[str, JupiterTokenData]] = None
+    _verified_tokens_expiry = 0.0
+    _verified_tokens_lock = threading.Lock()
 
-            response = requests.get("https://tokens.jup.ag/tokens?tags=verified", headers={"Content-Type": "application/json"})
-            response.raise_for_status()
+    @staticmethod
+    def get_verified_tokens() -> Dict[str, JupiterTokenData]:
+        """
+        Jupiter's verified token list keyed by mint address.
 
-            data = response.json()
-            for token in data:
-                if token.get("address") == str(mint):
-                    return JupiterTokenData(
+        The list is downloaded at most once per hour instead of on every lookup.
+        """
+        with TokenDataManager._verified_tokens_lock:
+            if TokenDataManager._verified_tokens is None or time.monotonic() >= TokenDataManager._verified_tokens_expiry:
+                response = http_policy.get(VERIFIED_TOKENS_URL, headers={"Content-Type": "application/json"})
+                response.raise_for_status()
+                TokenDataManager._verified_tokens = {
+                    token.get("address"): JupiterTokenData(
                         address=token.get("address"),
                         symbol=token.get("symbol"),
                         name=token.get("name"),
                     )
-            return None
+                    for token in response.json()
+                }
+                TokenDataManager._verified_tokens_expiry = time.monotonic() + VERIFIED_TOKENS_TTL
+            return TokenDataManager._verified_tokens
+
+    @staticmethod
+    def get_token_data_by_address(mint: Pubkey) -> Optional[JupiterTokenData]:
+        try:
+            if not mint:
+                raise ValueError("Mint address is required")
+
+            return TokenDataManager.get_verified_tokens().get(str(mint))
         except Exception as error:
             raise Exception(f"Error fetching token data: {str(error)}")
         
     @staticmethod
     def get_token_address_from_ticker(ticker: str) -> Optional[str]:
         try:
-            response = requests.get(f"https://api.dexscreener.com/latest/dex/search?q={ticker}")
+            response = http_policy.get(f"https://api.dexscreener.com/latest/dex/search?q={ticker}")
             response.raise_for_status()
 
             data = response.json()
@@ -1,9 +1,9 @@
+import asyncio
 import json
 import logging
 from typing import Any, Dict, Optional
 
 import aiohttp
-import requests
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed
 from solana.rpc.types import TxOpts
@@ -18,6 +18,7 @@ from agentipy.agent import SolanaAgentKit
 from agentipy.constants import DEFAULT_OPTIONS
 from agentipy.helpers import fix_asyncio_for_windows
 from agentipy.types import PumpfunTokenOptions, TokenLaunchResult
+from agentipy.utils.http_policy import http_policy
 from agentipy.utils.send_tx import sign_and_send_transaction
 
 logger = logging.getLogger(__name__)
@@ -64,10 +65,10 @@ class PumpfunTokenManager:
                 form_data.add_field("website", options.website)
 
         logger.debug(f"Downloading image from {image_url}...")
-        async with session.get(image_url) as image_response:
-            if image_response.status != 200:
-                raise ValueError(f"Failed to download image from {image_url} (status {image_response.status})")
-            image_data = await image_response.read()
+        image_response = await http_policy.arequest(session, "GET", image_url)
+        if image_response.status != 200:
+            raise ValueError(f"Failed to download image from {image_url} (status {image_response.status})")
+        image_data = await image_response.read()
 
         form_data.add_field(
             "file",
@@ -124,18 +125,20 @@ class PumpfunTokenManager:
         }
 
         logger.debug("Requesting token transaction from Pump.fun...")
-        response = requests.post(
+        response = await http_policy.arequest(
+                session,
+                "POST",
                 "https://pumpportal.fun/api/trade-local",
                 headers={"Content-Type": "application/json"},
                 data=json.dumps(payload)
             )
 
-        if response.status_code != 200:
+        if response.status != 200:
             raise RuntimeError(
-                f"Transaction creation failed (status {response.status_code}): {response.text}"
+                f"Transaction creation failed (status {response.status}): {await response.text()}"
             )
 
-        tx_data = response.content
+        tx_data = await response.read()
 
         tx = VersionedTransaction.from_bytes(tx_data)
         logger.debug(f"Transaction successfully created: {tx}")
@@ -201,7 +204,8 @@ class PumpfunTokenManager:
 
             logger.info("Sending transaction to Solana network...")
 
-            response = requests.post(
+            response = await asyncio.to_thread(
+            http_policy.post,
             url= agent.rpc_url,
             headers={"Content-Type": "application/json"},
             data=SendVersionedTransaction(tx, config).to_json()
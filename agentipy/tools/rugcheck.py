@@ -1,44 +1,112 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 import aiohttp
 
 from agentipy.types import TokenCheck, RiskItem, TokenLockers, TrendingToken 
+from agentipy.utils.http_policy import http_policy
 
 BASE_URL = "https://api.rugcheck.xyz/v1"
+DEFAULT_REPORT_TTL = 300.0
+DEFAULT_REPORT_CACHE_SIZE = 4096
+DEFAULT_BULK_CONCURRENCY = 16
 
 logger = logging.getLogger(__name__)
 
 class RugCheckManager:
-    def __init__(self, api_key: Optional[str] = None):
+    """
+    RugCheck API client.
+
+    One `aiohttp` session is reused for all requests, and per-mint reports
+    (summary, detailed report, LP lockers) are cached for `report_ttl`
+    seconds. Concurrent requests for the same report share a single call.
+
+    Args:
+        api_key (str, optional): RugCheck API key.
+        report_ttl (float): Seconds a per-mint report stays cached; 0 disables caching.
+        report_cache_size (int): Maximum number of cached reports.
+        max_connections (int): Connection pool size of the shared session.
+    """
+
+    _shared: Optional["RugCheckManager"] = None
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        report_ttl: float = DEFAULT_REPORT_TTL,
+        report_cache_size: int = DEFAULT_REPORT_CACHE_SIZE,
+        max_connections: int = 64,
+    ):
         self.api_key = api_key
         self.headers = {
             "Accept": "application/json"
         }
         if api_key:
             self.headers["Authorization"] = f"Bearer {api_key}"
+        self.report_ttl = report_ttl
+        self.report_cache_size = report_cache_size
+        self.max_connections = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reports: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @classmethod
+    def shared(cls) -> "RugCheckManager":
+        """Process-wide manager used by SolanaAgentKit, so all agents share one session and report cache."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    async def __aenter__(self) -> "RugCheckManager":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # A session is bound to the loop it was created on
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+            )
+            self._session_loop = loop
+            self._inflight.clear()
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    def clear_cache(self):
+        self._reports.clear()
 
     async def _make_request(self, method: str, url: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> Dict:
         """
         Internal helper function to make API requests, handling potential errors and API key usage.
         """
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                if method == "GET":
-                    async with session.get(url, params=params) as response:
-                        response.raise_for_status()
-                        return await response.json()
-                elif method == "POST":
-                    async with session.post(url, json=data, params=params) as response:
-                        response.raise_for_status()
-                        return await response.json()
-                elif method == "GET_BYTES":  
-                    async with session.get(url, params=params) as response:
-                        response.raise_for_status()
-                        return await response.read()
-
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+            if method not in ("GET", "POST", "GET_BYTES"):
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            session = self._get_session()
+            if method == "POST":
+                response = await http_policy.arequest(session, "POST", url, json=data, params=params)
+            else:
+                response = await http_policy.arequest(session, "GET", url, params=params)
+            response.raise_for_status()
+            if method == "GET_BYTES":
+                return await response.read()
+            return await response.json()
         except aiohttp.ClientResponseError as e:
             logger.error(f"HTTP error {e.status}: {e.message} - URL: {url} - Params: {params}")
             raise
@@ -46,6 +114,74 @@ class RugCheckManager:
             logger.error(f"Error making request to {url}: {str(e)} - Params: {params}")
             raise
 
+    async def _cached_report(self, kind: str, mint: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached `kind` report of `mint`, fetching it (once, even if requested concurrently) when stale."""
+        key = (kind, mint)
+        entry = self._reports.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._reports.move_to_end(key)
+            self.cache_hits += 1
+            return entry[1]
+        self.cache_misses += 1
+
+        self._get_session()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+
+            def _done(t: asyncio.Future):
+                self._inflight.pop(key, None)
+                if t.cancelled() or t.exception() is not None or self.report_ttl <= 0:
+                    return
+                self._reports[key] = (time.monotonic() + self.report_ttl, t.result())
+                self._reports.move_to_end(key)
+                while len(self._reports) > self.report_cache_size:
+                    self._reports.popitem(last=False)
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _parse_token_check(data: Dict) -> TokenCheck:
+        """Build a TokenCheck from only the fields it declares; detailed reports carry far more data."""
+        fields = {name: data[name] for name in TokenCheck.model_fields if name in data}
+        fields["risks"] = [RiskItem(**r) for r in fields.get("risks") or []]
+        return TokenCheck(**fields)
+
+    async def fetch_reports_bulk(
+        self,
+        mints: Iterable[str],
+        detailed: bool = False,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Dict[str, Optional[TokenCheck]]:
+        """
+        Fetch reports for many mints with bounded concurrency.
+
+        Args:
+            mints (Iterable[str]): Mint addresses; duplicates are fetched once.
+            detailed (bool): Fetch the detailed report instead of the summary.
+            max_concurrency (int): Maximum number of requests in flight.
+
+        Returns:
+            Dict[str, Optional[TokenCheck]]: Reports keyed by mint, in input order. Mints whose
+            report could not be fetched map to None.
+        """
+        unique = list(dict.fromkeys(mints))
+        semaphore = asyncio.Semaphore(max_concurrency)
+        fetch = self.fetch_token_detailed_report if detailed else self.fetch_token_report_summary
+
+        async def fetch_one(mint: str) -> Optional[TokenCheck]:
+            async with semaphore:
+                try:
+                    return await fetch(mint)
+                except Exception as e:
+                    logger.warning(f"RugCheck report for {mint} failed: {e}")
+                    return None
+
+        reports = await asyncio.gather(*(fetch_one(mint) for mint in unique))
+        return dict(zip(unique, reports))
+
     async def fetch_token_report_summary(self, mint: str) -> TokenCheck:
         """
         Fetch a summary report for a token.
@@ -61,11 +197,10 @@ class RugCheckManager:
         """
         url = f"{BASE_URL}/tokens/{mint}/report/summary"
         try:
-            data = await self._make_request("GET", url)
-
-            data["risks"] = [RiskItem(**r) for r in data.get("risks", [])]
+            async def fetch():
+                return self._parse_token_check(await self._make_request("GET", url))
 
-            return TokenCheck(**data)
+            return await self._cached_report("summary", mint, fetch)
         except Exception as e:
             logger.error(f"Error fetching token report: {str(e)}")
             raise
@@ -86,8 +221,10 @@ class RugCheckManager:
         """
         url = f"{BASE_URL}/tokens/{mint}/report"
         try:
-            data = await self._make_request("GET", url)
-            return TokenCheck(**data)
+            async def fetch():
+                return self._parse_token_check(await self._make_request("GET", url))
+
+            return await self._cached_report("report", mint, fetch)
         except Exception as e:
             logger.error(f"Error fetching detailed token report: {str(e)}")
             raise
@@ -293,8 +430,10 @@ class RugCheckManager:
         """
         url = f"{BASE_URL}/tokens/{token_id}/lockers"
         try:
-            data = await self._make_request("GET", url)
-            return TokenLockers(**data)
+            async def fetch():
+                return TokenLockers(**await self._make_request("GET", url))
+
+            return await self._cached_report("lockers", token_id, fetch)
         except Exception as e:
             logger.error(f"Error fetching LP lockers: {str(e)}")
             raise
@@ -314,8 +453,10 @@ class RugCheckManager:
         """
         url = f"{BASE_URL}/tokens/{token_id}/lockers/flux"
         try:
-            data = await self._make_request("GET", url)
-            return TokenLockers(**data)
+            async def fetch():
+                return TokenLockers(**await self._make_request("GET", url))
+
+            return await self._cached_report("flux_lockers", token_id, fetch)
         except Exception as e:
             logger.error(f"Error fetching Flux LP lockers: {str(e)}")
             raise
@@ -0,0 +1,280 @@
+import asyncio
+import logging
+from typing import (AsyncIterable, AsyncIterator, Dict, Iterable, List,
+                    Optional, Union)
+
+from solana.rpc.commitment import Confirmed
+from solders.pubkey import Pubkey  # type: ignore
+
+from agentipy.agent import SolanaAgentKit
+from agentipy.tools.fetch_price import TokenPriceFetcher
+from agentipy.tools.get_token_data import TokenDataManager
+from agentipy.tools.rugcheck import RugCheckManager
+from agentipy.tools.use_pumpfun import PumpfunManager
+from agentipy.types import TokenScreeningCriteria, TokenScreeningResult
+from agentipy.utils.http_policy import retry_async
+
+logger = logging.getLogger(__name__)
+
+MAX_ACCOUNTS_PER_RPC = 100
+DEFAULT_SCREENING_BATCH_SIZE = 100
+DEFAULT_SCREENING_BATCH_WAIT = 0.25
+DEFAULT_SCREENING_CONCURRENCY = 16
+
+_DONE = object()
+
+
+class TokenScreener:
+    """
+    Streaming token-screening pipeline.
+
+    Incoming mints are grouped into small batches (up to `batch_size` mints or
+    `batch_wait` seconds, whichever comes first). Each batch costs one
+    getMultipleAccounts call for the mint accounts and one for the Pump.fun
+    bonding curves; mints failing the on-chain checks (e.g. mint authority
+    still set) are rejected right away, without any API call. Survivors get
+    their RugCheck report and price fetched concurrently, with at most
+    `max_concurrency` mints in flight, and results are yielded as soon as
+    they are ready, so output order is not input order.
+
+    Args:
+        agent (SolanaAgentKit): Agent whose RPC connection is used.
+        criteria (TokenScreeningCriteria, optional): Rejection rules.
+        max_concurrency (int): Maximum number of mints being enriched at once.
+        batch_size (int): Maximum mints per on-chain batch read (at most 100).
+        batch_wait (float): Seconds to wait for a batch to fill when reading from an async stream.
+        rugcheck (RugCheckManager, optional): RugCheck client; defaults to the shared one.
+    """
+
+    def __init__(
+        self,
+        agent: SolanaAgentKit,
+        criteria: Optional[TokenScreeningCriteria] = None,
+        max_concurrency: int = DEFAULT_SCREENING_CONCURRENCY,
+        batch_size: int = DEFAULT_SCREENING_BATCH_SIZE,
+        batch_wait: float = DEFAULT_SCREENING_BATCH_WAIT,
+        rugcheck: Optional[RugCheckManager] = None,
+    ):
+        self.agent = agent
+        self.criteria = criteria or TokenScreeningCriteria()
+        self.max_concurrency = max_concurrency
+        self.batch_size = max(1, min(batch_size, MAX_ACCOUNTS_PER_RPC))
+        self.batch_wait = batch_wait
+        self.rugcheck = rugcheck or RugCheckManager.shared()
+
+    async def _batches(self, mints: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[List[str]]:
+        if not hasattr(mints, "__aiter__"):
+            unique = list(dict.fromkeys(mints))
+            for i in range(0, len(unique), self.batch_size):
+                yield unique[i:i + self.batch_size]
+            return
+
+        loop = asyncio.get_running_loop()
+        iterator = mints.__aiter__()
+        batch: List[str] = []
+        deadline = 0.0
+        pending = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                timeout = max(0.0, deadline - loop.time()) if batch else None
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if not done:
+                    yield batch
+                    batch = []
+                    continue
+                finished, pending = pending, None
+                try:
+                    mint = finished.result()
+                except StopAsyncIteration:
+                    break
+                if not batch:
+                    deadline = loop.time() + self.batch_wait
+                if mint not in batch:
+                    batch.append(mint)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _verified_tokens(self) -> Dict[str, object]:
+        try:
+            return await asyncio.to_thread(TokenDataManager.get_verified_tokens)
+        except Exception as e:
+            logger.warning(f"Verified token list unavailable: {e}")
+            return {}
+
+    def _reject(self, result: TokenScreeningResult, *reasons: str) -> TokenScreeningResult:
+        result.status = "rejected"
+        result.reasons = [*result.reasons, *reasons]
+        return result
+
+    async def _prefilter(self, batch: List[str]) -> List[TokenScreeningResult]:
+        """Run the on-chain checks of a batch; returns one result per mint, `status` "pending" for survivors."""
+        results: List[TokenScreeningResult] = []
+        pubkeys: List[Pubkey] = []
+        valid: List[TokenScreeningResult] = []
+        for mint in batch:
+            result = TokenScreeningResult(mint=mint, status="pending")
+            results.append(result)
+            try:
+                pubkeys.append(Pubkey.from_string(mint))
+                valid.append(result)
+            except Exception as e:
+                result.status = "error"
+                result.error = f"Invalid mint address: {e}"
+        if not pubkeys:
+            return results
+
+        curves = [PumpfunManager.derive_bonding_curve(pubkey) for pubkey in pubkeys]
+        mint_response, curve_states, verified = await asyncio.gather(
+            self.agent.connection.get_multiple_accounts_json_parsed(pubkeys, commitment=Confirmed),
+            PumpfunManager.get_pump_curve_states(self.agent.connection, curves),
+            self._verified_tokens(),
+        )
+
+        criteria = self.criteria
+        for result, account, curve_state in zip(valid, mint_response.value, curve_states):
+            if account is None:
+                self._reject(result, "Mint account does not exist")
+                continue
+            parsed = getattr(account.data, "parsed", None)
+            if not isinstance(parsed, dict) or parsed.get("type") != "mint":
+                self._reject(result, "Account is not a token mint")
+                continue
+            info = parsed["info"]
+            result.mint_authority = info.get("mintAuthority")
+            result.freeze_authority = info.get("freezeAuthority")
+            result.supply = int(info.get("supply", 0))
+            result.decimals = info.get("decimals")
+            result.verified = result.mint in verified
+            if curve_state is not None:
+                result.pump_curve_complete = curve_state.complete
+                try:
+                    result.pump_curve_price_sol = PumpfunManager.calculate_pump_curve_price(curve_state)
+                except ValueError:
+                    pass
+
+            reasons = []
+            if result.mint_authority and not criteria.allow_mint_authority:
+                reasons.append("Mint authority is still set")
+            if result.freeze_authority and not criteria.allow_freeze_authority:
+                reasons.append("Freeze authority is set")
+            if criteria.require_verified and not result.verified:
+                reasons.append("Token is not on the verified list")
+            if reasons:
+                self._reject(result, *reasons)
+        return results
+
+    async def _prefilter_or_error(self, batch: List[str]) -> List[TokenScreeningResult]:
+        """`_prefilter` with retries; if it keeps failing, every mint of the batch is reported with status "error"."""
+        try:
+            return await retry_async(
+                lambda: self._prefilter(batch), description=f"On-chain screening of {len(batch)} mints"
+            )
+        except Exception as e:
+            return [TokenScreeningResult(mint=mint, status="error", error=str(e)) for mint in batch]
+
+    async def _enrich(self, result: TokenScreeningResult, prices: asyncio.Future) -> TokenScreeningResult:
+        criteria = self.criteria
+        try:
+            report = await self.rugcheck.fetch_token_report_summary(result.mint)
+        except Exception as e:
+            report = None
+            result.reasons = [*result.reasons, f"RugCheck report unavailable: {e}"]
+
+        if report is not None:
+            result.rugcheck_score = report.score_normalised
+            result.risks = [risk.name for risk in report.risks]
+            reasons = [
+                f"RugCheck risk: {risk.name}"
+                for risk in report.risks
+                if risk.level in criteria.reject_risk_levels
+            ]
+            if (
+                criteria.max_rugcheck_score is not None
+                and report.score_normalised is not None
+                and report.score_normalised > criteria.max_rugcheck_score
+            ):
+                reasons.append(f"RugCheck score {report.score_normalised} above {criteria.max_rugcheck_score}")
+            if reasons:
+                return self._reject(result, *reasons)
+
+        try:
+            result.price_usd = (await asyncio.shield(prices)).get(result.mint)
+        except Exception as e:
+            logger.warning(f"Price lookup for {result.mint} failed: {e}")
+        if criteria.min_price_usd is not None and (result.price_usd is None or result.price_usd < criteria.min_price_usd):
+            return self._reject(result, f"Price below {criteria.min_price_usd} USD")
+
+        result.status = "passed"
+        if result.rugcheck_score is not None:
+            result.score = max(0.0, 100.0 - min(result.rugcheck_score, 100))
+        return result
+
+    async def screen(self, mints: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[TokenScreeningResult]:
+        """
+        Screen a stream of mints.
+
+        Args:
+            mints (Iterable[str] | AsyncIterable[str]): Mint addresses, e.g. from a new-token feed.
+
+        Yields:
+            TokenScreeningResult: One result per distinct mint (within a batch), as soon as it is ready.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = set()
+
+        async def enrich(result: TokenScreeningResult, prices: asyncio.Future):
+            try:
+                await queue.put(await self._enrich(result, prices))
+            except Exception as e:
+                result.status = "error"
+                result.error = str(e)
+                await queue.put(result)
+            finally:
+                semaphore.release()
+
+        async def produce():
+            try:
+                async for batch in self._batches(mints):
+                    results = await self._prefilter_or_error(batch)
+                    survivors = [result for result in results if result.status == "pending"]
+                    for result in results:
+                        if result.status != "pending":
+                            await queue.put(result)
+                    if not survivors:
+                        continue
+                    prices = asyncio.ensure_future(TokenPriceFetcher.fetch_prices([r.mint for r in survivors]))
+                    # Keep an unobserved price failure from being reported as never retrieved
+                    prices.add_done_callback(lambda f: f.cancelled() or f.exception())
+                    for result in survivors:
+                        await semaphore.acquire()
+                        task = asyncio.ensure_future(enrich(result, prices))
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                if tasks:
+                    await asyncio.gather(*tasks)
+                await queue.put(_DONE)
+            except Exception as e:
+                await queue.put(e)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+            for task in list(tasks):
+                task.cancel()
@@ -6,6 +6,7 @@ from solders.transaction import VersionedTransaction
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.helpers import fix_asyncio_for_windows
+from agentipy.utils.http_policy import http_policy
 
 fix_asyncio_for_windows()
 
@@ -30,10 +31,10 @@ class StakeManager:
             payload = {"account": str(agent.wallet_address)}
 
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as res:
-                    if res.status != 200:
-                        raise Exception(f"Failed to fetch transaction: {res.status}")
-                    data = await res.json()
+                res = await http_policy.arequest(session, "POST", url, json=payload)
+                if res.status != 200:
+                    raise Exception(f"Failed to fetch transaction: {res.status}")
+                data = await res.json()
 
             txn = VersionedTransaction.from_bytes(base64.b64decode(data["transaction"]))
             latest_blockhash = await agent.connection.get_latest_blockhash()
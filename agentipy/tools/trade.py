@@ -12,6 +12,7 @@ from solders.transaction import VersionedTransaction  # type: ignore
 from agentipy.agent import SolanaAgentKit
 from agentipy.constants import (DEFAULT_OPTIONS, JUP_API, LAMPORTS_PER_SOL,
                                 TOKENS)
+from agentipy.utils.http_policy import http_policy
 # from agentipy.helpers import fix_asyncio_for_windows #Removed because it is not needed anymore.
 
 if platform.system() == "Windows": #Added the aiodns fix.
@@ -56,12 +57,14 @@ class TradeManager:
             )
 
             async with aiohttp.ClientSession() as session:
-                async with session.get(quote_url) as quote_response:
-                    if quote_response.status != 200:
-                        raise Exception(f"Failed to fetch quote: {quote_response.status}")
-                    quote_data = await quote_response.json()
-
-                async with session.post(
+                quote_response = await http_policy.arequest(session, "GET", quote_url)
+                if quote_response.status != 200:
+                    raise Exception(f"Failed to fetch quote: {quote_response.status}")
+                quote_data = await quote_response.json()
+
+                swap_response = await http_policy.arequest(
+                    session,
+                    "POST",
                     f"{JUP_API}/swap",
                     json={
                         "quoteResponse": quote_data,
@@ -70,10 +73,10 @@ class TradeManager:
                         "dynamicComputeUnitLimit": True,
                         "prioritizationFeeLamports": "auto",
                     },
-                ) as swap_response:
-                    if swap_response.status != 200:
-                        raise Exception(f"Failed to fetch swap transaction: {swap_response.status}")
-                    swap_data = await swap_response.json()
+                )
+                if swap_response.status != 200:
+                    raise Exception(f"Failed to fetch swap transaction: {swap_response.status}")
+                swap_data = await swap_response.json()
 
             swap_transaction_buf = base64.b64decode(swap_data["swapTransaction"])
             transaction = VersionedTransaction.from_bytes(swap_transaction_buf)
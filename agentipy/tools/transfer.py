@@ -6,6 +6,7 @@ from solders.system_program import TransferParams, transfer
 from spl.token.async_client import AsyncToken
 
 from agentipy.agent import SolanaAgentKit
+from agentipy.utils.rpc_accounting import instrument_client
 
 LAMPORTS_PER_SOL = 10**9
 
@@ -41,7 +42,7 @@ class TokenTransferManager:
                 )
             else:
                 mint_pubkey = PublicKey.from_string(mint)
-                async with AsyncClient(agent.rpc_url) as client:
+                async with instrument_client(AsyncClient(agent.rpc_url), agent.rpc_accountant) as client:
                     token = AsyncToken(client, mint_pubkey)
                     
                     from_ata = await token.get_associated_token_address(wallet_pubkey)
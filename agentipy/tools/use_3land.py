@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +51,7 @@ class ThreeLandManager:
                 "isDevnet": is_devnet,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/nft/3land-create-collection",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -139,7 +140,7 @@ class ThreeLandManager:
                 "withPool": with_pool,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/nft/3land-create-nft",
                 json=payload,
                 headers={"Content-Type": "application/json"}
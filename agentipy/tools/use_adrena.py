@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ class AdrenaTradeManager:
                 "tradeMint": trade_mint,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/adrena/close-perp-trade-short",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -94,7 +95,7 @@ class AdrenaTradeManager:
                 "tradeMint": trade_mint,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/adrena/close-perp-trade-long",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -153,7 +154,7 @@ class AdrenaTradeManager:
                 "slippage": slippage,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/adrena/open-perp-trade-long",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -212,7 +213,7 @@ class AdrenaTradeManager:
                 "slippage": slippage,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/adrena/open-perp-trade-short",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -6,6 +6,7 @@ from solders.pubkey import Pubkey as PublicKey  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +37,7 @@ class AllDomainsManager:
                 "domain": domain,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/domains/resolve-all-domains",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -81,7 +82,7 @@ class AllDomainsManager:
                 "tld": tld,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/domains/get-owned-domains-for-tld",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -118,7 +119,7 @@ class AllDomainsManager:
                 "open_api_key": agent.openai_api_key,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/domains/get-all-domains-tlds",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -162,7 +163,7 @@ class AllDomainsManager:
                 "owner": str(owner_pubkey),
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/domains/get-owned-all-domains",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -1,3 +1,12 @@
+import asyncio
+import functools
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
 from backpack_exchange_sdk.authenticated import AuthenticationClient
 from backpack_exchange_sdk.public import PublicClient
 
@@ -378,6 +387,39 @@ class BackpackManager:
             return self.auth_client.cancel_open_orders(symbol=symbol)
         except Exception as e:
             raise Exception(f"Error canceling open orders: {str(e)}")
+
+    def execute_batch_orders(self, orders: List[dict]) -> List[dict]:
+        """
+        Execute several orders with one signed request to the batch order endpoint.
+
+        With an SDK that lacks the batch endpoint, the orders are sent as
+        concurrent single-order requests instead.
+
+        Args:
+            orders (List[dict]): Orders in the exchange's camelCase form (orderType, side, symbol, ...).
+
+        Returns:
+            List[dict]: One result per order, in input order; failed orders carry `code` and `message`.
+        """
+        batch = getattr(self.auth_client, "execute_batch_orders", None)
+        if batch is None:
+            return self._execute_orders_individually(orders)
+        try:
+            return batch(orders)
+        except Exception as e:
+            raise Exception(f"Error executing batch orders: {str(e)}")
+
+    def _execute_orders_individually(self, orders: List[dict]) -> List[dict]:
+        def execute(order: dict) -> dict:
+            try:
+                return self.auth_client.execute_order(**order)
+            except Exception as e:
+                return {"code": "ORDER_FAILED", "message": f"Error executing order: {str(e)}", "clientId": order.get("clientId")}
+
+        if not orders:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(orders), DEFAULT_ORDER_CONCURRENCY)) as executor:
+            return list(executor.map(execute, orders))
         
     # Public API
     def get_supported_assets(self) -> dict:
@@ -619,4 +661,216 @@ class BackpackManager:
         try:
             return self.public_client.get_historical_trades(symbol, limit, offset)
         except Exception as e:
-            raise Exception(f"Error fetching historical trades: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Error fetching historical trades: {str(e)}")
+
+BACKPACK_EXECUTOR_WORKERS = 8
+MAX_BATCH_ORDERS = 50
+DEFAULT_ORDER_CONCURRENCY = 16
+PUBLIC_CACHE_TTLS = {
+    "get_markets": 300.0,
+    "get_supported_assets": 300.0,
+    "get_market": 300.0,
+    "get_tickers": 10.0,
+}
+
+# Client ids are u32 on Backpack; start at a random point so restarts do not reuse ids
+_client_ids = itertools.count(random.randrange(1, 2**31))
+
+
+def next_client_id() -> int:
+    return next(_client_ids) % (2**32 - 1) + 1
+
+
+def _order_payload(order: dict) -> dict:
+    """Convert an `execute_order`-style order (snake_case keys) into the exchange's camelCase form."""
+    payload = {}
+    for key, value in order.items():
+        if value is None:
+            continue
+        head, *rest = key.split("_")
+        payload[head + "".join(part.capitalize() for part in rest)] = value
+    return payload
+
+
+class AsyncBackpackManager:
+    """
+    Async front-end of BackpackManager.
+
+    One BackpackManager (and so one pair of SDK clients with their pooled
+    HTTP sessions) is kept per API key. SDK calls, including request signing,
+    run on a small shared thread pool instead of the event loop. Rarely
+    changing public endpoints (`PUBLIC_CACHE_TTLS`) are cached with a TTL
+    and shared by all agents, and concurrent identical lookups share one
+    request.
+
+    Every BackpackManager method is available as a coroutine with the same
+    signature, e.g. `await AsyncBackpackManager.for_agent(agent).get_account_balances()`.
+    """
+
+    _instances: Dict[Tuple[str, str], "AsyncBackpackManager"] = {}
+    _instances_lock = threading.Lock()
+    _executor: Optional[ThreadPoolExecutor] = None
+    _public_cache: Dict[Tuple, Tuple[float, Any]] = {}
+    _public_inflight: Dict[Tuple, asyncio.Future] = {}
+
+    def __init__(self, manager: BackpackManager):
+        self.manager = manager
+
+    @classmethod
+    def for_agent(cls, agent: SolanaAgentKit) -> "AsyncBackpackManager":
+        key = (agent.backpack_api_key, agent.backpack_api_secret)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls._instances[key] = cls(BackpackManager(agent))
+            return instance
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=BACKPACK_EXECUTOR_WORKERS, thread_name_prefix="backpack")
+        return cls._executor
+
+    async def _call(self, name: str, *args, **kwargs) -> Any:
+        method = getattr(self.manager, name)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), functools.partial(method, *args, **kwargs)
+        )
+
+    async def _cached_call(self, name: str, *args) -> Any:
+        cls = type(self)
+        key = (name, *args)
+        entry = cls._public_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        task = cls._public_inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._call(name, *args))
+            cls._public_inflight[key] = task
+
+            def _done(t: asyncio.Future):
+                if cls._public_inflight.get(key) is t:
+                    del cls._public_inflight[key]
+                if not t.cancelled() and t.exception() is None:
+                    cls._public_cache[key] = (time.monotonic() + PUBLIC_CACHE_TTLS[name], t.result())
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    @classmethod
+    def clear_cache(cls):
+        cls._public_cache.clear()
+
+    async def get_markets(self) -> dict:
+        return await self._cached_call("get_markets")
+
+    async def get_supported_assets(self) -> dict:
+        return await self._cached_call("get_supported_assets")
+
+    async def get_tickers(self) -> dict:
+        return await self._cached_call("get_tickers")
+
+    async def get_market(self, symbol: str) -> dict:
+        return await self._cached_call("get_market", symbol)
+
+    async def execute_orders(
+        self, orders: List[dict], max_concurrency: int = DEFAULT_ORDER_CONCURRENCY
+    ) -> Dict[int, dict]:
+        """
+        Place many orders at once.
+
+        Orders take the keyword arguments of `BackpackManager.execute_order`.
+        Orders without a `client_id` get one, so every result can be matched to
+        its order. Orders are sent to the batch order endpoint in chunks of
+        `MAX_BATCH_ORDERS`; with an SDK that lacks it, they are sent as
+        concurrent single-order requests, signed in parallel on the executor.
+
+        Args:
+            orders (List[dict]): Orders to place.
+            max_concurrency (int): Requests in flight at once.
+
+        Returns:
+            Dict[int, dict]: Exchange response per client id, or `{"error": ...}` for failed orders.
+        """
+        orders = [dict(order, client_id=order.get("client_id") or next_client_id()) for order in orders]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results: Dict[int, dict] = {}
+
+        async def place_one(order: dict):
+            async with semaphore:
+                try:
+                    results[order["client_id"]] = await self._call("execute_order", **order)
+                except Exception as e:
+                    results[order["client_id"]] = {"error": str(e)}
+
+        async def place_batch(chunk: List[dict]):
+            async with semaphore:
+                try:
+                    responses = await self._call("execute_batch_orders", [_order_payload(o) for o in chunk])
+                except Exception as e:
+                    for order in chunk:
+                        results[order["client_id"]] = {"error": str(e)}
+                    return
+            # Match responses by the client id they echo; fall back to position for those that do not
+            by_client_id = {
+                response["clientId"]: response
+                for response in responses
+                if isinstance(response, dict) and response.get("clientId") is not None
+            }
+            positional = responses if len(responses) == len(chunk) else [None] * len(chunk)
+            for order, fallback in zip(chunk, positional):
+                response = by_client_id.get(order["client_id"], fallback)
+                if response is None:
+                    response = {"error": "No response for order in batch"}
+                elif isinstance(response, dict) and "code" in response and "id" not in response:
+                    response = {"error": response.get("message") or response["code"], **response}
+                results[order["client_id"]] = response
+
+        if hasattr(self.manager.auth_client, "execute_batch_orders"):
+            chunks = [orders[i:i + MAX_BATCH_ORDERS] for i in range(0, len(orders), MAX_BATCH_ORDERS)]
+            await asyncio.gather(*(place_batch(chunk) for chunk in chunks))
+        else:
+            await asyncio.gather(*(place_one(order) for order in orders))
+        return {order["client_id"]: results[order["client_id"]] for order in orders}
+
+    async def cancel_orders(
+        self, cancels: List[dict], max_concurrency: int = DEFAULT_ORDER_CONCURRENCY
+    ) -> Dict[Union[int, str], dict]:
+        """
+        Cancel many orders at once.
+
+        Backpack has no batch cancel endpoint for individual orders, so the
+        cancellations are pipelined as concurrent requests.
+
+        Args:
+            cancels (List[dict]): Each with `symbol` and `client_id` or `order_id`.
+            max_concurrency (int): Requests in flight at once.
+
+        Returns:
+            Dict[int | str, dict]: Exchange response keyed by the order's client id
+            (or order id when no client id was given), or `{"error": ...}`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def cancel_one(cancel: dict) -> dict:
+            async with semaphore:
+                try:
+                    return await self._call("cancel_open_order", **cancel)
+                except Exception as e:
+                    return {"error": str(e)}
+
+        responses = await asyncio.gather(*(cancel_one(cancel) for cancel in cancels))
+        return {
+            cancel.get("client_id") or cancel.get("order_id"): response
+            for cancel, response in zip(cancels, responses)
+        }
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        if name.startswith("_") or not callable(getattr(BackpackManager, name, None)):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            return await self._call(name, *args, **kwargs)
+
+        call.__name__ = name
+        return call
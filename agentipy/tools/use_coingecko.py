@@ -1,5 +1,6 @@
 import aiohttp
 from agentipy.agent import SolanaAgentKit
+from agentipy.utils.http_policy import http_policy
 
 
 class CoingeckoManager:
@@ -22,11 +23,11 @@ class CoingeckoManager:
                 url += f"?x_cg_demo_api_key={agent.coingecko_demo_api_key}"
             
             async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to fetch trending tokens: {response.status}")
-                    data = await response.json()
-                    return data
+                response = await http_policy.arequest(session, "GET", url)
+                if response.status != 200:
+                    raise Exception(f"Failed to fetch trending tokens: {response.status}")
+                data = await response.json()
+                return data
         except Exception as e:
             raise Exception(f"Couldn't get trending tokens: {e}")
 
@@ -53,11 +54,11 @@ class CoingeckoManager:
             headers = {"x-cg-pro-api-key": agent.coingecko_api_key}
             
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to fetch trending pools: {response.status}")
-                    data = await response.json()
-                    return data
+                response = await http_policy.arequest(session, "GET", url, headers=headers)
+                if response.status != 200:
+                    raise Exception(f"Failed to fetch trending pools: {response.status}")
+                data = await response.json()
+                return data
         except Exception as e:
             raise Exception(f"Error fetching trending pools from CoinGecko: {e}")
         
@@ -89,11 +90,11 @@ class CoingeckoManager:
             headers = {"x-cg-pro-api-key": agent.coingecko_api_key}
             
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to fetch top gainers: {response.status}")
-                    data = await response.json()
-                    return data
+                response = await http_policy.arequest(session, "GET", url, headers=headers)
+                if response.status != 200:
+                    raise Exception(f"Failed to fetch top gainers: {response.status}")
+                data = await response.json()
+                return data
         except Exception as e:
             raise Exception(f"Error fetching top gainers from CoinGecko: {e}")
 
@@ -124,11 +125,11 @@ class CoingeckoManager:
                 url += f"&x_cg_demo_api_key={agent.coingecko_demo_api_key}"
             
             async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to fetch token price data: {response.status}")
-                    data = await response.json()
-                    return data
+                response = await http_policy.arequest(session, "GET", url)
+                if response.status != 200:
+                    raise Exception(f"Failed to fetch token price data: {response.status}")
+                data = await response.json()
+                return data
         except Exception as e:
             raise Exception(f"Error fetching token price data from CoinGecko: {e}")
         
@@ -152,11 +153,11 @@ class CoingeckoManager:
             headers = {"x-cg-pro-api-key": agent.coingecko_api_key}
             
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to fetch token info: {response.status}")
-                    data = await response.json()
-                    return data
+                response = await http_policy.arequest(session, "GET", url, headers=headers)
+                if response.status != 200:
+                    raise Exception(f"Failed to fetch token info: {response.status}")
+                data = await response.json()
+                return data
         except Exception as e:
             raise Exception(f"Error fetching token info from CoinGecko: {e}")
 
@@ -182,10 +183,10 @@ class CoingeckoManager:
             headers = {"x-cg-pro-api-key": agent.coingecko_api_key}
             
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to fetch latest pools: {response.status}")
-                    data = await response.json()
-                    return data
+                response = await http_policy.arequest(session, "GET", url, headers=headers)
+                if response.status != 200:
+                    raise Exception(f"Failed to fetch latest pools: {response.status}")
+                data = await response.json()
+                return data
         except Exception as e:
             raise Exception(f"Error fetching latest pools from CoinGecko: {e}")
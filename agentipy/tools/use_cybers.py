@@ -3,10 +3,10 @@ from typing import Optional
 
 import nacl.encoding
 import nacl.signing
-import requests
 from solders.keypair import Keypair  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
+from agentipy.utils.http_policy import http_policy
 
 
 class CybersManager:
@@ -47,7 +47,7 @@ class CybersManager:
 
             signature = CybersManager._sign_message(keypair, message)
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{CybersManager.API_BASE_URL}/auth/verify-signature",
                 json={"walletAddress": wallet_address, "signature": signature, "message": message},
             )
@@ -110,7 +110,7 @@ class CybersManager:
                 "creatorTwitterUsername": tweet_author_username,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{CybersManager.API_BASE_URL}/coin/create",
                 headers={"Authorization": f"Bearer {jwt_token}"},
                 files=files,
@@ -1,7 +1,7 @@
+import asyncio
 import base64
 from typing import Optional
 
-import requests
 from solana.rpc.commitment import Confirmed
 from solana.rpc.types import TxOpts
 from solders.pubkey import Pubkey as PublicKey  # type: ignore
@@ -9,6 +9,7 @@ from solders.transaction import VersionedTransaction  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.constants import DEBRIDGE_API_URL
+from agentipy.utils.http_policy import http_policy
 
 
 class DeBridgeManager:
@@ -70,7 +71,7 @@ class DeBridgeManager:
             params["affiliateFeeRecipient"] = affiliate_fee_recipient
 
         try:
-            response = requests.get(
+            response = http_policy.get(
                 DEBRIDGE_API_URL, params=params
             )
 
@@ -140,7 +141,7 @@ class DeBridgeManager:
             order_ids_url = f"{DEBRIDGE_API_URL}/dln/tx/{tx_hash}/order-ids"
             print(f"Getting order IDs from: {order_ids_url}")
 
-            order_ids_response = requests.get(order_ids_url)
+            order_ids_response = await asyncio.to_thread(http_policy.get, order_ids_url)
             if not order_ids_response.ok:
                 raise Exception(
                     f"HTTP error! status: {order_ids_response.status_code}, "
@@ -158,7 +159,7 @@ class DeBridgeManager:
                 status_url = f"{DeBridgeManager.BASE_URL}/dln/order/{order_id}/status"
                 print(f"Getting status from: {status_url}")
 
-                status_response = requests.get(status_url)
+                status_response = await asyncio.to_thread(http_policy.get, status_url)
                 if not status_response.ok:
                     raise Exception(
                         f"HTTP error! status: {status_response.status_code}, "
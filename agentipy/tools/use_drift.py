@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +34,7 @@ class DriftManager:
                 "depositSymbol": deposit_symbol,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/create-drift-user-account",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -86,7 +87,7 @@ class DriftManager:
                 "isRepayment": is_repayment,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/deposit-to-drift-user-account",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -139,7 +140,7 @@ class DriftManager:
                 "isBorrow": is_borrow,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/withdraw-from-drift-user-account",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -196,7 +197,7 @@ class DriftManager:
                 "price": price,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/trade-using-drift-perp-account",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -240,7 +241,7 @@ class DriftManager:
                 "open_api_key": agent.openai_api_key,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/check-if-drift-account-exists",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -281,7 +282,7 @@ class DriftManager:
                 "open_api_key": agent.openai_api_key,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/drift-user-account-info",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -322,7 +323,7 @@ class DriftManager:
                 "open_api_key": agent.openai_api_key,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/get-available-drift-markets",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -370,7 +371,7 @@ class DriftManager:
                 "symbol": symbol,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/stake-to-drift-insurance-fund",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -421,7 +422,7 @@ class DriftManager:
                 "symbol": symbol,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/request-unstake-from-drift-insurance-fund",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -470,7 +471,7 @@ class DriftManager:
                 "symbol": symbol,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/unstake-from-drift-insurance-fund",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -533,7 +534,7 @@ class DriftManager:
                 **swap_params,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/drift-swap-spot-token",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -584,7 +585,7 @@ class DriftManager:
                 "period": period,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/get-drift-perp-market-funding-rate",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -640,7 +641,7 @@ class DriftManager:
                 "action": action,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/get-drift-entry-quote-of-perp-trade",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -689,7 +690,7 @@ class DriftManager:
                 "symbol": symbol,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/get-drift-lend-borrow-apy",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -761,7 +762,7 @@ class DriftManager:
                 **vault_params,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/create-drift-vault",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -812,7 +813,7 @@ class DriftManager:
                 "delegateAddress": delegate_address,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/update-drift-vault-delegate",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -886,7 +887,7 @@ class DriftManager:
                 **vault_params,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/update-drift-vault",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -935,7 +936,7 @@ class DriftManager:
                 "vaultName": vault_name,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/get-drift-vault-info",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -986,7 +987,7 @@ class DriftManager:
                 "vault": vault,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/deposit-into-drift-vault",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -1037,7 +1038,7 @@ class DriftManager:
                 "vault": vault,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/request-withdrawal-from-drift-vault",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -1086,7 +1087,7 @@ class DriftManager:
                 "vault": vault,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/withdraw-from-drift-vault",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -1135,7 +1136,7 @@ class DriftManager:
                 "name": name,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/derive-drift-vault-address",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -1204,7 +1205,7 @@ class DriftManager:
                 **trade_params,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/drift/trade-using-delegated-drift-vault",
                 json=payload,
                 headers={"Content-Type": "application/json"}
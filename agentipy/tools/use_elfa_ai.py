@@ -3,6 +3,7 @@ import aiohttp
 from agentipy.agent import SolanaAgentKit
 from agentipy.constants import ELFA_AI_BASE_URL
 from agentipy.utils.elfa_ai import get_headers as get_elfa_ai_headers
+from agentipy.utils.http_policy import http_policy
 
 
 class ElfaAiManager:
@@ -20,8 +21,8 @@ class ElfaAiManager:
             dict: API response.
         """
         async with aiohttp.ClientSession(headers=get_elfa_ai_headers(agent)) as session:
-            async with session.get(f"{ElfaAiManager.BASE_URL}/v1/ping") as response:
-                return await response.json()
+            response = await http_policy.arequest(session, "GET", f"{ElfaAiManager.BASE_URL}/v1/ping")
+            return await response.json()
 
     @staticmethod
     async def get_elfa_ai_api_key_status(agent: SolanaAgentKit) -> dict:
@@ -35,8 +36,8 @@ class ElfaAiManager:
             dict: API key status response.
         """
         async with aiohttp.ClientSession(headers=get_elfa_ai_headers(agent)) as session:
-            async with session.get(f"{ElfaAiManager.BASE_URL}/v1/key-status") as response:
-                return await response.json()
+            response = await http_policy.arequest(session, "GET", f"{ElfaAiManager.BASE_URL}/v1/key-status")
+            return await response.json()
 
     @staticmethod
     async def get_smart_mentions(agent: SolanaAgentKit, limit: int = 100, offset: int = 0) -> dict:
@@ -53,8 +54,8 @@ class ElfaAiManager:
         """
         params = {"limit": limit, "offset": offset}
         async with aiohttp.ClientSession(headers=get_elfa_ai_headers(agent)) as session:
-            async with session.get(f"{ElfaAiManager.BASE_URL}/v1/mentions", params=params) as response:
-                return await response.json()
+            response = await http_policy.arequest(session, "GET", f"{ElfaAiManager.BASE_URL}/v1/mentions", params=params)
+            return await response.json()
 
     @staticmethod
     async def get_top_mentions_by_ticker(
@@ -87,8 +88,8 @@ class ElfaAiManager:
             "includeAccountDetails": include_account_details
         }
         async with aiohttp.ClientSession(headers=get_elfa_ai_headers(agent)) as session:
-            async with session.get(f"{ElfaAiManager.BASE_URL}/v1/top-mentions", params=params) as response:
-                return await response.json()
+            response = await http_policy.arequest(session, "GET", f"{ElfaAiManager.BASE_URL}/v1/top-mentions", params=params)
+            return await response.json()
 
     @staticmethod
     async def search_mentions_by_keywords(
@@ -121,8 +122,8 @@ class ElfaAiManager:
             "cursor": cursor
         }
         async with aiohttp.ClientSession(headers=get_elfa_ai_headers(agent)) as session:
-            async with session.get(f"{ElfaAiManager.BASE_URL}/v1/mentions/search", params=params) as response:
-                return await response.json()
+            response = await http_policy.arequest(session, "GET", f"{ElfaAiManager.BASE_URL}/v1/mentions/search", params=params)
+            return await response.json()
 
     @staticmethod
     async def get_trending_tokens_using_elfa_ai(
@@ -152,8 +153,8 @@ class ElfaAiManager:
             "minMentions": min_mentions
         }
         async with aiohttp.ClientSession(headers=get_elfa_ai_headers(agent)) as session:
-            async with session.get(f"{ElfaAiManager.BASE_URL}/v1/trending-tokens", params=params) as response:
-                return await response.json()
+            response = await http_policy.arequest(session, "GET", f"{ElfaAiManager.BASE_URL}/v1/trending-tokens", params=params)
+            return await response.json()
 
     @staticmethod
     async def get_smart_twitter_account_stats(agent: SolanaAgentKit, username: str) -> dict:
@@ -169,5 +170,5 @@ class ElfaAiManager:
         """
         params = {"username": username}
         async with aiohttp.ClientSession(headers=get_elfa_ai_headers(agent)) as session:
-            async with session.get(f"{ElfaAiManager.BASE_URL}/v1/account/smart-stats", params=params) as response:
-                return await response.json()
+            response = await http_policy.arequest(session, "GET", f"{ElfaAiManager.BASE_URL}/v1/account/smart-stats", params=params)
+            return await response.json()
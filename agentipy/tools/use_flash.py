@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +45,7 @@ class FlashTradeManager:
                 "leverage": leverage,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/flash/flash-open-trade",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -100,7 +101,7 @@ class FlashTradeManager:
                 "side": side,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/flash/flash-close-trade",
                 json=payload,
                 headers={"Content-Type": "application/json"}
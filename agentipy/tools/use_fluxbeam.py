@@ -10,6 +10,7 @@ from solders.transaction import VersionedTransaction  # type: ignore
 from agentipy.agent import SolanaAgentKit
 from agentipy.constants import FLUXBEAM_BASE_URI, TOKENS
 from agentipy.utils.fluxbeam import get_token_decimals
+from agentipy.utils.http_policy import http_policy
 
 
 class FluxBeamManager:
@@ -54,40 +55,42 @@ class FluxBeamManager:
             }
 
             async with aiohttp.ClientSession() as session:
-                async with session.post(
+                response = await http_policy.arequest(
+                    session,
+                    "POST",
                     f"{FLUXBEAM_BASE_URI}/token_pools",
                     json=request_body,
                     headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"FluxBeam API request failed: {response.status}")
+                )
+                if response.status != 200:
+                    raise Exception(f"FluxBeam API request failed: {response.status}")
 
-                    response_data = await response.json()
+                response_data = await response.json()
 
-                    if "error" in response_data:
-                        raise Exception(response_data["error"])
+                if "error" in response_data:
+                    raise Exception(response_data["error"])
 
-                    transaction_buf = base64.b64decode(response_data["transaction"])
-                    transaction = VersionedTransaction.from_bytes(transaction_buf)
+                transaction_buf = base64.b64decode(response_data["transaction"])
+                transaction = VersionedTransaction.from_bytes(transaction_buf)
 
-                    latest_blockhash = await agent.connection.get_latest_blockhash()
+                latest_blockhash = await agent.connection.get_latest_blockhash()
 
-                    signature = agent.wallet.sign_message(to_bytes_versioned(transaction.message))
-                    signed_transaction = VersionedTransaction.populate(transaction.message, [signature])
+                signature = agent.wallet.sign_message(to_bytes_versioned(transaction.message))
+                signed_transaction = VersionedTransaction.populate(transaction.message, [signature])
 
-                    tx_resp = await agent.connection.send_transaction(
-                        signed_transaction,
-                        opts=TxOpts(preflight_commitment=Confirmed, skip_preflight=True, max_retries=3)
-                    )
-                    tx_id = tx_resp.value
+                tx_resp = await agent.connection.send_transaction(
+                    signed_transaction,
+                    opts=TxOpts(preflight_commitment=Confirmed, skip_preflight=True, max_retries=3)
+                )
+                tx_id = tx_resp.value
 
-                    await agent.connection.confirm_transaction(
-                        tx_id,
-                        commitment=Confirmed,
-                        last_valid_block_height=latest_blockhash.value.last_valid_block_height
-                    )
+                await agent.connection.confirm_transaction(
+                    tx_id,
+                    commitment=Confirmed,
+                    last_valid_block_height=latest_blockhash.value.last_valid_block_height
+                )
 
-                    return str(signature)
+                return str(signature)
 
         except Exception as e:
             raise Exception(f"Failed to create FluxBeam pool: {str(e)}")
@@ -1,11 +1,69 @@
-from typing import List
+import asyncio
+import os
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, List,
+                    Optional, Tuple)
+
+import aiohttp
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.utils.helius.helpers.utility import (_make_delete_request,
+from agentipy.utils.helius.helpers.cache import LRUCache
+from agentipy.utils.helius.helpers.utility import (_make_async_get_request,
+                                                   _make_async_post_request,
+                                                   _make_delete_request,
                                                    _make_get_request,
                                                    _make_post_request,
                                                    _make_put_request)
 
+Page = Tuple[List[Any], Optional[str]]
+
+# Helius rejects batches larger than this on /v0/transactions and /v0/tokens/metadata
+MAX_HELIUS_BATCH_SIZE = 100
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# Finalized transactions never change, but parsed ones are several KiB each, so
+# the cache is kept small and entries expire. Override with the environment
+# variables below or configure_parsed_transaction_cache().
+PARSED_TRANSACTION_CACHE_SIZE = int(os.getenv("HELIUS_PARSED_TX_CACHE_SIZE", "1000"))
+PARSED_TRANSACTION_CACHE_TTL = float(os.getenv("HELIUS_PARSED_TX_CACHE_TTL", "600"))
+
+parsed_transaction_cache = LRUCache(maxsize=PARSED_TRANSACTION_CACHE_SIZE, ttl=PARSED_TRANSACTION_CACHE_TTL or None)
+# NFT metadata can be updated, so it expires as well
+nft_metadata_cache = LRUCache(maxsize=10_000, ttl=600)
+
+
+def configure_parsed_transaction_cache(maxsize: int, ttl: Optional[float] = PARSED_TRANSACTION_CACHE_TTL) -> LRUCache:
+    """
+    Replace the cache of finalized parsed transactions.
+
+    Args:
+        maxsize (int): Maximum number of cached transactions; 0 disables caching.
+        ttl (float, optional): Seconds a transaction stays cached; None keeps it until evicted.
+
+    Returns:
+        LRUCache: The new cache.
+    """
+    global parsed_transaction_cache
+    parsed_transaction_cache = LRUCache(maxsize=maxsize, ttl=ttl)
+    return parsed_transaction_cache
+
+
+async def _iter_pages(fetch_page: Callable[[Optional[str]], Awaitable[Page]], cursor: Optional[str] = None) -> AsyncIterator[List[Any]]:
+    """
+    Yield pages from `fetch_page(cursor) -> (items, next_cursor)`, requesting the
+    next page while the current one is being consumed. At most one page is
+    buffered ahead, so memory stays constant however long the history is.
+    """
+    task = asyncio.ensure_future(fetch_page(cursor))
+    try:
+        while task is not None:
+            items, next_cursor = await task
+            task = asyncio.ensure_future(fetch_page(next_cursor)) if items and next_cursor else None
+            if items:
+                yield items
+    finally:
+        if task is not None:
+            task.cancel()
+
 
 class HeliusManager:
     def get_balances(agent: SolanaAgentKit, address: str):
@@ -27,7 +85,11 @@ class HeliusManager:
         api_key_query = f"?api-key={agent.helius_api_key}"
         path = "/v1/nft-events"
         url = base_url + path + api_key_query
-        payload = {
+        payload = HeliusManager._nft_events_payload(accounts, types, sources, start_slot, end_slot, start_time, end_time, first_verified_creator, verified_collection_address, limit, sort_order, pagination_token)
+        return _make_post_request(url, payload)
+
+    def _nft_events_payload(accounts, types, sources, start_slot, end_slot, start_time, end_time, first_verified_creator, verified_collection_address, limit, sort_order, pagination_token):
+        return {
             "query": {
                 "accounts": accounts,
                 "types": types,
@@ -47,14 +109,17 @@ class HeliusManager:
                 "paginationToken": pagination_token
             }
         }
-        return _make_post_request(url, payload)
 
     def get_mintlists(agent: SolanaAgentKit, first_verified_creators: List[str], verified_collection_addresses: List[str] = None, limit: int = None, pagination_token: str = None):
         base_url = agent.helius_rpc_url
         api_key_query = f"?api-key={agent.helius_api_key}"
         path = "/v1/mintlist"
         url = base_url + path + api_key_query
-        payload = {
+        payload = HeliusManager._mintlists_payload(first_verified_creators, verified_collection_addresses, limit, pagination_token)
+        return _make_post_request(url, payload)
+
+    def _mintlists_payload(first_verified_creators, verified_collection_addresses, limit, pagination_token):
+        return {
             "query": {
                 "firstVerifiedCreators": first_verified_creators,
                 "verifiedCollectionAddresses": verified_collection_addresses
@@ -64,7 +129,6 @@ class HeliusManager:
                 "paginationToken": pagination_token
             }
         }
-        return _make_post_request(url, payload)
 
     def get_nft_fingerprint(agent: SolanaAgentKit, mints: List[str]):
         base_url = agent.helius_rpc_url
@@ -81,7 +145,11 @@ class HeliusManager:
         api_key_query = f"?api-key={agent.helius_api_key}"
         path = "/v1/active-listings"
         url = base_url + path + api_key_query
-        payload = {
+        payload = HeliusManager._active_listings_payload(first_verified_creators, verified_collection_addresses, marketplaces, limit, pagination_token)
+        return _make_post_request(url, payload)
+
+    def _active_listings_payload(first_verified_creators, verified_collection_addresses, marketplaces, limit, pagination_token):
+        return {
             "query": {
                 "marketplaces": marketplaces,
                 "firstVerifiedCreators": first_verified_creators,
@@ -92,7 +160,6 @@ class HeliusManager:
                 "paginationToken": pagination_token
             }
         }
-        return _make_post_request(url, payload)
 
     def get_nft_metadata(agent: SolanaAgentKit, mint_accounts: List[str]):
         base_url = agent.helius_rpc_url
@@ -109,7 +176,11 @@ class HeliusManager:
         api_key_query = f"?api-key={agent.helius_api_key}"
         path = "/v1/raw-transactions"
         url = base_url + path + api_key_query
-        payload = {
+        payload = HeliusManager._raw_transactions_payload(accounts, start_slot, end_slot, start_time, end_time, limit, sort_order, pagination_token)
+        return _make_post_request(url, payload)
+
+    def _raw_transactions_payload(accounts, start_slot, end_slot, start_time, end_time, limit, sort_order, pagination_token):
+        return {
             "query": {
                 "accounts": accounts,
                 "startSlot": start_slot,
@@ -123,7 +194,6 @@ class HeliusManager:
                 "paginationToken": pagination_token
             }
         }
-        return _make_post_request(url, payload)
 
     def get_parsed_transactions(agent: SolanaAgentKit, transactions: List[str], commitment: str = None):
         base_url = agent.helius_rpc_url
@@ -138,6 +208,66 @@ class HeliusManager:
         }
         return _make_post_request(url, payload)
 
+    async def _fetch_batched(url: str, keys: List[str], body_field: str, key_field: str, cache: LRUCache, batch_size: int, max_concurrency: int) -> List[Optional[dict]]:
+        """POST `keys` in chunks of `batch_size`, concurrently, and return the items aligned with `keys`."""
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = cache.get_many(unique) if cache is not None else {}
+        missing = [key for key in unique if key not in found]
+        batch_size = max(1, min(batch_size, MAX_HELIUS_BATCH_SIZE))
+        chunks = [missing[i:i + batch_size] for i in range(0, len(missing), batch_size)]
+
+        if chunks:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            async with aiohttp.ClientSession() as session:
+                async def fetch_chunk(chunk):
+                    async with semaphore:
+                        return await _make_async_post_request(session, url, {body_field: chunk})
+
+                for items in await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks)):
+                    for item in items or []:
+                        key = item.get(key_field) if isinstance(item, dict) else None
+                        if key is None:
+                            continue
+                        found[key] = item
+                        if cache is not None:
+                            cache.set(key, item)
+        return [found.get(key) for key in keys]
+
+    async def get_parsed_transactions_batched(agent: SolanaAgentKit, transactions: List[str], commitment: str = None, batch_size: int = MAX_HELIUS_BATCH_SIZE, max_concurrency: int = DEFAULT_BATCH_CONCURRENCY) -> List[Optional[dict]]:
+        """
+        Parse any number of transactions, in chunks of at most 100 signatures sent concurrently.
+
+        Finalized results are cached per signature (see configure_parsed_transaction_cache),
+        so repeated signatures cost no request.
+
+        Args:
+            agent (SolanaAgentKit): Agent holding the Helius credentials.
+            transactions (List[str]): Transaction signatures.
+            commitment (str, optional): "finalized" (default) or "confirmed"; only finalized results are cached.
+            batch_size (int): Signatures per request (at most 100).
+            max_concurrency (int): Maximum number of requests in flight.
+
+        Returns:
+            List[Optional[dict]]: Parsed transactions aligned with `transactions`; None where Helius returned none.
+        """
+        url = agent.helius_rpc_url + "/v0/transactions" + f"?api-key={agent.helius_api_key}"
+        if commitment:
+            url += "&commitment=" + commitment
+        cache = parsed_transaction_cache if commitment in (None, "", "finalized") else None
+        return await HeliusManager._fetch_batched(url, transactions, "transactions", "signature", cache, batch_size, max_concurrency)
+
+    async def get_nft_metadata_batched(agent: SolanaAgentKit, mint_accounts: List[str], batch_size: int = MAX_HELIUS_BATCH_SIZE, max_concurrency: int = DEFAULT_BATCH_CONCURRENCY) -> List[Optional[dict]]:
+        """
+        Fetch token metadata for any number of mints, in chunks of at most 100 sent concurrently.
+
+        Results are cached per mint for ten minutes.
+
+        Returns:
+            List[Optional[dict]]: Metadata aligned with `mint_accounts`; None where Helius returned none.
+        """
+        url = agent.helius_rpc_url + "/v0/tokens/metadata" + f"?api-key={agent.helius_api_key}"
+        return await HeliusManager._fetch_batched(url, mint_accounts, "mintAccounts", "account", nft_metadata_cache, batch_size, max_concurrency)
+
     def get_parsed_transaction_history(agent: SolanaAgentKit, address: str, before: str = '', until: str = '', commitment: str = '', source: str = '', type: str = ''):
         base_url = agent.helius_rpc_url
         api_key_query = f"?api-key={agent.helius_api_key}"
@@ -152,6 +282,115 @@ class HeliusManager:
         url = base_url + path + api_key_query
         return _make_get_request(url, params=params)
 
+    async def iter_transaction_history(agent: SolanaAgentKit, address: str, before: str = '', until: str = '', commitment: str = '', source: str = '', type: str = '', start_slot: int = None, end_slot: int = None, start_time: int = None, end_time: int = None, max_items: int = None) -> AsyncIterator[dict]:
+        """
+        Stream the parsed transaction history of an address, newest first, following
+        `before` cursors automatically.
+
+        The next page is requested while the current one is consumed, and requests go
+        through the shared HTTP policy (per-host rate limits, Retry-After, retries).
+
+        Args:
+            agent (SolanaAgentKit): Agent holding the Helius credentials.
+            address (str): Address whose history is streamed.
+            before (str): Start before this signature.
+            until (str): Stop at this signature.
+            commitment, source, type (str): Filters passed to Helius.
+            start_slot, end_slot (int, optional): Only yield transactions within these slots (inclusive);
+                iteration stops once a transaction older than `start_slot` is reached.
+            start_time, end_time (int, optional): Same bounds on the block time (unix seconds).
+            max_items (int, optional): Stop after this many transactions.
+
+        Yields:
+            dict: Parsed transactions.
+        """
+        url = agent.helius_rpc_url + f"/v0/addresses/{address}/transactions" + f"?api-key={agent.helius_api_key}"
+        yielded = 0
+        async with aiohttp.ClientSession() as session:
+            async def fetch_page(cursor):
+                params = {"before": cursor, "until": until, "commitment": commitment, "source": source, "type": type}
+                items = await _make_async_get_request(session, url, params=params)
+                return items, (items[-1].get("signature") if items else None)
+
+            pages = _iter_pages(fetch_page, before or None)
+            try:
+                async for page in pages:
+                    for tx in page:
+                        slot, timestamp = tx.get("slot"), tx.get("timestamp")
+                        if (start_slot is not None and slot is not None and slot < start_slot) or (
+                            start_time is not None and timestamp is not None and timestamp < start_time
+                        ):
+                            return
+                        if (end_slot is not None and slot is not None and slot > end_slot) or (
+                            end_time is not None and timestamp is not None and timestamp > end_time
+                        ):
+                            continue
+                        yield tx
+                        yielded += 1
+                        if max_items is not None and yielded >= max_items:
+                            return
+            finally:
+                # Cancel the prefetched page before the session closes
+                await pages.aclose()
+
+    async def _iter_token_paginated(url: str, build_payload: Callable[[Optional[str]], dict], pagination_token: str = None, max_items: int = None) -> AsyncIterator[Any]:
+        yielded = 0
+        async with aiohttp.ClientSession() as session:
+            async def fetch_page(cursor):
+                data = await _make_async_post_request(session, url, build_payload(cursor))
+                return data.get("result") or [], data.get("paginationToken")
+
+            pages = _iter_pages(fetch_page, pagination_token)
+            try:
+                async for page in pages:
+                    for item in page:
+                        yield item
+                        yielded += 1
+                        if max_items is not None and yielded >= max_items:
+                            return
+            finally:
+                await pages.aclose()
+
+    def iter_raw_transactions(agent: SolanaAgentKit, accounts: List[str], start_slot: int = None, end_slot: int = None, start_time: int = None, end_time: int = None, limit: int = None, sort_order: str = None, pagination_token: str = None, max_items: int = None) -> AsyncIterator[dict]:
+        """Stream raw transactions of `accounts` across all pages; arguments as in `get_raw_transactions`, `limit` being the page size."""
+        url = agent.helius_rpc_url + "/v1/raw-transactions" + f"?api-key={agent.helius_api_key}"
+        return HeliusManager._iter_token_paginated(
+            url,
+            lambda cursor: HeliusManager._raw_transactions_payload(accounts, start_slot, end_slot, start_time, end_time, limit, sort_order, cursor),
+            pagination_token,
+            max_items,
+        )
+
+    def iter_nft_events(agent: SolanaAgentKit, accounts: List[str], types: List[str] = None, sources: List[str] = None, start_slot: int = None, end_slot: int = None, start_time: int = None, end_time: int = None, first_verified_creator: List[str] = None, verified_collection_address: List[str] = None, limit: int = None, sort_order: str = None, pagination_token: str = None, max_items: int = None) -> AsyncIterator[dict]:
+        """Stream NFT events across all pages; arguments as in `get_nft_events`, `limit` being the page size."""
+        url = agent.helius_rpc_url + "/v1/nft-events" + f"?api-key={agent.helius_api_key}"
+        return HeliusManager._iter_token_paginated(
+            url,
+            lambda cursor: HeliusManager._nft_events_payload(accounts, types, sources, start_slot, end_slot, start_time, end_time, first_verified_creator, verified_collection_address, limit, sort_order, cursor),
+            pagination_token,
+            max_items,
+        )
+
+    def iter_mintlists(agent: SolanaAgentKit, first_verified_creators: List[str], verified_collection_addresses: List[str] = None, limit: int = None, pagination_token: str = None, max_items: int = None) -> AsyncIterator[dict]:
+        """Stream mintlist entries across all pages; arguments as in `get_mintlists`, `limit` being the page size."""
+        url = agent.helius_rpc_url + "/v1/mintlist" + f"?api-key={agent.helius_api_key}"
+        return HeliusManager._iter_token_paginated(
+            url,
+            lambda cursor: HeliusManager._mintlists_payload(first_verified_creators, verified_collection_addresses, limit, cursor),
+            pagination_token,
+            max_items,
+        )
+
+    def iter_active_listings(agent: SolanaAgentKit, first_verified_creators: List[str], verified_collection_addresses: List[str] = None, marketplaces: List[str] = None, limit: int = None, pagination_token: str = None, max_items: int = None) -> AsyncIterator[dict]:
+        """Stream active listings across all pages; arguments as in `get_active_listings`, `limit` being the page size."""
+        url = agent.helius_rpc_url + "/v1/active-listings" + f"?api-key={agent.helius_api_key}"
+        return HeliusManager._iter_token_paginated(
+            url,
+            lambda cursor: HeliusManager._active_listings_payload(first_verified_creators, verified_collection_addresses, marketplaces, limit, cursor),
+            pagination_token,
+            max_items,
+        )
+
     def create_webhook(agent: SolanaAgentKit, webhook_url: str, transaction_types: list, account_addresses: list, webhook_type: str, txn_status: str = "all", auth_header: str = None):
         base_url = agent.helius_rpc_url
         api_key_query = f"?api-key={agent.helius_api_key}"
@@ -1,77 +1,126 @@
+import logging
+from typing import Any, Awaitable, Dict, List, Optional, Sequence
+
 from agentipy.agent import SolanaAgentKit
-from agentipy.utils.jito import __send_request
+from agentipy.utils.jito.client import JitoClient, JitoError
+from agentipy.utils.jito.fanout import JitoFanout
+
+logger = logging.getLogger(__name__)
+
+
+async def _envelope(call: Awaitable[Any]) -> Dict[str, Any]:
+    """Wrap a Jito call in the {"success", "data" | "error"} shape returned by JitoManager."""
+    try:
+        return {"success": True, "data": await call}
+    except JitoError as e:
+        return {"success": False, "error": str(e)}
+
+
+def _status_response(statuses: Dict[str, Optional[dict]]) -> dict:
+    return {"jsonrpc": "2.0", "result": {"value": [status for status in statuses.values() if status]}, "id": 1}
+
+
+async def _send_rpc(agent: SolanaAgentKit, endpoint: str, method: str, params: list, query=None) -> dict:
+    """Send through the agent's region fan-out when `jito_regions` is set, else to its block engine."""
+    if agent.jito_regions:
+        _, response = await JitoFanout.for_agent(agent).rpc(endpoint, method, params, query)
+        return response
+    return await JitoClient.for_agent(agent).rpc(endpoint, method, params, query)
 
-import random
 
 class JitoManager:
-    #Bundle Endpoint
-    def get_tip_accounts(agent: SolanaAgentKit):
-        if agent.jito_uuid == None:
-            return __send_request(agent, endpoint="/bundles", method="getTipAccounts")
-        else:
-            return __send_request(agent, endpoint="/bundles?uuid=" + agent.jito_uuid, method="getTipAccounts")
+    # Bundle Endpoint
+    @staticmethod
+    async def get_tip_accounts(agent: SolanaAgentKit) -> Dict[str, Any]:
+        async def call():
+            accounts = await JitoClient.for_agent(agent).get_tip_accounts()
+            return {"jsonrpc": "2.0", "result": accounts, "id": 1}
+        return await _envelope(call())
 
     @staticmethod
-    def get_random_tip_account():
-        response = JitoManager.get_tip_accounts()
-        if not response['success']:
-            print(f"Error getting tip accounts: {response.get('error', 'Unknown error')}")
-            return None
-        
-        tip_accounts = response['data']['result']
-        if not tip_accounts:
-            print("No tip accounts found.")
+    async def get_random_tip_account(agent: SolanaAgentKit) -> Optional[str]:
+        try:
+            return await JitoClient.for_agent(agent).get_random_tip_account()
+        except JitoError as e:
+            logger.error(f"Error getting tip accounts: {e}")
             return None
-        
-        random_account = random.choice(tip_accounts)
-        return random_account
-
-    def get_bundle_statuses(agent: SolanaAgentKit, bundle_uuids):
-        endpoint = "/bundles"
-        if agent.jito_uuid is not None:
-            endpoint += f"?uuid={agent.jito_uuid}"
-        
-        # Ensure bundle_uuids is a list
+
+    @staticmethod
+    async def get_bundle_statuses(agent: SolanaAgentKit, bundle_uuids) -> Dict[str, Any]:
         if not isinstance(bundle_uuids, list):
             bundle_uuids = [bundle_uuids]
-        
-        # Correct format for the request
-        params = bundle_uuids
-        
-        return __send_request(agent, endpoint=endpoint, method="getBundleStatuses", params=params)
-
-    def send_bundle(agent: SolanaAgentKit, params=None):
-        if agent.jito_uuid == None:
-            return __send_request(agent, endpoint="/bundles",method="sendBundle", params=params)
-        else:
-            return  __send_request(agent, endpoint="/bundles?uuid=" + agent.jito_uuid, method="sendBundle", params=params)
-
-    def get_inflight_bundle_statuses(agent: SolanaAgentKit, bundle_uuids):
-        endpoint = "/bundles"
-        if agent.jito_uuid is not None:
-            endpoint += f"?uuid={agent.jito_uuid}"
-        
-        # Ensure bundle_uuids is a list
+
+        async def call():
+            return _status_response(await JitoClient.for_agent(agent).get_bundle_statuses(bundle_uuids))
+        return await _envelope(call())
+
+    @staticmethod
+    async def send_bundle(agent: SolanaAgentKit, params=None) -> Dict[str, Any]:
+        return await _envelope(_send_rpc(agent, "/bundles", "sendBundle", [params]))
+
+    @staticmethod
+    async def get_inflight_bundle_statuses(agent: SolanaAgentKit, bundle_uuids) -> Dict[str, Any]:
         if not isinstance(bundle_uuids, list):
             bundle_uuids = [bundle_uuids]
-        
-        # Correct format for the request
-        params = bundle_uuids
-        
-        return __send_request(agent, endpoint=endpoint, method="getInflightBundleStatuses", params=params)
+
+        async def call():
+            return _status_response(await JitoClient.for_agent(agent).get_inflight_bundle_statuses(bundle_uuids))
+        return await _envelope(call())
 
     # Transaction Endpoint
-    def send_txn(agent: SolanaAgentKit, params=None, bundleOnly=False):
-        ep = "/transactions"
-        query_params = []
+    @staticmethod
+    async def send_txn(agent: SolanaAgentKit, params=None, bundleOnly=False) -> Dict[str, Any]:
+        query = {"bundleOnly": "true"} if bundleOnly else None
+        return await _envelope(_send_rpc(agent, "/transactions", "sendTransaction", [params], query))
 
-        if bundleOnly:
-            query_params.append("bundleOnly=true")
-        
-        if agent.jito_uuid is not None:
-            query_params.append(f"uuid={agent.jito_uuid}")
+    @staticmethod
+    async def send_bundle_with_tip(
+        agent: SolanaAgentKit,
+        transactions: Sequence[Any],
+        tip_lamports: int,
+        wait: bool = False,
+        timeout: float = 30.0,
+    ) -> Dict[str, Any]:
+        """
+        Bundle signed transactions, tip from the agent's wallet and submit the bundle.
+
+        Args:
+            agent (SolanaAgentKit): Agent whose wallet pays the tip.
+            transactions (Sequence): Signed solders Transaction/VersionedTransaction objects.
+            tip_lamports (int): Tip added unless a transaction already pays a tip account.
+            wait (bool): Poll until the bundle lands or fails.
+            timeout (float): Seconds to wait when `wait` is set.
+
+        Returns:
+            dict: `bundle_id`, the accepting `region` when sent through the region fan-out,
+            and the final in-flight `status` when waiting.
+        """
+        client = JitoClient.for_agent(agent)
+        bundle = await client.build_bundle(transactions, agent.wallet, tip_lamports)
+        result: Dict[str, Any] = {}
+        if agent.jito_regions:
+            fanout = JitoFanout.for_agent(agent)
+            region, bundle_id = await fanout.submit_bundle(bundle)
+            result["region"] = region
+            if wait:
+                # Only the accepting region knows the bundle; its landing tracker already polls it
+                statuses = await fanout.wait_for_bundles(region, [bundle_id], timeout=timeout)
+        else:
+            bundle_id = await client.send_bundle(bundle)
+            if wait:
+                statuses = await client.wait_for_bundles([bundle_id], timeout=timeout)
+        result["bundle_id"] = bundle_id
+        if wait:
+            result["status"] = statuses[bundle_id]
+        return result
 
-        if query_params:
-            ep += "?" + "&".join(query_params)
+    @staticmethod
+    def get_region_stats(agent: SolanaAgentKit) -> Dict[str, Dict[str, Any]]:
+        """Acceptance, landing and latency statistics of the agent's Jito regions, best first."""
+        if not agent.jito_regions:
+            return {}
+        return JitoFanout.for_agent(agent).region_stats()
 
-        return __send_request(agent, endpoint=ep, method="sendTransaction", params=params)
+    @staticmethod
+    async def wait_for_bundles(agent: SolanaAgentKit, bundle_ids: List[str], timeout: float = 30.0) -> Dict[str, Optional[dict]]:
+        return await JitoClient.for_agent(agent).wait_for_bundles(bundle_ids, timeout=timeout)
@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +51,7 @@ class LightProtocolManager:
                 "shouldLog": should_log,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/send-compressed-airdrop",
                 json=payload,
                 headers={"Content-Type": "application/json"}
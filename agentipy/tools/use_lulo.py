@@ -11,6 +11,7 @@ from solders.transaction import VersionedTransaction  # type: ignore
 from agentipy.agent import SolanaAgentKit
 from agentipy.constants import FLEXLEND_BASE_URL
 from agentipy.helpers import fix_asyncio_for_windows
+from agentipy.utils.http_policy import http_policy
 
 fix_asyncio_for_windows()
 
@@ -36,10 +37,10 @@ class LuloManager:
             payload = json.dumps({"account": str(agent.wallet.pubkey())})
 
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=payload) as response:
-                    if response.status != 200:
-                        raise Exception(f"Lulo API Error: {response.status}")
-                    data = await response.json()
+                response = await http_policy.arequest(session, "POST", url, headers=headers, data=payload)
+                if response.status != 200:
+                    raise Exception(f"Lulo API Error: {response.status}")
+                data = await response.json()
 
             transaction_bytes = base64.b64decode(data["transaction"])
             lulo_txn = VersionedTransaction.from_bytes(transaction_bytes)
@@ -94,10 +95,10 @@ class LuloManager:
             })
 
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=payload) as response:
-                    if response.status != 200:
-                        raise Exception(f"Lulo API Error: {response.status}")
-                    data = await response.json()
+                response = await http_policy.arequest(session, "POST", url, headers=headers, data=payload)
+                if response.status != 200:
+                    raise Exception(f"Lulo API Error: {response.status}")
+                data = await response.json()
 
             transaction_bytes = base64.b64decode(data["data"]["transactionMeta"][0]["transaction"])
             lulo_txn = VersionedTransaction.from_bytes(transaction_bytes)
@@ -155,10 +156,10 @@ class LuloManager:
             })
 
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=payload) as response:
-                    if response.status != 200:
-                        raise Exception(f"Lulo API Error: {response.status}")
-                    data = await response.json()
+                response = await http_policy.arequest(session, "POST", url, headers=headers, data=payload)
+                if response.status != 200:
+                    raise Exception(f"Lulo API Error: {response.status}")
+                data = await response.json()
 
             transaction_bytes = base64.b64decode(data["data"]["transactionMeta"][0]["transaction"])
             lulo_txn = VersionedTransaction.from_bytes(transaction_bytes)
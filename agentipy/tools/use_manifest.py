@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ class ManifestManager:
                 "quoteMint": quote_mint,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/manifest-create-market",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -100,7 +101,7 @@ class ManifestManager:
                 "price": price,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/limit-order",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -156,7 +157,7 @@ class ManifestManager:
                 "orders": orders,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/batch-order",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -209,7 +210,7 @@ class ManifestManager:
                 "marketId": market_id,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/cancel-all-orders",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -262,7 +263,7 @@ class ManifestManager:
                 "marketId": market_id,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/withdraw-all",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +45,7 @@ class DeployCollectionManager:
                 "creatorAddress": creator_address,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/nft/deploy-collection",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -97,7 +98,7 @@ class DeployCollectionManager:
                 "assetId": assetId,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/nft/get-asset",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -171,7 +172,7 @@ class DeployCollectionManager:
                 "after": after,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/nft/get-assets-by-creator",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -242,7 +243,7 @@ class DeployCollectionManager:
                 "after": after,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/nft/get-assets-by-authority",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -313,7 +314,7 @@ class DeployCollectionManager:
                 "recipient": recipient,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/nft/mint",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -1,7 +1,6 @@
 import logging
 import struct
 
-from solana.rpc.api import Client
 from solana.rpc.types import TokenAccountOpts, TxOpts
 from solana.transaction import AccountMeta
 from solders.compute_budget import set_compute_unit_limit  # type: ignore
@@ -26,7 +25,7 @@ class MoonshotManager:
     @staticmethod
     def buy(agent:SolanaAgentKit, mint_str: str, collateral_amount: float = 0.01, slippage_bps: int = 500):
         try:
-            client = Client(agent.rpc_url)
+            client = agent.connection_client
             amount = get_tokens_by_collateral_amount(mint_str, collateral_amount, TradeDirection.BUY)
             
             collateral_amount = int(collateral_amount * LAMPORTS_PER_SOL)
@@ -108,7 +107,7 @@ class MoonshotManager:
     @staticmethod 
     def sell(agent:SolanaAgentKit, mint_str: str, token_balance: float=None, slippage_bps: int=500):
         try:
-            client = Client(agent.rpc_url)
+            client = agent.connection_client
             if token_balance is None:
                 token_balance = get_token_balance(PUB_KEY, mint_str)
             
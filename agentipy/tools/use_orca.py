@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +36,7 @@ class OrcaManager:
                 "positionMintAddress": position_mint_address,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/orca-close-position",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -97,7 +98,7 @@ class OrcaManager:
                 "feeTier": fee_tier,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/orca-create-clmm",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -165,7 +166,7 @@ class OrcaManager:
                 "feeTier": fee_tier,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/orca-create-liquidity-pool",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -210,7 +211,7 @@ class OrcaManager:
                 "open_api_key": agent.openai_api_key,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/orca-fetch-positions",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -265,7 +266,7 @@ class OrcaManager:
                 "inputAmount": input_amount,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/orca-open-centered-position",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -323,7 +324,7 @@ class OrcaManager:
                 "inputAmount": input_amount,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/orca-open-single-sided-position",
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -1,15 +1,18 @@
 import asyncio
+import logging
 import struct
+from dataclasses import replace
+from typing import List, Optional
 
 import base58
 import spl.token.instructions as spl_token
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed
 from solana.rpc.types import TxOpts
-#from solana.transaction import Transaction
-from solders.transaction import Transaction
 from solders.instruction import AccountMeta, Instruction  # type: ignore
 from solders.pubkey import Pubkey  # type: ignore
+#from solana.transaction import Transaction
+from solders.transaction import Transaction
 from spl.token.instructions import get_associated_token_address
 
 from agentipy.agent import SolanaAgentKit
@@ -20,6 +23,10 @@ from agentipy.constants import (EXPECTED_DISCRIMINATOR, LAMPORTS_PER_SOL,
                                 SYSTEM_PROGRAM, SYSTEM_RENT,
                                 SYSTEM_TOKEN_PROGRAM, TOKEN_DECIMALS)
 from agentipy.types import BondingCurveState
+from agentipy.utils.http_policy import DEFAULT_RETRY_POLICY, retry_async
+from agentipy.utils.rpc_accounting import instrument_client
+
+logger = logging.getLogger(__name__)
 
 
 class PumpfunManager:
@@ -35,6 +42,30 @@ class PumpfunManager:
 
         return BondingCurveState(data)
 
+    @staticmethod
+    def derive_bonding_curve(mint: Pubkey) -> Pubkey:
+        """Bonding curve account of a Pump.fun mint."""
+        return Pubkey.find_program_address([b"bonding-curve", bytes(mint)], PUMP_PROGRAM)[0]
+
+    @staticmethod
+    async def get_pump_curve_states(conn: AsyncClient, curve_addresses: List[Pubkey]) -> List[Optional[BondingCurveState]]:
+        """
+        Fetch many bonding curve states with batched getMultipleAccounts calls.
+
+        Returns:
+            List[Optional[BondingCurveState]]: States in the order of `curve_addresses`; None for
+            accounts that do not exist or are not bonding curves.
+        """
+        chunks = [curve_addresses[i:i + 100] for i in range(0, len(curve_addresses), 100)]
+        responses = await asyncio.gather(*(conn.get_multiple_accounts(chunk) for chunk in chunks))
+        states = []
+        for account in (account for response in responses for account in response.value):
+            if account is None or account.data[:8] != EXPECTED_DISCRIMINATOR:
+                states.append(None)
+            else:
+                states.append(BondingCurveState(account.data))
+        return states
+
     @staticmethod
     def calculate_pump_curve_price(curve_state: BondingCurveState) -> float:
         if curve_state.virtual_token_reserves <= 0 or curve_state.virtual_sol_reserves <= 0:
@@ -51,8 +82,9 @@ class PumpfunManager:
     @staticmethod
     async def buy_token(agent: SolanaAgentKit, mint: Pubkey, bonding_curve: Pubkey, associated_bonding_curve: Pubkey, amount: float, slippage: float = 0.01, max_retries=5):
         payer = agent.wallet
+        policy = replace(DEFAULT_RETRY_POLICY, max_attempts=max_retries)
 
-        async with AsyncClient(agent.rpc_url) as client:
+        async with instrument_client(AsyncClient(agent.rpc_url), agent.rpc_accountant) as client:
             associated_token_account = get_associated_token_address(payer.pubkey(), mint)
             amount_lamports = int(amount * LAMPORTS_PER_SOL)
 
@@ -64,160 +96,117 @@ class PumpfunManager:
             # Calculate maximum SOL to spend with slippage
             max_amount_lamports = int(amount_lamports * (1 + slippage))
 
-            # Create associated token account with retries
-            for ata_attempt in range(max_retries):
-                try:
-                    account_info = await client.get_account_info(associated_token_account)
-                    if account_info.value is None:
-                        print(f"Creating associated token account (Attempt {ata_attempt + 1})...")
-                        create_ata_ix = spl_token.create_associated_token_account(
-                            payer=payer.pubkey(),
-                            owner=payer.pubkey(),
-                            mint=mint
-                        )
-                        create_ata_tx = Transaction()
-                        create_ata_tx.add(create_ata_ix)
-                        recent_blockhash = await client.get_latest_blockhash()
-                        create_ata_tx.recent_blockhash = recent_blockhash.value.blockhash
-                        await client.send_transaction(create_ata_tx, payer)
-                        print("Associated token account created.")
-                        print(f"Associated token account address: {associated_token_account}")
-                        break
-                    else:
-                        print("Associated token account already exists.")
-                        print(f"Associated token account address: {associated_token_account}")
-                        break
-                except Exception as e:
-                    print(f"Attempt {ata_attempt + 1} to create associated token account failed: {str(e)}")
-                    if ata_attempt < max_retries - 1:
-                        wait_time = 2 ** ata_attempt
-                        print(f"Retrying in {wait_time} seconds...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        print("Max retries reached. Unable to create associated token account.")
-                        return
-
-            # Continue with the buy transaction
-            for attempt in range(max_retries):
-                try:
-                    accounts = [
-                        AccountMeta(pubkey=PUMP_GLOBAL, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=PUMP_FEE, is_signer=False, is_writable=True),
-                        AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=bonding_curve, is_signer=False, is_writable=True),
-                        AccountMeta(pubkey=associated_bonding_curve, is_signer=False, is_writable=True),
-                        AccountMeta(pubkey=associated_token_account, is_signer=False, is_writable=True),
-                        AccountMeta(pubkey=payer.pubkey(), is_signer=True, is_writable=True),
-                        AccountMeta(pubkey=SYSTEM_PROGRAM, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=SYSTEM_TOKEN_PROGRAM, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=SYSTEM_RENT, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=PUMP_EVENT_AUTHORITY, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=PUMP_PROGRAM, is_signer=False, is_writable=False),
-                    ]
-
-                    discriminator = struct.pack("<Q", 16927863322537952870)
-                    data = discriminator + struct.pack("<Q", int(token_amount * 10**6)) + struct.pack("<Q", max_amount_lamports)
-                    buy_ix = Instruction(PUMP_PROGRAM, data, accounts)
-
-                    recent_blockhash = await client.get_latest_blockhash()
-                    transaction = Transaction()
-                    transaction.add(buy_ix)
-                    transaction.recent_blockhash = recent_blockhash.value.blockhash
-
-                    tx = await client.send_transaction(
-                        transaction,
-                        payer,
-                        opts=TxOpts(skip_preflight=True, preflight_commitment=Confirmed),
-                    )
-
-                    print(f"Transaction sent: https://explorer.solana.com/tx/{tx.value}")
-
-                    await client.confirm_transaction(tx.value, commitment="confirmed")
-                    print("Transaction confirmed")
-                    return tx.value
-
-                except Exception as e:
-                    print(f"Attempt {attempt + 1} failed: {str(e)}")
-                    if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt
-                        print(f"Retrying in {wait_time} seconds...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        print("Max retries reached. Unable to complete the transaction.")
+            async def ensure_associated_token_account():
+                account_info = await client.get_account_info(associated_token_account)
+                if account_info.value is not None:
+                    logger.info(f"Associated token account {associated_token_account} already exists")
+                    return
+                logger.info(f"Creating associated token account {associated_token_account}")
+                create_ata_ix = spl_token.create_associated_token_account(
+                    payer=payer.pubkey(),
+                    owner=payer.pubkey(),
+                    mint=mint
+                )
+                create_ata_tx = Transaction()
+                create_ata_tx.add(create_ata_ix)
+                recent_blockhash = await client.get_latest_blockhash()
+                create_ata_tx.recent_blockhash = recent_blockhash.value.blockhash
+                await client.send_transaction(create_ata_tx, payer)
+                logger.info(f"Associated token account {associated_token_account} created")
+
+            await retry_async(ensure_associated_token_account, policy, description="Pump.fun associated token account creation")
+
+            async def send_buy():
+                accounts = [
+                    AccountMeta(pubkey=PUMP_GLOBAL, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=PUMP_FEE, is_signer=False, is_writable=True),
+                    AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=bonding_curve, is_signer=False, is_writable=True),
+                    AccountMeta(pubkey=associated_bonding_curve, is_signer=False, is_writable=True),
+                    AccountMeta(pubkey=associated_token_account, is_signer=False, is_writable=True),
+                    AccountMeta(pubkey=payer.pubkey(), is_signer=True, is_writable=True),
+                    AccountMeta(pubkey=SYSTEM_PROGRAM, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=SYSTEM_TOKEN_PROGRAM, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=SYSTEM_RENT, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=PUMP_EVENT_AUTHORITY, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=PUMP_PROGRAM, is_signer=False, is_writable=False),
+                ]
+
+                discriminator = struct.pack("<Q", 16927863322537952870)
+                data = discriminator + struct.pack("<Q", int(token_amount * 10**6)) + struct.pack("<Q", max_amount_lamports)
+                buy_ix = Instruction(PUMP_PROGRAM, data, accounts)
+                return await PumpfunManager._send_and_confirm(client, payer, buy_ix)
+
+            return await retry_async(send_buy, policy, description="Pump.fun buy")
 
     @staticmethod
     async def sell_token(agent: SolanaAgentKit, mint: Pubkey, bonding_curve: Pubkey, associated_bonding_curve: Pubkey, slippage: float = 0.25, max_retries=5):
         payer = agent.wallet
+        policy = replace(DEFAULT_RETRY_POLICY, max_attempts=max_retries)
 
-        async with AsyncClient(agent.rpc_url) as client:
+        async with instrument_client(AsyncClient(agent.rpc_url), agent.rpc_accountant) as client:
             associated_token_account = get_associated_token_address(payer.pubkey(), mint)
-            
+
             # Get token balance
             token_balance = await PumpfunManager.get_token_balance(client, associated_token_account)
             token_balance_decimal = token_balance / 10**TOKEN_DECIMALS
-            print(f"Token balance: {token_balance_decimal}")
+            logger.info(f"Token balance: {token_balance_decimal}")
             if token_balance == 0:
-                print("No tokens to sell.")
+                logger.info("No tokens to sell")
                 return
 
             # Fetch the token price
             curve_state = await PumpfunManager.get_pump_curve_state(client, bonding_curve)
             token_price_sol = PumpfunManager.calculate_pump_curve_price(curve_state)
-            print(f"Price per Token: {token_price_sol:.20f} SOL")
+            logger.debug(f"Price per token: {token_price_sol:.20f} SOL")
 
             # Calculate minimum SOL output
             amount = token_balance
             min_sol_output = float(token_balance_decimal) * float(token_price_sol)
             slippage_factor = 1 - slippage
             min_sol_output = int((min_sol_output * slippage_factor) * LAMPORTS_PER_SOL)
-            
-            print(f"Selling {token_balance_decimal} tokens")
-            print(f"Minimum SOL output: {min_sol_output / LAMPORTS_PER_SOL:.10f} SOL")
-
-            for attempt in range(max_retries):
-                try:
-                    accounts = [
-                        AccountMeta(pubkey=PUMP_GLOBAL, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=PUMP_FEE, is_signer=False, is_writable=True),
-                        AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=bonding_curve, is_signer=False, is_writable=True),
-                        AccountMeta(pubkey=associated_bonding_curve, is_signer=False, is_writable=True),
-                        AccountMeta(pubkey=associated_token_account, is_signer=False, is_writable=True),
-                        AccountMeta(pubkey=payer.pubkey(), is_signer=True, is_writable=True),
-                        AccountMeta(pubkey=SYSTEM_PROGRAM, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=SYSTEM_ASSOCIATED_TOKEN_ACCOUNT_PROGRAM, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=SYSTEM_TOKEN_PROGRAM, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=PUMP_EVENT_AUTHORITY, is_signer=False, is_writable=False),
-                        AccountMeta(pubkey=PUMP_PROGRAM, is_signer=False, is_writable=False),
-                    ]
-
-                    discriminator = struct.pack("<Q", 12502976635542562355)
-                    data = discriminator + struct.pack("<Q", amount) + struct.pack("<Q", min_sol_output)
-                    sell_ix = Instruction(PUMP_PROGRAM, data, accounts)
-
-                    recent_blockhash = await client.get_latest_blockhash()
-                    transaction = Transaction()
-                    transaction.add(sell_ix)
-                    transaction.recent_blockhash = recent_blockhash.value.blockhash
-
-                    tx = await client.send_transaction(
-                        transaction,
-                        payer,
-                        opts=TxOpts(skip_preflight=True, preflight_commitment=Confirmed),
-                    )
-
-                    print(f"Transaction sent: https://explorer.solana.com/tx/{tx.value}")
-
-                    await client.confirm_transaction(tx.value, commitment="confirmed")
-                    print("Transaction confirmed")
-
-                    return tx.value
-
-                except Exception as e:
-                    print(f"Attempt {attempt + 1} failed: {str(e)}")
-                    if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt
-                        print(f"Retrying in {wait_time} seconds...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        print("Max retries reached. Unable to complete the transaction.")
+
+            logger.info(
+                f"Selling {token_balance_decimal} tokens for at least {min_sol_output / LAMPORTS_PER_SOL:.10f} SOL"
+            )
+
+            async def send_sell():
+                accounts = [
+                    AccountMeta(pubkey=PUMP_GLOBAL, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=PUMP_FEE, is_signer=False, is_writable=True),
+                    AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=bonding_curve, is_signer=False, is_writable=True),
+                    AccountMeta(pubkey=associated_bonding_curve, is_signer=False, is_writable=True),
+                    AccountMeta(pubkey=associated_token_account, is_signer=False, is_writable=True),
+                    AccountMeta(pubkey=payer.pubkey(), is_signer=True, is_writable=True),
+                    AccountMeta(pubkey=SYSTEM_PROGRAM, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=SYSTEM_ASSOCIATED_TOKEN_ACCOUNT_PROGRAM, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=SYSTEM_TOKEN_PROGRAM, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=PUMP_EVENT_AUTHORITY, is_signer=False, is_writable=False),
+                    AccountMeta(pubkey=PUMP_PROGRAM, is_signer=False, is_writable=False),
+                ]
+
+                discriminator = struct.pack("<Q", 12502976635542562355)
+                data = discriminator + struct.pack("<Q", amount) + struct.pack("<Q", min_sol_output)
+                sell_ix = Instruction(PUMP_PROGRAM, data, accounts)
+                return await PumpfunManager._send_and_confirm(client, payer, sell_ix)
+
+            return await retry_async(send_sell, policy, description="Pump.fun sell")
+
+    @staticmethod
+    async def _send_and_confirm(client: AsyncClient, payer, instruction: Instruction):
+        recent_blockhash = await client.get_latest_blockhash()
+        transaction = Transaction()
+        transaction.add(instruction)
+        transaction.recent_blockhash = recent_blockhash.value.blockhash
+
+        tx = await client.send_transaction(
+            transaction,
+            payer,
+            opts=TxOpts(skip_preflight=True, preflight_commitment=Confirmed),
+        )
+        logger.info(f"Transaction sent: https://explorer.solana.com/tx/{tx.value}")
+
+        await client.confirm_transaction(tx.value, commitment="confirmed")
+        logger.info(f"Transaction {tx.value} confirmed")
+        return tx.value
@@ -2,7 +2,6 @@ import base64
 import logging
 import os
 
-from solana.rpc.api import Client
 from solana.rpc.commitment import Processed
 from solana.rpc.types import TokenAccountOpts, TxOpts
 from solders.compute_budget import set_compute_unit_limit  # type: ignore
@@ -55,7 +54,7 @@ class RaydiumManager:
             bool: True if the transaction is confirmed, False otherwise.
         """
         try:
-            client = Client(agent.rpc_url)
+            client = agent.connection_client
             payer_keypair = agent.wallet
 
             # Fetch pool keys and validate
@@ -179,7 +178,7 @@ class RaydiumManager:
             bool: True if the transaction is confirmed, False otherwise.
         """
         try:
-            client = Client(agent.rpc_url)
+            client = agent.connection_client
             payer_keypair = agent.wallet
             logger.info(f"Starting sell transaction for pair address: {pair_address}")
             if not (1 <= percentage <= 100):
@@ -9,6 +9,7 @@ from solders.pubkey import Pubkey  # type: ignore
 from solders.transaction import VersionedTransaction  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
+from agentipy.utils.http_policy import http_policy
 
 
 class SendArcadeManager:
@@ -33,10 +34,10 @@ class SendArcadeManager:
             payload = json.dumps({"account": str(agent.wallet.pubkey())})
 
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=payload) as response:
-                    if response.status != 200:
-                        raise Exception(f"RPS API Error: {response.status}")
-                    data = await response.json()
+                response = await http_policy.arequest(session, "POST", url, headers=headers, data=payload)
+                if response.status != 200:
+                    raise Exception(f"RPS API Error: {response.status}")
+                data = await response.json()
 
             if "transaction" in data:
                 transaction_bytes = base64.b64decode(data["transaction"])
@@ -87,10 +88,10 @@ class SendArcadeManager:
             payload = json.dumps({"account": str(agent.wallet.pubkey()), "signature": sig})
 
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=payload) as response:
-                    if response.status != 200:
-                        raise Exception(f"RPS outcome API Error: {response.status}")
-                    data = await response.json()
+                response = await http_policy.arequest(session, "POST", url, headers=headers, data=payload)
+                if response.status != 200:
+                    raise Exception(f"RPS outcome API Error: {response.status}")
+                data = await response.json()
 
             title = data.get("title", "")
             if title.startswith("You lost"):
@@ -120,10 +121,10 @@ class SendArcadeManager:
             payload = json.dumps({"account": str(agent.wallet.pubkey())})
 
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=payload) as response:
-                    if response.status != 200:
-                        raise Exception(f"RPS claim API Error: {response.status}")
-                    data = await response.json()
+                response = await http_policy.arequest(session, "POST", url, headers=headers, data=payload)
+                if response.status != 200:
+                    raise Exception(f"RPS claim API Error: {response.status}")
+                data = await response.json()
 
             if "transaction" in data:
                 transaction_bytes = base64.b64decode(data["transaction"])
@@ -163,10 +164,10 @@ class SendArcadeManager:
             payload = json.dumps({"account": str(agent.wallet.pubkey())})
 
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=payload) as response:
-                    if response.status != 200:
-                        raise Exception(f"RPS finalization API Error: {response.status}")
-                    data = await response.json()
+                response = await http_policy.arequest(session, "POST", url, headers=headers, data=payload)
+                if response.status != 200:
+                    raise Exception(f"RPS finalization API Error: {response.status}")
+                data = await response.json()
 
             title = data.get("title", "Unknown result")
             return f"Prize claimed Successfully\n{title}"
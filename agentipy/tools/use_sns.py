@@ -1,9 +1,8 @@
 import logging
 from typing import Any, Dict, Optional
 
-import requests
-
 from agentipy.agent import SolanaAgentKit
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +26,7 @@ class NameServiceManager:
                 "params": [domain]
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 agent.quicknode_rpc_url,
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -59,7 +58,7 @@ class NameServiceManager:
                 "params": [owner]
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 agent.quicknode_rpc_url,
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -91,7 +90,7 @@ class NameServiceManager:
                 "params": [owner]
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 agent.quicknode_rpc_url,
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -139,7 +138,7 @@ class NameServiceManager:
             if referrer_key:
                 payload["params"].append(referrer_key)
 
-            response = requests.post(
+            response = http_policy.post(
                 agent.quicknode_rpc_url,
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -9,6 +9,7 @@ from solders.pubkey import Pubkey  # type: ignore
 from solders.transaction import VersionedTransaction  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
+from agentipy.utils.http_policy import http_policy
 
 
 class SolayerManager:
@@ -32,11 +33,11 @@ class SolayerManager:
             payload = json.dumps({"account": str(agent.wallet_address)})
 
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=payload) as response:
-                    if response.status != 200:
-                        error_data = await response.json()
-                        raise Exception(error_data.get("message", "Staking request failed"))
-                    data = await response.json()
+                response = await http_policy.arequest(session, "POST", url, headers=headers, data=payload)
+                if response.status != 200:
+                    error_data = await response.json()
+                    raise Exception(error_data.get("message", "Staking request failed"))
+                data = await response.json()
 
             transaction_bytes = base64.b64decode(data["transaction"])
             txn = VersionedTransaction.from_bytes(transaction_bytes)
@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,7 @@ class SolutiofiManager:
                 "mints": mints,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/solutiofi/close-accounts",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -88,7 +89,7 @@ class SolutiofiManager:
                 "mints": mints,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/solutiofi/burn-tokens",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -141,7 +142,7 @@ class SolutiofiManager:
                 "priorityFee": priority_fee,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/solutiofi/merge-tokens",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -194,7 +195,7 @@ class SolutiofiManager:
                 "priorityFee": priority_fee,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/solutiofi/spread-token",
                 json=payload,
                 headers={"Content-Type": "application/json"},
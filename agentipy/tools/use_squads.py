@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,7 @@ class SquadsManager:
                 "transactionIndex": transaction_index,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/squads/multisig-approve-proposal",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -82,7 +83,7 @@ class SquadsManager:
                 "creator": creator,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/squads/create-squads-multisig",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -128,7 +129,7 @@ class SquadsManager:
                 "transactionIndex": transaction_index,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/squads/multisig-create-proposal",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -177,7 +178,7 @@ class SquadsManager:
                 "mint": mint if mint else None,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/squads/multisig-deposit-to-treasury",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -223,7 +224,7 @@ class SquadsManager:
                 "transactionIndex": transaction_index,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/squads/multisig-execute-proposal",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -266,7 +267,7 @@ class SquadsManager:
                 "transactionIndex": transaction_index,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/squads/multisig-reject-proposal",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -318,7 +319,7 @@ class SquadsManager:
                 "mint": mint,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/squads/multisig-transfer-from-treasury",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -5,6 +5,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +44,7 @@ class TensorManager:
                 "nftMint": nft_mint,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/tensor/list-nft-for-sale",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -86,7 +87,7 @@ class TensorManager:
                 "nftMint": nft_mint,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/tensor/cancel-listing",
                 json=payload,
                 headers={"Content-Type": "application/json"},
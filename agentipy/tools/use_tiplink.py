@@ -4,6 +4,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +47,7 @@ class TiplinkManager:
             print("[DEBUG] Sending POST to:", endpoint)
             print("[DEBUG] Payload:", payload)
 
-            response = requests.post(
+            response = http_policy.post(
                 endpoint,
                 json=payload,
                 headers={"Content-Type": "application/json"},
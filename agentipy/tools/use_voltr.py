@@ -6,6 +6,7 @@ import requests
 
 from agentipy.agent import SolanaAgentKit
 from agentipy.utils.agentipy_proxy.utils import encrypt_private_key
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +47,7 @@ class VoltrManager:
                 "strategy": strategy,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/voltr/deposit-strategy",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -83,7 +84,7 @@ class VoltrManager:
                 "vault": vault,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/voltr/get-position-values",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -132,7 +133,7 @@ class VoltrManager:
                 "strategy": strategy,
             }
 
-            response = requests.post(
+            response = http_policy.post(
                 f"{agent.base_proxy_url}/{agent.api_version}/voltr/withdraw-strategy",
                 json=payload,
                 headers={"Content-Type": "application/json"},
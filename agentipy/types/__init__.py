@@ -180,6 +180,54 @@ class TransferResult(BaseModelWithArbitraryTypes):
     amount: float
     token: Optional[str] = None
 
+class BurnAndCloseResult(BaseModelWithArbitraryTypes):
+    """Per-account outcome of a bulk burn-and-close operation."""
+    token_account: str
+    status: str  # "submitted", "skipped" or "failed"
+    signature: Optional[str] = None
+    mint: Optional[str] = None
+    burned_amount: int = 0
+    error: Optional[str] = None
+
+class TokenScreeningCriteria(BaseModelWithArbitraryTypes):
+    """Rejection rules of the token-screening pipeline."""
+    allow_mint_authority: bool = False
+    allow_freeze_authority: bool = False
+    reject_risk_levels: List[str] = ["danger"]
+    max_rugcheck_score: Optional[int] = None  # RugCheck normalised score, higher is riskier
+    min_price_usd: Optional[float] = None
+    require_verified: bool = False
+
+class TokenScreeningResult(BaseModelWithArbitraryTypes):
+    """Outcome of screening a single mint."""
+    mint: str
+    status: str  # "passed", "rejected" or "error"
+    score: Optional[float] = None
+    reasons: List[str] = []
+    mint_authority: Optional[str] = None
+    freeze_authority: Optional[str] = None
+    supply: Optional[int] = None
+    decimals: Optional[int] = None
+    verified: bool = False
+    rugcheck_score: Optional[int] = None
+    risks: List[str] = []
+    price_usd: Optional[float] = None
+    pump_curve_price_sol: Optional[float] = None
+    pump_curve_complete: Optional[bool] = None
+    error: Optional[str] = None
+
+class HeliusWebhookEvent(BaseModelWithArbitraryTypes):
+    """A transaction delivered by a Helius webhook."""
+    signature: str
+    type: Optional[str] = None
+    source: Optional[str] = None
+    slot: Optional[int] = None
+    timestamp: Optional[int] = None
+    fee_payer: Optional[str] = None
+    description: Optional[str] = None
+    accounts: List[str] = []
+    raw: Dict = {}
+
 class JupiterTokenData(BaseModelWithArbitraryTypes):
     address:str
     symbol:str
@@ -1,15 +1,15 @@
 import base64
 import os
 
-import requests
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 from agentipy.constants import API_VERSION, BASE_PROXY_URL
+from agentipy.utils.http_policy import http_policy
 
 
 def get_encryption_key():
-    response = requests.post(f"{BASE_PROXY_URL}/{API_VERSION}/security/get-encryption-key")
+    response = http_policy.post(f"{BASE_PROXY_URL}/{API_VERSION}/security/get-encryption-key")
     data = response.json()
     return data["requestId"], base64.b64decode(data["encryptionKey"]), base64.b64decode(data["iv"])
 
@@ -0,0 +1,293 @@
+import asyncio
+import csv
+import json
+import logging
+import os
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List
+
+import numpy as np
+
+from agentipy.tools.use_backpack import AsyncBackpackManager
+from agentipy.utils.http_policy import retry_async
+from agentipy.utils.rpc_accounting import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+HISTORY_METHODS = {
+    "fills": "get_fill_history",
+    "orders": "get_order_history",
+    "pnl": "get_pnl_history",
+    "funding": "get_funding_payments",
+    "borrows": "get_borrow_history",
+    "interest": "get_interest_history",
+}
+MAX_PAGE_SIZE = 1000
+DEFAULT_EXPORT_CONCURRENCY = 4
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+
+# Column kinds of the columnar output
+FLOAT, BOOL, DATETIME, OBJECT = "float", "bool", "datetime", "object"
+
+
+def _is_id_column(name: str) -> bool:
+    # Ids are numeric strings past float precision; keep them verbatim
+    return name == "id" or name.endswith("Id") or name.endswith("_id")
+
+
+def _is_time_column(name: str) -> bool:
+    return "timestamp" in name.lower() or name.endswith("At") or name.endswith("Time")
+
+
+def _infer_kind(name: str, values: List[Any]) -> str:
+    present = [value for value in values if value is not None]
+    if not present or _is_id_column(name):
+        return OBJECT
+    if _is_time_column(name):
+        try:
+            np.array(present, dtype="datetime64[ms]")
+            return DATETIME
+        except (TypeError, ValueError):
+            return OBJECT
+    if all(isinstance(value, bool) for value in present):
+        return BOOL
+    if all(isinstance(value, (int, float, str)) and not isinstance(value, bool) for value in present):
+        try:
+            [float(value) for value in present]
+            return FLOAT
+        except ValueError:
+            pass
+    return OBJECT
+
+
+def _missing_like(array: np.ndarray, length: int) -> np.ndarray:
+    """Column of `length` missing values with the dtype of `array` (NaN, NaT or None)."""
+    if array.dtype.kind == "f":
+        return np.full(length, np.nan)
+    if array.dtype.kind == "M":
+        return np.full(length, np.datetime64("NaT"), dtype=array.dtype)
+    return np.full(length, None, dtype=object)
+
+
+def _rewrite_csv_header(path: str, columns: List[str]):
+    """Rewrite the CSV at `path` under the header `columns`, padding the rows already written."""
+    tmp_path = f"{path}.tmp"
+    with open(path, newline="", encoding="utf-8") as source, \
+            open(tmp_path, "w", newline="", encoding="utf-8") as target:
+        reader, writer = csv.reader(source), csv.writer(target)
+        next(reader, None)
+        writer.writerow(columns)
+        writer.writerows(row + [""] * (len(columns) - len(row)) for row in reader)
+    os.replace(tmp_path, path)
+
+
+def _to_array(kind: str, values: List[Any]) -> np.ndarray:
+    if kind == FLOAT:
+        return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+    if kind == DATETIME:
+        return np.array(values, dtype="datetime64[ms]")
+    if kind == BOOL and None not in values:
+        return np.array(values, dtype=bool)
+    return np.array(
+        [json.dumps(value) if isinstance(value, (dict, list)) else value for value in values], dtype=object
+    )
+
+
+class BackpackHistoryExporter:
+    """
+    Exports complete Backpack account histories in columnar form.
+
+    The `limit`/`offset` pages of a history endpoint are fetched `concurrency`
+    at a time, under a shared request rate limit, and delivered in order.
+    Each page is converted to columns as soon as it arrives, so exports never
+    keep the whole history as Python dicts.
+
+    Column types are inferred from the page a column first appears on.
+    Numeric string fields become float64 arrays, timestamps datetime64[ms]
+    and ids stay strings. Fields that first appear on a later page (e.g.
+    `clientId` or `triggerPrice` of some orders) widen the output: earlier
+    rows get missing values, and a CSV or Parquet file already written is
+    rewritten once with the new columns. Offsets shift when new rows arrive
+    during an export, so bound live histories with a `to_timestamp` filter
+    where the endpoint supports one.
+
+    Args:
+        manager (AsyncBackpackManager): Account whose history is exported.
+        page_size (int): Rows per request (Backpack allows at most 1000).
+        concurrency (int): Pages fetched concurrently.
+        requests_per_second (float): Request rate limit shared by all exports of this exporter.
+    """
+
+    def __init__(
+        self,
+        manager: AsyncBackpackManager,
+        page_size: int = MAX_PAGE_SIZE,
+        concurrency: int = DEFAULT_EXPORT_CONCURRENCY,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    ):
+        self.manager = manager
+        self.page_size = min(page_size, MAX_PAGE_SIZE)
+        self.concurrency = max(1, concurrency)
+        self._bucket = TokenBucket(requests_per_second, capacity=self.concurrency)
+
+    async def _fetch_page(self, kind: str, offset: int, filters: dict) -> List[dict]:
+        method = getattr(self.manager, HISTORY_METHODS[kind])
+
+        async def fetch():
+            await self._bucket.acquire()
+            return await method(limit=self.page_size, offset=offset, **filters)
+
+        rows = await retry_async(fetch, description=f"Backpack {kind} history page at offset {offset}")
+        return list(rows or [])
+
+    async def iter_pages(self, kind: str, **filters) -> AsyncIterator[List[dict]]:
+        """
+        Yield every page of a history in order.
+
+        Args:
+            kind (str): One of "fills", "orders", "pnl", "funding", "borrows", "interest".
+            **filters: Keyword filters of the matching BackpackManager method (symbol, from_timestamp, ...).
+        """
+        if kind not in HISTORY_METHODS:
+            raise ValueError(f"Unknown history kind {kind!r}; expected one of {sorted(HISTORY_METHODS)}")
+        inflight: Deque[asyncio.Future] = deque()
+        next_offset = 0
+
+        def schedule():
+            nonlocal next_offset
+            inflight.append(asyncio.ensure_future(self._fetch_page(kind, next_offset, filters)))
+            next_offset += self.page_size
+
+        try:
+            for _ in range(self.concurrency):
+                schedule()
+            while inflight:
+                page = await inflight.popleft()
+                if page:
+                    yield page
+                if len(page) < self.page_size:
+                    break
+                schedule()
+        finally:
+            # Pages scheduled past the end of the history are not needed
+            for task in inflight:
+                task.cancel()
+
+    async def iter_column_batches(self, kind: str, **filters) -> AsyncIterator[Dict[str, np.ndarray]]:
+        """
+        Yield each page of a history as a dict of column arrays.
+
+        Every batch holds all columns seen so far, in first-seen order; columns
+        first seen on a page are appended to the end.
+        """
+        kinds: Dict[str, str] = {}
+        async for page in self.iter_pages(kind, **filters):
+            for name in dict.fromkeys(name for row in page for name in row):
+                if name not in kinds:
+                    kinds[name] = _infer_kind(name, [row.get(name) for row in page])
+            batch = {}
+            for name, column_kind in kinds.items():
+                values = [row.get(name) for row in page]
+                try:
+                    batch[name] = _to_array(column_kind, values)
+                except (TypeError, ValueError):
+                    batch[name] = _to_array(OBJECT, values)
+            yield batch
+
+    async def export_arrays(self, kind: str, **filters) -> Dict[str, np.ndarray]:
+        """
+        Export a complete history as NumPy arrays.
+
+        Returns:
+            Dict[str, np.ndarray]: One array per column, all of the same length.
+        """
+        batches: Dict[str, List[np.ndarray]] = {}
+        rows = 0
+        async for batch in self.iter_column_batches(kind, **filters):
+            for name, array in batch.items():
+                if name not in batches:
+                    batches[name] = [_missing_like(array, rows)] if rows else []
+                batches[name].append(array)
+            rows += len(next(iter(batch.values()), ()))
+        return {name: np.concatenate(arrays) for name, arrays in batches.items()}
+
+    async def export_csv(self, kind: str, path: str, **filters) -> int:
+        """
+        Stream a complete history to a CSV file, one page at a time.
+
+        Returns:
+            int: Number of rows written.
+        """
+        rows_written = 0
+        columns: List[str] = []
+        file = open(path, "w", newline="", encoding="utf-8")
+        try:
+            writer = csv.writer(file)
+            async for page in self.iter_pages(kind, **filters):
+                known = set(columns)
+                new_columns = [name for name in dict.fromkeys(name for row in page for name in row) if name not in known]
+                if new_columns:
+                    columns += new_columns
+                    if rows_written:
+                        file.close()
+                        _rewrite_csv_header(path, columns)
+                        file = open(path, "a", newline="", encoding="utf-8")
+                        writer = csv.writer(file)
+                    else:
+                        writer.writerow(columns)
+                writer.writerows(
+                    [
+                        json.dumps(value) if isinstance(value, (dict, list)) else value
+                        for value in (row.get(name) for name in columns)
+                    ]
+                    for row in page
+                )
+                rows_written += len(page)
+        finally:
+            file.close()
+        return rows_written
+
+    async def export_parquet(self, kind: str, path: str, **filters) -> int:
+        """
+        Stream a complete history to a Parquet file, one row group per page.
+
+        Requires pyarrow.
+
+        Returns:
+            int: Number of rows written.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow") from e
+
+        def typed(field):
+            # Columns that are empty on the page they first appear on are typed as strings
+            return pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field
+
+        rows_written = 0
+        writer = None
+        try:
+            async for batch in self.iter_column_batches(kind, **filters):
+                table = pa.Table.from_pydict(
+                    {name: pa.array(array, from_pandas=True) for name, array in batch.items()}
+                )
+                if writer is None:
+                    writer = pq.ParquetWriter(path, pa.schema([typed(f) for f in table.schema]))
+                elif len(table.schema) > len(writer.schema):
+                    # A Parquet schema cannot grow; rewrite the row groups so far with the new columns
+                    width = len(writer.schema)
+                    writer.close()
+                    written = pq.read_table(path)
+                    for field in (typed(table.schema.field(i)) for i in range(width, len(table.schema))):
+                        written = written.append_column(field, pa.nulls(written.num_rows, field.type))
+                    writer = pq.ParquetWriter(path, written.schema)
+                    writer.write_table(written)
+                table = table.cast(writer.schema)
+                writer.write_table(table)
+                rows_written += table.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows_written
@@ -0,0 +1,548 @@
+import asyncio
+import json
+import logging
+import time
+from bisect import bisect_left, insort
+from collections import deque
+from decimal import Decimal
+from typing import (Any, AsyncIterator, Awaitable, Callable, Deque, Dict,
+                    Iterable, List, Optional, Union)
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+BACKPACK_WS_URL = "wss://ws.backpack.exchange"
+DEFAULT_TRADE_BUFFER = 1000
+DEFAULT_PENDING_DIFFS = 10_000
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+
+MessageSource = Callable[[List[str]], AsyncIterator[Union[str, dict]]]
+
+
+class SequenceGapError(Exception):
+    """A depth update does not follow the last applied update."""
+
+
+class LocalOrderBook:
+    """
+    Incrementally maintained order book of one Backpack market.
+
+    Price levels are kept in dicts keyed by Decimal price next to sorted
+    price lists, so updates cost a bisect and lookups of the best levels or
+    the top N levels never sort. The book is seeded from a REST depth
+    snapshot and then advanced by `depth.<symbol>` events, whose first/last
+    update ids (`U`/`u`) must chain onto `last_update_id`.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.last_update_id: Optional[int] = None
+        self.updated_at: Optional[float] = None
+        self._bids: Dict[Decimal, List[str]] = {}
+        self._asks: Dict[Decimal, List[str]] = {}
+        self._bid_prices: List[Decimal] = []
+        self._ask_prices: List[Decimal] = []
+        self._version = 0
+        self._rendered: Dict[Optional[int], tuple] = {}
+
+    @property
+    def synced(self) -> bool:
+        return self.last_update_id is not None
+
+    def reset(self):
+        """Forget all levels; the book is unsynced until the next snapshot."""
+        self.last_update_id = None
+        self._bids.clear()
+        self._asks.clear()
+        self._bid_prices.clear()
+        self._ask_prices.clear()
+        self._touch()
+
+    def _touch(self):
+        self._version += 1
+        self._rendered.clear()
+        self.updated_at = time.time()
+
+    @staticmethod
+    def _set_level(levels: Dict[Decimal, List[str]], prices: List[Decimal], price: str, quantity: str):
+        key = Decimal(price)
+        if Decimal(quantity) == 0:
+            if levels.pop(key, None) is not None:
+                del prices[bisect_left(prices, key)]
+        elif key in levels:
+            levels[key][1] = quantity
+        else:
+            levels[key] = [price, quantity]
+            insort(prices, key)
+
+    def apply_snapshot(self, snapshot: dict):
+        """Replace the book with a REST depth snapshot (`bids`, `asks`, `lastUpdateId`)."""
+        self.reset()
+        for price, quantity in snapshot.get("bids") or []:
+            self._set_level(self._bids, self._bid_prices, price, quantity)
+        for price, quantity in snapshot.get("asks") or []:
+            self._set_level(self._asks, self._ask_prices, price, quantity)
+        self.last_update_id = int(snapshot["lastUpdateId"])
+        self._touch()
+
+    def apply_diff(self, event: dict) -> bool:
+        """
+        Apply a `depth` stream event.
+
+        Returns:
+            bool: False when the event is older than the book and was skipped.
+
+        Raises:
+            SequenceGapError: If updates between the book and the event were missed.
+        """
+        if self.last_update_id is None:
+            raise SequenceGapError(f"{self.symbol} order book is not synced")
+        first_id, last_id = int(event["U"]), int(event["u"])
+        if last_id <= self.last_update_id:
+            return False
+        if first_id > self.last_update_id + 1:
+            raise SequenceGapError(
+                f"{self.symbol} depth gap: book at {self.last_update_id}, update starts at {first_id}"
+            )
+        for price, quantity in event.get("b") or []:
+            self._set_level(self._bids, self._bid_prices, price, quantity)
+        for price, quantity in event.get("a") or []:
+            self._set_level(self._asks, self._ask_prices, price, quantity)
+        self.last_update_id = last_id
+        self._touch()
+        return True
+
+    def best_bid(self) -> Optional[List[str]]:
+        return list(self._bids[self._bid_prices[-1]]) if self._bid_prices else None
+
+    def best_ask(self) -> Optional[List[str]]:
+        return list(self._asks[self._ask_prices[0]]) if self._ask_prices else None
+
+    def mid_price(self) -> Optional[Decimal]:
+        if not self._bid_prices or not self._ask_prices:
+            return None
+        return (self._bid_prices[-1] + self._ask_prices[0]) / 2
+
+    def spread(self) -> Optional[Decimal]:
+        if not self._bid_prices or not self._ask_prices:
+            return None
+        return self._ask_prices[0] - self._bid_prices[-1]
+
+    def snapshot(self, limit: Optional[int] = None) -> dict:
+        """
+        The book in the shape of `BackpackManager.get_depth`.
+
+        Both sides are in ascending price order, so the best bid is the last
+        bid and the best ask the first ask. `limit` keeps only the N levels
+        closest to the spread on each side.
+        """
+        rendered = self._rendered.get(limit)
+        if rendered is None:
+            bid_prices = self._bid_prices[-limit:] if limit else self._bid_prices
+            ask_prices = self._ask_prices[:limit] if limit else self._ask_prices
+            rendered = self._rendered[limit] = (
+                [list(self._bids[price]) for price in bid_prices],
+                [list(self._asks[price]) for price in ask_prices],
+            )
+        bids, asks = rendered
+        return {
+            "bids": list(bids),
+            "asks": list(asks),
+            "lastUpdateId": str(self.last_update_id),
+            "timestamp": int(self.updated_at * 1000) if self.updated_at else None,
+        }
+
+
+def _ticker_from_event(event: dict) -> dict:
+    """Convert a `ticker` stream event to the shape of `BackpackManager.get_ticker_information`."""
+    first, last = event.get("o"), event.get("c")
+    change = change_percent = None
+    if first is not None and last is not None:
+        change_value = Decimal(last) - Decimal(first)
+        change = str(change_value)
+        if Decimal(first):
+            change_percent = str((change_value / Decimal(first)).quantize(Decimal("0.000001")))
+    return {
+        "symbol": event.get("s"),
+        "firstPrice": first,
+        "lastPrice": last,
+        "priceChange": change,
+        "priceChangePercent": change_percent,
+        "high": event.get("h"),
+        "low": event.get("l"),
+        "volume": event.get("v"),
+        "quoteVolume": event.get("V"),
+        "trades": str(event["n"]) if event.get("n") is not None else None,
+    }
+
+
+def _trade_from_event(event: dict) -> dict:
+    """Convert a `trade` stream event to the shape of `BackpackManager.get_recent_trades` entries."""
+    price, quantity = event.get("p"), event.get("q")
+    return {
+        "id": event.get("t"),
+        "price": price,
+        "quantity": quantity,
+        "quoteQuantity": str(Decimal(price) * Decimal(quantity)) if price and quantity else None,
+        "timestamp": event.get("T"),
+        "isBuyerMaker": event.get("m"),
+    }
+
+
+async def websocket_messages(streams: List[str], url: str = BACKPACK_WS_URL, heartbeat: float = 30.0):
+    """Subscribe to `streams` on the Backpack websocket and yield raw messages until the connection closes."""
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(url, heartbeat=heartbeat) as ws:
+            await ws.send_json({"method": "SUBSCRIBE", "params": streams})
+            async for message in ws:
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    yield message.data
+                elif message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+
+
+def replay_messages(recording: Union[str, Iterable[Union[str, dict]]]) -> MessageSource:
+    """
+    Message source replaying a recording instead of the live websocket.
+
+    Args:
+        recording: Path of a JSON-lines file written with `record_path`, or an
+            iterable of raw messages (JSON strings or decoded dicts).
+    """
+
+    async def source(streams: List[str]):
+        if isinstance(recording, str):
+            with open(recording, "r", encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        yield line
+        else:
+            for message in recording:
+                yield message
+
+    return source
+
+
+class BackpackMarketStream:
+    """
+    Live Backpack market data kept in memory.
+
+    Subscribes to the depth, ticker and trade streams of `symbols` and keeps
+    a LocalOrderBook, the latest ticker and a window of recent trades per
+    symbol, so `get_depth`, `get_ticker` and `get_recent_trades` are served
+    without a network round trip.
+
+    A book is seeded from a REST snapshot; depth events that arrive meanwhile
+    are buffered and applied on top of it. A sequence gap marks the book
+    unsynced and triggers a new snapshot. A dropped connection unsyncs every
+    book at once, then reconnects with backoff and resyncs them. Malformed
+    messages are logged and skipped.
+
+    Passing `source=replay_messages(...)` drives the stream from a recording
+    (as written with `record_path`) instead of the websocket. Recorded
+    snapshots are replayed in place, so a replay needs no network access.
+
+    Args:
+        symbols (List[str]): Market symbols, e.g. ["SOL_USDC"].
+        snapshot_fetcher (callable, optional): Coroutine function returning the REST depth
+            snapshot of a symbol. Defaults to the public Backpack client in live mode.
+        source (callable, optional): Message source; defaults to the Backpack websocket.
+        url (str): Websocket endpoint.
+        trade_buffer (int): Number of recent trades kept per symbol.
+        record_path (str, optional): JSON-lines file every received message and snapshot is appended to.
+    """
+
+    def __init__(
+        self,
+        symbols: List[str],
+        snapshot_fetcher: Optional[Callable[[str], Awaitable[dict]]] = None,
+        source: Optional[MessageSource] = None,
+        url: str = BACKPACK_WS_URL,
+        trade_buffer: int = DEFAULT_TRADE_BUFFER,
+        record_path: Optional[str] = None,
+    ):
+        self.symbols = list(dict.fromkeys(symbols))
+        self.url = url
+        self.record_path = record_path
+        self._live = source is None
+        self._source = source or (lambda streams: websocket_messages(streams, self.url))
+        if snapshot_fetcher is None and self._live:
+            snapshot_fetcher = self._fetch_public_depth
+        self.snapshot_fetcher = snapshot_fetcher
+        self.books: Dict[str, LocalOrderBook] = {symbol: LocalOrderBook(symbol) for symbol in self.symbols}
+        self.tickers: Dict[str, dict] = {}
+        self.trades: Dict[str, Deque[dict]] = {symbol: deque(maxlen=trade_buffer) for symbol in self.symbols}
+        self.messages = 0
+        self.resyncs = 0
+        self._pending: Dict[str, Deque[dict]] = {
+            symbol: deque(maxlen=DEFAULT_PENDING_DIFFS) for symbol in self.symbols
+        }
+        self._snapshot_tasks: Dict[str, asyncio.Task] = {}
+        self._synced_events: Dict[str, asyncio.Event] = {}
+        self._listeners: List[Callable[[str, str, dict], Any]] = []
+        self._public_client = None
+        self._record_file = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def streams(self) -> List[str]:
+        return [f"{kind}.{symbol}" for symbol in self.symbols for kind in ("depth", "ticker", "trade")]
+
+    def add_listener(self, callback: Callable[[str, str, dict], Any]):
+        """Call `callback(kind, symbol, data)` after every applied depth, ticker or trade event."""
+        self._listeners.append(callback)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> "BackpackMarketStream":
+        if self._task is None or self._task.done():
+            if self.record_path:
+                self._record_file = open(self.record_path, "a", encoding="utf-8")
+            self._task = asyncio.create_task(self.run())
+        return self
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for task in self._snapshot_tasks.values():
+            task.cancel()
+        self._snapshot_tasks.clear()
+        if self._record_file is not None:
+            self._record_file.close()
+            self._record_file = None
+
+    async def __aenter__(self) -> "BackpackMarketStream":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def run(self):
+        """
+        Consume the message source until it ends (replay) or the stream is stopped (live).
+
+        In live mode the books are unsynced as soon as the source ends or fails,
+        so nothing is served from them while the stream reconnects.
+        """
+        attempt = 0
+        while True:
+            self._reset_books()
+            try:
+                async for raw in self._source(self.streams):
+                    attempt = 0
+                    self.handle_message(raw)
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                logger.warning(f"Backpack market stream disconnected: {e}")
+            finally:
+                if self._live:
+                    self._unsync_books()
+            if not self._live:
+                return
+            delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** attempt)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _unsync_books(self):
+        """Forget every book and stop pending snapshot fetches; nothing is synced until `_reset_books`."""
+        for task in self._snapshot_tasks.values():
+            task.cancel()
+        self._snapshot_tasks.clear()
+        for symbol, book in self.books.items():
+            book.reset()
+            self._pending[symbol].clear()
+            self._synced_event(symbol).clear()
+
+    def _reset_books(self):
+        self._unsync_books()
+        if self.snapshot_fetcher is not None:
+            for symbol in self.books:
+                self._request_snapshot(symbol)
+
+    # ------------------------------------------------------------------
+    # Message handling
+    # ------------------------------------------------------------------
+
+    def _record(self, message: dict):
+        if self._record_file is not None:
+            self._record_file.write(json.dumps(message, separators=(",", ":")) + "\n")
+
+    def handle_message(self, raw: Union[str, dict]):
+        """Apply one raw stream message (`{"stream": ..., "data": ...}`); malformed messages are logged and skipped."""
+        try:
+            self._handle_message(raw)
+        except Exception as e:
+            logger.warning(f"Skipping malformed Backpack stream message {str(raw)[:200]!r}: {e!r}")
+
+    def _handle_message(self, raw: Union[str, dict]):
+        message = json.loads(raw) if isinstance(raw, (str, bytes)) else raw
+        stream, data = message.get("stream"), message.get("data")
+        if not stream or data is None:
+            return
+        self.messages += 1
+        self._record(message)
+        kind, _, symbol = stream.partition(".")
+        if symbol not in self.books:
+            return
+        if kind == "depth":
+            self._on_depth(symbol, data)
+        elif kind == "snapshot":
+            self._on_snapshot(symbol, data)
+        elif kind == "ticker":
+            self.tickers[symbol] = _ticker_from_event(data)
+            self._notify("ticker", symbol, self.tickers[symbol])
+        elif kind == "trade":
+            trade = _trade_from_event(data)
+            self.trades[symbol].append(trade)
+            self._notify("trade", symbol, trade)
+
+    def _notify(self, kind: str, symbol: str, data: dict):
+        for callback in self._listeners:
+            try:
+                callback(kind, symbol, data)
+            except Exception as e:
+                logger.warning(f"Backpack stream listener failed: {e}")
+
+    def _on_depth(self, symbol: str, event: dict):
+        # Raises before anything is buffered or applied if the update ids are missing
+        int(event["U"]), int(event["u"])
+        book = self.books[symbol]
+        if not book.synced:
+            self._pending[symbol].append(event)
+            return
+        try:
+            if book.apply_diff(event):
+                self._notify("depth", symbol, event)
+        except SequenceGapError as e:
+            logger.info(f"{e}; resyncing")
+            self._resync(symbol)
+            self._pending[symbol].append(event)
+        except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+            # The update may be half applied
+            logger.warning(f"Malformed {symbol} depth update: {e!r}; resyncing")
+            self._resync(symbol)
+
+    def _apply_snapshot(self, symbol: str, snapshot: dict) -> bool:
+        """
+        Seed the book from `snapshot` and replay the buffered diffs on top of it.
+
+        Returns:
+            bool: False when the snapshot is older than the buffered diffs it must
+            bridge to; the book is left unsynced with the diffs still buffered.
+        """
+        book = self.books[symbol]
+        book.apply_snapshot(snapshot)
+        pending = self._pending[symbol]
+        while pending:
+            event = pending.popleft()
+            try:
+                book.apply_diff(event)
+            except SequenceGapError as e:
+                logger.info(f"{e}; snapshot is stale")
+                pending.appendleft(event)
+                book.reset()
+                return False
+            except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+                # Dropped; if later diffs no longer chain, the next snapshot bridges them
+                logger.warning(f"Dropping malformed {symbol} depth update: {e!r}")
+                pending.clear()
+                book.reset()
+                return False
+        self._synced_event(symbol).set()
+        self._notify("depth", symbol, {"s": symbol, "u": book.last_update_id})
+        return True
+
+    def _on_snapshot(self, symbol: str, snapshot: dict):
+        # Snapshot recorded in the message stream
+        if not self._apply_snapshot(symbol, snapshot):
+            self._resync(symbol)
+
+    def _resync(self, symbol: str):
+        self.resyncs += 1
+        self.books[symbol].reset()
+        self._synced_event(symbol).clear()
+        if self.snapshot_fetcher is not None:
+            self._request_snapshot(symbol)
+
+    def _request_snapshot(self, symbol: str):
+        task = self._snapshot_tasks.get(symbol)
+        if task is not None and not task.done():
+            # The running fetch keeps going until its snapshot bridges the buffered diffs
+            return
+        self._snapshot_tasks[symbol] = asyncio.ensure_future(self._load_snapshot(symbol))
+
+    async def _load_snapshot(self, symbol: str):
+        """Fetch snapshots until one bridges the buffered diffs and the book is synced."""
+        attempt = 0
+        while True:
+            try:
+                snapshot = await self.snapshot_fetcher(symbol)
+            except Exception as e:
+                logger.warning(f"Failed to fetch {symbol} depth snapshot: {e}")
+            else:
+                self._record({"stream": f"snapshot.{symbol}", "data": snapshot})
+                if self._apply_snapshot(symbol, snapshot):
+                    return
+                self.resyncs += 1
+            await asyncio.sleep(min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** attempt))
+            attempt += 1
+
+    async def _fetch_public_depth(self, symbol: str) -> dict:
+        if self._public_client is None:
+            from backpack_exchange_sdk.public import PublicClient
+            self._public_client = PublicClient()
+        return await asyncio.to_thread(self._public_client.get_depth, symbol)
+
+    def _synced_event(self, symbol: str) -> asyncio.Event:
+        event = self._synced_events.get(symbol)
+        if event is None:
+            event = self._synced_events[symbol] = asyncio.Event()
+        return event
+
+    # ------------------------------------------------------------------
+    # In-memory market data
+    # ------------------------------------------------------------------
+
+    def is_synced(self, symbol: str) -> bool:
+        book = self.books.get(symbol)
+        return book is not None and book.synced
+
+    async def wait_synced(self, symbol: Optional[str] = None, timeout: Optional[float] = None):
+        """Wait until the book of `symbol` (every book if None) is synced."""
+        symbols = [symbol] if symbol else self.symbols
+        await asyncio.wait_for(
+            asyncio.gather(*(self._synced_event(s).wait() for s in symbols)), timeout
+        )
+
+    def get_depth(self, symbol: str, limit: Optional[int] = None) -> dict:
+        """
+        Order book of `symbol` from memory, in the shape of `BackpackManager.get_depth`.
+
+        Raises:
+            ValueError: If the symbol is not streamed or its book is not synced.
+        """
+        book = self.books.get(symbol)
+        if book is None:
+            raise ValueError(f"{symbol} is not streamed")
+        if not book.synced:
+            raise ValueError(f"{symbol} order book is not synced")
+        return book.snapshot(limit)
+
+    def get_ticker(self, symbol: str) -> Optional[dict]:
+        """Latest 24h ticker of `symbol`, or None before the first ticker event."""
+        return self.tickers.get(symbol)
+
+    def get_recent_trades(self, symbol: str, limit: int = 100) -> List[dict]:
+        """Most recent streamed trades of `symbol`, oldest first."""
+        trades = self.trades.get(symbol)
+        if not trades:
+            return []
+        return list(trades)[-limit:]
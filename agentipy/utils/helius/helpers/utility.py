@@ -1,31 +1,31 @@
 import json
 
-import requests
+from agentipy.utils.http_policy import http_policy
 
 
-def _make_get_request(url:str, headers:None, params= None):
-    response = requests.get(url=url,headers=headers,params=params)
+def _make_get_request(url:str, headers=None, params= None):
+    response = http_policy.get(url=url,headers=headers,params=params)
     if response.status_code == 200:
         return response.json()
     else:
         raise ValueError(f"Error: {response.status_code}: {response.content}")
     
 def _make_post_request(url:str, payload):
-    response = requests.post(url=url, json=payload)
+    response = http_policy.post(url=url, json=payload)
     if response.status_code == 200:
         return response.json()
     else:
         raise ValueError(f"Error {response.status_code}: {response.content}")
     
 def _make_put_request(url:str,payload):
-    response = requests.put(url=url, json=payload)
+    response = http_policy.put(url=url, json=payload)
     if response.status_code == 200:
         return response.json()
     else:
         raise ValueError(f"Error: {response.status_code}: {response.content}")
     
 def _make_delete_request(url):
-    response = requests.delete(url)
+    response = http_policy.delete(url)
     if response.status_code == 200:
         try:
             if response.text.strip():
@@ -35,4 +35,18 @@ def _make_delete_request(url):
         except json.JSONDecodeError:
             raise ValueError("Received unexpected response format from API")
     else:
-        response.raise_for_status()
\ No newline at end of file
+        response.raise_for_status()
+
+async def _make_async_get_request(session, url: str, params=None):
+    # aiohttp rejects None query values; the sync helpers send them as empty strings
+    params = {key: value for key, value in (params or {}).items() if value not in (None, "")}
+    response = await http_policy.arequest(session, "GET", url, params=params)
+    if response.status == 200:
+        return await response.json()
+    raise ValueError(f"Error: {response.status}: {await response.text()}")
+
+async def _make_async_post_request(session, url: str, payload):
+    response = await http_policy.arequest(session, "POST", url, json=payload)
+    if response.status == 200:
+        return await response.json()
+    raise ValueError(f"Error {response.status}: {await response.text()}")
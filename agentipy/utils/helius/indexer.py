@@ -0,0 +1,351 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from agentipy.agent import SolanaAgentKit
+from agentipy.tools.use_helius import HeliusManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_ITEMS = 1000
+DEFAULT_REFRESH_INTERVAL = 15.0
+DEFAULT_QUERY_LIMIT = 100
+INSERT_BATCH_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    address TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    slot INTEGER,
+    timestamp INTEGER,
+    type TEXT,
+    source TEXT,
+    fee_payer TEXT,
+    generation INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (address, signature)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_transactions_position ON transactions (address, generation DESC, ordinal DESC);
+CREATE INDEX IF NOT EXISTS idx_transactions_time ON transactions (address, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions (address, type, generation DESC, ordinal DESC);
+CREATE INDEX IF NOT EXISTS idx_transactions_source ON transactions (address, source, generation DESC, ordinal DESC);
+CREATE TABLE IF NOT EXISTS sync_state (
+    address TEXT PRIMARY KEY,
+    newest_signature TEXT,
+    oldest_signature TEXT,
+    backfill_complete INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL
+);
+"""
+
+
+class HeliusHistoryIndexer:
+    """
+    Incremental local index of Helius parsed transaction histories.
+
+    Transactions are stored per address in SQLite together with a
+    high-water mark (the newest indexed signature). A sync only fetches the
+    pages newer than the mark; older history can be backfilled on demand.
+    History queries by type, source and time range are answered from the
+    local tables.
+
+    Every transaction keeps its position in the API's history order as a
+    (generation, ordinal) pair: each sync of newer pages opens a new
+    generation, and ordinals count down in the order the API returned the
+    transactions, backfills continuing below the oldest one. Ordering and
+    `before`/`until` cursors use this position, so transactions sharing a
+    slot keep the API order and are never skipped.
+
+    Args:
+        db_path (str): SQLite database file; ":memory:" keeps the index in memory.
+        initial_items (int): Transactions fetched on the first sync of an address.
+        refresh_interval (float): Seconds `get_history` serves from the index before syncing again.
+    """
+
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        initial_items: int = DEFAULT_INITIAL_ITEMS,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ):
+        self.db_path = db_path
+        self.initial_items = initial_items
+        self.refresh_interval = refresh_interval
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._db_lock = threading.Lock()
+        self._address_locks: Dict[str, asyncio.Lock] = {}
+
+    def close(self):
+        with self._db_lock:
+            self._conn.close()
+
+    async def _run(self, func, *args):
+        def call():
+            with self._db_lock:
+                return func(*args)
+        return await asyncio.to_thread(call)
+
+    def _lock_for(self, address: str) -> asyncio.Lock:
+        lock = self._address_locks.get(address)
+        if lock is None:
+            lock = self._address_locks[address] = asyncio.Lock()
+        return lock
+
+    def _get_state(self, address: str) -> Optional[sqlite3.Row]:
+        return self._conn.execute("SELECT * FROM sync_state WHERE address = ?", (address,)).fetchone()
+
+    def _insert(self, address: str, generation: int, transactions: List[Tuple[int, dict]]):
+        # Rows left behind by an interrupted pass take the position of the pass that refetches them
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO transactions "
+                "(address, signature, slot, timestamp, type, source, fee_payer, generation, ordinal, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (address, signature) DO UPDATE SET "
+                "generation = excluded.generation, ordinal = excluded.ordinal",
+                [
+                    (
+                        address,
+                        tx.get("signature"),
+                        tx.get("slot"),
+                        tx.get("timestamp"),
+                        tx.get("type"),
+                        tx.get("source"),
+                        tx.get("feePayer"),
+                        generation,
+                        ordinal,
+                        json.dumps(tx, separators=(",", ":")),
+                    )
+                    for ordinal, tx in transactions
+                    if tx.get("signature")
+                ],
+            )
+
+    def _newest_generation(self, address: str) -> Optional[int]:
+        return self._conn.execute(
+            "SELECT MAX(generation) AS generation FROM transactions WHERE address = ?", (address,)
+        ).fetchone()["generation"]
+
+    def _oldest_position(self, address: str) -> Optional[Tuple[int, int]]:
+        row = self._conn.execute(
+            "SELECT generation, ordinal FROM transactions WHERE address = ? "
+            "ORDER BY generation, ordinal LIMIT 1",
+            (address,),
+        ).fetchone()
+        return (row["generation"], row["ordinal"]) if row else None
+
+    def _update_state(self, address: str, synced: bool = True, **fields):
+        if synced:
+            fields["synced_at"] = time.time()
+        with self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO sync_state (address) VALUES (?)", (address,))
+            assignments = ", ".join(f"{name} = ?" for name in fields)
+            self._conn.execute(f"UPDATE sync_state SET {assignments} WHERE address = ?", (*fields.values(), address))
+
+    async def _ingest(
+        self,
+        agent: SolanaAgentKit,
+        address: str,
+        max_items: Optional[int],
+        generation: int,
+        first_ordinal: int,
+        **history_kwargs,
+    ) -> dict:
+        """
+        Stream history into the index, numbering it downwards from `first_ordinal` within `generation`.
+
+        Returns the newest/oldest signature seen, the count and whether the history ended.
+        """
+        newest = oldest = None
+        count = 0
+        batch: List[Tuple[int, dict]] = []
+        async for tx in HeliusManager.iter_transaction_history(agent, address, max_items=max_items, **history_kwargs):
+            if newest is None:
+                newest = tx.get("signature")
+            oldest = tx.get("signature")
+            batch.append((first_ordinal - count, tx))
+            count += 1
+            if len(batch) >= INSERT_BATCH_SIZE:
+                await self._run(self._insert, address, generation, batch)
+                batch = []
+        if batch:
+            await self._run(self._insert, address, generation, batch)
+        return {
+            "newest": newest,
+            "oldest": oldest,
+            "count": count,
+            "exhausted": max_items is None or count < max_items,
+        }
+
+    async def sync(self, agent: SolanaAgentKit, address: str) -> int:
+        """
+        Fetch the transactions of `address` newer than its high-water mark.
+
+        The first sync of an address indexes its `initial_items` most recent
+        transactions. The mark only moves once all new pages are stored, so
+        the next sync after an interrupted one refetches everything newer than
+        the old mark; the rows the interrupted sync stored are moved to their
+        position in that pass instead of keeping a generation of their own.
+
+        Returns:
+            int: Number of transactions fetched.
+        """
+        async with self._lock_for(address):
+            state = await self._run(self._get_state, address)
+            if state is None or state["newest_signature"] is None:
+                result = await self._ingest(agent, address, self.initial_items, 0, 0)
+                await self._run(
+                    lambda: self._update_state(
+                        address,
+                        newest_signature=result["newest"],
+                        oldest_signature=result["oldest"],
+                        backfill_complete=int(result["exhausted"]),
+                    )
+                )
+            else:
+                generation = (await self._run(self._newest_generation, address) or 0) + 1
+                result = await self._ingest(agent, address, None, generation, 0, until=state["newest_signature"])
+                fields = {"newest_signature": result["newest"]} if result["newest"] else {}
+                await self._run(lambda: self._update_state(address, **fields))
+            logger.debug(f"Indexed {result['count']} new transactions for {address}")
+            return result["count"]
+
+    async def backfill(self, agent: SolanaAgentKit, address: str, max_items: Optional[int] = None) -> int:
+        """
+        Index older history of `address`, continuing from the oldest indexed transaction.
+
+        Returns:
+            int: Number of transactions fetched.
+        """
+        if await self._run(self._get_state, address) is None:
+            return await self.sync(agent, address)
+        async with self._lock_for(address):
+            state = await self._run(self._get_state, address)
+            if state["backfill_complete"]:
+                return 0
+            generation, ordinal = await self._run(self._oldest_position, address) or (0, 1)
+            result = await self._ingest(
+                agent, address, max_items, generation, ordinal - 1, before=state["oldest_signature"] or ""
+            )
+            fields = {"backfill_complete": int(result["exhausted"])}
+            if result["oldest"]:
+                fields["oldest_signature"] = result["oldest"]
+            # Backfilling does not make the newest end of the index any fresher
+            await self._run(lambda: self._update_state(address, synced=False, **fields))
+            return result["count"]
+
+    def _query(
+        self,
+        address: str,
+        type: Optional[str],
+        source: Optional[str],
+        start_time: Optional[int],
+        end_time: Optional[int],
+        before_position: Optional[Tuple[int, int]],
+        after_position: Optional[Tuple[int, int]],
+        limit: int,
+        offset: int,
+    ) -> List[dict]:
+        clauses, args = ["address = ?"], [address]
+        for clause, value in (
+            ("type = ?", type),
+            ("source = ?", source),
+            ("timestamp >= ?", start_time),
+            ("timestamp <= ?", end_time),
+        ):
+            if value not in (None, ""):
+                clauses.append(clause)
+                args.append(value)
+        if before_position is not None:
+            clauses.append("(generation, ordinal) < (?, ?)")
+            args.extend(before_position)
+        if after_position is not None:
+            clauses.append("(generation, ordinal) > (?, ?)")
+            args.extend(after_position)
+        rows = self._conn.execute(
+            f"SELECT data FROM transactions WHERE {' AND '.join(clauses)} "
+            "ORDER BY generation DESC, ordinal DESC LIMIT ? OFFSET ?",
+            (*args, limit, offset),
+        ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    async def query(
+        self,
+        address: str,
+        type: Optional[str] = None,
+        source: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+        offset: int = 0,
+    ) -> List[dict]:
+        """
+        Query indexed transactions of `address`, newest first, without any API call.
+
+        Args:
+            address (str): Indexed address.
+            type (str, optional): Helius transaction type, e.g. "SWAP".
+            source (str, optional): Helius source, e.g. "JUPITER".
+            start_time, end_time (int, optional): Block time bounds (unix seconds, inclusive).
+            limit (int): Maximum number of transactions.
+            offset (int): Number of matching transactions to skip.
+
+        Returns:
+            List[dict]: Parsed transactions.
+        """
+        return await self._run(self._query, address, type, source, start_time, end_time, None, None, limit, offset)
+
+    def _position_of(self, address: str, signature: str) -> Optional[Tuple[int, int]]:
+        row = self._conn.execute(
+            "SELECT generation, ordinal FROM transactions WHERE address = ? AND signature = ?", (address, signature)
+        ).fetchone()
+        return (row["generation"], row["ordinal"]) if row else None
+
+    async def get_history(
+        self,
+        agent: SolanaAgentKit,
+        address: str,
+        before: str = "",
+        until: str = "",
+        source: str = "",
+        type: str = "",
+        limit: int = DEFAULT_QUERY_LIMIT,
+    ) -> List[Any]:
+        """
+        Read-through replacement for `HeliusManager.get_parsed_transaction_history`.
+
+        The index is synced when it is older than `refresh_interval`, older history is
+        backfilled when the index cannot fill the page, and the page is served from
+        the local tables. Cursors that are not indexed fall back to the API.
+        """
+        state = await self._run(self._get_state, address)
+        if state is None or state["synced_at"] is None or time.time() - state["synced_at"] >= self.refresh_interval:
+            await self.sync(agent, address)
+
+        before_position = after_position = None
+        if before:
+            before_position = await self._run(self._position_of, address, before)
+        if until:
+            after_position = await self._run(self._position_of, address, until)
+        if (before and before_position is None) or (until and after_position is None):
+            return await asyncio.to_thread(
+                HeliusManager.get_parsed_transaction_history, agent, address, before, until, "", source, type
+            )
+
+        args = (address, type, source, None, None, before_position, after_position, limit, 0)
+        transactions = await self._run(self._query, *args)
+        if len(transactions) < limit and not until:
+            state = await self._run(self._get_state, address)
+            if not state["backfill_complete"]:
+                await self.backfill(agent, address, max_items=self.initial_items)
+                transactions = await self._run(self._query, *args)
+        return transactions
@@ -0,0 +1,246 @@
+import asyncio
+import hmac
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from aiohttp import web
+
+from agentipy.types import HeliusWebhookEvent
+from agentipy.utils.helius.helpers.cache import MISSING, LRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WEBHOOK_PATH = "/helius/webhook"
+DEFAULT_DEDUPE_SIZE = 100_000
+DEFAULT_SUBSCRIPTION_QUEUE_SIZE = 1000
+LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+
+def _involved_accounts(tx: dict) -> List[str]:
+    """Addresses touched by an enhanced or raw webhook transaction."""
+    accounts = []
+    if tx.get("feePayer"):
+        accounts.append(tx["feePayer"])
+    for transfer in tx.get("nativeTransfers") or []:
+        accounts += [transfer.get("fromUserAccount"), transfer.get("toUserAccount")]
+    for transfer in tx.get("tokenTransfers") or []:
+        accounts += [
+            transfer.get("fromUserAccount"),
+            transfer.get("toUserAccount"),
+            transfer.get("fromTokenAccount"),
+            transfer.get("toTokenAccount"),
+            transfer.get("mint"),
+        ]
+    for entry in tx.get("accountData") or []:
+        accounts.append(entry.get("account"))
+    # Raw webhooks carry the RPC transaction instead of Helius' enhanced fields
+    message = (tx.get("transaction") or {}).get("message") or {}
+    for key in message.get("accountKeys") or []:
+        accounts.append(key.get("pubkey") if isinstance(key, dict) else key)
+    return [account for account in dict.fromkeys(accounts) if account]
+
+
+def decode_webhook_event(tx: dict) -> Optional[HeliusWebhookEvent]:
+    """Decode one webhook transaction; returns None when it carries no signature."""
+    signature = tx.get("signature") or next(iter((tx.get("transaction") or {}).get("signatures") or []), None)
+    if not signature:
+        return None
+    return HeliusWebhookEvent(
+        signature=signature,
+        type=tx.get("type"),
+        source=tx.get("source"),
+        slot=tx.get("slot"),
+        timestamp=tx.get("timestamp") or tx.get("blockTime"),
+        fee_payer=tx.get("feePayer"),
+        description=tx.get("description"),
+        accounts=_involved_accounts(tx),
+        raw=tx,
+    )
+
+
+class Subscription:
+    """
+    A bus subscription; iterate it with `async for` to receive matching events.
+
+    When the consumer falls behind and the queue is full, the oldest event is
+    dropped (and counted in `dropped`) so the receiver never blocks.
+    """
+
+    def __init__(self, bus: "EventBus", addresses: Set[str], types: Set[str], maxsize: int):
+        self.bus = bus
+        self.addresses = addresses
+        self.types = types
+        self.dropped = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._closed = False
+
+    def matches(self, event: HeliusWebhookEvent) -> bool:
+        return not self.types or event.type in self.types
+
+    def _deliver(self, event: Optional[HeliusWebhookEvent]):
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def get(self) -> HeliusWebhookEvent:
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> HeliusWebhookEvent:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        return await self.get()
+
+    def close(self):
+        """Unsubscribe; pending iteration ends after the queued events."""
+        if not self._closed:
+            self._closed = True
+            self.bus._remove(self)
+            self._deliver(None)
+
+
+class EventBus:
+    """In-process pub/sub for webhook events, routed by address and event type."""
+
+    def __init__(self):
+        self._by_address: Dict[str, Set[Subscription]] = {}
+        self._wildcard: Set[Subscription] = set()
+
+    def subscribe(
+        self,
+        addresses: Optional[Iterable[str]] = None,
+        types: Optional[Iterable[str]] = None,
+        maxsize: int = DEFAULT_SUBSCRIPTION_QUEUE_SIZE,
+    ) -> Subscription:
+        """
+        Subscribe to events touching any of `addresses` (all events if None) whose
+        type is one of `types` (any type if None).
+        """
+        subscription = Subscription(self, set(addresses or ()), set(types or ()), maxsize)
+        if subscription.addresses:
+            for address in subscription.addresses:
+                self._by_address.setdefault(address, set()).add(subscription)
+        else:
+            self._wildcard.add(subscription)
+        return subscription
+
+    def _remove(self, subscription: Subscription):
+        self._wildcard.discard(subscription)
+        for address in subscription.addresses:
+            subscribers = self._by_address.get(address)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._by_address[address]
+
+    def publish(self, event: HeliusWebhookEvent) -> int:
+        """Deliver `event` to every matching subscription; returns the number of deliveries."""
+        targets = set(self._wildcard)
+        for account in event.accounts:
+            targets.update(self._by_address.get(account, ()))
+        delivered = 0
+        for subscription in targets:
+            if subscription.matches(event):
+                subscription._deliver(event)
+                delivered += 1
+        return delivered
+
+
+class HeliusWebhookReceiver:
+    """
+    Embeddable aiohttp server receiving Helius webhook deliveries.
+
+    Requests must carry the `Authorization` header configured on the webhook
+    (`auth_header` of `HeliusManager.create_webhook`). Payloads are decoded into
+    HeliusWebhookEvent models, de-duplicated by signature (Helius retries
+    deliveries) and published on `bus`.
+
+    Without `auth_header` anyone who can reach the receiver can publish events,
+    so `start` only serves it on a loopback address (e.g. behind a proxy that
+    checks the header).
+
+    Args:
+        bus (EventBus, optional): Bus events are published on; a new one is created if omitted.
+        auth_header (str, optional): Expected Authorization header value; None accepts any request.
+        path (str): URL path the webhook posts to.
+        dedupe_size (int): Number of recent signatures remembered for de-duplication.
+    """
+
+    def __init__(
+        self,
+        bus: Optional[EventBus] = None,
+        auth_header: Optional[str] = None,
+        path: str = DEFAULT_WEBHOOK_PATH,
+        dedupe_size: int = DEFAULT_DEDUPE_SIZE,
+    ):
+        self.bus = bus or EventBus()
+        self.auth_header = auth_header
+        self.path = path
+        self.received = 0
+        self.duplicates = 0
+        self._seen = LRUCache(maxsize=dedupe_size)
+        self._runner: Optional[web.AppRunner] = None
+
+    def add_routes(self, app: web.Application):
+        """Mount the receiver on an existing aiohttp application."""
+        app.router.add_post(self.path, self.handle)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if self.auth_header is not None and not hmac.compare_digest(
+            request.headers.get("Authorization", ""), self.auth_header
+        ):
+            return web.json_response({"error": "unauthorized"}, status=401)
+        try:
+            payload: Any = await request.json()
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return web.json_response({"error": "invalid JSON"}, status=400)
+
+        published = 0
+        for tx in payload if isinstance(payload, list) else [payload]:
+            event = decode_webhook_event(tx) if isinstance(tx, dict) else None
+            if event is None:
+                continue
+            self.received += 1
+            if self._seen.get(event.signature) is not MISSING:
+                self.duplicates += 1
+                continue
+            self._seen.set(event.signature, True)
+            self.bus.publish(event)
+            published += 1
+        return web.json_response({"published": published})
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080):
+        """
+        Serve the receiver on its own aiohttp server.
+
+        Raises:
+            ValueError: If `host` is not a loopback address and no `auth_header` is set.
+        """
+        if self.auth_header is None:
+            if host not in LOOPBACK_HOSTS:
+                raise ValueError(f"Refusing to serve an unauthenticated webhook receiver on {host}; set auth_header")
+            logger.warning("Helius webhook receiver accepts unauthenticated requests; set auth_header")
+        app = web.Application()
+        self.add_routes(app)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        logger.info(f"Helius webhook receiver listening on {host}:{port}{self.path}")
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "HeliusWebhookReceiver":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
@@ -0,0 +1,349 @@
+import asyncio
+import email.utils
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+
+from agentipy.utils.rpc_accounting import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class CircuitOpenError(Exception):
+    """Raised when calls to a host are short-circuited after repeated failures."""
+    pass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+
+    Attributes:
+        max_attempts (int): Total attempts, including the first one.
+        base_delay (float): Delay scale in seconds; attempt `n` waits up to `base_delay * 2**n`.
+        max_delay (float): Upper bound of a single delay (and of honoured Retry-After values).
+        retry_statuses (frozenset): Statuses retried for idempotent requests.
+        unsafe_retry_statuses (frozenset): Statuses retried for non-idempotent requests
+            (the server rejected them without processing).
+        unsafe_retry_after_statuses (frozenset): Statuses retried for non-idempotent requests
+            only when the response carries Retry-After. A bare 503 may come from a gateway
+            after the upstream already processed the request.
+    """
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    retry_statuses: FrozenSet[int] = field(default_factory=lambda: frozenset({408, 425, 429, 500, 502, 503, 504}))
+    unsafe_retry_statuses: FrozenSet[int] = field(default_factory=lambda: frozenset({429}))
+    unsafe_retry_after_statuses: FrozenSet[int] = field(default_factory=lambda: frozenset({503}))
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered delay before retry number `attempt` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def should_retry_status(self, method: str, status: int, retry_after: Optional[str] = None) -> bool:
+        if method.upper() in IDEMPOTENT_METHODS:
+            return status in self.retry_statuses
+        return status in self.unsafe_retry_statuses or (
+            retry_after is not None and status in self.unsafe_retry_after_statuses
+        )
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for
+    `reset_timeout` seconds, then lets a single trial call through (half-open).
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_call(self, host: str):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                raise CircuitOpenError(f"Circuit open for {host}; retry later")
+            self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    def release_trial(self):
+        """End a half-open trial without an outcome (e.g. the call was cancelled)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class HostState:
+    """Rate limiter, circuit breaker and Retry-After block of one host."""
+
+    def __init__(self, rate_limit: Optional[float], burst: Optional[float], breaker: CircuitBreaker):
+        self.bucket = TokenBucket(rate_limit, burst) if rate_limit else None
+        self.breaker = breaker
+        self.blocked_until = 0.0
+
+    def block_for(self, seconds: float):
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def wait_time(self) -> float:
+        return max(0.0, self.blocked_until - time.monotonic())
+
+
+def parse_retry_after(value: Optional[str], max_delay: float) -> Optional[float]:
+    """Seconds to wait according to a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), max_delay)
+
+
+class HttpPolicyEngine:
+    """
+    Shared retry and rate-limit policy for third-party HTTP APIs.
+
+    Each host gets its own token bucket (if a rate limit is configured),
+    circuit breaker and Retry-After tracking, so bursts from many agents
+    against one API slow down together instead of failing one by one.
+    """
+
+    def __init__(
+        self,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        self.retry_policy = retry_policy
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._rate_limits: Dict[str, tuple] = {}
+        self._hosts: Dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    def set_rate_limit(self, host: str, rate: float, burst: Optional[float] = None):
+        """Limit requests to `host` to `rate` per second (bursts up to `burst`)."""
+        with self._lock:
+            self._rate_limits[host] = (rate, burst)
+            self._hosts.pop(host, None)
+
+    def host_state(self, url: str) -> HostState:
+        host = urlsplit(url).netloc
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                rate, burst = self._rate_limits.get(host, (None, None))
+                state = self._hosts[host] = HostState(
+                    rate, burst, CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                )
+            return state
+
+    @staticmethod
+    def _retry_delay(policy: RetryPolicy, attempt: int, retry_after: Optional[str]) -> float:
+        delay = parse_retry_after(retry_after, policy.max_delay)
+        return delay if delay is not None else policy.backoff(attempt)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        session: Optional[requests.Session] = None,
+        background: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Drop-in replacement for `requests.request` applying the host policy.
+
+        The final response is returned as is (callers still call
+        `raise_for_status()`); connection errors are re-raised after the last attempt.
+        A 429 on a `background` request (e.g. a status poll) is retried but neither
+        blocks the host nor counts as a circuit breaker failure, so it cannot hold
+        back the foreground requests to that host. `retry_policy` overrides the
+        engine's policy for this request.
+        """
+        state = self.host_state(url)
+        sender = session or requests
+        host = urlsplit(url).netloc
+        policy = retry_policy or self.retry_policy
+        for attempt in range(policy.max_attempts):
+            state.breaker.before_call(host)
+            try:
+                time.sleep(state.wait_time())
+                if state.bucket is not None:
+                    state.bucket.acquire_sync()
+                response = sender.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                state.breaker.record_failure()
+                # Only connection setup failures are known not to have reached the server
+                retryable = method.upper() in IDEMPOTENT_METHODS or isinstance(e, requests.exceptions.ConnectTimeout)
+                if not retryable or attempt == policy.max_attempts - 1:
+                    raise
+                delay = policy.backoff(attempt)
+                logger.warning(f"{method} {host} failed ({e}); retrying in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+            except Exception:
+                # Other transport errors (ChunkedEncodingError, TooManyRedirects, ...)
+                state.breaker.record_failure()
+                raise
+            except BaseException:
+                state.breaker.release_trial()
+                raise
+
+            if response.status_code < 500 and response.status_code != 429:
+                state.breaker.record_success()
+            elif response.status_code == 429 and background:
+                state.breaker.release_trial()
+            else:
+                state.breaker.record_failure()
+            retry_after = response.headers.get("Retry-After")
+            if not policy.should_retry_status(method, response.status_code, retry_after) or attempt == policy.max_attempts - 1:
+                return response
+            delay = self._retry_delay(policy, attempt, retry_after)
+            if response.status_code == 429 and not background:
+                state.block_for(delay)
+            logger.warning(f"{method} {host} returned {response.status_code}; retrying in {delay:.2f}s")
+            time.sleep(delay)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    async def arequest(
+        self,
+        session: Any,
+        method: str,
+        url: str,
+        background: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        `aiohttp` counterpart of `request`: performs `session.request(method, url, **kwargs)`
+        under the host policy and returns the final response with its body already read.
+        """
+        import aiohttp
+
+        state = self.host_state(url)
+        host = urlsplit(url).netloc
+        policy = retry_policy or self.retry_policy
+        for attempt in range(policy.max_attempts):
+            state.breaker.before_call(host)
+            try:
+                wait = state.wait_time()
+                if wait:
+                    await asyncio.sleep(wait)
+                if state.bucket is not None:
+                    await state.bucket.acquire()
+                async with session.request(method, url, **kwargs) as response:
+                    await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                state.breaker.record_failure()
+                retryable = method.upper() in IDEMPOTENT_METHODS or isinstance(e, aiohttp.ClientConnectorError)
+                if not retryable or attempt == policy.max_attempts - 1:
+                    raise
+                delay = policy.backoff(attempt)
+                logger.warning(f"{method} {host} failed ({e}); retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                # Other client errors (ClientPayloadError, TooManyRedirects, ...)
+                state.breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancellation: no outcome, but the half-open trial must not stay claimed
+                state.breaker.release_trial()
+                raise
+
+            if response.status < 500 and response.status != 429:
+                state.breaker.record_success()
+            elif response.status == 429 and background:
+                state.breaker.release_trial()
+            else:
+                state.breaker.record_failure()
+            retry_after = response.headers.get("Retry-After")
+            if not policy.should_retry_status(method, response.status, retry_after) or attempt == policy.max_attempts - 1:
+                return response
+            delay = self._retry_delay(policy, attempt, retry_after)
+            if response.status == 429 and not background:
+                state.block_for(delay)
+            logger.warning(f"{method} {host} returned {response.status}; retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+        return response
+
+
+http_policy = HttpPolicyEngine()
+
+
+async def retry_async(
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    retry_on: tuple = (Exception,),
+    description: str = "operation",
+) -> T:
+    """
+    Await `func()` until it succeeds, retrying on `retry_on` exceptions with
+    jittered exponential backoff. The last exception is re-raised.
+    """
+    for attempt in range(policy.max_attempts):
+        try:
+            return await func()
+        except retry_on as e:
+            if attempt == policy.max_attempts - 1:
+                logger.error(f"{description} failed after {policy.max_attempts} attempts: {e}")
+                raise
+            delay = policy.backoff(attempt)
+            logger.warning(f"{description} attempt {attempt + 1} failed ({e}); retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
@@ -0,0 +1,319 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import AsyncGenerator, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Name of the tool currently executing, used to attribute RPC calls and bytes
+current_tool: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("agentipy_current_tool", default=None)
+
+
+class ToolStats:
+    """Aggregated metrics of a single tool."""
+
+    __slots__ = ("calls", "errors", "total_seconds", "bucket_counts", "rpc_calls", "bytes_transferred")
+
+    def __init__(self, bucket_count: int):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.bucket_counts = [0] * (bucket_count + 1)
+        self.rpc_calls = 0
+        self.bytes_transferred = 0
+
+    def to_dict(self, buckets: Tuple[float, ...]) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_seconds": self.total_seconds,
+            "buckets": dict(zip([*buckets, float("inf")], self.bucket_counts)),
+            "rpc_calls": self.rpc_calls,
+            "bytes_transferred": self.bytes_transferred,
+        }
+
+
+class MetricsSink:
+    """Receives every recorded tool call. Subclass and override `on_call`."""
+
+    def on_call(self, tool: str, duration: float, error: Optional[BaseException]) -> None:
+        pass
+
+    def on_rpc(self, tool: Optional[str], method: str, duration: float, payload_bytes: int, error: Optional[BaseException]) -> None:
+        pass
+
+
+class CallbackSink(MetricsSink):
+    """Forwards tool calls to a plain callback `fn(tool, duration, error)`."""
+
+    def __init__(self, callback: Callable[[str, float, Optional[BaseException]], None]):
+        self.callback = callback
+
+    def on_call(self, tool, duration, error):
+        self.callback(tool, duration, error)
+
+
+class OpenTelemetrySink(MetricsSink):
+    """
+    Exports tool latency and error counts through the OpenTelemetry metrics API.
+
+    Requires the optional `opentelemetry-api` package.
+    """
+
+    def __init__(self, meter_name: str = "agentipy"):
+        try:
+            from opentelemetry import metrics as otel_metrics
+        except ImportError:
+            raise ImportError("OpenTelemetrySink requires the 'opentelemetry-api' package")
+        meter = otel_metrics.get_meter(meter_name)
+        self._latency = meter.create_histogram("agentipy.tool.duration", unit="s", description="Tool call latency")
+        self._errors = meter.create_counter("agentipy.tool.errors", description="Failed tool calls")
+        self._rpc_calls = meter.create_counter("agentipy.rpc.calls", description="RPC calls by method")
+
+    def on_call(self, tool, duration, error):
+        self._latency.record(duration, {"tool": tool})
+        if error is not None:
+            self._errors.add(1, {"tool": tool})
+
+    def on_rpc(self, tool, method, duration, payload_bytes, error):
+        self._rpc_calls.add(1, {"tool": tool or "", "method": method})
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of per-tool latency histograms, error counts, RPC call
+    counts and transferred bytes, with pluggable sinks.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.enabled = True
+        self._stats: Dict[str, ToolStats] = {}
+        self._sinks: List[MetricsSink] = []
+        self._lock = threading.Lock()
+
+    def add_sink(self, sink: MetricsSink) -> MetricsSink:
+        self._sinks.append(sink)
+        return sink
+
+    def remove_sink(self, sink: MetricsSink):
+        self._sinks.remove(sink)
+
+    def _stats_for(self, tool: str) -> ToolStats:
+        stats = self._stats.get(tool)
+        if stats is None:
+            stats = self._stats[tool] = ToolStats(len(self.buckets))
+        return stats
+
+    def record_call(self, tool: str, duration: float, error: Optional[BaseException] = None):
+        with self._lock:
+            stats = self._stats_for(tool)
+            stats.calls += 1
+            stats.total_seconds += duration
+            stats.bucket_counts[bisect_left(self.buckets, duration)] += 1
+            if error is not None:
+                stats.errors += 1
+        for sink in self._sinks:
+            try:
+                sink.on_call(tool, duration, error)
+            except Exception as e:
+                logger.warning(f"Metrics sink {type(sink).__name__} failed: {e}")
+
+    def record_rpc(self, method: str, duration: float, payload_bytes: int = 0, error: Optional[BaseException] = None):
+        tool = current_tool.get()
+        if tool is not None:
+            with self._lock:
+                stats = self._stats_for(tool)
+                stats.rpc_calls += 1
+                stats.bytes_transferred += payload_bytes
+        for sink in self._sinks:
+            try:
+                sink.on_rpc(tool, method, duration, payload_bytes, error)
+            except Exception as e:
+                logger.warning(f"Metrics sink {type(sink).__name__} failed: {e}")
+
+    def record_bytes(self, payload_bytes: int, tool: Optional[str] = None):
+        tool = tool or current_tool.get()
+        if tool is None:
+            return
+        with self._lock:
+            self._stats_for(tool).bytes_transferred += payload_bytes
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {tool: stats.to_dict(self.buckets) for tool, stats in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def to_prometheus(self) -> str:
+        """Render all tool metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP agentipy_tool_duration_seconds Tool call latency.",
+            "# TYPE agentipy_tool_duration_seconds histogram",
+        ]
+        snapshot = self.snapshot()
+        for tool, stats in snapshot.items():
+            cumulative = 0
+            for bound, count in stats["buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'agentipy_tool_duration_seconds_bucket{{tool="{tool}",le="{le}"}} {cumulative}')
+            lines.append(f'agentipy_tool_duration_seconds_sum{{tool="{tool}"}} {stats["total_seconds"]}')
+            lines.append(f'agentipy_tool_duration_seconds_count{{tool="{tool}"}} {stats["calls"]}')
+        for name, key, help_text in (
+            ("agentipy_tool_errors_total", "errors", "Failed tool calls."),
+            ("agentipy_tool_rpc_calls_total", "rpc_calls", "RPC calls issued by tool."),
+            ("agentipy_tool_bytes_total", "bytes_transferred", "Bytes transferred by tool."),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for tool, stats in snapshot.items():
+                lines.append(f'{name}{{tool="{tool}"}} {stats[key]}')
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+async def _recorded_iteration(agen: AsyncGenerator, name: str, registry: MetricsRegistry) -> AsyncGenerator:
+    """Iterate `agen`, recording it as one call of `name` once it is exhausted, fails or is closed."""
+    elapsed = 0.0
+    error = None
+    try:
+        while True:
+            # Set per step: the consumer may resume the generator from another context
+            token = current_tool.set(current_tool.get() or name)
+            start = time.perf_counter()
+            try:
+                item = await agen.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                elapsed += time.perf_counter() - start
+                current_tool.reset(token)
+            yield item
+    except GeneratorExit:
+        raise
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        await agen.aclose()
+        registry.record_call(name, elapsed, error)
+
+
+def instrument(name: str, registry: Optional[MetricsRegistry] = None) -> Callable:
+    """
+    Decorator recording latency and errors of a sync or async callable under `name`.
+
+    While the call runs, `current_tool` is set to `name` (unless an outer
+    instrumented call already set it) so that nested RPC calls are attributed
+    to the outermost tool.
+
+    Async generators are recorded as one call once they are exhausted, fail or
+    are closed; the duration is the time spent producing items, excluding the
+    time the consumer holds each item. The same applies to the async generator
+    returned by a plain function (e.g. an `iter_*` facade method).
+    """
+    def decorator(func: Callable) -> Callable:
+        if getattr(func, "__agentipy_instrumented__", False):
+            return func
+
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def asyncgen_wrapper(*args, **kwargs):
+                reg = registry or metrics
+                agen = func(*args, **kwargs)
+                if reg.enabled:
+                    agen = _recorded_iteration(agen, name, reg)
+                try:
+                    async for item in agen:
+                        yield item
+                finally:
+                    await agen.aclose()
+            wrapper = asyncgen_wrapper
+        elif inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                reg = registry or metrics
+                if not reg.enabled:
+                    return await func(*args, **kwargs)
+                token = current_tool.set(current_tool.get() or name)
+                start = time.perf_counter()
+                error = None
+                try:
+                    return await func(*args, **kwargs)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    reg.record_call(name, time.perf_counter() - start, error)
+                    current_tool.reset(token)
+            wrapper = async_wrapper
+        else:
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                reg = registry or metrics
+                if not reg.enabled:
+                    return func(*args, **kwargs)
+                token = current_tool.set(current_tool.get() or name)
+                start = time.perf_counter()
+                error = None
+                result = None
+                try:
+                    result = func(*args, **kwargs)
+                    if inspect.isasyncgen(result):
+                        # Recorded when iterated, not when the generator is created
+                        return _recorded_iteration(result, name, reg)
+                    return result
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    if not inspect.isasyncgen(result):
+                        reg.record_call(name, time.perf_counter() - start, error)
+                    current_tool.reset(token)
+            wrapper = sync_wrapper
+
+        wrapper.__agentipy_instrumented__ = True
+        return wrapper
+    return decorator
+
+
+@contextlib.contextmanager
+def track(name: str, registry: Optional[MetricsRegistry] = None):
+    """Context manager equivalent of `instrument` for a block of (sync or async) code."""
+    reg = registry or metrics
+    if not reg.enabled:
+        yield
+        return
+    token = current_tool.set(current_tool.get() or name)
+    start = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        reg.record_call(name, time.perf_counter() - start, error)
+        current_tool.reset(token)
+
+
+def instrument_methods(cls: type, prefix: str, registry: Optional[MetricsRegistry] = None) -> type:
+    """Apply `instrument` to every public method defined on `cls`, named `<prefix>.<method>`."""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, instrument(f"{prefix}.{attr}", registry)(value))
+    return cls
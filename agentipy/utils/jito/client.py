@@ -0,0 +1,328 @@
+import asyncio
+import base64
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import aiohttp
+from solders.hash import Hash  # type: ignore
+from solders.keypair import Keypair  # type: ignore
+from solders.message import MessageV0  # type: ignore
+from solders.pubkey import Pubkey  # type: ignore
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction  # type: ignore
+from solders.transaction import VersionedTransaction  # type: ignore
+
+from agentipy.utils.http_policy import RetryPolicy, http_policy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_ENGINE_URL = "https://mainnet.block-engine.jito.wtf"
+API_PATH = "/api/v1"
+MAX_BUNDLE_TRANSACTIONS = 5
+MAX_STATUS_IDS = 5  # bundle ids accepted per status request
+MIN_TIP_LAMPORTS = 1000
+DEFAULT_TIP_ACCOUNTS_TTL = 300.0
+DEFAULT_STATUS_POLL_INTERVAL = 1.0
+FINAL_INFLIGHT_STATUSES = ("Landed", "Failed")
+# A bundle is only useful for a few slots; resend once, quickly, rather than back off for seconds
+SEND_METHODS = ("sendBundle", "sendTransaction")
+SEND_RETRY_POLICY = RetryPolicy(max_attempts=2, base_delay=0.1, max_delay=0.5)
+
+AnyTransaction = Union[Transaction, VersionedTransaction]
+
+
+class JitoError(Exception):
+    """A Jito block engine request failed or returned a JSON-RPC error."""
+
+
+def _api_url(block_engine_url: str) -> str:
+    url = (block_engine_url or DEFAULT_BLOCK_ENGINE_URL).rstrip("/")
+    return url if url.endswith(API_PATH) else url + API_PATH
+
+
+def _recent_blockhash(tx: AnyTransaction) -> Hash:
+    return tx.message.recent_blockhash
+
+
+def encode_transaction(tx: Union[AnyTransaction, bytes, str]) -> str:
+    """Base64 wire encoding of a signed transaction (strings are assumed to be encoded already)."""
+    if isinstance(tx, str):
+        return tx
+    return base64.b64encode(tx if isinstance(tx, bytes) else bytes(tx)).decode("ascii")
+
+
+class JitoClient:
+    """
+    Async client of one Jito block engine.
+
+    All requests share a pooled aiohttp session and go through the HTTP
+    policy engine (host rate limits, retries, circuit breaking). The tip
+    account list is cached for `tip_accounts_ttl` seconds, and bundle status
+    lookups are split into the engine's 5-id batches and issued concurrently.
+
+    Args:
+        block_engine_url (str): Block engine base URL, with or without "/api/v1".
+        uuid (str, optional): Jito UUID, sent as `x-jito-auth` header and `uuid` query parameter.
+        tip_accounts_ttl (float): Seconds the tip account list is cached.
+        max_connections (int): Connection pool size.
+        timeout (float): Per-request timeout in seconds.
+    """
+
+    _instances: Dict[Tuple[str, Optional[str]], "JitoClient"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        block_engine_url: str = DEFAULT_BLOCK_ENGINE_URL,
+        uuid: Optional[str] = None,
+        tip_accounts_ttl: float = DEFAULT_TIP_ACCOUNTS_TTL,
+        max_connections: int = 64,
+        timeout: float = 10.0,
+    ):
+        self.api_url = _api_url(block_engine_url)
+        self.uuid = uuid
+        self.tip_accounts_ttl = tip_accounts_ttl
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", "accept": "application/json"}
+        if uuid:
+            self.headers["x-jito-auth"] = uuid
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tip_accounts: Optional[Tuple[float, List[str]]] = None
+        self._tip_accounts_task: Optional[asyncio.Future] = None
+        self._request_id = 0
+
+    @classmethod
+    def for_agent(cls, agent) -> "JitoClient":
+        """Client for the agent's `jito_block_engine_url`, shared by all agents with the same engine and UUID."""
+        key = (_api_url(agent.jito_block_engine_url), agent.jito_uuid)
+        with cls._instances_lock:
+            client = cls._instances.get(key)
+            if client is None:
+                client = cls._instances[key] = cls(agent.jito_block_engine_url, agent.jito_uuid)
+            return client
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # A session is bound to the loop it was created on
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._session_loop = loop
+            self._tip_accounts_task = None
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def __aenter__(self) -> "JitoClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def rpc(
+        self,
+        endpoint: str,
+        method: str,
+        params: Optional[list] = None,
+        query: Optional[Dict] = None,
+        background: bool = False,
+    ) -> dict:
+        """
+        Send a JSON-RPC request to `endpoint` ("/bundles" or "/transactions").
+
+        `background` requests (status polls) that are rate limited do not hold
+        back the sends to the same block engine; see `HttpPolicyEngine.arequest`.
+
+        Returns:
+            dict: The full JSON-RPC response.
+
+        Raises:
+            JitoError: On HTTP errors and JSON-RPC errors.
+        """
+        self._request_id += 1
+        payload = {"jsonrpc": "2.0", "id": self._request_id, "method": method, "params": params or []}
+        query = dict(query or {})
+        if self.uuid:
+            query["uuid"] = self.uuid
+        try:
+            response = await http_policy.arequest(
+                self._get_session(),
+                "POST",
+                self.api_url + endpoint,
+                json=payload,
+                params=query or None,
+                background=background,
+                retry_policy=SEND_RETRY_POLICY if method in SEND_METHODS else None,
+            )
+            body = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            raise JitoError(f"{method} request failed: {e}") from e
+        if response.status != 200 or not isinstance(body, dict):
+            raise JitoError(f"{method} returned HTTP {response.status}: {body}")
+        if body.get("error"):
+            raise JitoError(f"{method} failed: {body['error']}")
+        return body
+
+    # ------------------------------------------------------------------
+    # Tips
+    # ------------------------------------------------------------------
+
+    async def get_tip_accounts(self, refresh: bool = False) -> List[str]:
+        """Tip accounts of the block engine, cached for `tip_accounts_ttl` seconds."""
+        if not refresh and self._tip_accounts is not None and self._tip_accounts[0] > time.monotonic():
+            return self._tip_accounts[1]
+        self._get_session()
+        task = self._tip_accounts_task
+        if task is None or task.done():
+            task = self._tip_accounts_task = asyncio.ensure_future(self.rpc("/bundles", "getTipAccounts"))
+        accounts = (await asyncio.shield(task))["result"]
+        self._tip_accounts = (time.monotonic() + self.tip_accounts_ttl, accounts)
+        return accounts
+
+    async def get_random_tip_account(self) -> str:
+        accounts = await self.get_tip_accounts()
+        if not accounts:
+            raise JitoError("The block engine returned no tip accounts")
+        return random.choice(accounts)
+
+    async def build_tip_transaction(
+        self, payer: Keypair, tip_lamports: int, recent_blockhash: Hash
+    ) -> VersionedTransaction:
+        """Signed transaction transferring `tip_lamports` from `payer` to a random tip account."""
+        if tip_lamports < MIN_TIP_LAMPORTS:
+            raise ValueError(f"Jito tips must be at least {MIN_TIP_LAMPORTS} lamports")
+        tip_account = Pubkey.from_string(await self.get_random_tip_account())
+        instruction = transfer(
+            TransferParams(from_pubkey=payer.pubkey(), to_pubkey=tip_account, lamports=tip_lamports)
+        )
+        message = MessageV0.try_compile(payer.pubkey(), [instruction], [], recent_blockhash)
+        return VersionedTransaction(message, [payer])
+
+    async def build_bundle(
+        self,
+        transactions: Sequence[AnyTransaction],
+        payer: Optional[Keypair] = None,
+        tip_lamports: int = 0,
+    ) -> List[str]:
+        """
+        Encode signed transactions as a bundle, appending a tip transaction when needed.
+
+        No tip is added when `tip_lamports` is 0 or when a transaction of the
+        bundle already writes to a tip account. The tip transaction reuses the
+        blockhash of the last transaction, so it expires together with the bundle.
+
+        Returns:
+            List[str]: Base64-encoded transactions, ready for `send_bundle`.
+        """
+        transactions = list(transactions)
+        if not transactions:
+            raise ValueError("A bundle needs at least one transaction")
+        if tip_lamports:
+            if payer is None:
+                raise ValueError("A payer keypair is required to add a tip")
+            tip_accounts = {Pubkey.from_string(account) for account in await self.get_tip_accounts()}
+            if not any(tip_accounts.intersection(tx.message.account_keys) for tx in transactions):
+                transactions.append(
+                    await self.build_tip_transaction(payer, tip_lamports, _recent_blockhash(transactions[-1]))
+                )
+        if len(transactions) > MAX_BUNDLE_TRANSACTIONS:
+            raise ValueError(f"A bundle holds at most {MAX_BUNDLE_TRANSACTIONS} transactions")
+        return [encode_transaction(tx) for tx in transactions]
+
+    # ------------------------------------------------------------------
+    # Sending
+    # ------------------------------------------------------------------
+
+    async def send_bundle(self, transactions: Sequence[Union[AnyTransaction, bytes, str]]) -> str:
+        """
+        Submit a bundle of signed transactions.
+
+        Returns:
+            str: Bundle id.
+        """
+        encoded = [encode_transaction(tx) for tx in transactions]
+        response = await self.rpc("/bundles", "sendBundle", [encoded, {"encoding": "base64"}])
+        return response["result"]
+
+    async def send_transaction(self, transaction: Union[AnyTransaction, bytes, str], bundle_only: bool = False) -> str:
+        """
+        Submit a single signed transaction through the block engine.
+
+        Returns:
+            str: Transaction signature.
+        """
+        query = {"bundleOnly": "true"} if bundle_only else None
+        response = await self.rpc(
+            "/transactions", "sendTransaction", [encode_transaction(transaction), {"encoding": "base64"}], query
+        )
+        return response["result"]
+
+    # ------------------------------------------------------------------
+    # Status polling
+    # ------------------------------------------------------------------
+
+    async def _batched_statuses(self, method: str, bundle_ids: Sequence[str]) -> Dict[str, Optional[dict]]:
+        bundle_ids = list(dict.fromkeys(bundle_ids))
+        chunks = [bundle_ids[i:i + MAX_STATUS_IDS] for i in range(0, len(bundle_ids), MAX_STATUS_IDS)]
+        responses = await asyncio.gather(
+            *(self.rpc("/bundles", method, [chunk], background=True) for chunk in chunks)
+        )
+        statuses: Dict[str, Optional[dict]] = dict.fromkeys(bundle_ids)
+        for response in responses:
+            for status in (response.get("result") or {}).get("value") or []:
+                if status and status.get("bundle_id") in statuses:
+                    statuses[status["bundle_id"]] = status
+        return statuses
+
+    async def get_bundle_statuses(self, bundle_ids: Sequence[str]) -> Dict[str, Optional[dict]]:
+        """Landed-bundle statuses by bundle id; None for bundles the engine has not seen land."""
+        return await self._batched_statuses("getBundleStatuses", bundle_ids)
+
+    async def get_inflight_bundle_statuses(self, bundle_ids: Sequence[str]) -> Dict[str, Optional[dict]]:
+        """In-flight statuses (Invalid, Pending, Failed, Landed) by bundle id, from the last 5 minutes."""
+        return await self._batched_statuses("getInflightBundleStatuses", bundle_ids)
+
+    async def wait_for_bundles(
+        self,
+        bundle_ids: Sequence[str],
+        timeout: float = 30.0,
+        poll_interval: float = DEFAULT_STATUS_POLL_INTERVAL,
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Poll the in-flight statuses of `bundle_ids` until each one has landed or failed.
+
+        All pending bundles are polled together in batched requests.
+
+        Returns:
+            Dict[str, Optional[dict]]: Last in-flight status per bundle id; bundles
+            still pending at `timeout` keep their last status.
+        """
+        deadline = time.monotonic() + timeout
+        statuses: Dict[str, Optional[dict]] = dict.fromkeys(bundle_ids)
+        pending = list(statuses)
+        while pending:
+            try:
+                statuses.update(await self.get_inflight_bundle_statuses(pending))
+            except JitoError as e:
+                logger.warning(f"Bundle status poll failed: {e}")
+            pending = [
+                bundle_id
+                for bundle_id in pending
+                if (statuses[bundle_id] or {}).get("status") not in FINAL_INFLIGHT_STATUSES
+            ]
+            if not pending or time.monotonic() + poll_interval > deadline:
+                break
+            await asyncio.sleep(poll_interval)
+        return statuses
@@ -0,0 +1,365 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from agentipy.utils.jito.client import (JitoClient, JitoError,
+                                        encode_transaction)
+
+logger = logging.getLogger(__name__)
+
+JITO_REGIONS = {
+    "mainnet": "https://mainnet.block-engine.jito.wtf",
+    "amsterdam": "https://amsterdam.mainnet.block-engine.jito.wtf",
+    "dublin": "https://dublin.mainnet.block-engine.jito.wtf",
+    "frankfurt": "https://frankfurt.mainnet.block-engine.jito.wtf",
+    "london": "https://london.mainnet.block-engine.jito.wtf",
+    "ny": "https://ny.mainnet.block-engine.jito.wtf",
+    "slc": "https://slc.mainnet.block-engine.jito.wtf",
+    "singapore": "https://singapore.mainnet.block-engine.jito.wtf",
+    "tokyo": "https://tokyo.mainnet.block-engine.jito.wtf",
+}
+DEFAULT_FANOUT_REGIONS = 3
+DEFAULT_EXPLORE_RATE = 0.1
+DEFAULT_TRACK_TIMEOUT = 60.0
+DEFAULT_TRACK_POLL_INTERVAL = 1.0
+LATENCY_EWMA_ALPHA = 0.2
+# Assumed submission-to-landing delay of regions without landing data (about one slot)
+DEFAULT_LANDING_DELAY = 0.4
+
+
+def resolve_region(region: str) -> Tuple[str, str]:
+    """(name, block engine URL) of a region name from JITO_REGIONS or of a block engine URL."""
+    if region in JITO_REGIONS:
+        return region, JITO_REGIONS[region]
+    name = region.split("://", 1)[-1].split(".", 1)[0]
+    return name, region
+
+
+class RegionStats:
+    """Acceptance, landing and latency statistics of one block-engine region."""
+
+    def __init__(self):
+        self.sent = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.landed = 0
+        self.not_landed = 0
+        self.accept_latency: Optional[float] = None
+        self.landing_latency: Optional[float] = None
+
+    @staticmethod
+    def _ewma(current: Optional[float], sample: float) -> float:
+        return sample if current is None else current + LATENCY_EWMA_ALPHA * (sample - current)
+
+    def record_accept(self, latency: float):
+        self.accepted += 1
+        self.accept_latency = self._ewma(self.accept_latency, latency)
+
+    def record_landing(self, latency: float):
+        self.landed += 1
+        self.landing_latency = self._ewma(self.landing_latency, latency)
+
+    @property
+    def acceptance_rate(self) -> float:
+        return (self.accepted + 1) / (self.sent + 2)
+
+    @property
+    def landing_rate(self) -> float:
+        return (self.landed + 1) / (self.landed + self.not_landed + 2)
+
+    def expected_latency(self) -> float:
+        if self.landing_latency is not None:
+            return self.landing_latency
+        return (self.accept_latency or 0.0) + DEFAULT_LANDING_DELAY
+
+    def score(self) -> float:
+        """Landed bundles per second of expected landing latency; higher is better."""
+        return self.acceptance_rate * self.landing_rate / max(self.expected_latency(), 1e-3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sent": self.sent,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "landed": self.landed,
+            "not_landed": self.not_landed,
+            "acceptance_rate": self.acceptance_rate,
+            "landing_rate": self.landing_rate,
+            "accept_latency": self.accept_latency,
+            "landing_latency": self.landing_latency,
+            "score": self.score(),
+        }
+
+
+class JitoFanout:
+    """
+    Sends bundles and transactions to several Jito block-engine regions at once.
+
+    Each send goes concurrently to the `max_regions` best-scoring regions
+    and returns as soon as the first region accepts it; the remaining
+    requests finish in the background and still count towards the
+    statistics. A region's score combines its acceptance rate, its landing
+    rate and its latency (landing latency once known, otherwise request
+    latency). With probability `explore_rate` one slot goes to a random
+    other region, so regions that are not selected keep being measured.
+
+    Accepted bundles are tracked until they land, fail or `track_timeout`
+    expires. Each region is asked for the in-flight status of the bundles it
+    accepted, in batched requests. A region gets landing credit when it
+    reports the bundle as landed. Landing latency is measured at the
+    resolution of `poll_interval`. `wait_for_bundles` is served from the
+    same polls, so a region is never polled twice for one bundle.
+
+    Args:
+        regions (Sequence[str]): Region names from JITO_REGIONS or block engine URLs.
+        uuid (str, optional): Jito UUID used for every region.
+        max_regions (int, optional): Regions per send; None sends to all.
+        explore_rate (float): Probability of swapping the weakest selected region for a random one.
+        track_timeout (float): Seconds an accepted bundle is tracked before it counts as not landed.
+        poll_interval (float): Seconds between landing-status polls.
+    """
+
+    _instances: Dict[Tuple[Tuple[str, ...], Optional[str]], "JitoFanout"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        regions: Sequence[str],
+        uuid: Optional[str] = None,
+        max_regions: Optional[int] = DEFAULT_FANOUT_REGIONS,
+        explore_rate: float = DEFAULT_EXPLORE_RATE,
+        track_timeout: float = DEFAULT_TRACK_TIMEOUT,
+        poll_interval: float = DEFAULT_TRACK_POLL_INTERVAL,
+    ):
+        if not regions:
+            raise ValueError("At least one Jito region is required")
+        self.clients: Dict[str, JitoClient] = {}
+        for region in regions:
+            name, url = resolve_region(region)
+            self.clients[name] = JitoClient(url, uuid)
+        self.stats: Dict[str, RegionStats] = {name: RegionStats() for name in self.clients}
+        self.max_regions = max_regions
+        self.explore_rate = explore_rate
+        self.track_timeout = track_timeout
+        self.poll_interval = poll_interval
+        self._tracking: Dict[str, Dict[str, float]] = {name: {} for name in self.clients}
+        self._last_status: Dict[str, Dict[str, dict]] = {name: {} for name in self.clients}
+        self._waiters: Dict[str, Dict[str, asyncio.Future]] = {name: {} for name in self.clients}
+        self._tracker: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Future] = set()
+
+    @classmethod
+    def for_agent(cls, agent) -> "JitoFanout":
+        """Fan-out sender for the agent's `jito_regions`, shared by agents with the same regions and UUID."""
+        key = (tuple(agent.jito_regions), agent.jito_uuid)
+        with cls._instances_lock:
+            fanout = cls._instances.get(key)
+            if fanout is None:
+                fanout = cls._instances[key] = cls(agent.jito_regions, agent.jito_uuid)
+            return fanout
+
+    async def close(self):
+        if self._tracker is not None:
+            self._tracker.cancel()
+            self._tracker = None
+        for task in list(self._background):
+            task.cancel()
+        await asyncio.gather(*(client.close() for client in self.clients.values()))
+
+    async def __aenter__(self) -> "JitoFanout":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def region_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Statistics per region, best-scoring first."""
+        return {name: self.stats[name].to_dict() for name in self.ranked_regions()}
+
+    def ranked_regions(self) -> List[str]:
+        return sorted(self.clients, key=lambda name: self.stats[name].score(), reverse=True)
+
+    def select_regions(self) -> List[str]:
+        ranked = self.ranked_regions()
+        if self.max_regions is None or self.max_regions >= len(ranked):
+            return ranked
+        selected = ranked[:self.max_regions]
+        if random.random() < self.explore_rate:
+            selected[-1] = random.choice(ranked[self.max_regions:])
+        return selected
+
+    # ------------------------------------------------------------------
+    # Sending
+    # ------------------------------------------------------------------
+
+    async def _send_to(self, region: str, endpoint: str, method: str, params: list, query: Optional[Dict]) -> dict:
+        stats = self.stats[region]
+        stats.sent += 1
+        started = time.monotonic()
+        try:
+            response = await self.clients[region].rpc(endpoint, method, params, query)
+        except JitoError:
+            stats.rejected += 1
+            raise
+        stats.record_accept(time.monotonic() - started)
+        if method == "sendBundle":
+            self._track(region, response["result"], started)
+        return response
+
+    async def rpc(self, endpoint: str, method: str, params: list, query: Optional[Dict] = None) -> Tuple[str, dict]:
+        """
+        Send one JSON-RPC request to the selected regions concurrently.
+
+        Returns:
+            Tuple[str, dict]: The first region that accepted the request and its response.
+
+        Raises:
+            JitoError: If every selected region rejected the request.
+        """
+        regions = self.select_regions()
+        tasks = {
+            asyncio.ensure_future(self._send_to(region, endpoint, method, params, query)): region
+            for region in regions
+        }
+        errors = []
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return tasks[task], task.result()
+                    errors.append(f"{tasks[task]}: {task.exception()}")
+        finally:
+            # Slower regions still finish so their acceptance and landing are measured
+            for task in pending:
+                self._background.add(task)
+                task.add_done_callback(self._finish_background)
+        raise JitoError(f"{method} rejected by every region: {'; '.join(errors)}")
+
+    def _finish_background(self, task: asyncio.Future):
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Background Jito send failed: {task.exception()}")
+
+    async def submit_bundle(self, transactions: Sequence[Any]) -> Tuple[str, str]:
+        """
+        Submit a bundle of signed transactions to the selected regions.
+
+        Returns:
+            Tuple[str, str]: The first region that accepted the bundle and the bundle id
+            (identical across regions). Only that region is known to hold the bundle,
+            so its client (`clients[region]`) is the one to poll for its status.
+        """
+        encoded = [encode_transaction(tx) for tx in transactions]
+        region, response = await self.rpc("/bundles", "sendBundle", [encoded, {"encoding": "base64"}])
+        return region, response["result"]
+
+    async def send_bundle(self, transactions: Sequence[Any]) -> str:
+        """
+        Submit a bundle of signed transactions to the selected regions.
+
+        Returns:
+            str: Bundle id (identical across regions).
+        """
+        _, bundle_id = await self.submit_bundle(transactions)
+        return bundle_id
+
+    async def send_transaction(self, transaction: Any, bundle_only: bool = False) -> str:
+        """
+        Submit a signed transaction to the selected regions.
+
+        Returns:
+            str: Transaction signature.
+        """
+        query = {"bundleOnly": "true"} if bundle_only else None
+        _, response = await self.rpc(
+            "/transactions", "sendTransaction", [encode_transaction(transaction), {"encoding": "base64"}], query
+        )
+        return response["result"]
+
+    # ------------------------------------------------------------------
+    # Landing tracking
+    # ------------------------------------------------------------------
+
+    def _track(self, region: str, bundle_id: str, sent_at: float):
+        self._tracking[region][bundle_id] = sent_at
+        if self._tracker is None or self._tracker.done():
+            self._tracker = asyncio.ensure_future(self._track_landings())
+
+    async def _track_landings(self):
+        while any(self._tracking.values()):
+            await asyncio.sleep(self.poll_interval)
+            regions = [region for region, pending in self._tracking.items() if pending]
+            results = await asyncio.gather(*(self._poll_region(region) for region in regions), return_exceptions=True)
+            # One region's failure must not stop tracking the others
+            for region, result in zip(regions, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Landing tracking of {region} failed: {result!r}")
+
+    async def _poll_region(self, region: str):
+        pending = self._tracking[region]
+        last_status = self._last_status[region]
+        stats = self.stats[region]
+        try:
+            statuses = await self.clients[region].get_inflight_bundle_statuses(list(pending))
+        except Exception as e:
+            # Transport errors, open circuits and timeouts included; expiry below still applies
+            logger.debug(f"Landing poll of {region} failed: {e!r}")
+            statuses = {}
+        now = time.monotonic()
+        for bundle_id, sent_at in list(pending.items()):
+            if statuses.get(bundle_id):
+                last_status[bundle_id] = statuses[bundle_id]
+            status = last_status.get(bundle_id, {}).get("status")
+            if status == "Landed":
+                stats.record_landing(now - sent_at)
+            elif status == "Failed" or now - sent_at > self.track_timeout:
+                stats.not_landed += 1
+            else:
+                continue
+            del pending[bundle_id]
+            self._settle(region, bundle_id, last_status.pop(bundle_id, None))
+
+    def _settle(self, region: str, bundle_id: str, status: Optional[dict]):
+        waiter = self._waiters[region].pop(bundle_id, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(status)
+
+    async def wait_for_bundles(
+        self, region: str, bundle_ids: Sequence[str], timeout: float = 30.0
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Wait until the bundles `region` accepted have landed or failed.
+
+        Tracked bundles are resolved by the landing tracker's polls; bundles
+        the tracker does not follow are looked up once.
+
+        Returns:
+            Dict[str, Optional[dict]]: Last in-flight status per bundle id; bundles
+            still pending at `timeout` keep their last status.
+        """
+        loop = asyncio.get_running_loop()
+        waiters = self._waiters[region]
+        statuses: Dict[str, Optional[dict]] = dict.fromkeys(bundle_ids)
+        untracked = [bundle_id for bundle_id in statuses if bundle_id not in self._tracking[region]]
+        if untracked:
+            try:
+                statuses.update(await self.clients[region].get_inflight_bundle_statuses(untracked))
+            except JitoError as e:
+                logger.warning(f"Bundle status lookup in {region} failed: {e}")
+        futures = {}
+        for bundle_id in statuses:
+            if bundle_id in self._tracking[region]:
+                waiter = waiters.get(bundle_id)
+                if waiter is None or waiter.get_loop() is not loop:
+                    waiter = waiters[bundle_id] = loop.create_future()
+                futures[bundle_id] = waiter
+        if futures:
+            await asyncio.wait([asyncio.shield(waiter) for waiter in futures.values()], timeout=timeout)
+        for bundle_id, waiter in futures.items():
+            statuses[bundle_id] = waiter.result() if waiter.done() else self._last_status[region].get(bundle_id)
+        return statuses
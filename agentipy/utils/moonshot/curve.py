@@ -3,7 +3,6 @@ from dataclasses import dataclass
 from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation, getcontext
 
 from construct import Bytes, Enum, Int8ul, Int32ul, Int64ul, Padding, Struct
-from solana.rpc.api import Client
 from solders.pubkey import Pubkey  # type: ignore
 from spl.token.instructions import get_associated_token_address
 
@@ -51,7 +50,7 @@ class CurveState:
 
 def get_curve_state(agent: SolanaAgentKit, mint_str: str):
     try:
-        client = Client(agent.rpc_url)
+        client = agent.connection_client
         mint = Pubkey.from_string(mint_str)
         MOONSHOT_PROGRAM = Pubkey.from_string("MoonCVVNZFSYkqNXP6bxHLPL6QQJiMagDL3qcqUQTrG")
         SEED = "token".encode()
@@ -2,11 +2,10 @@ import json
 import logging
 import time
 
-import requests
-from solana.rpc.api import Client
 from solana.transaction import Signature
 
 from agentipy.agent import SolanaAgentKit
+from agentipy.utils.http_policy import http_policy
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +41,7 @@ def get_token_balance(agent:SolanaAgentKit, pub_key: str, token: str):
             ],
         }
         
-        response = requests.post(agent.rpc_url, json=payload, headers=headers)
+        response = http_policy.post(agent.rpc_url, json=payload, headers=headers)
         ui_amount = find_data(response.json(), "uiAmount")
         return float(ui_amount)
     except Exception as e:
@@ -50,7 +49,7 @@ def get_token_balance(agent:SolanaAgentKit, pub_key: str, token: str):
 
 def confirm_txn(agent:SolanaAgentKit ,txn_sig, max_retries=20, retry_interval=3):
     retries = 0
-    client = Client(agent.rpc_url)
+    client = agent.connection_client
     if isinstance(txn_sig, str):
         txn_sig = Signature.from_string(txn_sig)
     while retries < max_retries:
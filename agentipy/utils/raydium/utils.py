@@ -4,7 +4,6 @@ import struct
 import time
 from typing import Optional
 
-import requests
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed, Processed
 from solana.rpc.types import MemcmpOpts, TokenAccountOpts
@@ -14,7 +13,8 @@ from solders.pubkey import Pubkey as PublicKey  # type: ignore
 from solders.signature import Signature  # type: ignore
 
 from agentipy.agent import SolanaAgentKit
-from agentipy.helpers import validate_input
+from agentipy.helpers import compile_schema
+from agentipy.utils.http_policy import http_policy
 
 from .constants import (OPEN_BOOK_PROGRAM, RAY_AUTHORITY_V4, RAY_V4,
                         TOKEN_PROGRAM_ID, WSOL)
@@ -24,6 +24,15 @@ from .types import AccountMeta, PoolKeys
 
 logger = logging.getLogger(__name__)
 
+# Input schemas compiled once; these helpers run on every swap
+_validate_pair_address = compile_schema({"pair_address": {"type": str, "required": True}})
+_validate_mint = compile_schema({"mint": {"type": str, "required": True}})
+_validate_swap_amounts = compile_schema({
+    "amount_in": {"type": int, "required": True},
+    "minimum_amount_out": {"type": int, "required": True},
+})
+_validate_mint_str = compile_schema({"mint_str": {"type": str, "required": True}})
+
 def fetch_pool_keys(client: AsyncClient, pair_address: str) -> Optional[PoolKeys]:
     """
     Fetches pool keys for a given Raydium pair address.
@@ -35,11 +44,8 @@ def fetch_pool_keys(client: AsyncClient, pair_address: str) -> Optional[PoolKeys
     Returns:
         Optional[PoolKeys]: Pool keys if successful, None otherwise
     """
-    schema = {
-        "pair_address": {"type": str, "required": True}
-    }
     try:
-        validate_input({"pair_address": pair_address}, schema)
+        _validate_pair_address({"pair_address": pair_address})
         amm_id = PublicKey.from_string(pair_address)
         amm_data = client.get_account_info_json_parsed(amm_id, commitment=Processed)
         if not amm_data:
@@ -94,14 +100,10 @@ def get_pair_address_from_api(mint):
     Returns:
         Optional[str]: Pair address if found, None otherwise
     """
-    schema = {
-        "mint": {"type": str, "required": True}
-    }
-    
     try:
-        validate_input({"mint": mint}, schema)
+        _validate_mint({"mint": mint})
         url = f"https://api-v3.raydium.io/pools/info/mint?mint1={mint}&poolType=all&poolSortField=default&sortType=desc&pageSize=1&page=1"
-        response = requests.get(url)
+        response = http_policy.get(url)
         response.raise_for_status()
         data = response.json()
 
@@ -172,15 +174,11 @@ def make_swap_instruction(
     Returns:
         Optional[Instruction]: Swap instruction if successful, None otherwise
     """
-    schema = {
-        "amount_in": {"type": int, "required": True},
-        "minimum_amount_out": {"type": int, "required": True},
-    }
     try:
-        validate_input({
+        _validate_swap_amounts({
             "amount_in": amount_in,
             "minimum_amount_out": minimum_amount_out
-        }, schema)
+        })
         
         keys = [
             AccountMeta(pubkey=TOKEN_PROGRAM_ID, is_signer=False, is_writable=False),
@@ -225,11 +223,8 @@ def get_token_balance(agent: SolanaAgentKit, mint_str: str) -> float | None:
     Returns:
         Optional[float]: Token balance if found, None otherwise
     """
-    schema = {
-        "mint_str": {"type": str, "required": True}
-    }
     try:
-        validate_input({"mint_str": mint_str}, schema)
+        _validate_mint_str({"mint_str": mint_str})
         mint = PublicKey.from_string(mint_str)
         response = agent.connection.get_account_info_json_parsed(
             agent.wallet_address,
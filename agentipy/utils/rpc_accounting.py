@@ -0,0 +1,210 @@
+import asyncio
+import functools
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from agentipy.utils.instrumentation import current_tool, metrics
+
+logger = logging.getLogger(__name__)
+
+# solders request classes whose name does not map to the JSON-RPC method name
+_METHOD_ALIASES = {
+    "SendRawTransaction": "sendTransaction",
+    "SendLegacyTransaction": "sendTransaction",
+    "SendVersionedTransaction": "sendTransaction",
+}
+
+
+class RpcBudgetExceededError(Exception):
+    """Raised when an RPC call would exceed the configured credit budget."""
+    pass
+
+
+def rpc_method_name(body: Any) -> str:
+    """JSON-RPC method name of a solders request body (e.g. `GetBalance` -> `getBalance`)."""
+    name = type(body).__name__
+    if name in _METHOD_ALIASES:
+        return _METHOD_ALIASES[name]
+    return name[:1].lower() + name[1:]
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` tokens per second with bursts of up to `capacity`.
+
+    Safe to share between threads and event loops; waiting happens outside the lock.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take `tokens` (possibly going into debt) and return how long the caller must wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self, tokens: float = 1.0):
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self, tokens: float = 1.0):
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class RpcAccountant:
+    """
+    Counts RPC calls, latency and response size per method and per calling tool,
+    and optionally rate-limits and budgets them.
+
+    Args:
+        rate_limit (float, optional): Maximum credits per second; calls wait instead of hitting provider 429s.
+        burst (float, optional): Token bucket capacity. Defaults to `rate_limit`.
+        method_costs (dict, optional): Credits charged per method (default 1), matching the provider's billing.
+        credit_budget (float, optional): Total credits allowed; further calls raise RpcBudgetExceededError.
+    """
+
+    def __init__(
+        self,
+        rate_limit: Optional[float] = None,
+        burst: Optional[float] = None,
+        method_costs: Optional[Dict[str, float]] = None,
+        credit_budget: Optional[float] = None,
+    ):
+        self.bucket = TokenBucket(rate_limit, burst) if rate_limit else None
+        self.method_costs = method_costs or {}
+        self.credit_budget = credit_budget
+        self.credits_used = 0.0
+        self._methods: Dict[str, Dict[str, float]] = {}
+        self._by_tool: Dict[Tuple[Optional[str], str], int] = {}
+        self._lock = threading.Lock()
+
+    def _charge(self, method: str) -> float:
+        cost = self.method_costs.get(method, 1)
+        with self._lock:
+            if self.credit_budget is not None and self.credits_used + cost > self.credit_budget:
+                raise RpcBudgetExceededError(
+                    f"RPC credit budget of {self.credit_budget} exhausted ({method} costs {cost})"
+                )
+            self.credits_used += cost
+        return cost
+
+    def record(self, method: str, duration: float, payload_bytes: int, error: Optional[BaseException] = None):
+        tool = current_tool.get()
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = {"calls": 0, "errors": 0, "total_seconds": 0.0, "bytes": 0}
+            stats["calls"] += 1
+            stats["total_seconds"] += duration
+            stats["bytes"] += payload_bytes
+            if error is not None:
+                stats["errors"] += 1
+            self._by_tool[(tool, method)] = self._by_tool.get((tool, method), 0) + 1
+        metrics.record_rpc(method, duration, payload_bytes, error)
+
+    async def before_call(self, method: str):
+        cost = self._charge(method)
+        if self.bucket is not None:
+            await self.bucket.acquire(cost)
+
+    def before_call_sync(self, method: str):
+        cost = self._charge(method)
+        if self.bucket is not None:
+            self.bucket.acquire_sync(cost)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            by_tool: Dict[str, Dict[str, int]] = {}
+            for (tool, method), count in self._by_tool.items():
+                by_tool.setdefault(tool or "<none>", {})[method] = count
+            return {
+                "methods": {method: dict(stats) for method, stats in self._methods.items()},
+                "by_tool": by_tool,
+                "credits_used": self.credits_used,
+                "credit_budget": self.credit_budget,
+            }
+
+    def reset(self):
+        with self._lock:
+            self._methods.clear()
+            self._by_tool.clear()
+            self.credits_used = 0.0
+
+
+rpc_accountant = RpcAccountant()
+
+
+def _wrap_async(accountant: RpcAccountant, func, batch: bool):
+    @functools.wraps(func)
+    async def wrapper(body, *args, **kwargs):
+        method = "batch" if batch else rpc_method_name(body)
+        await accountant.before_call(method)
+        start = time.perf_counter()
+        raw, error = None, None
+        try:
+            raw = await func(body, *args, **kwargs)
+            return raw
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            accountant.record(method, time.perf_counter() - start, len(raw) if isinstance(raw, (str, bytes)) else 0, error)
+    return wrapper
+
+
+def _wrap_sync(accountant: RpcAccountant, func, batch: bool):
+    @functools.wraps(func)
+    def wrapper(body, *args, **kwargs):
+        method = "batch" if batch else rpc_method_name(body)
+        accountant.before_call_sync(method)
+        start = time.perf_counter()
+        raw, error = None, None
+        try:
+            raw = func(body, *args, **kwargs)
+            return raw
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            accountant.record(method, time.perf_counter() - start, len(raw) if isinstance(raw, (str, bytes)) else 0, error)
+    return wrapper
+
+
+def instrument_client(client: Any, accountant: Optional[RpcAccountant] = None) -> Any:
+    """
+    Route the RPC calls of a solana-py `Client` or `AsyncClient` through an RpcAccountant.
+
+    The client's HTTP provider is wrapped at the unparsed-request level, so every
+    public client method is covered and the raw response size is known. Calling
+    this twice on the same client is a no-op.
+    """
+    accountant = accountant or rpc_accountant
+    provider = getattr(client, "_provider", None)
+    if provider is None or getattr(provider, "_agentipy_accountant", None) is not None:
+        return client
+    if not hasattr(provider, "make_request_unparsed"):
+        logger.warning(f"Cannot instrument RPC provider {type(provider).__name__}; RPC accounting disabled")
+        return client
+
+    is_async = asyncio.iscoroutinefunction(provider.make_request_unparsed)
+    wrap = _wrap_async if is_async else _wrap_sync
+    provider.make_request_unparsed = wrap(accountant, provider.make_request_unparsed, batch=False)
+    if hasattr(provider, "make_batch_request_unparsed"):
+        provider.make_batch_request_unparsed = wrap(accountant, provider.make_batch_request_unparsed, batch=True)
+    provider._agentipy_accountant = accountant
+    return client
@@ -1,5 +1,6 @@
 import json
 import logging
+import time
 
 import requests
 from solana.rpc.async_api import AsyncClient
@@ -8,10 +9,12 @@ from solders.compute_budget import set_compute_unit_price  # type: ignore
 from solders.instruction import Instruction  # type: ignore
 from solders.keypair import Keypair  # type: ignore
 from solders.pubkey import Pubkey  # type: ignore
-from solders.transaction import (Transaction,  # type: ignore
-                                 VersionedTransaction)
+from solders.transaction import Transaction  # type: ignore
+from solders.transaction import VersionedTransaction
 
 from agentipy.agent import SolanaAgentKit
+from agentipy.utils.http_policy import http_policy
+from agentipy.utils.rpc_accounting import rpc_accountant
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +40,11 @@ def get_recent_prioritization_fees(addresses=None):
         "params": [addresses] if addresses else []
     }
 
+    rpc_accountant.before_call_sync("getRecentPrioritizationFees")
+    start = time.perf_counter()
     try:
-        response = requests.post(url=url, headers=headers, data=json.dumps(payload))
+        response = http_policy.post(url=url, headers=headers, data=json.dumps(payload))
+        rpc_accountant.record("getRecentPrioritizationFees", time.perf_counter() - start, len(response.content))
         response.raise_for_status()
         response_data = response.json()
 
@@ -1,5 +1,4 @@
-import requests
-
+from agentipy.utils.http_policy import http_policy
 from agentipy.utils.stork.constants import STORK_HTTPS_ENDPOINT
 
 
@@ -10,7 +9,7 @@ def get_stork_price(asset_id: str, api_token: str):
         "Authorization": f"Basic {api_token}"
     }
     try:
-        response = requests.get(url, headers=headers)
+        response = http_policy.get(url, headers=headers)
         return response.json()
     except Exception as e:
         return {
@@ -0,0 +1,89 @@
+import asyncio
+import csv
+
+import numpy as np
+import pytest
+
+from agentipy.utils.backpack.export import (BOOL, DATETIME, FLOAT, OBJECT,
+                                            BackpackHistoryExporter,
+                                            _infer_kind)
+
+
+class FakeHistoryManager:
+    """Order history served in `limit`/`offset` pages; later pages answer first."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.offsets = []
+
+    async def get_order_history(self, limit, offset, **filters):
+        self.offsets.append(offset)
+        await asyncio.sleep(0.01 * max(0, 5 - offset // limit))
+        return self.rows[offset:offset + limit]
+
+
+def _order(i, **extra):
+    return {"id": str(10**20 + i), "symbol": "SOL_USDC", "price": f"{150 + i}.5", "createdAt": 1_700_000_000_000 + i, **extra}
+
+
+def _exporter(rows, page_size=10, concurrency=4):
+    manager = FakeHistoryManager(rows)
+    return manager, BackpackHistoryExporter(manager, page_size=page_size, concurrency=concurrency, requests_per_second=1000)
+
+
+def test_pages_are_yielded_in_order_and_stop_at_the_end():
+    manager, exporter = _exporter([_order(i) for i in range(25)])
+
+    async def collect():
+        return [[row["id"] for row in page] async for page in exporter.iter_pages("orders")]
+
+    pages = asyncio.run(collect())
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [row for page in pages for row in page] == [str(10**20 + i) for i in range(25)]
+    # The short page ends the export; nothing is scheduled past the prefetched pages
+    assert sorted(manager.offsets) == [0, 10, 20, 30]
+
+
+def test_column_kinds_are_inferred():
+    assert _infer_kind("price", ["1.5", 2, None]) == FLOAT
+    assert _infer_kind("createdAt", [1_700_000_000_000]) == DATETIME
+    assert _infer_kind("postOnly", [True, False]) == BOOL
+    assert _infer_kind("orderId", ["123456789012345678901"]) == OBJECT
+    assert _infer_kind("status", ["Filled", "1.0"]) == OBJECT
+    assert _infer_kind("triggerPrice", [None, None]) == OBJECT
+
+    _, exporter = _exporter([_order(i) for i in range(3)])
+    arrays = asyncio.run(exporter.export_arrays("orders"))
+    assert arrays["price"].dtype == np.float64
+    assert arrays["createdAt"].dtype == np.dtype("datetime64[ms]")
+    assert arrays["id"][0] == str(10**20)
+
+
+def test_columns_first_seen_on_later_pages_widen_the_export(tmp_path):
+    rows = [_order(i) for i in range(10)] + [_order(i, clientId=i, triggerPrice="140.0") for i in range(10, 15)]
+    _, exporter = _exporter(rows)
+
+    arrays = asyncio.run(exporter.export_arrays("orders"))
+    assert all(len(array) == 15 for array in arrays.values())
+    assert list(arrays["clientId"][9:11]) == [None, 10]
+    assert np.isnan(arrays["triggerPrice"][0]) and arrays["triggerPrice"][14] == 140.0
+
+    path = tmp_path / "orders.csv"
+    assert asyncio.run(exporter.export_csv("orders", str(path))) == 15
+    with open(path, newline="", encoding="utf-8") as file:
+        written = list(csv.DictReader(file))
+    assert list(written[0]) == ["id", "symbol", "price", "createdAt", "clientId", "triggerPrice"]
+    assert (written[0]["clientId"], written[14]["clientId"]) == ("", "14")
+    assert written[14]["triggerPrice"] == "140.0"
+
+
+def test_parquet_export_widens_the_file(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = [_order(i) for i in range(10)] + [_order(i, clientId=i) for i in range(10, 15)]
+    _, exporter = _exporter(rows)
+
+    path = tmp_path / "orders.parquet"
+    assert asyncio.run(exporter.export_parquet("orders", str(path))) == 15
+    table = pq.read_table(path)
+    assert table.column_names == ["id", "symbol", "price", "createdAt", "clientId"]
+    assert table.column("clientId").to_pylist()[9:11] == [None, 10]
@@ -0,0 +1,89 @@
+import asyncio
+
+from agentipy.tools.use_backpack import AsyncBackpackManager, BackpackManager
+
+
+class BatchClient:
+    """Batch endpoint that answers out of order and rejects one order."""
+
+    def __init__(self):
+        self.batches = []
+
+    def execute_batch_orders(self, orders):
+        self.batches.append(orders)
+        responses = []
+        for order in reversed(orders):
+            if order["price"] == "0":
+                responses.append({"code": "INVALID_ORDER", "message": "Price must be positive", "clientId": order["clientId"]})
+            else:
+                responses.append({"id": f"order-{order['clientId']}", "clientId": order["clientId"], "price": order["price"]})
+        return responses
+
+
+class SingleOrderClient:
+    """An SDK without the batch endpoint."""
+
+    def __init__(self):
+        self.orders = []
+
+    def execute_order(self, **order):
+        self.orders.append(order)
+        if order["price"] == "0":
+            raise ValueError("Price must be positive")
+        return {"id": f"order-{order['clientId']}", "clientId": order["clientId"], "price": order["price"]}
+
+
+def _manager(auth_client) -> BackpackManager:
+    manager = BackpackManager.__new__(BackpackManager)
+    manager.auth_client = auth_client
+    return manager
+
+
+def _orders():
+    return [
+        {"order_type": "Limit", "side": "Bid", "symbol": "SOL_USDC", "price": price, "quantity": "1", "client_id": client_id}
+        for client_id, price in ((11, "150"), (12, "0"), (13, "152"))
+    ]
+
+
+def test_batch_responses_are_matched_by_client_id():
+    client = BatchClient()
+    results = asyncio.run(AsyncBackpackManager(_manager(client)).execute_orders(_orders()))
+
+    assert list(results) == [11, 12, 13]
+    assert results[11]["id"] == "order-11" and results[11]["price"] == "150"
+    assert results[13]["id"] == "order-13" and results[13]["price"] == "152"
+    assert results[12]["error"] == "Price must be positive"
+    assert [order["clientId"] for order in client.batches[0]] == [11, 12, 13]
+
+
+def test_orders_without_client_id_get_one():
+    orders = [{key: value for key, value in order.items() if key != "client_id"} for order in _orders()]
+    results = asyncio.run(AsyncBackpackManager(_manager(BatchClient())).execute_orders(orders))
+
+    assert len(set(results)) == 3
+    for client_id, response in results.items():
+        assert response.get("clientId") == client_id
+
+
+def test_batch_orders_fall_back_to_single_orders():
+    client = SingleOrderClient()
+    payloads = [{"orderType": "Limit", "side": "Bid", "symbol": "SOL_USDC", "price": price, "clientId": client_id}
+                for client_id, price in ((21, "150"), (22, "0"))]
+
+    responses = _manager(client).execute_batch_orders(payloads)
+
+    assert responses[0]["id"] == "order-21"
+    assert responses[1]["code"] == "ORDER_FAILED" and responses[1]["clientId"] == 22
+    assert "Price must be positive" in responses[1]["message"]
+    assert sorted(order["clientId"] for order in client.orders) == [21, 22]
+
+
+def test_execute_orders_without_batch_endpoint_keys_results_by_client_id():
+    client = SingleOrderClient()
+    results = asyncio.run(AsyncBackpackManager(_manager(client)).execute_orders(_orders()))
+
+    assert results[11]["id"] == "order-11"
+    assert results[13]["id"] == "order-13"
+    assert "Price must be positive" in results[12]["error"]
+    assert sorted(order["clientId"] for order in client.orders) == [11, 12, 13]
@@ -0,0 +1,202 @@
+import asyncio
+import json
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+import agentipy.utils.backpack.stream as stream_module
+from agentipy.utils.backpack.stream import (BackpackMarketStream,
+                                            LocalOrderBook, SequenceGapError,
+                                            replay_messages)
+
+RECORDING = Path(__file__).parent / "fixtures" / "backpack_sol_usdc_stream.jsonl"
+
+
+def _depth(first_id, last_id, bids=(), asks=()):
+    return {
+        "stream": "depth.SOL_USDC",
+        "data": {"e": "depth", "s": "SOL_USDC", "U": first_id, "u": last_id, "b": list(bids), "a": list(asks)},
+    }
+
+
+def _snapshot(last_update_id, bids, asks):
+    return {"bids": list(bids), "asks": list(asks), "lastUpdateId": str(last_update_id)}
+
+
+def test_replay_recording_builds_book_ticker_and_trades():
+    async def replay():
+        stream = BackpackMarketStream(["SOL_USDC"], source=replay_messages(str(RECORDING)))
+        await stream.run()
+        return stream
+
+    stream = asyncio.run(replay())
+
+    depth = stream.get_depth("SOL_USDC")
+    assert depth["lastUpdateId"] == "1004"
+    assert depth["bids"] == [["171.00", "10.25"], ["171.10", "3.00"], ["171.20", "1.50"]]
+    assert depth["asks"] == [["171.35", "2.00"], ["171.40", "6.00"], ["171.50", "20.00"]]
+    assert stream.get_depth("SOL_USDC", limit=1) == {**depth, "bids": [["171.20", "1.50"]], "asks": [["171.35", "2.00"]]}
+
+    ticker = stream.get_ticker("SOL_USDC")
+    assert ticker["lastPrice"] == "171.20"
+    assert ticker["priceChange"] == "6.20"
+    assert ticker["trades"] == "183422"
+
+    trades = stream.get_recent_trades("SOL_USDC")
+    assert [trade["id"] for trade in trades] == [5501, 5502]
+    assert trades[0]["quoteQuantity"] == "342.6000"
+    assert stream.resyncs == 0
+
+
+def test_recording_round_trips_through_replay(tmp_path):
+    record_path = tmp_path / "recorded.jsonl"
+    messages = [json.loads(line) for line in RECORDING.read_text().splitlines()]
+
+    async def record_then_replay():
+        recorder = BackpackMarketStream(["SOL_USDC"], source=replay_messages(messages), record_path=str(record_path))
+        async with recorder:
+            await recorder.wait_synced(timeout=1)
+        replayed = BackpackMarketStream(["SOL_USDC"], source=replay_messages(str(record_path)))
+        await replayed.run()
+        return recorder, replayed
+
+    recorder, replayed = asyncio.run(record_then_replay())
+    assert replayed.get_depth("SOL_USDC")["bids"] == recorder.get_depth("SOL_USDC")["bids"]
+    assert replayed.get_depth("SOL_USDC")["asks"] == recorder.get_depth("SOL_USDC")["asks"]
+
+
+def test_stale_snapshot_is_refetched_until_diffs_bridge():
+    snapshots = [
+        # Stale: the buffered diffs start at 11
+        _snapshot(5, [["99", "1"]], [["101", "1"]]),
+        _snapshot(10, [["99", "2"]], [["101", "3"]]),
+    ]
+    fetches = []
+
+    async def fetcher(symbol):
+        fetches.append(symbol)
+        return snapshots[min(len(fetches), len(snapshots)) - 1]
+
+    messages = [_depth(11, 11, bids=[["100", "1"]]), _depth(12, 13, asks=[["101", "0"], ["102", "4"]])]
+
+    async def replay():
+        stream = BackpackMarketStream(["SOL_USDC"], snapshot_fetcher=fetcher, source=replay_messages(messages))
+        await stream.run()
+        await stream.wait_synced("SOL_USDC", timeout=5)
+        return stream
+
+    stream = asyncio.run(replay())
+    assert len(fetches) == 2
+    assert stream.is_synced("SOL_USDC")
+    assert stream.get_depth("SOL_USDC")["bids"] == [["99", "2"], ["100", "1"]]
+    assert stream.get_depth("SOL_USDC")["asks"] == [["102", "4"]]
+    assert not stream._pending["SOL_USDC"]
+
+
+def test_sequence_gap_resyncs_from_fetched_snapshot():
+    fetches = []
+
+    async def fetcher(symbol):
+        fetches.append(symbol)
+        if len(fetches) == 1:
+            return _snapshot(1, [["99", "1"]], [["101", "1"]])
+        return _snapshot(6, [["98", "5"]], [["103", "5"]])
+
+    async def scenario():
+        stream = BackpackMarketStream(["SOL_USDC"], snapshot_fetcher=fetcher, source=replay_messages([]))
+        await stream.run()
+        await stream.wait_synced("SOL_USDC", timeout=1)
+        stream.handle_message(_depth(2, 2, bids=[["100", "1"]]))
+        # Updates 3-4 are missed
+        stream.handle_message(_depth(5, 7, asks=[["104", "1"]]))
+        assert not stream.is_synced("SOL_USDC")
+        await stream.wait_synced("SOL_USDC", timeout=5)
+        return stream
+
+    stream = asyncio.run(scenario())
+    assert stream.resyncs == 1
+    assert len(fetches) == 2
+    depth = stream.get_depth("SOL_USDC")
+    assert depth["lastUpdateId"] == "7"
+    assert depth["bids"] == [["98", "5"]]
+    assert depth["asks"] == [["103", "5"], ["104", "1"]]
+
+
+def test_order_book_rejects_gaps_and_skips_old_updates():
+    book = LocalOrderBook("SOL_USDC")
+    book.apply_snapshot(_snapshot(10, [["99", "1"], ["98", "1"]], [["101", "1"]]))
+    assert book.apply_diff(_depth(5, 10)["data"]) is False
+    assert book.apply_diff(_depth(9, 11, bids=[["99", "0"]])["data"]) is True
+    assert book.best_bid() == ["98", "1"]
+    try:
+        book.apply_diff(_depth(13, 13)["data"])
+    except SequenceGapError:
+        pass
+    else:
+        raise AssertionError("a gap must raise SequenceGapError")
+
+
+def test_books_unsync_as_soon_as_the_live_source_fails(monkeypatch):
+    connections = []
+    fail = asyncio.Event()
+
+    async def websocket_messages(streams, url=None):
+        connections.append(streams)
+        if len(connections) == 1:
+            await fail.wait()
+            raise aiohttp.ClientConnectionError("connection reset")
+        await asyncio.Event().wait()
+        yield
+
+    async def fetcher(symbol):
+        return _snapshot(len(connections), [["99", "1"]], [["101", "1"]])
+
+    monkeypatch.setattr(stream_module, "websocket_messages", websocket_messages)
+    monkeypatch.setattr(stream_module, "RECONNECT_BASE_DELAY", 0.2)
+
+    async def scenario():
+        async with BackpackMarketStream(["SOL_USDC"], snapshot_fetcher=fetcher) as stream:
+            await stream.wait_synced(timeout=1)
+            fail.set()
+            await asyncio.sleep(0.05)
+            # Still backing off, but nothing stale is served
+            assert len(connections) == 1
+            assert not stream.is_synced("SOL_USDC")
+            with pytest.raises(ValueError, match="not synced"):
+                stream.get_depth("SOL_USDC")
+            await stream.wait_synced(timeout=2)
+            assert len(connections) == 2
+            assert stream.get_depth("SOL_USDC")["lastUpdateId"] == "2"
+
+    asyncio.run(scenario())
+
+
+def test_malformed_messages_are_skipped():
+    async def fetcher(symbol):
+        return _snapshot(10, [["99", "1"]], [["101", "1"]])
+
+    messages = [
+        "{not json",
+        {"stream": "depth.SOL_USDC", "data": {"e": "depth", "b": [["100", "1"]]}},
+        {"stream": "trade.SOL_USDC", "data": {"t": 1, "p": "abc", "q": "1"}},
+        _depth(11, 11, bids=[["100", "1"]]),
+        {"stream": "trade.SOL_USDC", "data": {"t": 2, "p": "100", "q": "1"}},
+    ]
+
+    async def scenario():
+        stream = BackpackMarketStream(["SOL_USDC"], snapshot_fetcher=fetcher, source=replay_messages(messages))
+        await stream.run()
+        await stream.wait_synced(timeout=1)
+        assert stream.get_depth("SOL_USDC")["bids"] == [["99", "1"], ["100", "1"]]
+        assert [trade["id"] for trade in stream.get_recent_trades("SOL_USDC")] == [2]
+
+        # A half-applied update resyncs the book instead of leaving it corrupt
+        stream.handle_message(_depth(12, 12, bids=[["98", "1"], ["97", "abc"]]))
+        assert not stream.is_synced("SOL_USDC")
+        await stream.wait_synced(timeout=1)
+        return stream
+
+    stream = asyncio.run(scenario())
+    assert stream.resyncs == 1
+    assert stream.get_depth("SOL_USDC")["bids"] == [["99", "1"]]
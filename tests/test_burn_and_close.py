@@ -0,0 +1,97 @@
+import asyncio
+from types import SimpleNamespace
+
+from solders.hash import Hash  # type: ignore
+from solders.keypair import Keypair  # type: ignore
+from solders.pubkey import Pubkey  # type: ignore
+from solders.transaction import VersionedTransaction  # type: ignore
+from spl.token.constants import TOKEN_PROGRAM_ID
+
+from agentipy.tools.burn_and_close_account import BurnManager, BurnValues
+
+PACKET_DATA_SIZE = 1232
+BURN, CLOSE_ACCOUNT = 8, 9  # SPL token instruction tags
+
+
+def _account_info(owner: Pubkey, amount: int):
+    parsed = {
+        "mint": str(Pubkey.new_unique()),
+        "owner": str(owner),
+        "state": "initialized",
+        "tokenAmount": {"amount": str(amount)},
+    }
+    return SimpleNamespace(owner=TOKEN_PROGRAM_ID, data=SimpleNamespace(parsed={"info": parsed}))
+
+
+class FakeConnection:
+    def __init__(self, infos, failing_account=None):
+        self.infos = infos
+        self.failing_account = failing_account
+        self.account_requests = []
+        self.transactions = []
+
+    async def get_multiple_accounts_json_parsed(self, pubkeys, commitment=None):
+        self.account_requests.append(len(pubkeys))
+        return SimpleNamespace(value=[self.infos.get(str(pubkey)) for pubkey in pubkeys])
+
+    async def get_latest_blockhash(self, commitment=None):
+        return SimpleNamespace(value=SimpleNamespace(blockhash=Hash.default()))
+
+    async def send_raw_transaction(self, raw, opts=None):
+        transaction = VersionedTransaction.from_bytes(raw)
+        self.transactions.append(transaction)
+        keys = [str(key) for key in transaction.message.account_keys]
+        if self.failing_account in keys:
+            raise RuntimeError("Transaction simulation failed")
+        return SimpleNamespace(value=transaction.signatures[0])
+
+
+def _token_instructions(transaction):
+    keys = transaction.message.account_keys
+    return [
+        instruction.data[0]
+        for instruction in transaction.message.instructions
+        if keys[instruction.program_id_index] == TOKEN_PROGRAM_ID
+    ]
+
+
+def test_bulk_burn_and_close_batches_reads_and_packs_transactions():
+    wallet = Keypair()
+    accounts = [str(Pubkey.new_unique()) for _ in range(205)]
+    missing = set(accounts[:5])
+    empty = set(accounts[5:10])
+    infos = {
+        account: _account_info(wallet.pubkey(), 0 if account in empty else 1_000)
+        for account in accounts
+        if account not in missing
+    }
+    # Rejects the whole transaction that closes accounts[20]
+    connection = FakeConnection(infos, failing_account=accounts[20])
+    agent = SimpleNamespace(wallet=wallet, connection=connection)
+
+    results = asyncio.run(BurnManager.burn_and_close_accounts_bulk(agent, accounts))
+
+    assert connection.account_requests == [100, 100, 5]
+    per_transaction = BurnValues.ACCOUNTS_PER_TRANSACTION
+    assert len(connection.transactions) == -(-200 // per_transaction)
+    for transaction in connection.transactions:
+        assert len(bytes(transaction)) <= PACKET_DATA_SIZE
+        assert _token_instructions(transaction).count(CLOSE_ACCOUNT) <= per_transaction
+
+    assert [result.token_account for result in results] == accounts
+    by_account = {result.token_account: result for result in results}
+    assert all(by_account[account].status == "skipped" for account in missing)
+    for account in empty:
+        assert by_account[account].status == "submitted"
+        assert by_account[account].burned_amount == 0
+    # Empty accounts are closed without a burn
+    assert sum(_token_instructions(tx).count(BURN) for tx in connection.transactions) == 200 - len(empty)
+    assert sum(_token_instructions(tx).count(CLOSE_ACCOUNT) for tx in connection.transactions) == 200
+
+    failed = [result for result in results if result.status == "failed"]
+    assert len(failed) == per_transaction
+    assert accounts[20] in {result.token_account for result in failed}
+    assert all(result.error == "Transaction simulation failed" and result.signature is None for result in failed)
+    submitted = [result for result in results if result.status == "submitted"]
+    assert len(submitted) == 200 - per_transaction
+    assert all(result.signature and result.error is None for result in submitted)
@@ -0,0 +1,61 @@
+"""
+Cold-start benchmark of `import agentipy` and of the lazy LangChain tool registry.
+
+Each measurement runs in a fresh interpreter. Wall time and the tracemalloc
+peak of the import are recorded as test properties (`cold_start_ms`,
+`cold_start_peak_kib`) and must stay within AGENTIPY_COLD_START_BUDGET_MS
+(default 1000 ms) and AGENTIPY_COLD_START_MEMORY_KIB (default 32 MiB).
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+COLD_START_BUDGET_MS = float(os.environ.get("AGENTIPY_COLD_START_BUDGET_MS", "1000"))
+COLD_START_MEMORY_KIB = float(os.environ.get("AGENTIPY_COLD_START_MEMORY_KIB", str(32 * 1024)))
+
+INTEGRATION_PACKAGES = ("langchain", "langchain_core", "mcp", "allora_sdk", "backpack_exchange_sdk")
+
+_COLD_START_SCRIPT = """
+import json, sys, time, tracemalloc
+tracemalloc.start()
+started = time.perf_counter()
+import agentipy
+elapsed = time.perf_counter() - started
+_, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+# Resolving the lazy export must not import any tool provider yet
+agentipy.create_solana_tools
+print(json.dumps({
+    "ms": elapsed * 1000,
+    "peak_kib": peak / 1024,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+def _run(script: str) -> dict:
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def test_cold_start_time_and_memory(record_property):
+    result = _run(_COLD_START_SCRIPT)
+    record_property("cold_start_ms", round(result["ms"], 2))
+    record_property("cold_start_peak_kib", round(result["peak_kib"], 1))
+
+    assert result["ms"] <= COLD_START_BUDGET_MS, f"import agentipy took {result['ms']:.1f} ms"
+    assert result["peak_kib"] <= COLD_START_MEMORY_KIB, f"import agentipy allocated {result['peak_kib']:.0f} KiB"
+
+
+def test_tool_providers_load_on_first_use():
+    modules = _run(_COLD_START_SCRIPT)["modules"]
+    integrations = [name for name in modules if name.split(".")[0] in INTEGRATION_PACKAGES]
+    providers = [name for name in modules if name.startswith("agentipy.langchain.")]
+    assert integrations == []
+    assert providers == []
@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+
+import agentipy.tools.use_helius as use_helius
+from agentipy.tools.use_helius import (HeliusManager,
+                                       configure_parsed_transaction_cache)
+from agentipy.utils.helius.helpers import cache as cache_module
+
+AGENT = SimpleNamespace(helius_rpc_url="https://helius.test", helius_api_key="key")
+
+
+def _fake_post(requests):
+    async def post(session, url, payload):
+        requests.append(list(payload["transactions"]))
+        return [{"signature": signature, "slot": 1} for signature in payload["transactions"]]
+
+    return post
+
+
+def _parse(signatures, **kwargs):
+    return asyncio.run(HeliusManager.get_parsed_transactions_batched(AGENT, signatures, **kwargs))
+
+
+def test_default_parsed_transaction_cache_is_bounded_and_expires():
+    assert use_helius.parsed_transaction_cache.maxsize <= 1_000
+    assert use_helius.parsed_transaction_cache.ttl is not None
+
+
+def test_parsed_transaction_cache_size_and_ttl(monkeypatch):
+    requests = []
+    now = [1_000.0]
+    monkeypatch.setattr(use_helius, "_make_async_post_request", _fake_post(requests))
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(use_helius, "parsed_transaction_cache", use_helius.parsed_transaction_cache)
+    cache = configure_parsed_transaction_cache(maxsize=2, ttl=60)
+
+    assert [tx["signature"] for tx in _parse(["a", "b", "c"])] == ["a", "b", "c"]
+    assert len(cache) == 2
+
+    # "a" was evicted, "b" and "c" are served from the cache
+    _parse(["a", "b", "c"])
+    assert requests[-1] == ["a"]
+
+    # Confirmed results are never cached
+    _parse(["c"], commitment="confirmed")
+    assert requests[-1] == ["c"]
+
+    now[0] += 61
+    _parse(["b", "c"])
+    assert requests[-1] == ["b", "c"]
+
+
+def test_parsed_transaction_cache_can_be_disabled(monkeypatch):
+    requests = []
+    monkeypatch.setattr(use_helius, "_make_async_post_request", _fake_post(requests))
+    monkeypatch.setattr(use_helius, "parsed_transaction_cache", use_helius.parsed_transaction_cache)
+    configure_parsed_transaction_cache(maxsize=0)
+
+    _parse(["a"])
+    _parse(["a"])
+    assert requests == [["a"], ["a"]]
@@ -0,0 +1,109 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import agentipy.utils.helius.indexer as indexer_module
+from agentipy.tools.use_helius import HeliusManager
+from agentipy.utils.helius.indexer import HeliusHistoryIndexer
+
+ADDRESS = "Wallet111"
+
+
+class FakeHistory:
+    """Newest-first parsed history following the Helius `before`/`until` semantics."""
+
+    def __init__(self, transactions):
+        self.transactions = list(transactions)
+
+    async def iter_transaction_history(self, agent, address, before="", until="", max_items=None, **kwargs):
+        signatures = [tx["signature"] for tx in self.transactions]
+        start = signatures.index(before) + 1 if before else 0
+        yielded = 0
+        for tx in self.transactions[start:]:
+            if tx["signature"] == until or (max_items is not None and yielded >= max_items):
+                return
+            yield tx
+            yielded += 1
+
+
+def _tx(signature, slot, type="TRANSFER"):
+    return {"signature": signature, "slot": slot, "timestamp": 1_700_000_000 + slot, "type": type, "source": "SYSTEM_PROGRAM"}
+
+
+def _signatures(transactions):
+    return [tx["signature"] for tx in transactions]
+
+
+def _history(monkeypatch, transactions):
+    fake = FakeHistory(transactions)
+    monkeypatch.setattr(HeliusManager, "iter_transaction_history", fake.iter_transaction_history)
+    return fake
+
+
+def test_pages_do_not_drop_transactions_sharing_a_slot(monkeypatch):
+    # Several transactions per slot; the API order within a slot is not alphabetical
+    history = [_tx("s9", 30), _tx("s3", 30), _tx("s7", 30), _tx("s1", 20), _tx("s8", 20), _tx("s2", 10)]
+    _history(monkeypatch, history)
+    indexer = HeliusHistoryIndexer(refresh_interval=3600)
+    agent = SimpleNamespace()
+
+    async def page_through():
+        pages, before = [], ""
+        while True:
+            page = await indexer.get_history(agent, ADDRESS, before=before, limit=2)
+            if not page:
+                return pages
+            pages.append(_signatures(page))
+            before = page[-1]["signature"]
+
+    pages = asyncio.run(page_through())
+    assert pages == [["s9", "s3"], ["s7", "s1"], ["s8", "s2"]]
+
+
+def test_sync_and_backfill_keep_api_order(monkeypatch):
+    full = [_tx("n2", 40), _tx("n1", 40), _tx("a", 30), _tx("b", 30), _tx("c", 30), _tx("d", 20), _tx("e", 20)]
+    fake = _history(monkeypatch, full[2:])
+    indexer = HeliusHistoryIndexer(initial_items=2, refresh_interval=3600)
+    agent = SimpleNamespace()
+
+    async def scenario():
+        await indexer.sync(agent, ADDRESS)
+        # New transactions arrive, then the older history is backfilled
+        fake.transactions = full
+        await indexer.sync(agent, ADDRESS)
+        await indexer.backfill(agent, ADDRESS)
+        everything = await indexer.query(ADDRESS, limit=100)
+        after_b = await indexer.get_history(agent, ADDRESS, before="b", limit=100)
+        until_b = await indexer.get_history(agent, ADDRESS, until="b", limit=100)
+        return everything, after_b, until_b
+
+    everything, after_b, until_b = asyncio.run(scenario())
+    assert _signatures(everything) == _signatures(full)
+    assert _signatures(after_b) == ["c", "d", "e"]
+    assert _signatures(until_b) == ["n2", "n1", "a"]
+
+
+def test_interrupted_sync_does_not_misorder_the_retry(monkeypatch):
+    full = [_tx("E", 60), _tx("A", 50), _tx("B", 40), _tx("C", 30), _tx("D", 20), _tx("M", 10)]
+    fake = _history(monkeypatch, full[-1:])
+    indexer = HeliusHistoryIndexer(refresh_interval=3600)
+    agent = SimpleNamespace()
+
+    async def failing_history(agent, address, until="", **kwargs):
+        for tx in full[1:3]:
+            yield tx
+        raise ConnectionError("connection reset")
+
+    async def scenario():
+        await indexer.sync(agent, ADDRESS)
+        monkeypatch.setattr(indexer_module, "INSERT_BATCH_SIZE", 1)
+        monkeypatch.setattr(HeliusManager, "iter_transaction_history", failing_history)
+        with pytest.raises(ConnectionError):
+            await indexer.sync(agent, ADDRESS)
+        fake.transactions = full
+        monkeypatch.setattr(HeliusManager, "iter_transaction_history", fake.iter_transaction_history)
+        assert await indexer.sync(agent, ADDRESS) == 5
+        return await indexer.query(ADDRESS, limit=100)
+
+    assert _signatures(asyncio.run(scenario())) == _signatures(full)
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from agentipy.utils.helius.webhooks import (EventBus, HeliusWebhookReceiver,
+                                            decode_webhook_event)
+
+AUTH = "Bearer secret"
+
+
+def _enhanced(signature, type="SWAP", fee_payer="Payer1", to="Wallet1"):
+    return {
+        "signature": signature,
+        "type": type,
+        "source": "JUPITER",
+        "slot": 10,
+        "timestamp": 1_700_000_000,
+        "feePayer": fee_payer,
+        "nativeTransfers": [{"fromUserAccount": fee_payer, "toUserAccount": to, "amount": 1}],
+    }
+
+
+def _post(receiver, payloads):
+    """POST each (headers, payload) pair to the receiver and return the (status, body) responses."""
+
+    async def scenario():
+        app = web.Application()
+        receiver.add_routes(app)
+        async with TestClient(TestServer(app)) as client:
+            responses = []
+            for headers, payload in payloads:
+                response = await client.post(receiver.path, json=payload, headers=headers)
+                responses.append((response.status, await response.json()))
+            return responses
+
+    return asyncio.run(scenario())
+
+
+def test_requests_without_the_auth_header_are_rejected():
+    bus = EventBus()
+    subscription = bus.subscribe()
+    receiver = HeliusWebhookReceiver(bus, auth_header=AUTH)
+
+    responses = _post(receiver, [
+        ({}, [_enhanced("sig1")]),
+        ({"Authorization": "Bearer wrong"}, [_enhanced("sig1")]),
+        ({"Authorization": AUTH}, [_enhanced("sig1")]),
+    ])
+
+    assert [status for status, _ in responses] == [401, 401, 200]
+    assert responses[2][1] == {"published": 1}
+    assert subscription._queue.qsize() == 1
+
+
+def test_redelivered_transactions_are_published_once():
+    bus = EventBus()
+    subscription = bus.subscribe()
+    receiver = HeliusWebhookReceiver(bus, auth_header=AUTH)
+    headers = {"Authorization": AUTH}
+
+    responses = _post(receiver, [
+        (headers, [_enhanced("sig1"), _enhanced("sig2")]),
+        (headers, [_enhanced("sig2"), _enhanced("sig3")]),
+    ])
+
+    assert [body["published"] for _, body in responses] == [2, 1]
+    assert (receiver.received, receiver.duplicates) == (4, 1)
+    assert subscription._queue.qsize() == 3
+
+
+def test_raw_webhook_payloads_are_decoded():
+    event = decode_webhook_event({
+        "slot": 42,
+        "blockTime": 1_700_000_123,
+        "transaction": {
+            "signatures": ["rawsig"],
+            "message": {"accountKeys": [{"pubkey": "Payer1"}, "Wallet1", "Payer1"]},
+        },
+    })
+
+    assert event.signature == "rawsig"
+    assert event.slot == 42
+    assert event.timestamp == 1_700_000_123
+    assert event.accounts == ["Payer1", "Wallet1"]
+    assert decode_webhook_event({"transaction": {"signatures": []}}) is None
+
+
+def test_events_are_routed_by_address_and_type():
+    bus = EventBus()
+    wallet_swaps = bus.subscribe(addresses=["Wallet1"], types=["SWAP"])
+    other_wallet = bus.subscribe(addresses=["Wallet2"])
+    everything = bus.subscribe()
+
+    assert bus.publish(decode_webhook_event(_enhanced("a", type="SWAP", to="Wallet1"))) == 2
+    assert bus.publish(decode_webhook_event(_enhanced("b", type="TRANSFER", to="Wallet1"))) == 1
+    assert bus.publish(decode_webhook_event(_enhanced("c", type="TRANSFER", to="Wallet2"))) == 2
+
+    assert wallet_swaps._queue.qsize() == 1
+    assert other_wallet._queue.qsize() == 1
+    assert everything._queue.qsize() == 3
+
+    wallet_swaps.close()
+    assert bus.publish(decode_webhook_event(_enhanced("d", type="SWAP", to="Wallet1"))) == 1
+
+
+def test_full_subscription_drops_the_oldest_event():
+    bus = EventBus()
+    subscription = bus.subscribe(maxsize=2)
+    for signature in ("a", "b", "c"):
+        bus.publish(decode_webhook_event(_enhanced(signature)))
+
+    async def drain():
+        return [(await subscription.get()).signature for _ in range(2)]
+
+    assert subscription.dropped == 1
+    assert asyncio.run(drain()) == ["b", "c"]
+
+
+def test_unauthenticated_receiver_only_serves_loopback():
+    receiver = HeliusWebhookReceiver()
+    with pytest.raises(ValueError, match="auth_header"):
+        asyncio.run(receiver.start(host="0.0.0.0", port=0))
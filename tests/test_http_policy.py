@@ -0,0 +1,127 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from agentipy.utils.http_policy import (CircuitBreaker, CircuitOpenError,
+                                        HttpPolicyEngine, RetryPolicy)
+
+
+def _half_open_engine():
+    engine = HttpPolicyEngine(RetryPolicy(max_attempts=1), failure_threshold=1, reset_timeout=0.0)
+    state = engine.host_state("https://api.example.com/x")
+    state.breaker.record_failure()
+    assert state.breaker.state == "half-open"
+    return engine, state
+
+
+class _RaisingSession:
+    def __init__(self, exc):
+        self.exc = exc
+
+    def request(self, method, url, **kwargs):
+        raise self.exc
+
+
+def test_unexpected_transport_error_ends_half_open_trial():
+    engine, state = _half_open_engine()
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        engine.request("GET", "https://api.example.com/x", session=_RaisingSession(requests.exceptions.ChunkedEncodingError()))
+    assert not state.breaker._trial_in_flight
+    # The next call is allowed through as a new trial instead of being rejected forever
+    state.breaker.before_call("api.example.com")
+
+
+def test_cancelled_async_request_releases_trial():
+    engine, state = _half_open_engine()
+
+    class HangingSession:
+        def request(self, method, url, **kwargs):
+            return self
+
+        async def __aenter__(self):
+            await asyncio.sleep(10)
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+    async def scenario():
+        task = asyncio.ensure_future(engine.arequest(HangingSession(), "GET", "https://api.example.com/x"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    assert not state.breaker._trial_in_flight
+    assert state.breaker._failures == 1
+
+
+def test_open_circuit_rejects_calls():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("api.example.com")
+
+
+def test_non_idempotent_requests_retry_only_on_safe_statuses():
+    policy = RetryPolicy()
+    assert policy.should_retry_status("GET", 503)
+    assert policy.should_retry_status("POST", 429)
+    # A bare 503 may come from a gateway after the upstream processed the request
+    assert not policy.should_retry_status("POST", 503)
+    assert policy.should_retry_status("POST", 503, retry_after="1")
+    assert not policy.should_retry_status("POST", 502, retry_after="1")
+
+
+class _StatusSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        status, headers = self.responses.pop(0)
+        return SimpleNamespace(status_code=status, headers=headers)
+
+
+def test_post_is_not_resent_after_bare_503():
+    engine = HttpPolicyEngine(RetryPolicy(max_attempts=3, base_delay=0.0))
+    session = _StatusSession([(503, {}), (200, {})])
+    response = engine.request("POST", "https://api.example.com/swap", session=session)
+    assert response.status_code == 503
+    assert session.calls == 1
+
+    session = _StatusSession([(503, {"Retry-After": "0"}), (200, {})])
+    response = engine.request("POST", "https://api.example.com/swap", session=session)
+    assert response.status_code == 200
+    assert session.calls == 2
+
+
+def test_rate_limited_background_requests_do_not_hold_back_the_host(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+
+    def rate_limited(background):
+        engine = HttpPolicyEngine(RetryPolicy(max_attempts=2), failure_threshold=2)
+        session = _StatusSession([(429, {"Retry-After": "30"})] * 2)
+        response = engine.request("POST", "https://api.example.com/x", session=session, background=background)
+        assert response.status_code == 429 and session.calls == 2
+        return engine.host_state("https://api.example.com/x")
+
+    status_poll = rate_limited(background=True)
+    assert status_poll.wait_time() == 0
+    assert status_poll.breaker.state == "closed"
+
+    send = rate_limited(background=False)
+    assert send.wait_time() > 0
+    assert send.breaker.state == "open"
+
+
+def test_per_request_retry_policy_overrides_the_engine_policy(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    engine = HttpPolicyEngine(RetryPolicy(max_attempts=4))
+    session = _StatusSession([(429, {})] * 4)
+    engine.request("POST", "https://api.example.com/x", session=session, retry_policy=RetryPolicy(max_attempts=2))
+    assert session.calls == 2
@@ -0,0 +1,70 @@
+"""
+`-X importtime` regression benchmark for `from agentipy.agent import SolanaAgentKit`.
+
+Importing the agent must only load solders/base58 (plus the standard library);
+RPC clients, SDKs and integrations are imported on first use. The measured
+cumulative import time is recorded as the `agentipy_agent_import_us` property
+and must stay below AGENTIPY_IMPORT_BUDGET_MS (default 500 ms).
+"""
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+IMPORT_BUDGET_MS = float(os.environ.get("AGENTIPY_IMPORT_BUDGET_MS", "500"))
+RUNS = 3
+
+# Top-level packages that must stay deferred until a feature needs them
+DEFERRED_PACKAGES = (
+    "aiohttp",
+    "allora_sdk",
+    "anchorpy",
+    "asyncio",
+    "backpack_exchange_sdk",
+    "httpx",
+    "langchain",
+    "langchain_core",
+    "mcp",
+    "numpy",
+    "pydantic",
+    "requests",
+    "solana",
+    "spl",
+)
+
+
+def _importtime(statement: str) -> dict:
+    """Cumulative import time in microseconds of every module loaded by `statement`, from a fresh interpreter."""
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_agent_import_defers_heavy_dependencies():
+    modules = _importtime("from agentipy.agent import SolanaAgentKit")
+    loaded = sorted(name for name in modules if name.split(".")[0] in DEFERRED_PACKAGES)
+    assert loaded == [], f"importing SolanaAgentKit loaded deferred modules: {loaded}"
+
+
+def test_agent_import_time_budget(record_property):
+    samples = [_importtime("from agentipy.agent import SolanaAgentKit")["agentipy.agent"] for _ in range(RUNS)]
+    median_us = statistics.median(samples)
+    record_property("agentipy_agent_import_us", median_us)
+    assert median_us <= IMPORT_BUDGET_MS * 1000, (
+        f"agentipy.agent took {median_us / 1000:.1f} ms to import (budget {IMPORT_BUDGET_MS} ms)"
+    )
@@ -0,0 +1,110 @@
+import asyncio
+import inspect
+
+import pytest
+from pydantic import BaseModel
+
+import agentipy.langchain as langchain_tools
+from agentipy.agent import SolanaAgentKit
+from agentipy.utils.instrumentation import (MetricsRegistry, current_tool,
+                                            instrument, instrument_methods,
+                                            metrics)
+
+
+def _collect(agen, limit=None):
+    async def run():
+        items = []
+        async for item in agen:
+            items.append(item)
+            if limit is not None and len(items) == limit:
+                break
+        return items
+
+    return asyncio.run(run())
+
+
+def test_async_generators_are_recorded_once_per_iteration():
+    registry = MetricsRegistry()
+    seen_tools = []
+
+    @instrument("stream", registry)
+    async def stream(count, fail=False):
+        for i in range(count):
+            seen_tools.append(current_tool.get())
+            yield i
+        if fail:
+            raise RuntimeError("boom")
+
+    assert inspect.isasyncgenfunction(stream)
+    assert _collect(stream(3)) == [0, 1, 2]
+    assert seen_tools == ["stream"] * 3
+    assert current_tool.get() is None
+    assert registry.snapshot()["stream"]["calls"] == 1
+
+    # Stopping early is not an error
+    assert _collect(stream(5), limit=2) == [0, 1]
+    with pytest.raises(RuntimeError):
+        _collect(stream(1, fail=True))
+    stats = registry.snapshot()["stream"]
+    assert (stats["calls"], stats["errors"]) == (3, 1)
+
+
+def test_async_generators_returned_by_plain_methods_are_recorded_when_iterated():
+    registry = MetricsRegistry()
+    seen_tools = []
+
+    async def produce(count, fail):
+        for i in range(count):
+            seen_tools.append(current_tool.get())
+            yield i
+        if fail:
+            raise RuntimeError("boom")
+
+    class Facade:
+        def iter_items(self, count, fail=False):
+            return produce(count, fail)
+
+    instrument_methods(Facade, "facade", registry)
+    items = Facade().iter_items(2)
+    assert registry.snapshot() == {}
+    assert _collect(items) == [0, 1]
+    assert seen_tools == ["facade.iter_items"] * 2
+    with pytest.raises(RuntimeError):
+        _collect(Facade().iter_items(1, fail=True))
+    stats = registry.snapshot()["facade.iter_items"]
+    assert (stats["calls"], stats["errors"]) == (2, 1)
+
+
+def test_agent_async_generators_keep_their_kind():
+    for name, method in vars(SolanaAgentKit).items():
+        if getattr(method, "__agentipy_instrumented__", False):
+            assert inspect.isasyncgenfunction(method) == inspect.isasyncgenfunction(inspect.unwrap(method)), name
+    assert inspect.isasyncgenfunction(SolanaAgentKit.screen_tokens)
+
+
+class FakeTool(BaseModel):
+    name: str
+    solana_kit: object
+
+    async def _arun(self, input: str):
+        return f"{self.name}:{input}"
+
+
+def test_langchain_tools_are_instrumented_per_instance(monkeypatch):
+    def factory(solana_kit):
+        return [FakeTool(name="fake_read", solana_kit=solana_kit), FakeTool(name="fake_write", solana_kit=solana_kit)]
+
+    monkeypatch.setitem(langchain_tools.TOOL_PROVIDERS, "fake", "tests:factory")
+    monkeypatch.setitem(langchain_tools._loaded_factories, "fake", factory)
+    original = FakeTool._arun
+
+    read, write = langchain_tools.create_solana_tools(object(), providers=["fake"])
+    before = metrics.snapshot()
+    assert asyncio.run(read._arun("x")) == "fake_read:x"
+    assert asyncio.run(write._arun("y")) == "fake_write:y"
+    after = metrics.snapshot()
+
+    assert FakeTool._arun is original
+    assert FakeTool(name="plain", solana_kit=None)._arun.__func__ is original
+    for name in ("langchain.fake_read", "langchain.fake_write"):
+        assert after[name]["calls"] == before.get(name, {}).get("calls", 0) + 1
@@ -0,0 +1,124 @@
+import asyncio
+import inspect
+from types import SimpleNamespace
+
+from agentipy.tools.use_jito import JitoManager
+from agentipy.utils.http_policy import http_policy
+from agentipy.utils.jito.client import SEND_RETRY_POLICY, JitoClient, JitoError
+from agentipy.utils.jito.fanout import JitoFanout
+
+
+class FakeRegion:
+    def __init__(self, accept=True, delay=0.0, status_error=None):
+        self.accept = accept
+        self.delay = delay
+        self.status_error = status_error
+        self.status_polls = 0
+
+    async def rpc(self, endpoint, method, params=None, query=None):
+        await asyncio.sleep(self.delay)
+        if not self.accept:
+            raise JitoError("rejected")
+        return {"result": "bundle-1"}
+
+    async def get_inflight_bundle_statuses(self, bundle_ids):
+        self.status_polls += 1
+        if self.status_error is not None:
+            raise self.status_error
+        return {bundle_id: {"bundle_id": bundle_id, "status": "Landed"} for bundle_id in bundle_ids}
+
+    async def wait_for_bundles(self, bundle_ids, timeout=30.0):
+        return await self.get_inflight_bundle_statuses(bundle_ids)
+
+    async def close(self):
+        pass
+
+
+def _fanout(regions, **kwargs):
+    fanout = JitoFanout(list(regions), max_regions=None, poll_interval=0.01, **kwargs)
+    fanout.clients = dict(regions)
+    return fanout
+
+
+def test_wait_polls_the_region_that_accepted_the_bundle(monkeypatch):
+    regions = {"ny": FakeRegion(accept=False), "tokyo": FakeRegion(delay=0.01)}
+    fanout = _fanout(regions)
+    default_engine = FakeRegion()
+
+    async def build_bundle(transactions, wallet, tip_lamports):
+        return list(transactions)
+
+    default_engine.build_bundle = build_bundle
+    agent = SimpleNamespace(jito_regions=["ny", "tokyo"], jito_uuid=None, wallet=None)
+    monkeypatch.setattr(JitoClient, "for_agent", classmethod(lambda cls, agent: default_engine))
+    monkeypatch.setattr(JitoFanout, "for_agent", classmethod(lambda cls, agent: fanout))
+
+    async def scenario():
+        try:
+            return await JitoManager.send_bundle_with_tip(agent, ["tx"], 1000, wait=True)
+        finally:
+            await fanout.close()
+
+    result = asyncio.run(scenario())
+    assert result["region"] == "tokyo"
+    assert result["status"]["status"] == "Landed"
+    assert default_engine.status_polls == 0
+    assert regions["ny"].status_polls == 0
+    # The wait is served by the landing tracker's poll, not a second poller
+    assert regions["tokyo"].status_polls == 1
+
+
+def test_status_polls_default_to_at_most_once_a_second():
+    fanout = JitoFanout(["ny"])
+    assert fanout.poll_interval >= 1.0
+    assert inspect.signature(JitoClient.wait_for_bundles).parameters["poll_interval"].default >= 1.0
+
+
+def test_landing_tracker_survives_unexpected_poll_errors():
+    regions = {"ny": FakeRegion(status_error=RuntimeError("boom")), "tokyo": FakeRegion(delay=0.01)}
+    fanout = _fanout(regions, track_timeout=0.05)
+    regions["ny"].delay = 0.0
+
+    async def scenario():
+        region, bundle_id = await fanout.submit_bundle(["tx"])
+        # Let the slower region's send finish in the background as well
+        await asyncio.sleep(0.3)
+        tracker = fanout._tracker
+        await fanout.close()
+        return region, bundle_id, tracker
+
+    region, bundle_id, tracker = asyncio.run(scenario())
+    assert (region, bundle_id) == ("ny", "bundle-1")
+    assert regions["ny"].status_polls > 1
+    assert fanout.stats["ny"].not_landed == 1
+    assert fanout.stats["tokyo"].landed == 1
+    assert tracker.done() and not tracker.cancelled() and tracker.exception() is None
+
+
+def test_sends_use_the_short_retry_policy(monkeypatch):
+    policies = {}
+
+    async def arequest(session, method, url, retry_policy=None, **kwargs):
+        policies[kwargs["json"]["method"]] = retry_policy
+
+        async def body(content_type=None):
+            return {"result": "ok"}
+
+        return SimpleNamespace(status=200, json=body)
+
+    monkeypatch.setattr(http_policy, "arequest", arequest)
+    client = JitoClient()
+
+    async def scenario():
+        try:
+            await client.send_bundle(["tx"])
+            await client.send_transaction("tx")
+            await client.get_tip_accounts()
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+    assert policies["sendBundle"] is SEND_RETRY_POLICY
+    assert policies["sendTransaction"] is SEND_RETRY_POLICY
+    assert policies["getTipAccounts"] is None
+    assert SEND_RETRY_POLICY.max_attempts <= 2 and SEND_RETRY_POLICY.max_delay <= 1.0
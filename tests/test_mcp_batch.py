@@ -0,0 +1,74 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from mcp.types import Tool
+
+from agentipy.mcp.batch import compile_params_validator, make_batch_action
+from agentipy.mcp.executor import ToolExecutor
+
+SCHEMA = {
+    "to": {"type": "string", "required": True},
+    "amount": {"type": "number", "required": True},
+    "mint": {"type": "string"},
+    "side": {"type": "string", "enum": ["buy", "sell"]},
+}
+
+
+def test_params_validator_enforces_required_fields():
+    validate = compile_params_validator(SCHEMA)
+    validate({"to": "wallet", "amount": 1})
+    validate({"to": "wallet", "amount": 1.5, "mint": None})
+
+    with pytest.raises(ValueError, match="Missing required field: to"):
+        validate({"amount": 1})
+    with pytest.raises(ValueError, match="amount must be of type number"):
+        validate({"to": "wallet", "amount": None})
+    with pytest.raises(ValueError, match="amount must be of type number"):
+        validate({"to": "wallet", "amount": True})
+    with pytest.raises(ValueError, match="side must be one of"):
+        validate({"to": "wallet", "amount": 1, "side": "hold"})
+
+
+def test_batch_reports_missing_required_params_per_entry():
+    calls = []
+
+    async def handler(agent, params):
+        calls.append(params)
+        return "sent"
+
+    actions = {"TRANSFER": Tool(name="TRANSFER", description="", inputSchema=SCHEMA, handler=handler)}
+    batch = make_batch_action(actions, ToolExecutor(), allow_writes=True)
+    requests = [
+        {"action": "TRANSFER", "params": {"amount": 1}},
+        {"action": "TRANSFER", "params": {"to": "wallet", "amount": 1}},
+    ]
+
+    results = asyncio.run(batch.handler(SimpleNamespace(), {"requests": requests}))
+    assert results[0] == {"action": "TRANSFER", "status": "error", "error": "Missing required field: to"}
+    assert results[1] == {"action": "TRANSFER", "status": "success", "result": "sent"}
+    assert calls == [{"to": "wallet", "amount": 1}]
+
+
+def test_batch_rejects_state_changing_actions_by_default():
+    calls = []
+
+    async def handler(agent, params):
+        calls.append(params)
+        return "done"
+
+    actions = {
+        "TRANSFER": Tool(name="TRANSFER", description="", inputSchema=SCHEMA, handler=handler),
+        "GET_BALANCE": Tool(name="GET_BALANCE", description="", inputSchema={}, handler=handler, read_only=True),
+    }
+    batch = make_batch_action(actions, ToolExecutor())
+    requests = [
+        {"action": "GET_BALANCE", "params": {}},
+        {"action": "TRANSFER", "params": {"to": "wallet", "amount": 1}},
+    ]
+
+    results = asyncio.run(batch.handler(SimpleNamespace(), {"requests": requests}))
+    assert results[0] == {"action": "GET_BALANCE", "status": "success", "result": "done"}
+    assert results[1]["status"] == "error"
+    assert "not read-only" in results[1]["error"]
+    assert calls == [{}]
@@ -0,0 +1,111 @@
+"""
+LangChain tool to MCP action conversion: agent fields, read-only flags and startup cost.
+
+Pydantic models stand in for LangChain `BaseTool`s; the adapter only relies on
+`name`, `description`, `metadata`, the SolanaAgentKit field and `_arun`. The
+time to convert TOOL_COUNT tools is recorded as the `langchain_actions_ms`
+property and must stay within AGENTIPY_LANGCHAIN_ACTIONS_BUDGET_MS (default 500 ms).
+"""
+import asyncio
+import os
+import time
+from typing import ClassVar, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from agentipy.agent import SolanaAgentKit
+from agentipy.helpers import InputValidator, compile_schema
+from agentipy.mcp.batch import is_read_only
+from agentipy.mcp.langchain_adapter import langchain_tools_to_actions
+from agentipy.utils.instrumentation import metrics
+
+TOOL_COUNT = 200
+BUDGET_MS = float(os.environ.get("AGENTIPY_LANGCHAIN_ACTIONS_BUDGET_MS", "500"))
+
+
+def _agent() -> SolanaAgentKit:
+    return SolanaAgentKit.__new__(SolanaAgentKit)
+
+
+class BaseFakeTool(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str
+    description: str = "Fake tool"
+    metadata: Optional[dict] = None
+    input_validator: ClassVar[InputValidator] = compile_schema({
+        "address": {"type": str, "required": True},
+        "limit": {"type": int, "required": False},
+    })
+
+    async def _arun(self, input: str):
+        return f"{self.name}:{id(self.kit)}:{input}"
+
+
+class FakeTool(BaseFakeTool):
+    solana_kit: SolanaAgentKit
+
+    @property
+    def kit(self):
+        return self.solana_kit
+
+
+class AgentKitTool(BaseFakeTool):
+    agent_kit: SolanaAgentKit
+
+    @property
+    def kit(self):
+        return self.agent_kit
+
+
+def _tool_class(name: str, base: type = FakeTool) -> type:
+    return type(f"Tool_{name}", (base,), {"__annotations__": {"name": str}, "name": name})
+
+
+def _tool(name: str, agent: SolanaAgentKit, **kwargs):
+    return _tool_class(name)(solana_kit=agent, **kwargs)
+
+
+def test_agent_kit_tools_are_bound_per_agent():
+    first, second = _agent(), _agent()
+    tool = _tool_class("agent_kit_tool", AgentKitTool)(agent_kit=first)
+    action = langchain_tools_to_actions([tool])["AGENT_KIT_TOOL"]
+
+    async def call(agent):
+        return await action.handler(agent, {"address": "x"})
+
+    assert asyncio.run(call(first)) == f'agent_kit_tool:{id(first)}:{{"address": "x"}}'
+    assert asyncio.run(call(second)) == f'agent_kit_tool:{id(second)}:{{"address": "x"}}'
+
+
+def test_read_only_tools_come_from_the_registry_and_metadata():
+    agent = _agent()
+    tools = [
+        _tool("solana_helius_get_balances", agent),
+        _tool("solana_transfer", agent),
+        _tool("custom_lookup", agent, metadata={"read_only": True}),
+    ]
+
+    actions = langchain_tools_to_actions(tools)
+    assert is_read_only(actions["SOLANA_HELIUS_GET_BALANCES"])
+    assert not is_read_only(actions["SOLANA_TRANSFER"])
+    assert is_read_only(actions["CUSTOM_LOOKUP"])
+
+    overridden = langchain_tools_to_actions(tools, read_only_tools=["solana_transfer"])
+    assert not is_read_only(overridden["SOLANA_HELIUS_GET_BALANCES"])
+    assert is_read_only(overridden["SOLANA_TRANSFER"])
+
+
+def test_action_generation_time(record_property):
+    agent = _agent()
+    tools = [_tool(f"tool_{i}", agent) for i in range(TOOL_COUNT)]
+    calls_before = metrics.snapshot().get("mcp.langchain_actions", {}).get("calls", 0)
+
+    start = time.perf_counter()
+    actions = langchain_tools_to_actions(tools)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    record_property("langchain_actions_ms", round(elapsed_ms, 2))
+    assert len(actions) == TOOL_COUNT
+    assert metrics.snapshot()["mcp.langchain_actions"]["calls"] == calls_before + 1
+    assert elapsed_ms <= BUDGET_MS, f"converting {TOOL_COUNT} tools took {elapsed_ms:.1f} ms"
@@ -0,0 +1,125 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool
+
+import agentipy.mcp.mcp_server as mcp_server
+from agentipy.mcp.executor import ToolExecutor
+from agentipy.mcp.mcp_server import (_advertised_actions, _handle_tool_call,
+                                     _register_tools, call_tool)
+from agentipy.mcp.serialization import ResultPager
+
+
+def _next_cursor(contents):
+    return json.loads(contents[-1].text)["page"].get("next_cursor")
+
+
+def test_cursor_is_only_served_to_its_owner():
+    pager = ResultPager(page_size=2)
+    first = pager.render(list(range(5)), owner="wallet-a")
+    cursor = _next_cursor(first)
+    assert cursor
+
+    with pytest.raises(ValueError, match="expired or unknown"):
+        pager.next_page(cursor, owner="wallet-b")
+    second = pager.next_page(cursor, owner="wallet-a")
+    assert json.loads(second[0].text) == [2, 3]
+
+
+def test_multi_agent_cursor_requires_the_resolved_agent():
+    agents = {"alice": SimpleNamespace(wallet_address="A"), "bob": SimpleNamespace(wallet_address="B")}
+    calls = []
+
+    async def handler(agent, params):
+        calls.append(agent.wallet_address)
+        return [f"{agent.wallet_address}-{i}" for i in range(5)]
+
+    action = Tool(name="LIST", description="", inputSchema={}, handler=handler)
+    executor = ToolExecutor()
+    pager = ResultPager(page_size=2)
+
+    def resolve_agent(kwargs):
+        return agents[kwargs.pop("agent_id")]
+
+    async def scenario():
+        first = await _handle_tool_call("LIST", action, {"agent_id": "alice"}, executor, pager, resolve_agent)
+        cursor = _next_cursor(first)
+        with pytest.raises(ValueError):
+            await _handle_tool_call("LIST", action, {"agent_id": "bob", "cursor": cursor}, executor, pager, resolve_agent)
+        return await _handle_tool_call("LIST", action, {"agent_id": "alice", "cursor": cursor}, executor, pager, resolve_agent)
+
+    page = asyncio.run(scenario())
+    executor.shutdown()
+    assert json.loads(page[0].text) == ["A-2", "A-3"]
+    assert calls == ["A"]
+
+
+def test_advertised_schemas_include_server_arguments():
+    action = Tool(name="GET", description="", inputSchema={"mint": {"type": "string"}})
+    single = _advertised_actions({"GET": action}, multi_agent=False)["GET"]
+    multi = _advertised_actions({"GET": action}, multi_agent=True)["GET"]
+
+    assert set(single.inputSchema) == {"mint", "cursor"}
+    assert set(multi.inputSchema) == {"mint", "cursor", "agent_id"}
+    assert multi.inputSchema["agent_id"]["required"] is True
+    assert action.inputSchema == {"mint": {"type": "string"}}
+
+
+def test_registered_tools_expose_and_accept_the_action_schema():
+    calls = []
+
+    async def handler(agent, params):
+        calls.append((agent.wallet_address, params))
+        return {"ok": True}
+
+    action = Tool(name="GET", description="", inputSchema={"mint": {"type": "string", "required": True}}, handler=handler)
+    executor = ToolExecutor()
+    server = FastMCP("test")
+    agents = {"alice": SimpleNamespace(wallet_address="A")}
+
+    def resolve_agent(kwargs):
+        return agents[kwargs.pop("agent_id")]
+
+    _register_tools({"GET": action}, executor, ResultPager(), resolve_agent, multi_agent=True, server=server)
+
+    async def scenario():
+        tools = {tool.name: tool for tool in await server.list_tools()}
+        result = await server.call_tool("GET", {"mint": "So1", "agent_id": "alice"})
+        return tools, result
+
+    tools, result = asyncio.run(scenario())
+    executor.shutdown()
+    schema = tools["GET"].inputSchema
+    assert set(schema["properties"]) == {"mint", "cursor", "agent_id"}
+    assert set(schema["required"]) == {"mint", "agent_id"}
+    assert set(tools["BATCH"].inputSchema["properties"]) == {"requests", "cursor", "agent_id"}
+    assert calls == [("A", {"mint": "So1"})]
+    assert json.loads(result[0].text) == {"ok": True}
+
+
+def test_call_tool_reuses_one_default_executor(monkeypatch):
+    created = []
+
+    class CountingExecutor(ToolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    async def handler(agent, params):
+        return params["n"]
+
+    monkeypatch.setattr(mcp_server, "ToolExecutor", CountingExecutor)
+    monkeypatch.setattr(mcp_server, "_default_executor", None)
+    actions = {"ECHO": Tool(name="ECHO", description="", inputSchema={}, handler=handler)}
+    agent = SimpleNamespace(wallet_address="A")
+
+    async def scenario():
+        return [await call_tool(agent, actions, "ECHO", {"n": n}) for n in range(3)]
+
+    results = asyncio.run(scenario())
+    assert [json.loads(result[0].text) for result in results] == [0, 1, 2]
+    assert len(created) == 1
+    created[0].shutdown()
@@ -0,0 +1,56 @@
+"""
+Every tool in READ_ONLY_TOOLS must exist and only call agent methods that read state.
+
+The LangChain tool modules are inspected with `ast` so the test does not need
+langchain installed.
+"""
+import ast
+from pathlib import Path
+
+from agentipy.langchain import READ_ONLY_TOOLS
+
+LANGCHAIN_DIR = Path(__file__).resolve().parent.parent / "agentipy" / "langchain"
+
+# First word of agent methods that sign, send or otherwise change state
+WRITE_VERBS = {
+    "approve", "burn", "buy", "cancel", "close", "create", "deploy", "deposit", "execute", "launch", "lend",
+    "list", "merge", "mint", "open", "place", "register", "reject", "request", "restake", "sell", "send",
+    "spread", "stake", "swap", "trade", "transfer", "unstake", "update", "withdraw",
+}
+# Read-only calls whose name starts with a write verb
+READ_ONLY_EXCEPTIONS = {"send_ping"}
+
+
+def _tool_calls():
+    """Map each LangChain tool name to the agent methods its class calls."""
+    tools = {}
+    for path in LANGCHAIN_DIR.rglob("*.py"):
+        for cls in ast.walk(ast.parse(path.read_text())):
+            if not isinstance(cls, ast.ClassDef):
+                continue
+            name = None
+            for stmt in cls.body:
+                target = getattr(stmt, "target", None) or (stmt.targets[0] if isinstance(stmt, ast.Assign) else None)
+                if getattr(target, "id", None) == "name" and isinstance(getattr(stmt, "value", None), ast.Constant):
+                    name = stmt.value.value
+            if name is None:
+                continue
+            tools[name] = {
+                node.func.attr
+                for node in ast.walk(cls)
+                if isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Attribute)
+                and node.func.value.attr in ("solana_kit", "agent_kit")
+            }
+    return tools
+
+
+def test_read_only_tools_only_read_state():
+    tools = _tool_calls()
+    assert sorted(READ_ONLY_TOOLS - set(tools)) == []
+    writes = {
+        name: sorted(method for method in tools[name] if method.split("_")[0] in WRITE_VERBS and method not in READ_ONLY_EXCEPTIONS)
+        for name in READ_ONLY_TOOLS
+    }
+    assert {name: methods for name, methods in writes.items() if methods} == {}
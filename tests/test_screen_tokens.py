@@ -0,0 +1,31 @@
+import asyncio
+from types import SimpleNamespace
+
+from agentipy.tools.screen_tokens import TokenScreener
+from agentipy.types import TokenScreeningResult
+from agentipy.utils.http_policy import RetryPolicy
+
+
+def test_failing_batch_is_reported_as_errors_and_stream_continues(monkeypatch):
+    monkeypatch.setattr(RetryPolicy, "backoff", lambda self, attempt: 0.0)
+    attempts = []
+
+    async def prefilter(self, batch):
+        attempts.append(list(batch))
+        if "bad" in batch:
+            raise ConnectionError("RPC unavailable")
+        return [TokenScreeningResult(mint=mint, status="rejected", reasons=["Mint authority is still set"]) for mint in batch]
+
+    monkeypatch.setattr(TokenScreener, "_prefilter", prefilter)
+    screener = TokenScreener(SimpleNamespace(), batch_size=2, rugcheck=object())
+
+    async def collect():
+        return [result async for result in screener.screen(["bad", "m1", "m2", "m3"])]
+
+    results = {result.mint: result for result in asyncio.run(collect())}
+    assert set(results) == {"bad", "m1", "m2", "m3"}
+    assert results["bad"].status == results["m1"].status == "error"
+    assert "RPC unavailable" in results["bad"].error
+    assert results["m2"].status == results["m3"].status == "rejected"
+    # The failing batch was retried before giving up
+    assert attempts.count(["bad", "m1"]) == RetryPolicy().max_attempts